@@ -69,6 +69,19 @@ invalid evidence is a finding.
     - ``held``          — an observation exists and satisfies the bound.
     - ``breached``      — an observation exists and EXCEEDS the declared bound.
 
+  **Raw samples and sketches.** ``--samples <file>`` (repeatable) streams raw
+  sample dumps — JSONL (``{"metric", "value"}``, or k6's ``--out json``
+  ``Point`` lines) or CSV (a ``metric``/``metric_name`` and a
+  ``value``/``metric_value`` column), gzip when the name ends ``.gz`` — into
+  one mergeable quantile sketch per metric
+  (``chief_wiggum/quantile_sketch.py``) in bounded memory, however many
+  millions of samples. ``--sketch <file>`` (repeatable) merges sketches
+  saved by earlier runs, e.g. one per load-test shard; ``--write-sketch``
+  saves the merged result. A node whose metric has a sketch is evaluated at
+  its OWN declared ``alpha`` (the ``1 - alpha`` quantile); a summary-only
+  metric uses that quantile when the export carries it and its ``p95``
+  otherwise, exactly as before. Each result records the quantile it used.
+
   ``unbound`` vs ``no_observations`` is a deliberate distinction (a missing
   binding is a spec gap; a bound metric with no data is a measurement gap);
   ``held`` vs ``breached`` is the bound evaluation for nodes that have data.
@@ -92,17 +105,31 @@ was proven:
     measured: "measured mode reports observations from <source>; not a proof of runtime behaviour"
 
 Mirrors ``check_traceability.py``'s shape (dataclasses, report object with
-counts/ok, argparse, best-effort factory_log emit). Stdlib only.
+counts/ok, argparse, best-effort factory_log emit). Stdlib only (the sketch
+is ``chief_wiggum``'s, itself stdlib).
 """
 
 from __future__ import annotations
 
 import argparse
+import csv
+import gzip
 import json
+import math
 import re
 import sys
+from collections.abc import Iterable, Iterator
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import IO
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from chief_wiggum.quantile_sketch import (  # noqa: E402
+    DEFAULT_RELATIVE_ACCURACY,
+    SKETCH_FORMAT,
+    QuantileSketch,
+)
 
 DEFAULT_SCHEMA = (
     Path(__file__).resolve().parents[1] / "templates" / "formal-models" / "system-contracts-schema.json"
@@ -168,6 +195,9 @@ class MeasuredResult:
     # None unless an --emits-report was supplied (#170): then True/False records
     # whether ANY @cw-emits site was found for this telemetry_ref, repo-wide.
     emitter_bound: bool | None = None
+    # The quantile ``observed`` was read at (0.95 for a summary p95; the
+    # node's own 1 - alpha from a sketch); None when nothing was observed.
+    quantile: float | None = None
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -253,10 +283,133 @@ def load_measured(path: str | Path) -> dict[str, dict]:
         values = stats.get("values") if isinstance(stats.get("values"), dict) else stats
         p95 = next((values[k] for k in ("p95", "p(95)", "P95") if values.get(k) is not None), None)
         count = next((values[k] for k in ("count", "len", "Count") if values.get(k) is not None), None)
-        out[name] = {"p95": p95, "count": count}
+        entry: dict = {"p95": p95, "count": count}
+        # Other exported percentiles (p(99), p99.9, ...) let a node with a
+        # different alpha be judged at its own quantile.
+        quantiles = {
+            q: values[k] for k in values
+            if (q := _percentile_key(k)) is not None and q != 0.95 and values[k] is not None
+        }
+        if quantiles:
+            entry["quantiles"] = quantiles
+        out[name] = entry
+    return out
+
+
+_PERCENTILE_KEY_RE = re.compile(r"^[pP]\(?(\d+(?:\.\d+)?)\)?$")
+
+
+def _percentile_key(key: str) -> float | None:
+    """``p(99)`` / ``p99`` / ``P99.9`` -> 0.99 / 0.99 / 0.999; else None."""
+    m = _PERCENTILE_KEY_RE.match(key)
+    if not m or not 0 < float(m.group(1)) < 100:
+        return None
+    return round(float(m.group(1)) / 100, 9)
+
+
+# --- raw sample ingestion -----------------------------------------------------
+
+_METRIC_KEYS = ("metric", "metric_name", "name", "telemetry_ref")
+_VALUE_KEYS = ("value", "metric_value", "duration_ms")
+
+
+def _open_text(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")  # noqa: SIM115 — caller closes
+
+
+def _first(record: dict, keys: tuple[str, ...]):
+    return next((record[k] for k in keys if record.get(k) not in (None, "")), None)
+
+
+def _sample_records(path: Path) -> Iterator[tuple[object, object]]:
+    """``(metric, value)`` per line of a raw sample dump, streamed. A line
+    that carries no sample (k6's ``Metric`` declarations, blank lines) is
+    skipped; a malformed one yields ``(None, None)`` so it is counted."""
+    fmt = Path(path.stem).suffix if path.suffix == ".gz" else path.suffix
+    with _open_text(path) as fh:
+        if fmt == ".csv":
+            for row in csv.DictReader(fh):
+                yield _first(row, _METRIC_KEYS), _first(row, _VALUE_KEYS)
+            return
+        for line in fh:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                yield None, None
+                continue
+            if not isinstance(record, dict):
+                yield None, None
+                continue
+            if record.get("type") == "Metric":  # k6 declares each metric once
+                continue
+            data = record.get("data") if isinstance(record.get("data"), dict) else record
+            yield _first(record, _METRIC_KEYS), _first(data, _VALUE_KEYS)
+
+
+def load_samples(
+    paths: Iterable[str | Path],
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    sketches: dict[str, QuantileSketch] | None = None,
+) -> tuple[dict[str, QuantileSketch], int]:
+    """Stream raw sample files into one quantile sketch per metric:
+    ``(sketches, skipped)``. Memory is bounded by the number of metrics and
+    the sketches' bucket cap, never by the sample count. ``skipped`` counts
+    lines that named no metric or no finite numeric value — reported, not
+    fatal: one torn line at the end of a crashed dump must not void the
+    other million. Pass ``sketches`` to add into existing ones."""
+    out = sketches if sketches is not None else {}
+    skipped = 0
+    for path in paths:
+        for metric, value in _sample_records(Path(path)):
+            try:
+                number = float(value)  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                number = math.nan
+            if not isinstance(metric, str) or not metric or not math.isfinite(number):
+                skipped += 1
+                continue
+            sketch = out.get(metric)
+            if sketch is None:
+                sketch = out[metric] = QuantileSketch(relative_accuracy)
+            sketch.add(number)
+    return out, skipped
+
+
+def load_sketches(path: str | Path, sketches: dict[str, QuantileSketch] | None = None) -> dict[str, QuantileSketch]:
+    """Merge a saved sketch file (``write_sketches``) into ``sketches``.
+    ``ValueError`` on anything that is not one — a wrong file must not merge
+    as "no observations"."""
+    raw = json.loads(Path(path).read_text())
+    if not isinstance(raw, dict) or raw.get("format") != SKETCH_FORMAT or not isinstance(raw.get("metrics"), dict):
+        raise ValueError(f"not a {SKETCH_FORMAT} sketch file")
+    out = sketches if sketches is not None else {}
+    for name, data in raw["metrics"].items():
+        sketch = QuantileSketch.from_dict(data)
+        if name in out:
+            out[name].merge(sketch)
+        else:
+            out[name] = sketch
     return out
 
 
+def write_sketches(path: str | Path, sketches: dict[str, QuantileSketch]) -> None:
+    payload = {"format": SKETCH_FORMAT, "metrics": {k: v.to_dict() for k, v in sorted(sketches.items())}}
+    Path(path).write_text(json.dumps(payload) + "\n")
+
+
+def measured_from_sketches(sketches: dict[str, QuantileSketch]) -> dict[str, dict]:
+    """The ``load_measured`` shape for sketched metrics, plus the sketch
+    itself so ``_measure_node`` can read each node's own quantile."""
+    return {
+        name: {"p95": sketch.quantile(0.95), "count": sketch.count, "sketch": sketch}
+        for name, sketch in sketches.items()
+    }
+
+
 # --- schema validation --------------------------------------------------------
 #
 # The schema (templates/formal-models/system-contracts-schema.json) is ENFORCED,
@@ -558,6 +711,25 @@ def check_measured(
     return report
 
 
+def _observe(stats: dict | None, alpha) -> tuple[float | None, float | None]:
+    """``(observed, quantile)`` for a node with tail budget ``alpha``: its
+    own ``1 - alpha`` quantile from a sketch, or from the export's matching
+    percentile; else the export's ``p95`` (the only figure a plain summary
+    carries — what measured mode has always compared)."""
+    if not stats:
+        return None, None
+    want = round(1 - alpha, 9) if isinstance(alpha, int | float) and 0 < alpha < 1 else 0.95
+    sketch = stats.get("sketch")
+    if isinstance(sketch, QuantileSketch):
+        observed = sketch.quantile(want)
+        return observed, (want if observed is not None else None)
+    exported = (stats.get("quantiles") or {}).get(want)
+    if exported is not None:
+        return exported, want
+    p95 = stats.get("p95")
+    return p95, (0.95 if p95 is not None else None)
+
+
 def _measure_node(
     node: dict,
     measured: dict[str, dict],
@@ -569,7 +741,7 @@ def _measure_node(
     bound = node.get("bound")
 
     stats = measured.get(telemetry_ref) if telemetry_ref else None
-    observed = stats.get("p95") if stats else None
+    observed, quantile = _observe(stats, node.get("alpha"))
     count = stats.get("count") if stats else None
 
     # unbound (no binding declared) vs no_observations (binding declared but no
@@ -597,7 +769,9 @@ def _measure_node(
         if status == "no_observations" and not emitter_bound:
             status = "not_emitted"
 
-    report.measured.append(MeasuredResult(node_id, telemetry_ref, bound, observed, status, emitter_bound))
+    report.measured.append(
+        MeasuredResult(node_id, telemetry_ref, bound, observed, status, emitter_bound, quantile)
+    )
 
     for child in node.get("children") or []:
         _measure_node(child, measured, report, emitted)
@@ -633,6 +807,8 @@ def render_text(report: BudgetTreeReport) -> str:
             lines += ["", "## Measured bindings"]
             for m in report.measured:
                 obs = m.observed if m.observed is not None else "—"
+                if m.quantile is not None:
+                    obs = f"{obs} (p{m.quantile * 100:g})"
                 emit_note = "" if m.emitter_bound is None else f" (emitter {'found' if m.emitter_bound else 'MISSING'})"
                 lines.append(
                     f"- {m.id} ref={m.telemetry_ref or '(none)'} bound={m.bound} observed={obs} "
@@ -656,6 +832,30 @@ def main(argv: list[str] | None = None) -> int:
         help="k6 summary JSON or flat {metric: {p95: ...}} export; switches to measured mode "
         "(evidence-only, never gates)",
     )
+    parser.add_argument(
+        "--samples",
+        action="append",
+        default=[],
+        metavar="FILE",
+        help="Raw sample dump (JSONL or CSV, optionally .gz; repeatable) streamed into a "
+        "quantile sketch per metric; switches to measured mode. Each node is evaluated at "
+        "its own 1 - alpha quantile.",
+    )
+    parser.add_argument(
+        "--sketch",
+        action="append",
+        default=[],
+        metavar="FILE",
+        help="Sketch file from a previous --write-sketch (repeatable; e.g. one per load-test "
+        "shard) merged with any --samples; switches to measured mode",
+    )
+    parser.add_argument("--write-sketch", metavar="FILE", help="Save the merged sketches for later merging")
+    parser.add_argument(
+        "--relative-accuracy",
+        type=float,
+        default=DEFAULT_RELATIVE_ACCURACY,
+        help=f"Sketch relative error for --samples (default {DEFAULT_RELATIVE_ACCURACY})",
+    )
     parser.add_argument(
         "--emits-report",
         help="Optional check_instrumentation.py JSON report (#170); when given with --measured, "
@@ -682,12 +882,31 @@ def main(argv: list[str] | None = None) -> int:
         print(f"Error: cannot load budget tree file: {exc}", file=sys.stderr)
         return 2
 
-    if args.measured:
-        try:
-            measured_data = load_measured(args.measured)
-        except (OSError, json.JSONDecodeError) as exc:
-            print(f"Error: cannot load measured data: {exc}", file=sys.stderr)
-            return 2
+    if args.measured or args.samples or args.sketch:
+        measured_data: dict[str, dict] = {}
+        if args.measured:
+            try:
+                measured_data = load_measured(args.measured)
+            except (OSError, json.JSONDecodeError) as exc:
+                print(f"Error: cannot load measured data: {exc}", file=sys.stderr)
+                return 2
+        if args.samples or args.sketch:
+            sketches: dict[str, QuantileSketch] = {}
+            try:
+                for sketch_path in args.sketch:
+                    load_sketches(sketch_path, sketches)
+                _, skipped = load_samples(args.samples, args.relative_accuracy, sketches)
+            except (OSError, json.JSONDecodeError, ValueError) as exc:
+                print(f"Error: cannot load samples/sketches: {exc}", file=sys.stderr)
+                return 2
+            if skipped:
+                print(f"Warning: skipped {skipped} sample line(s) with no metric or numeric value",
+                      file=sys.stderr)
+            if args.write_sketch:
+                write_sketches(args.write_sketch, sketches)
+            # A sketched metric supersedes a summary entry of the same name:
+            # it can answer every node's own alpha.
+            measured_data.update(measured_from_sketches(sketches))
         emitted = None
         if args.emits_report:
             try:
@@ -695,7 +914,8 @@ def main(argv: list[str] | None = None) -> int:
             except (OSError, json.JSONDecodeError, ValueError) as exc:
                 print(f"Error: cannot load emits report: {exc}", file=sys.stderr)
                 return 2
-        report = check_measured(doc, measured_data, source=args.measured, schema=schema, emitted=emitted)
+        source = ", ".join([*filter(None, [args.measured]), *args.sketch, *args.samples])
+        report = check_measured(doc, measured_data, source=source, schema=schema, emitted=emitted)
     else:
         report = check_static(doc, schema=schema)
 
@@ -242,7 +242,7 @@ def check_capture(name: str, required: bool = True):
                   "inapplicable on this harness")
             warn_count += 1
             return
-        records = [r for r in factory_log.read_log() if r.get("event") == factory_log.CLAUDE_CODE]
+        records = factory_log.read_log(event=factory_log.CLAUDE_CODE)
         if not records:
             print(f"{RED if required else YELLOW}[{'MISSING' if required else 'OPTIONAL'}]{NC}  "
                   f"{name:<24s} 0 claude_code records — the Claude layer has never been "
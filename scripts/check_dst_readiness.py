@@ -79,6 +79,20 @@ signal, not enforcement — a repo opts into gating via its own ratchet config,
 this script defaulting to `--gate`). `--gate` exists for that opt-in case: exit 1 if
 any finding survives the allowlist.
 
+**Walk, cache, workers.** The candidate list comes from the shared
+``chief_wiggum.manifest.walk_source_files`` walk with ``SKIP_PARTS`` pruned DURING
+traversal — a ``node_modules``/``vendor``/build-output tree is never descended into,
+rather than listed in full and filtered afterwards — and, like every other full-tree
+scanner here, nested git checkouts (submodules) are left to their own repo's gates.
+Path-only exemptions (test path, seam glob) are decided before anything is read. Every
+remaining file's per-file result (its findings, or its ``cw:dst-exempt`` marker) is a
+pure function of its path and content, so it is served from ``chief_wiggum.findings_cache``
+when the file's git blob sha and this scanner's hash-derived ``--scanner-version`` both
+match a prior run, and recomputed otherwise; cache misses are scanned through
+``chief_wiggum.emission_pool`` (``--jobs N`` / ``CW_SCAN_WORKERS``), with results
+assembled in walk order so the report is identical at any worker count and with
+``--no-cache``. A non-git root simply scans every file live.
+
 Exit codes: 0 = ok (or report-only with findings), 1 = `--gate` violation, 2 = usage error.
 """
 
@@ -86,11 +100,18 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import sys
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from chief_wiggum import emission_pool, findings_cache  # noqa: E402
+from chief_wiggum.hashing import scanner_version  # noqa: E402
+from chief_wiggum.manifest import ManifestError, build_manifest, walk_source_files  # noqa: E402
+
 AUTHORITY = (
     "flags nondeterminism-shaped calls in scanned first-party code; does not prove "
     "dependencies or unscanned files are deterministic"
@@ -497,13 +518,89 @@ def scan_file(suffix: str, raw_lines: list[str], rel: str) -> list[Finding]:
     return findings
 
 
+# The cached/emitted per-file result of a file carrying the exempt marker, in
+# place of its (never computed) findings.
+_MARKER_EXEMPT = {"exempt": EXEMPT_MARKER}
+
+_CACHE_ENGINE = "check_dst_readiness"
+
+
+def _file_predicate(rel: str) -> bool:
+    """The scanner's file-selection rule: a scanned extension and no
+    ``SKIP_PARTS`` component (relative to the root)."""
+    p = Path(rel)
+    return p.suffix in ALL_EXTS and not any(part in SKIP_PARTS for part in p.parts)
+
+
+def _emit_file(source_root: str, rel: str) -> tuple[list[dict] | None, str | None]:
+    """One file's result: ``([_MARKER_EXEMPT], None)`` for a marker-exempt
+    file, ``(finding dicts, None)`` otherwise, ``(None, reason)`` when it could
+    not be read. Module-level so ``emission_pool`` can ship it to a worker."""
+    path = Path(source_root) / rel
+    try:
+        raw_lines = path.read_text().splitlines()
+    except OSError as exc:
+        return None, f"unreadable: {exc.strerror or exc}"
+    if _has_exempt_marker(raw_lines):
+        return [dict(_MARKER_EXEMPT)], None
+    return [f.to_dict() for f in scan_file(path.suffix, raw_lines, rel)], None
+
+
+def _scan_results(root: Path, rels: list[str]) -> dict[str, tuple[list[dict] | None, str | None]]:
+    """``_emit_file`` for every path in ``rels``: cache hits served, misses
+    emitted through the pool and stored (see the module doc)."""
+    blobs: dict[str, str] = {}
+    scanner_hash = ""
+    if rels and not findings_cache.disabled():
+        try:
+            manifest = build_manifest(root, _file_predicate)
+        except ManifestError:
+            manifest = {}
+        blobs = {rel: manifest[rel] for rel in rels if rel in manifest}
+        if blobs:
+            scanner_hash = _scanner_version()
+    results: dict[str, tuple[list[dict] | None, str | None]] = {
+        rel: (payload, None)
+        for rel, payload in (
+            findings_cache.load_many(str(root), _CACHE_ENGINE, scanner_hash, blobs) if blobs else {}
+        ).items()
+    }
+    misses = [rel for rel in rels if rel not in results]
+    emitted = emission_pool.emit_files(str(root), misses, _emit_file)
+    results.update(zip(misses, emitted, strict=True))
+    fresh = [
+        (rel, blobs[rel], payload)
+        for rel, (payload, skip_reason) in zip(misses, emitted, strict=True)
+        if skip_reason is None and rel in blobs
+    ]
+    if fresh:
+        findings_cache.store_many(str(root), _CACHE_ENGINE, scanner_hash, fresh)
+    return results
+
+
+def _scanner_version() -> str:
+    """Hash-derived ``--scanner-version``: this module plus the ``chief_wiggum``
+    pieces that decide which files are scanned and how a cached result is
+    served — a cache entry from any other version of them never serves."""
+    here = Path(__file__).resolve()
+    cw_dir = here.parent / "chief_wiggum"
+    return scanner_version(
+        here,
+        cw_dir / "manifest.py",
+        cw_dir / "hashing.py",
+        cw_dir / "findings_cache.py",
+        cw_dir / "sqlite_store.py",
+        cw_dir / "emission_pool.py",
+    )
+
+
 def check(source_root: str | Path, config_path: str | Path | None = None) -> DSTReport:
     root = Path(source_root)
     warnings: list[str] = []
     seams = _load_seams(config_path, warnings)
     seam_regexes = [_glob_to_regex(g) for g in seams]
 
-    findings: list[Finding] = []
+    findings: list[dict] = []
     exempted: list[dict] = []
     scanned = 0
 
@@ -511,34 +608,34 @@ def check(source_root: str | Path, config_path: str | Path | None = None) -> DST
         warnings.append(f"source root not found: {source_root}")
         return DSTReport(seams=seams, warnings=warnings)
 
-    for path in sorted(root.rglob("*")):
-        if not path.is_file() or path.suffix not in ALL_EXTS:
-            continue
-        rel_path = path.relative_to(root)
-        if any(part in SKIP_PARTS for part in rel_path.parts):
-            continue
-        rel = str(rel_path)
+    # Ordered by path components, as the pre-walk ``sorted(root.rglob("*"))`` was.
+    candidates = sorted(
+        (rel for rel in walk_source_files(root, skip_dirs=SKIP_PARTS) if _file_predicate(rel)),
+        key=lambda rel: Path(rel).parts,
+    )
+    to_scan: list[str] = []
+    for rel in candidates:
         posix_rel = rel.replace("\\", "/")
-
         if _is_test_path(rel):
             exempted.append({"file": rel, "reason": "test-path"})
-            continue
-        if _is_seam(posix_rel, seam_regexes):
+        elif _is_seam(posix_rel, seam_regexes):
             exempted.append({"file": rel, "reason": "seam-glob"})
+        else:
+            to_scan.append(rel)
+
+    results = _scan_results(root, to_scan)
+    for rel in to_scan:
+        payload, skip_reason = results[rel]
+        if skip_reason is not None:
             continue
-        try:
-            raw_lines = path.read_text().splitlines()
-        except OSError:
-            continue
-        if _has_exempt_marker(raw_lines):
+        if payload == [_MARKER_EXEMPT]:
             exempted.append({"file": rel, "reason": f"{EXEMPT_MARKER} marker"})
             continue
-
         scanned += 1
-        findings += scan_file(path.suffix, raw_lines, rel)
+        findings += payload
 
     return DSTReport(
-        findings=[f.to_dict() for f in findings],
+        findings=findings,
         scanned_files=scanned,
         exempted_files=exempted,
         seams=seams,
@@ -575,7 +672,7 @@ def main(argv: list[str] | None = None) -> int:
         description="DST-readiness scanner: flags wall-clock reads and unseeded "
         "randomness outside designated seams (report-only by default)"
     )
-    parser.add_argument("source_root", help="Repo root to scan")
+    parser.add_argument("source_root", nargs="?", help="Repo root to scan")
     parser.add_argument(
         "--config",
         help="JSON file with a 'seams' array of glob patterns, unioned with the "
@@ -588,9 +685,44 @@ def main(argv: list[str] | None = None) -> int:
         "advisory FOREVER by default — a repo opts into gating via its own ratchet "
         "config, not by this flag being on by default anywhere in the pipeline.",
     )
+    parser.add_argument(
+        "--scanner-version",
+        action="store_true",
+        help="Print the hash-derived scanner version (source hash of this module + its "
+        "chief_wiggum deps) and exit",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the per-file findings cache for this run — every candidate file is "
+        "re-scanned, even on an unchanged git blob (see chief_wiggum/findings_cache.py).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Worker processes for scanning cache misses (default: one per CPU; 1 = serial). "
+        "The report is identical at any N — see chief_wiggum/emission_pool.py.",
+    )
     parser.add_argument("--format", choices=["text", "json"], default="text")
     args = parser.parse_args(argv)
 
+    if args.scanner_version:
+        print(_scanner_version())
+        return 0
+
+    if args.source_root is None:
+        parser.error("source_root is required unless --scanner-version is given")
+
+    if args.no_cache:
+        os.environ[findings_cache.NO_CACHE_ENV] = "1"
+
+    if args.jobs is not None:
+        if args.jobs < 1:
+            print("Error: --jobs must be >= 1", file=sys.stderr)
+            return 2
+        os.environ[emission_pool.WORKERS_ENV] = str(args.jobs)
+
     if not Path(args.source_root).exists():
         print(f"Error: source root not found: {args.source_root}", file=sys.stderr)
         return 2
@@ -603,7 +735,6 @@ def main(argv: list[str] | None = None) -> int:
         print(render_text(report))
 
     try:  # factory telemetry; no-op unless enabled, never breaks the gate
-        import os
         _here = os.path.dirname(os.path.abspath(__file__))
         if _here not in sys.path:
             sys.path.insert(0, _here)
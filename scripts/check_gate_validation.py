@@ -89,15 +89,20 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import os
 import re
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from chief_wiggum.hashing import stable_hash  # noqa: E402
+from chief_wiggum.scanner_registry import live_scanner_version  # noqa: E402
 
 # Single definition site (INV-fh-004): this used to be a second, independently
 # spelled DEFAULT_VALIDATION_DIR here (a relative string) that happened to
@@ -199,6 +204,50 @@ def load_record(gate: str, validation_dir: str | Path) -> dict | None:
         return None
 
 
+# Stat-keyed corpus digest cache. ``corpus_digest`` is a single sha256 over
+# every byte of the corpus, so it cannot be assembled from per-file hashes —
+# what CAN be skipped is re-reading the bytes when nothing changed. The cache
+# maps a corpus root to ``(signature, digest)``, where the signature is the
+# sorted ``(relpath, mtime_ns, size, inode)`` of every hashed file (the key
+# ``chief_wiggum/manifest.py`` uses per file); any add, delete, rename, or
+# rewrite changes it and forces a full re-hash. Git's racy-clean rule applies:
+# a corpus with a file modified within ``_RACY_WINDOW_NS`` of the hash is
+# never remembered. ``CW_CORPUS_DIGEST_CACHE_DIR`` relocates the cache
+# (``tests/conftest.py`` isolates it), ``CW_CORPUS_DIGEST_NO_CACHE=1``
+# disables it, and an unreadable/unwritable cache degrades to hashing.
+CORPUS_DIGEST_NO_CACHE_ENV = "CW_CORPUS_DIGEST_NO_CACHE"
+CORPUS_DIGEST_CACHE_DIR_ENV = "CW_CORPUS_DIGEST_CACHE_DIR"
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _corpus_files(root: Path) -> list[Path]:
+    return [
+        p for p in sorted(root.rglob("*"))
+        if p.is_file() and "__pycache__" not in p.parts and p.suffix != ".pyc"
+    ]
+
+
+def _corpus_cache_path(root: Path) -> Path | None:
+    if os.environ.get(CORPUS_DIGEST_NO_CACHE_ENV, "") not in ("", "0"):
+        return None
+    base = Path(
+        os.environ.get(CORPUS_DIGEST_CACHE_DIR_ENV)
+        or (Path.home() / ".chief-wiggum" / "cache" / "corpus-digest")
+    )
+    root_id = hashlib.sha256(os.path.abspath(root).encode()).hexdigest()[:16]
+    return base / f"{root_id}.json"
+
+
+def _digest_files(root: Path, files: list[Path]) -> str:
+    h = hashlib.sha256()
+    for p in files:
+        h.update(str(p.relative_to(root)).encode())
+        h.update(b"\0")
+        h.update(p.read_bytes())
+        h.update(b"\0")
+    return "sha256:" + h.hexdigest()
+
+
 def corpus_digest(root: str | Path) -> str:
     """Content digest of a validation corpus directory — the ``sha`` a record
     pins its trials to when the corpus is an in-repo fixture tree rather than a
@@ -207,19 +256,45 @@ def corpus_digest(root: str | Path) -> str:
     detectably stale (tests re-derive this and compare). This is the mechanism
     that lets saas_gate/quality_slop_gate records pin a FIXTURE/recorded target
     (never a live URL / AI band) with reproducible, staleness-checked clean runs.
+
+    An unchanged corpus (same file set, same stat keys) is answered from the
+    stat-keyed cache above without reading its bytes; the digest VALUE is the
+    same either way — records pin it.
     @cw-trace guards CTR-fh-044"""
-    h = hashlib.sha256()
     root = Path(root)
-    for p in sorted(root.rglob("*")):
-        if not p.is_file():
-            continue
-        if "__pycache__" in p.parts or p.suffix == ".pyc":
-            continue
-        h.update(str(p.relative_to(root)).encode())
-        h.update(b"\0")
-        h.update(p.read_bytes())
-        h.update(b"\0")
-    return "sha256:" + h.hexdigest()
+    files = _corpus_files(root)
+    try:
+        stats = [p.stat() for p in files]
+    except OSError:
+        return _digest_files(root, files)  # raced; let the read surface it
+    signature = stable_hash(*(
+        f"{p.relative_to(root)}\0{st.st_mtime_ns}\0{st.st_size}\0{st.st_ino}"
+        for p, st in zip(files, stats, strict=True)
+    ))
+    cache_path = _corpus_cache_path(root)
+    if cache_path is not None:
+        try:
+            cached = json.loads(cache_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            cached = None
+        if (
+            isinstance(cached, dict) and cached.get("signature") == signature
+            and isinstance(cached.get("digest"), str)
+        ):
+            return cached["digest"]
+    digest = _digest_files(root, files)
+    racy_after = time.time_ns() - _RACY_WINDOW_NS
+    if cache_path is not None and all(st.st_mtime_ns < racy_after for st in stats):
+        tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(
+                {"root": os.path.abspath(root), "signature": signature, "digest": digest}
+            ))
+            os.replace(tmp, cache_path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+    return digest
 
 
 def _schema_errors(record: dict, schema: dict) -> list[str]:
@@ -288,10 +363,23 @@ def _live_scanner_version(gate: str, scripts_dir: Path) -> tuple[str | None, str
     that is actually present and fails to answer its own version flag is a
     BROKEN PROBE, not evidence of "no support"; the caller turns this into a
     loud provenance error instead of a silent skip.
+
+    The hash is computed IN PROCESS whenever the gate's ``_scanner_version()``
+    is the plain path-list form every gate here uses
+    (``chief_wiggum/scanner_registry.py``): the same ``scanner_version`` over
+    the same files, without an interpreter start and a full import of the
+    gate. Only a script that registry cannot read statically is probed in a
+    subprocess, with unchanged semantics.
     """
     script = scripts_dir / f"{gate}.py"
     if not script.is_file():
         return None, None
+    try:
+        version = live_scanner_version(script)
+    except OSError as exc:
+        return None, f"--scanner-version dependency could not be read: {exc}"
+    if version is not None:
+        return version, None
     try:
         proc = subprocess.run(
             [sys.executable, str(script), "--scanner-version"],
@@ -673,6 +761,51 @@ def check_and_transition(
     return report, transition
 
 
+def record_gates(validation_dir: str | Path) -> list[str]:
+    """Every gate with a ``<gate>.json`` record in ``validation_dir``, sorted."""
+    d = Path(validation_dir)
+    return sorted(p.stem for p in d.glob("*.json") if p.is_file()) if d.is_dir() else []
+
+
+def check_many(
+    gates: list[str],
+    validation_dir: str | Path,
+    schema: dict | None = None,
+    scripts_dir: str | Path | None = None,
+    *,
+    wire: bool = False,
+    unwire: bool = False,
+    chain_cache: dict | None = None,
+    jobs: int | None = None,
+) -> list[tuple[str, GateValidationReport, AuthorityTransition]]:
+    """``check_and_transition`` for each of ``gates``, results in input order.
+
+    Independent gates run on a thread pool (``jobs`` workers; default
+    ``min(8, cpu_count)``): each check is record parsing, one scanner-version
+    hash, and at most one ``--scanner-version`` subprocess — all I/O-bound.
+    The shared journal chain is verified ONCE up front (#323) so no two
+    workers race to fill ``chain_cache``. ``wire``/``unwire`` append to the
+    journal and stay strictly sequential."""
+    if chain_cache is None:
+        chain_cache = {}
+
+    def one(gate: str) -> tuple[str, GateValidationReport, AuthorityTransition]:
+        report, transition = check_and_transition(
+            gate, validation_dir, schema=schema, scripts_dir=scripts_dir,
+            wire=wire, unwire=unwire, chain_cache=chain_cache,
+        )
+        return gate, report, transition
+
+    workers = jobs if jobs is not None else min(8, os.cpu_count() or 1)
+    if wire or unwire or workers <= 1 or len(gates) <= 1:
+        return [one(gate) for gate in gates]
+    journal = Path(validation_dir).resolve().parent / JOURNAL_NAME
+    if str(journal) not in chain_cache:
+        chain_cache[str(journal)] = _load_and_verify_chain(journal)
+    with ThreadPoolExecutor(max_workers=min(workers, len(gates))) as pool:
+        return list(pool.map(one, gates))
+
+
 def render_text(report: GateValidationReport, transition: AuthorityTransition | None = None) -> str:
     lines = [
         f"# Gate Validation — {report.gate}",
@@ -714,7 +847,7 @@ def main(argv: list[str] | None = None) -> int:
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument(
-        "gates", metavar="gate", nargs="+",
+        "gates", metavar="gate", nargs="*",
         help="Gate name(s), e.g. check_single_writer. Multiple names (#323) check "
              "each against its OWN <gate>.json record but verify the shared ratchet "
              "journal chain only ONCE for the whole invocation, instead of once per "
@@ -728,6 +861,17 @@ def main(argv: list[str] | None = None) -> int:
              "the ratchet journal that corroborates them is expected at its sibling "
              f"../{JOURNAL_NAME})",
     )
+    parser.add_argument(
+        "--all", dest="all_gates", action="store_true",
+        help="Check every gate with a <gate>.json record in --validation-dir, "
+             "instead of naming them. Output is in gate-name order and has the "
+             "multi-gate shape.",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=None, metavar="N",
+        help="Gates checked concurrently when more than one is checked "
+             "(default: min(8, CPU count)); 1 checks them one after another.",
+    )
     parser.add_argument("--schema", default=str(DEFAULT_SCHEMA))
     parser.add_argument(
         "--scripts-dir", default=None,
@@ -756,7 +900,21 @@ def main(argv: list[str] | None = None) -> int:
     )
     args = parser.parse_args(argv)
 
-    if len(args.gates) > 1 and (args.wire or args.unwire):
+    if args.all_gates and args.gates:
+        print("Error: pass gate names or --all, not both", file=sys.stderr)
+        return 2
+    if args.jobs is not None and args.jobs < 1:
+        print("Error: --jobs must be >= 1", file=sys.stderr)
+        return 2
+    if args.all_gates:
+        args.gates = record_gates(args.validation_dir)
+        if not args.gates:
+            print(f"Error: no <gate>.json validation records in {args.validation_dir}", file=sys.stderr)
+            return 2
+    elif not args.gates:
+        parser.error("name at least one gate, or pass --all")
+
+    if (len(args.gates) > 1 or args.all_gates) and (args.wire or args.unwire):
         print("Error: --wire/--unwire are single-gate operator acts — "
               "pass exactly one gate name with either flag", file=sys.stderr)
         return 2
@@ -772,16 +930,13 @@ def main(argv: list[str] | None = None) -> int:
     # gate-specific) — verify it once here and every check() call below reuses
     # the cached (entries, error) instead of re-walking it from genesis (#323).
     chain_cache: dict = {}
-    results: list[tuple[str, GateValidationReport, AuthorityTransition]] = []
-    for gate in args.gates:
-        report, transition = check_and_transition(
-            gate, args.validation_dir, schema=schema, scripts_dir=args.scripts_dir,
-            wire=args.wire, unwire=args.unwire, chain_cache=chain_cache,
-        )
-        results.append((gate, report, transition))
+    results = check_many(
+        args.gates, args.validation_dir, schema=schema, scripts_dir=args.scripts_dir,
+        wire=args.wire, unwire=args.unwire, chain_cache=chain_cache, jobs=args.jobs,
+    )
 
     if args.format == "json":
-        if len(results) == 1:
+        if len(results) == 1 and not args.all_gates:
             # Byte-identical to the pre-#323 single-gate shape — every
             # existing caller/test parses this top-level object directly.
             _gate, report, transition = results[0]
@@ -129,8 +129,10 @@ import emitters  # noqa: E402
 
 # Per-file emission cache (#327): every gate-scanned file's write sites are
 # memoized keyed by (rel, blob_sha, scanner_hash) — see the module docstring
-# for why both halves of the key are load-bearing.
-from chief_wiggum import findings_cache  # noqa: E402
+# for why both halves of the key are load-bearing. Cache MISSES are emitted
+# through the process pool in emission_pool (configurable worker count,
+# input-order results — byte-identical to the serial path).
+from chief_wiggum import emission_pool, findings_cache  # noqa: E402
 
 # Adoption-grandfather waivers (#215 F5) — the shared reader both blocking
 # gates use; key grammar + expiry posture documented there.
@@ -656,6 +658,39 @@ def match_writers(sites: list[WriteSite], invariant: SingleWriterInvariant) -> l
     return _match_writers_indexed(_index_sites_by_line(sites), invariant, _distinct_field_forms(invariant))
 
 
+def claim_writers(
+    sites: list[WriteSite],
+    invariants: list[SingleWriterInvariant],
+    forms_by_invariant: list[list[tuple[str, str]]] | None = None,
+) -> list[Writer]:
+    """Claim ONE file's emitted ``sites`` against every invariant, in the
+    scan's canonical order. Shared by ``_scan_writers_and_unscanned`` and
+    ``code_query.py``'s indexed Plane B path, so a writer list assembled from
+    persisted sites is ordered exactly like a live scan's.
+
+    Claims per invariant, then merges preserving the ORIGINAL ordering: line
+    ascending first, invariant list-order second (the original scan looped
+    "for line: for invariant", not "for invariant: for line" — a file with
+    hits for multiple invariants at interleaved lines must come out in line
+    order, not grouped by invariant). (#326) ``by_line`` is built ONCE per
+    file here, not once per (file, invariant) as a bare
+    ``match_writers(sites, inv)`` call per invariant would rebuild it;
+    callers claiming many files pass ``forms_by_invariant`` (one
+    ``_distinct_field_forms`` per invariant) so it is hoisted out of the
+    per-file loop too."""
+    if not sites:
+        return []
+    if forms_by_invariant is None:
+        forms_by_invariant = [_distinct_field_forms(inv) for inv in invariants]
+    by_line = _index_sites_by_line(sites)
+    tagged: list[tuple[int, Writer]] = []
+    for idx, inv in enumerate(invariants):
+        for w in _match_writers_indexed(by_line, inv, forms_by_invariant[idx]):
+            tagged.append((idx, w))
+    tagged.sort(key=lambda t: (t[1].line, t[0]))
+    return [w for _, w in tagged]
+
+
 def scan_writers(
     source_root: str | Path,
     invariants: list[SingleWriterInvariant],
@@ -704,6 +739,11 @@ def _scan_writers_and_unscanned(
     supplies ``blob_sha`` requires git; a non-git ``--source`` (or a path the
     manifest legitimately excludes) degrades that file to a live scan, exactly
     as before this cache existed.
+
+    Cache misses are emitted through ``chief_wiggum.emission_pool`` — sharded
+    across worker processes on a large cold scan (``--jobs`` /
+    ``CW_SCAN_WORKERS``), in-process otherwise. The claim loop still walks
+    candidates in order, so the report is byte-identical to a serial scan.
     """
     root = Path(source_root)
     exclude = exclude or []
@@ -736,61 +776,66 @@ def _scan_writers_and_unscanned(
     # the actual hot loop this scan used to re-derive it in.
     forms_by_invariant = [_distinct_field_forms(inv) for inv in invariants]
 
-    for rel in candidates:
-        if Path(rel).suffix not in SOURCE_EXTS:
-            continue
-        if any(part in SKIP_PARTS for part in Path(rel).parts):
-            continue
-        if _excluded(rel, exclude):
-            continue
-        path = root / rel
-        blob_sha = manifest.get(rel) if manifest is not None else None
-        sites: list | None = None
-        if blob_sha is not None and scanner_hash is not None:
-            cached = findings_cache.load(str(root), "check_single_writer", rel, blob_sha, scanner_hash)
-            if cached is not None:
-                sites = [WriteSite(**d) for d in cached]
+    selected = [
+        rel for rel in candidates
+        if Path(rel).suffix in SOURCE_EXTS
+        and not any(part in SKIP_PARTS for part in Path(rel).parts)
+        and not _excluded(rel, exclude)
+    ]
+    # Only a file with a manifest blob sha has a provably-fresh cache key.
+    blobs: dict[str, str] = {}
+    if manifest is not None and scanner_hash is not None:
+        blobs = {rel: manifest[rel] for rel in selected if rel in manifest}
+    cached = (
+        findings_cache.load_many(str(root), "check_single_writer", scanner_hash, blobs)
+        if blobs else {}
+    )
+    served = {rel: [WriteSite(**d) for d in findings] for rel, findings in cached.items()}
+    misses = [rel for rel in selected if rel not in served]
+
+    # Every miss is emitted (possibly across worker processes) before the
+    # claim loop below, which walks `selected` in order — writer, `unscanned`
+    # and `scanned` accounting never depend on which worker finished first.
+    emitted = dict(zip(misses, emission_pool.emit_files(str(root), misses, _emit_file), strict=True))
+    fresh: list[tuple[str, str, list[dict]]] = []
+    for rel in selected:
+        sites = served.get(rel)
         if sites is None:
-            text, skip_reason = read_text_safe(path)
+            findings, skip_reason = emitted[rel]
             if skip_reason is not None:
                 unscanned.append({"file": rel, "reason": skip_reason})
                 continue
-            # Route through the per-language emitter registry (#162) — the gate
-            # consumes the SAME dispatch path scripts/emitters exposes, so a
-            # per-language emitter can never drift from what the gate actually
-            # scans. Every SOURCE_EXTS extension has an emitter (a tier-1 language
-            # module or the generic regex tier), so tier is never "unsupported"
-            # here; genuinely unsupported extensions are counted separately by
-            # unsupported_extension_counts.
-            facts, _tier = emitters.emit(rel, text)
-            sites = emitters.facts_of_kind(facts, "write_site")
-            if blob_sha is not None and scanner_hash is not None:
-                findings_cache.store(
-                    str(root), "check_single_writer", rel, blob_sha, scanner_hash,
-                    [asdict(s) for s in sites],
-                )
+            sites = [WriteSite(**d) for d in findings]
+            if rel in blobs:
+                fresh.append((rel, blobs[rel], findings))
         scanned += 1
-        if not sites:
-            continue
-        # Claim per invariant, then merge preserving the ORIGINAL ordering: line
-        # ascending first, invariant list-order second (the original scan looped
-        # "for line: for invariant", not "for invariant: for line" — a file with
-        # hits for multiple invariants at interleaved lines must come out in line
-        # order, not grouped by invariant).
-        # (#326) by_line is built ONCE per file here, not once per (file,
-        # invariant) as a bare match_writers(sites, inv) call per invariant
-        # would rebuild it — O(files × lines) instead of O(files × invariants
-        # × lines).
-        by_line = _index_sites_by_line(sites)
-        tagged: list[tuple[int, Writer]] = []
-        for idx, inv in enumerate(invariants):
-            for w in _match_writers_indexed(by_line, inv, forms_by_invariant[idx]):
-                tagged.append((idx, w))
-        tagged.sort(key=lambda t: (t[1].line, t[0]))
-        writers.extend(w for _, w in tagged)
+        writers.extend(claim_writers(sites, invariants, forms_by_invariant))
+    if fresh:
+        findings_cache.store_many(str(root), "check_single_writer", scanner_hash, fresh)
     return writers, unscanned, scanned
 
 
+def _emit_file(source_root: str, rel: str) -> tuple[list[dict] | None, str | None]:
+    """Per-file EMISSION for one candidate: ``(write-site dicts, None)`` on a
+    read, ``(None, skip_reason)`` when the file could not be read at all.
+    Module-level so ``chief_wiggum.emission_pool`` can ship it to a worker
+    process; plain dicts are the findings-cache payload, so pooled, cached
+    and serial results all rebuild identical ``WriteSite`` objects.
+
+    Routes through the per-language emitter registry (#162) — the gate
+    consumes the SAME dispatch path scripts/emitters exposes, so a
+    per-language emitter can never drift from what the gate actually scans.
+    Every SOURCE_EXTS extension has an emitter (a tier-1 language module or
+    the generic regex tier), so tier is never "unsupported" here; genuinely
+    unsupported extensions are counted separately by
+    unsupported_extension_counts."""
+    text, skip_reason = read_text_safe(Path(source_root) / rel)
+    if skip_reason is not None:
+        return None, skip_reason
+    facts, _tier = emitters.emit(rel, text)
+    return [asdict(s) for s in emitters.facts_of_kind(facts, "write_site")], None
+
+
 def _is_sanctioned(inv: SingleWriterInvariant, rel: str, symbol: str | None) -> bool:
     """A writer is sanctioned if its enclosing symbol OR its file matches an entry
     in ``sanctioned_writers``. File entries match as a path suffix (so a repo-root
@@ -862,6 +907,13 @@ def _scanner_version() -> str:
         # must invalidate every previously-cached entry, not just the ones
         # whose file content changed.
         cw_dir / "findings_cache.py",
+        # ...and the opener behind its database: whether a stored row is
+        # even reachable (or the file is discarded) is decided there.
+        cw_dir / "sqlite_store.py",
+        # The process-pool emission engine — finding-affecting: it decides
+        # which file's sites land in which slot of the claim loop, so an
+        # ordering bug there reorders (or misattributes) every writer.
+        cw_dir / "emission_pool.py",
         # Decode-defensive bulk-source read (#282) — finding-affecting: a
         # decode-policy change here changes what a file's write sites look
         # like once read, or whether it lands in `unscanned` at all.
@@ -1261,6 +1313,14 @@ def main(argv: list[str] | None = None) -> int:
         "zero-diff validation check; not needed for correctness in normal use (a stale "
         "cache entry never serves — see chief_wiggum/findings_cache.py).",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Worker processes for per-file emission of cache misses (default: one per "
+        "CPU; 1 = serial). Results are assembled in walk order, so the report is "
+        "byte-identical at any N — see chief_wiggum/emission_pool.py.",
+    )
     parser.add_argument("--format", choices=["text", "json"], default="text")
     args = parser.parse_args(argv)
 
@@ -1271,6 +1331,12 @@ def main(argv: list[str] | None = None) -> int:
     if args.no_cache:
         os.environ[findings_cache.NO_CACHE_ENV] = "1"
 
+    if args.jobs is not None:
+        if args.jobs < 1:
+            print("Error: --jobs must be >= 1", file=sys.stderr)
+            return 2
+        os.environ[emission_pool.WORKERS_ENV] = str(args.jobs)
+
     if not args.epic_dir:
         print("Error: epic_dir is required unless --scanner-version is given", file=sys.stderr)
         return 2
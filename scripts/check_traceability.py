@@ -64,10 +64,12 @@ import emitters  # noqa: E402
 #
 # Per-file emission cache (#327): every gate-scanned file's annotations are
 # memoized keyed by (rel, blob_sha, scanner_hash) — see the module docstring
-# for why both halves of the key are load-bearing. Kept on ONE line (not
-# ruff's multi-line parenthesized form) — the CTR-fh-041 dep-completeness
+# for why both halves of the key are load-bearing. Cache MISSES are emitted
+# through the process pool in emission_pool (configurable worker count,
+# input-order results — byte-identical to the serial path). Kept on ONE line
+# (not ruff's multi-line parenthesized form) — the CTR-fh-041 dep-completeness
 # test's regex parses `from chief_wiggum import ...` as a single line.
-from chief_wiggum import external_links, findings_cache  # noqa: E402
+from chief_wiggum import emission_pool, external_links, findings_cache  # noqa: E402
 
 # Grandfather waivers (#215 F5): `adopt.py grandfather` records pre-adoption
 # baseline findings in <meta root>/adoption/grandfathered.json — for THIS gate,
@@ -495,6 +497,12 @@ def _scan_source_and_unscanned(
     legitimately excludes, e.g. a gitignored-but-present file) degrades that
     file to a live scan, exactly as before this cache existed — never a
     dropped file.
+
+    Cache misses are emitted through ``chief_wiggum.emission_pool`` — sharded
+    across worker processes on a large cold scan (``--jobs`` /
+    ``CW_SCAN_WORKERS``), in-process otherwise. Results are assembled in
+    candidate order either way, so the report is byte-identical to a serial
+    scan; the cache is read and written only here, never by a worker.
     """
     root = Path(source_root)
     annotations: list[Annotation] = []
@@ -518,34 +526,58 @@ def _scan_source_and_unscanned(
         if manifest is not None:
             scanner_hash = _scanner_version()
 
-    for rel in candidates:
-        if not _file_predicate(rel):
+    selected = [rel for rel in candidates if _file_predicate(rel)]
+    # Only a file with a manifest blob sha has a provably-fresh cache key.
+    blobs: dict[str, str] = {}
+    if manifest is not None and scanner_hash is not None:
+        blobs = {rel: manifest[rel] for rel in selected if rel in manifest}
+    cached = (
+        findings_cache.load_many(str(root), "check_traceability", scanner_hash, blobs)
+        if blobs else {}
+    )
+    served = {rel: [Annotation(**d) for d in findings] for rel, findings in cached.items()}
+    misses = [rel for rel in selected if rel not in served]
+
+    # Every miss is emitted (possibly across worker processes) before any
+    # result is assembled; the assembly below walks `selected` in order, so
+    # annotation and `unscanned` order never depend on which worker ran first.
+    emitted = dict(zip(misses, emission_pool.emit_files(str(root), misses, _emit_file), strict=True))
+    fresh: list[tuple[str, str, list[dict]]] = []
+    for rel in selected:
+        if rel in served:
+            annotations.extend(served[rel])
             continue
-        path = root / rel
-        blob_sha = manifest.get(rel) if manifest is not None else None
-        if blob_sha is not None and scanner_hash is not None:
-            cached = findings_cache.load(str(root), "check_traceability", rel, blob_sha, scanner_hash)
-            if cached is not None:
-                annotations.extend(Annotation(**d) for d in cached)
-                continue
-        text, skip_reason = read_text_safe(path)
+        findings, skip_reason = emitted[rel]
         if skip_reason is not None:
             unscanned.append({"file": rel, "reason": skip_reason})
             continue
-        if path.suffix in VERIFICATION_EXTS:
-            file_annotations = emit_source_annotations(rel, text, path.suffix)
-        else:
-            facts, _tier = emitters.emit(rel, text)
-            file_annotations = emitters.facts_of_kind(facts, "trace_annotation")
-        annotations.extend(file_annotations)
-        if blob_sha is not None and scanner_hash is not None:
-            findings_cache.store(
-                str(root), "check_traceability", rel, blob_sha, scanner_hash,
-                [a.to_dict() for a in file_annotations],
-            )
+        annotations.extend(Annotation(**d) for d in findings)
+        if rel in blobs:
+            fresh.append((rel, blobs[rel], findings))
+    if fresh:
+        findings_cache.store_many(str(root), "check_traceability", scanner_hash, fresh)
     return annotations, unscanned
 
 
+def _emit_file(source_root: str, rel: str) -> tuple[list[dict] | None, str | None]:
+    """Per-file EMISSION for one candidate: ``(annotation dicts, None)`` on a
+    read, ``(None, skip_reason)`` when the file could not be read at all.
+    Module-level so ``chief_wiggum.emission_pool`` can ship it to a worker
+    process; returns plain dicts — the same payload the findings cache
+    persists — so a pooled, a cached and a serial result all rebuild the
+    same ``Annotation`` objects."""
+    path = Path(source_root) / rel
+    text, skip_reason = read_text_safe(path)
+    if skip_reason is not None:
+        return None, skip_reason
+    if path.suffix in VERIFICATION_EXTS:
+        file_annotations = emit_source_annotations(rel, text, path.suffix)
+    else:
+        facts, _tier = emitters.emit(rel, text)
+        file_annotations = emitters.facts_of_kind(facts, "trace_annotation")
+    return [a.to_dict() for a in file_annotations], None
+
+
 def _scanner_version() -> str:
     """Hash-derived ``--scanner-version``: the source of this module plus its
     ``chief_wiggum`` dependencies. No hand-bumped constant to forget
@@ -565,6 +597,11 @@ def _scanner_version() -> str:
         cw_dir / "trace_emission.py",
         cw_dir / "trace_links.py",
         cw_dir / "external_links.py",
+        # external_links' LSP tier resolves through these pooled sessions (or
+        # an attached broker's); a session bug changes which tier — and so
+        # which span — anchors a link.
+        cw_dir / "lsp.py",
+        cw_dir / "lsp_broker.py",
         cw_dir / "grandfather.py",
         cw_dir / "manifest.py",
         cw_dir / "hashing.py",
@@ -579,6 +616,13 @@ def _scanner_version() -> str:
         # must invalidate every previously-cached entry, not just the ones
         # whose file content changed.
         cw_dir / "findings_cache.py",
+        # ...and the opener behind its database: whether a stored row is
+        # even reachable (or the file is discarded) is decided there.
+        cw_dir / "sqlite_store.py",
+        # The process-pool emission engine — finding-affecting: it decides
+        # which file's result lands in which slot of the assembled report, so
+        # an ordering bug there reorders (or misattributes) every annotation.
+        cw_dir / "emission_pool.py",
         # Decode-defensive bulk-source read (#282) — finding-affecting: a
         # decode-policy change here changes what a file's annotations look
         # like once read, or whether it lands in `unscanned` at all.
@@ -1095,6 +1139,14 @@ def main(argv: list[str] | None = None) -> int:
         "zero-diff validation check; not needed for correctness in normal use (a stale "
         "cache entry never serves — see chief_wiggum/findings_cache.py).",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Worker processes for per-file emission of cache misses (default: one per "
+        "CPU; 1 = serial). Results are assembled in walk order, so the report is "
+        "byte-identical at any N — see chief_wiggum/emission_pool.py.",
+    )
     parser.add_argument(
         "--links",
         metavar="PATH",
@@ -1138,6 +1190,12 @@ def main(argv: list[str] | None = None) -> int:
     if args.no_cache:
         os.environ[findings_cache.NO_CACHE_ENV] = "1"
 
+    if args.jobs is not None:
+        if args.jobs < 1:
+            print("Error: --jobs must be >= 1", file=sys.stderr)
+            return 2
+        os.environ[emission_pool.WORKERS_ENV] = str(args.jobs)
+
     if not args.epic_dir:
         print("Error: epic_dir is required unless --scanner-version is given", file=sys.stderr)
         return 2
@@ -0,0 +1,147 @@
+"""Verified-prefix checkpoints for the ratchet's hash-chained journal.
+
+``ratchet.py``'s journal is an append-only hash chain, and every reader —
+``load_journal`` on each ``check``/``record``/``regressed``, ``verified_prefix``
+and ``last_authority_action`` on each gate-validation and ``status`` call, and
+``bet.py``'s ledger through the same ``load_journal`` — re-derived every
+record's ``record_hash`` from ``genesis``: a canonical ``json.dumps`` plus a
+SHA-256 per record, thousands of records per call, several calls per command.
+The prefix it re-verifies is, by construction, the same bytes every time.
+
+A checkpoint records that a byte prefix of one journal file WAS verified:
+
+- ``offset`` — the prefix length in bytes (always a line boundary),
+- ``records`` — how many records it holds,
+- ``chain_hash`` — the ``record_hash`` of its last record (where verification
+  of the rest resumes),
+- ``prefix_sha256`` — a digest of those exact bytes.
+
+**Resuming is not trusting.** A reader re-hashes the raw prefix bytes (one
+streaming SHA-256, no JSON) and resumes only when they still match — any
+edit anywhere in the verified prefix, however it was made, changes the digest
+and the reader falls back to verifying from ``genesis``, where the tamper is
+found and fails closed exactly as before. Everything after ``offset`` is
+verified record by record, every time. A checkpoint can therefore only
+skip work whose answer is already known; it can never make a tampered
+journal read as intact.
+
+**Signed.** The stored checkpoint carries an HMAC-SHA256 under a per-user
+random key (``<dir>/key``, mode 0600). A checkpoint file that was not written
+by this module — hand-edited, copied from another machine, committed next to
+a doctored journal — fails the MAC and is ignored. Checkpoints live in the
+user cache (``~/.chief-wiggum/cache/ratchet``, or ``CW_RATCHET_CHECKPOINT_DIR``),
+never in the target repo, keyed by the journal's absolute path.
+
+Derived data: a missing, corrupt, or unverifiable checkpoint costs one full
+verification, never a wrong answer. ``CW_RATCHET_NO_CHECKPOINT=1`` disables
+both the read and the write."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import secrets
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+CHECKPOINT_DIR_ENV = "CW_RATCHET_CHECKPOINT_DIR"
+NO_CHECKPOINT_ENV = "CW_RATCHET_NO_CHECKPOINT"
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    records: int
+    offset: int
+    chain_hash: str
+    prefix_sha256: str
+
+
+def disabled() -> bool:
+    """True when the escape hatch is set — any non-empty, non-"0" value."""
+    return os.environ.get(NO_CHECKPOINT_ENV, "") not in ("", "0")
+
+
+def _dir() -> Path:
+    return Path(
+        os.environ.get(CHECKPOINT_DIR_ENV)
+        or (Path.home() / ".chief-wiggum" / "cache" / "ratchet")
+    )
+
+
+def _path(journal: Path) -> Path:
+    journal_id = hashlib.sha256(os.path.abspath(journal).encode()).hexdigest()[:16]
+    return _dir() / f"{journal_id}.json"
+
+
+def _key(*, create: bool) -> bytes | None:
+    """The per-user MAC key; created (0600, exclusively) on first write."""
+    path = _dir() / "key"
+    try:
+        return bytes.fromhex(path.read_text().strip())
+    except (OSError, ValueError):
+        if not create:
+            return None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w") as fh:
+            fh.write(secrets.token_hex(32))
+    except FileExistsError:
+        pass  # a concurrent writer created it first — read theirs
+    except OSError:
+        return None
+    try:
+        return bytes.fromhex(path.read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _mac(key: bytes, journal: Path, cp: Checkpoint) -> str:
+    payload = json.dumps({"journal": os.path.abspath(journal), **asdict(cp)}, sort_keys=True)
+    return hmac.new(key, payload.encode(), hashlib.sha256).hexdigest()
+
+
+def load(journal: Path) -> Checkpoint | None:
+    """The journal's checkpoint when one exists and its MAC verifies. The
+    caller must still match ``prefix_sha256`` against the bytes on disk."""
+    if disabled():
+        return None
+    key = _key(create=False)
+    if key is None:
+        return None
+    try:
+        raw = json.loads(_path(journal).read_text())
+        cp = Checkpoint(
+            records=int(raw["records"]),
+            offset=int(raw["offset"]),
+            chain_hash=str(raw["chain_hash"]),
+            prefix_sha256=str(raw["prefix_sha256"]),
+        )
+        mac = str(raw["mac"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return cp if hmac.compare_digest(mac, _mac(key, journal, cp)) else None
+
+
+def store(journal: Path, cp: Checkpoint) -> None:
+    """Persist ``cp`` (atomically — a reader sees the old checkpoint or the
+    new one, never a torn file). Best effort: a failure only costs the next
+    reader a longer verification."""
+    if disabled():
+        return
+    key = _key(create=True)
+    if key is None:
+        return
+    path = _path(journal)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps({**asdict(cp), "mac": _mac(key, journal, cp)}, sort_keys=True))
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def prefix_digest(data: bytes, offset: int) -> str:
+    return hashlib.sha256(memoryview(data)[:offset]).hexdigest()
@@ -0,0 +1,265 @@
+"""Streaming ``git diff`` capture with a per-file index (bounded memory).
+
+``review.capture_diff`` used to take ``git diff base...HEAD`` as one Python
+string — the whole diff, before ``truncate_diff`` kept the first 200KB of it —
+and ``review._touched_files`` then regex-scanned that full text again for the
+touched paths. On a large refactor or a vendored-dependency bump that is
+hundreds of MB held in memory twice, only to throw almost all of it away; and
+the 200KB that survived was whatever git happened to print first, often a
+lockfile.
+
+``index_diff`` instead reads the diff as a byte stream in bounded chunks,
+spooling it to a temporary file and building a ``DiffIndex`` as it goes: one
+``FileDiff`` per ``diff --git`` section with its byte range in the spool, its
+hunk count, its added/removed line counts, and whether it is binary. Nothing
+larger than one chunk is ever held. The index answers "which files does this
+diff touch" without re-reading anything, and ``DiffIndex.render`` builds the
+review's diff text by reading back ONLY the files that fit the byte budget:
+
+- a diff that fits the budget renders byte-identical to the diff as
+  ``text=True`` captured it (line endings translated to ``\\n`` as the
+  stream is read — ``_pieces``);
+- otherwise files are taken in relevance order (``rank``: ordinary source
+  and tests first; vendored trees, lockfiles, minified/generated output, and
+  binary diffs last), in git's order within a rank, skipping any file too
+  large for what remains — and are printed back in git's order;
+- everything left out is listed (path, +/- lines, bytes) in a trailing
+  marker, so the reviewer knows what it was not shown;
+- a diff with no file sections, or in which no file fits the budget, falls
+  back to head truncation (``truncated_head``, the format
+  ``review.truncate_text`` shares), reading only the kept head.
+
+The spool is a temporary file removed by ``close()`` (``DiffIndex`` is a
+context manager).
+"""
+
+from __future__ import annotations
+
+import re
+import tempfile
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import BinaryIO
+
+# Bytes per read. A line longer than this (minified JS, a base85 binary
+# patch) is consumed in pieces; only a piece that starts a line is parsed.
+CHUNK_BYTES = 1 << 16
+
+# A ``diff --git`` header line is the one line gathered whole across pieces
+# (its two paths are needed); past this many bytes the rest is not kept.
+MAX_HEADER_BYTES = 1 << 16
+
+# The same header pattern review._touched_files uses, so both agree on paths.
+_HEADER_RE = re.compile(rb"^diff --git a/(.+?) b/(.+?)$")
+
+# Low-relevance files: reviewed last, dropped first when the budget is short.
+_LOW_RELEVANCE_DIRS = frozenset({
+    "vendor", "vendored", "third_party", "third-party", "node_modules",
+    "dist", "build", "__snapshots__",
+})
+_LOW_RELEVANCE_NAMES = frozenset({
+    "package-lock.json", "npm-shrinkwrap.json", "yarn.lock", "pnpm-lock.yaml",
+    "poetry.lock", "uv.lock", "Pipfile.lock", "Cargo.lock", "go.sum",
+    "Gemfile.lock", "composer.lock", "mix.lock",
+})
+_LOW_RELEVANCE_SUFFIXES = (".min.js", ".min.css", ".map", ".snap", ".pb.go", "_pb2.py")
+
+# At most this many omitted files are named in the trailing marker.
+MAX_LISTED_OMISSIONS = 50
+
+
+@dataclass
+class FileDiff:
+    """One ``diff --git`` section: ``[start, end)`` in the spool."""
+
+    path: str
+    old_path: str
+    start: int
+    end: int = 0
+    hunks: int = 0
+    added: int = 0
+    removed: int = 0
+    binary: bool = False
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start
+
+
+def rank(file: FileDiff) -> int:
+    """Default relevance rank (lower is reviewed first): 0 for ordinary
+    files, 1 for vendored/lockfile/generated/binary diffs."""
+    p = PurePosixPath(file.path)
+    if (
+        file.binary
+        or _LOW_RELEVANCE_DIRS.intersection(p.parts[:-1])
+        or p.name in _LOW_RELEVANCE_NAMES
+        or p.name.endswith(_LOW_RELEVANCE_SUFFIXES)
+    ):
+        return 1
+    return 0
+
+
+class DiffIndex:
+    """A spooled diff plus its per-file index. Build with ``index_diff``."""
+
+    def __init__(self, spool: BinaryIO, files: list[FileDiff], total_bytes: int,
+                 preamble_end: int) -> None:
+        self._spool = spool
+        self.files = files
+        self.total_bytes = total_bytes
+        # Bytes before the first ``diff --git`` header (normally none).
+        self.preamble_end = preamble_end
+
+    @property
+    def paths(self) -> list[str]:
+        """Post-image paths in diff order, deduplicated."""
+        return list(dict.fromkeys(f.path for f in self.files))
+
+    def read(self, start: int, end: int) -> bytes:
+        self._spool.seek(start)
+        return self._spool.read(end - start)
+
+    def text(self, start: int, end: int) -> str:
+        return self.read(start, end).decode("utf-8", errors="replace")
+
+    def render(self, max_bytes: int, *, rank: Callable[[FileDiff], int] = rank) -> str:
+        """The diff text for a ``max_bytes`` budget (see the module doc)."""
+        if self.total_bytes <= max_bytes:
+            return self.text(0, self.total_bytes)
+        remaining = max_bytes - self.preamble_end
+        chosen: set[int] = set()
+        for i in sorted(range(len(self.files)), key=lambda i: (rank(self.files[i]), i)):
+            size = self.files[i].size
+            if size <= remaining:
+                chosen.add(i)
+                remaining -= size
+        if not chosen:
+            return truncated_head(self.read(0, max_bytes), max_bytes, self.total_bytes)
+        parts = [self.text(0, self.preamble_end)] if self.preamble_end else []
+        parts += [self.text(f.start, f.end) for i, f in enumerate(self.files) if i in chosen]
+        omitted = [f for i, f in enumerate(self.files) if i not in chosen]
+        shown = sum(self.files[i].size for i in chosen) + self.preamble_end
+        return "".join(parts) + _omission_marker(
+            omitted, shown=shown, total=self.total_bytes, files=len(self.files), max_bytes=max_bytes,
+        )
+
+    def close(self) -> None:
+        self._spool.close()
+
+    def __enter__(self) -> DiffIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def truncated_head(head: bytes, max_bytes: int, total: int, label: str = "diff") -> str:
+    """The first ``max_bytes`` of ``head`` (cut on a UTF-8 boundary) plus a
+    marker stating the ``total`` size — the one truncation format shared by
+    ``review.truncate_text`` and an over-budget ``DiffIndex.render``."""
+    text = head[:max_bytes].decode("utf-8", errors="ignore")
+    return text + f"\n\n... [{label} truncated at {max_bytes} bytes of {total}] ..."
+
+
+def _omission_marker(omitted: list[FileDiff], *, shown: int, total: int, files: int,
+                     max_bytes: int) -> str:
+    lines = [
+        f"\n\n... [diff budgeted at {max_bytes} bytes: showing {files - len(omitted)} of "
+        f"{files} files ({shown} of {total} bytes); omitted (did not fit — "
+        "vendored, lockfile, generated, and binary diffs are dropped first):"
+    ]
+    for f in omitted[:MAX_LISTED_OMISSIONS]:
+        kind = "binary" if f.binary else f"+{f.added}/-{f.removed}"
+        lines.append(f"  {f.path} ({kind}, {f.size} bytes)")
+    if len(omitted) > MAX_LISTED_OMISSIONS:
+        lines.append(f"  ... and {len(omitted) - MAX_LISTED_OMISSIONS} more")
+    lines.append("] ...")
+    return "\n".join(lines)
+
+
+def _pieces(stream: BinaryIO) -> Iterable[bytes]:
+    """``stream`` in pieces of at most ``CHUNK_BYTES``, each ending at a line
+    end or the chunk limit, with ``\\r\\n`` and a lone ``\\r`` translated
+    to ``\\n`` — the universal-newlines read ``capture_diff`` made with
+    ``text=True`` before it streamed, so a CRLF file's diff still renders
+    (and is budgeted) exactly as it did then."""
+    cr_pending = False  # the last piece ended in a CR, already yielded as LF
+    while True:
+        piece = stream.readline(CHUNK_BYTES)
+        if not piece:
+            return
+        if cr_pending and piece.startswith(b"\n"):
+            piece = piece[1:]
+        cr_pending = piece.endswith(b"\r")
+        if b"\r" not in piece:
+            if piece:
+                yield piece
+            continue
+        for line in piece.splitlines(keepends=True):
+            if line.endswith((b"\r", b"\n")):
+                line = line.rstrip(b"\r\n") + b"\n"
+            yield line
+
+
+def index_diff(stream: BinaryIO) -> DiffIndex:
+    """Consume a unified ``git diff`` byte stream into a spooled ``DiffIndex``."""
+    spool = tempfile.TemporaryFile(prefix="cw-diff-")
+    files: list[FileDiff] = []
+    current: FileDiff | None = None
+    in_hunk = False
+    offset = 0
+    at_line_start = True
+    # A ``diff --git`` line still being read (it spans pieces), and its offset.
+    header: bytearray | None = None
+    header_start = 0
+
+    def open_file() -> None:
+        nonlocal current, header
+        assert header is not None
+        m = _HEADER_RE.match(bytes(header).rstrip(b"\r\n"))
+        if m:
+            current = FileDiff(
+                path=m.group(2).decode("utf-8", errors="replace"),
+                old_path=m.group(1).decode("utf-8", errors="replace"),
+                start=header_start,
+            )
+            files.append(current)
+        header = None
+
+    try:
+        for piece in _pieces(stream):
+            if header is not None:
+                if len(header) < MAX_HEADER_BYTES:
+                    header += piece
+            elif at_line_start:
+                if piece.startswith(b"diff --git "):
+                    if current is not None:
+                        current.end = offset
+                    header, header_start = bytearray(piece), offset
+                    in_hunk = False
+                elif current is not None:
+                    if piece.startswith(b"@@"):
+                        current.hunks += 1
+                        in_hunk = True
+                    elif in_hunk and piece.startswith(b"+"):
+                        current.added += 1
+                    elif in_hunk and piece.startswith(b"-"):
+                        current.removed += 1
+                    elif piece.startswith((b"Binary files ", b"GIT binary patch")):
+                        current.binary = True
+            spool.write(piece)
+            offset += len(piece)
+            at_line_start = piece.endswith(b"\n")
+            if header is not None and at_line_start:
+                open_file()
+        if header is not None:
+            open_file()
+    except BaseException:
+        spool.close()
+        raise
+    if current is not None:
+        current.end = offset
+    preamble_end = files[0].start if files else offset
+    return DiffIndex(spool, files, offset, preamble_end)
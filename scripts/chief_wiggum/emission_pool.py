@@ -0,0 +1,89 @@
+"""Process-pool per-file emission for the gate scanners.
+
+``check_traceability.py`` and ``check_single_writer.py`` split scanning into
+per-file **emission** (a pure function of one file's path + content) and a
+report-time **claim** join (see ``chief_wiggum.findings_cache``). The #327
+cache makes a WARM run cheap; a COLD run — a fresh clone, a scanner edit that
+busts every cache entry, a big codegen step — still reads and emits every
+candidate file on one core. Because emission is pure per file, it shards
+trivially: this module fans the cache MISSES out across a process pool and
+hands the results back in the exact order they were requested.
+
+What this module deliberately does NOT own:
+
+- **which files are visited** — the caller's candidate list (full walk or the
+  ``--changed-since`` set) is passed in unchanged; a pool never narrows it.
+- **the cache** — ``findings_cache.load``/``store`` stay in the calling
+  process, so a hit is validated and a success is stored exactly as on the
+  serial path (workers never touch the cache directory).
+- **the claim** — workers return plain emission dicts; the join against the
+  epic's IDs/invariants runs in the caller, over every fact, every run.
+
+Determinism is the contract: ``emit_files`` returns one result per input path
+in INPUT order regardless of which worker finished first, so the assembled
+report (annotation order, ``unscanned`` order, writer order) is byte-identical
+to the serial path's. A ``skip_reason`` travels back with its path, so a file
+that could not be read lands in ``unscanned`` in the same position it would
+have serially.
+
+Worker count: ``CW_SCAN_WORKERS`` (each checker's ``--jobs N`` flag sets it for
+its own process). Unset means one worker per CPU; ``1`` forces the serial
+path. Below ``MIN_PARALLEL_FILES`` misses the pool is skipped outright — its
+startup cost exceeds the work on a small or mostly-cached scan. A pool that
+cannot start at all (no ``sem_open`` in a sandbox, a worker killed by the OOM
+killer) degrades to the serial path rather than failing the gate: emission is
+pure, so re-running it in-process is always safe.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+
+WORKERS_ENV = "CW_SCAN_WORKERS"
+
+# Fewer cache misses than this and the pool's fork/import cost dominates —
+# emit in-process instead.
+MIN_PARALLEL_FILES = 64
+
+# ``(findings, skip_reason)`` for one file: ``findings`` is the list of plain
+# emission dicts (the same payload ``findings_cache.store`` persists) when the
+# file was read, ``skip_reason`` the ``read_text_safe`` reason when it was not.
+EmitResult = tuple[list[dict] | None, str | None]
+EmitOne = Callable[[str, str], EmitResult]
+
+
+def workers() -> int:
+    """Configured worker count: ``CW_SCAN_WORKERS`` when set to a positive
+    integer, otherwise one per CPU. A malformed value falls back to serial
+    (``1``) — a typo must never fan out more processes than asked for."""
+    raw = os.environ.get(WORKERS_ENV, "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            return 1
+    return os.cpu_count() or 1
+
+
+def emit_files(
+    root: str, rels: Sequence[str], emit_one: EmitOne, *, max_workers: int | None = None
+) -> list[EmitResult]:
+    """``[emit_one(root, rel) for rel in rels]``, sharded across a process pool
+    when there is enough work to pay for one. ``emit_one`` must be a
+    module-level (picklable) function; results come back in ``rels`` order."""
+    n = workers() if max_workers is None else max(1, max_workers)
+    if n <= 1 or len(rels) < MIN_PARALLEL_FILES:
+        return [emit_one(root, rel) for rel in rels]
+    n = min(n, len(rels))
+    # A few chunks per worker: big enough to amortize IPC per file, small
+    # enough that one slow shard (a huge generated file) doesn't idle the rest.
+    chunksize = max(1, len(rels) // (n * 4))
+    try:
+        with ProcessPoolExecutor(max_workers=n) as pool:
+            return list(pool.map(emit_one, repeat(root), rels, chunksize=chunksize))
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        return [emit_one(root, rel) for rel in rels]
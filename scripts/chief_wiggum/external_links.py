@@ -25,7 +25,10 @@ Symbol anchoring is TIERED (settled in #213 — reuse, don't reimplement):
   verifier-hash span discipline and needs no server spin-up.
 - **lsp** — languages with a configured, installed language server
   (``chief_wiggum.lsp.SERVERS``; gopls today) resolve via
-  ``textDocument/documentSymbol``.
+  ``textDocument/documentSymbol`` — one request per file, answered by a
+  running LSP broker's warm server (``chief_wiggum.lsp_broker``) or by one
+  session per server held for the whole run (``lsp.LspPool``), never a cold
+  start per link.
 - **regex** — remaining known extensions (``config/languages.json`` tier-1 +
   generic tier) fall back to the emitters' declaration regexes via
   ``chief_wiggum.write_emission._decl_name`` — the EXACT per-line dispatch
@@ -48,6 +51,8 @@ import argparse
 import ast
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path, PurePosixPath
@@ -58,7 +63,7 @@ if __package__ in (None, ""):  # direct CLI invocation: put scripts/ on the path
 import artifacts  # noqa: E402 — meta resolver (head_sha version binding, #213)
 
 from chief_wiggum import languages as cw_languages  # noqa: E402
-from chief_wiggum import lsp  # noqa: E402
+from chief_wiggum import lsp, lsp_broker  # noqa: E402
 from chief_wiggum.trace_ids import canonical_id  # noqa: E402
 from chief_wiggum.trace_links import load_sidecar, write_sidecar  # noqa: E402
 
@@ -98,16 +103,12 @@ class SymbolSpan:
 # --- tiered symbol resolution -----------------------------------------------------
 
 
-def _ast_span(text: str, symbol: str) -> tuple[SymbolSpan | None, str | None]:
+def _ast_match(
+    quals: list, lines: list[str], symbol: str
+) -> tuple[SymbolSpan | None, str | None]:
     """Python tier: verifier_hashes' qualified-function spans. ``symbol`` may be
     the full qualified name (``TestA.test_it``) or a bare name that matches
     exactly one function."""
-    try:
-        tree = ast.parse(text)
-    except SyntaxError as exc:
-        return None, f"python syntax error: {exc}"
-    lines = text.splitlines()
-    quals = _qualified_functions(tree)
     matches = [(q, span) for _n, q, span in quals if q == symbol]
     if not matches:
         matches = [(q, span) for _n, q, span in quals if q.split(".")[-1] == symbol]
@@ -122,16 +123,12 @@ def _ast_span(text: str, symbol: str) -> tuple[SymbolSpan | None, str | None]:
     return SymbolSpan(start, end, "ast", _hash_span(lines, start, end)), None
 
 
-def _regex_span(
-    lines: list[str], symbol: str, suffix: str | None = None
+def _regex_match(
+    decls: list[tuple[int, str]], lines: list[str], symbol: str
 ) -> tuple[SymbolSpan | None, str | None]:
     """Regex tier: the span runs from the symbol's declaration line to the line
     before the next declaration (or EOF), trailing blanks trimmed — the same
-    block semantics as ``hashing.hash_markdown_defs``. ``suffix`` is threaded
-    through to ``write_emission._decl_name`` so a suffix-gated regex (C#'s
-    CS_FUNC_RE) is dispatched exactly like ``_enclosing_symbol`` does — never
-    a parallel gating decision (chief-wiggum#313)."""
-    decls = [(i, name) for i, line in enumerate(lines) if (name := _decl_name(line, suffix))]
+    block semantics as ``hashing.hash_markdown_defs``."""
     hits = [idx for idx, (i, name) in enumerate(decls) if name == symbol]
     if not hits:
         return None, f"symbol {symbol!r} not found (regex tier)"
@@ -165,20 +162,73 @@ def _flatten_symbols(items: list, prefix: str = "") -> list[tuple[str, int, int]
     return out
 
 
-def _lsp_span(root: Path, full: Path, symbol: str, lines: list[str]) -> SymbolSpan | None:
+class _LspSymbols:
+    """The run's LSP tier: one ``documentSymbol`` round trip per file, however
+    many links anchor in it, answered by an already-running LSP broker
+    (``lsp_broker`` — warm servers shared across runs; never started from
+    here) or else by one pooled session per server for this run
+    (``lsp.LspPool``). ``None`` for a file means the tier has nothing to say
+    (no server installed, server failed, request errored) — callers fall
+    through."""
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+        self._pool = lsp.LspPool(root)
+        self._lock = threading.Lock()
+        self._by_file: dict[Path, list[tuple[str, int, int]] | None] = {}
+        self._broker: Path | None | bool = False  # False: not probed yet
+
+    def _broker_socket(self) -> Path | None:
+        with self._lock:
+            if self._broker is False:
+                sock = lsp_broker.default_socket_path()
+                alive = lsp_broker.request(sock, {"op": "ping"}, timeout=2.0)
+                self._broker = sock if alive and not alive.get("stale") else None
+            return self._broker
+
+    def _from_broker(self, full: Path) -> list[tuple[str, int, int]] | None:
+        sock = self._broker_socket()
+        if sock is None:
+            return None
+        reply = lsp_broker.query(sock, {
+            "op": "symbols", "root": str(self._root.resolve()), "file": str(full.resolve()),
+        })
+        if reply is None or not reply.get("available"):
+            return None
+        return _flatten_symbols(reply.get("result") or [])
+
+    def symbols(self, full: Path, text: str) -> list[tuple[str, int, int]] | None:
+        with self._lock:
+            if full in self._by_file:
+                return self._by_file[full]
+        flat = None
+        server = lsp.server_for_file(full)
+        if server is not None and lsp.server_available(server):
+            flat = self._from_broker(full)
+            if flat is None:
+                try:
+                    client = self._pool.client(server)
+                    with client.document(full, text):
+                        flat = _flatten_symbols(client.document_symbols(full))
+                except lsp.LspError:
+                    flat = None
+        with self._lock:
+            self._by_file[full] = flat
+        return flat
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+def _lsp_span(
+    sessions: _LspSymbols, full: Path, text: str, lines: list[str], symbol: str
+) -> SymbolSpan | None:
     """LSP tier. Returns None (fall through to the regex tier) when no server is
     configured/installed, the server errors, or the symbol isn't uniquely
     matched — the native tiers own the not-found/ambiguous REPORTING."""
-    server = lsp.server_for_file(full)
-    if server is None or not lsp.server_available(server):
-        return None
-    try:
-        with lsp.LspClient(server, root) as client:
-            client.did_open(full)
-            symbols = client.document_symbols(full)
-    except lsp.LspError:
+    flat = sessions.symbols(full, text)
+    if flat is None:
         return None
-    flat = _flatten_symbols(symbols)
     matches = [s for s in flat if s[0] == symbol]
     if not matches:
         matches = [s for s in flat if s[0].split(".")[-1] == symbol]
@@ -190,6 +240,104 @@ def _lsp_span(root: Path, full: Path, symbol: str, lines: list[str]) -> SymbolSp
     return SymbolSpan(start, end, "lsp", _hash_span(lines, start, end))
 
 
+class _SourceFile:
+    """One target file, read once; each tier's parse of it is built on first
+    use and shared by every symbol anchored in the file."""
+
+    def __init__(self, full: Path, text: str) -> None:
+        self.full = full
+        self.text = text
+        self.lines = text.splitlines()
+        self.suffix = full.suffix
+        self._ast: tuple[list | None, str | None] | None = None
+        self._decls: list[tuple[int, str]] | None = None
+
+    def ast(self) -> tuple[list | None, str | None]:
+        if self._ast is None:
+            try:
+                self._ast = (_qualified_functions(ast.parse(self.text)), None)
+            except SyntaxError as exc:
+                self._ast = (None, f"python syntax error: {exc}")
+        return self._ast
+
+    def decls(self) -> list[tuple[int, str]]:
+        # ``suffix`` is threaded through to ``write_emission._decl_name`` so a
+        # suffix-gated regex (C#'s CS_FUNC_RE) is dispatched exactly like
+        # ``_enclosing_symbol`` does — never a parallel gating decision
+        # (chief-wiggum#313).
+        if self._decls is None:
+            self._decls = [
+                (i, name) for i, line in enumerate(self.lines)
+                if (name := _decl_name(line, self.suffix))
+            ]
+        return self._decls
+
+
+class SymbolResolver:
+    """Resolves many ``relpath :: symbol`` anchors against one target tree.
+
+    ``verify_links`` used to resolve each stored link from scratch: re-read
+    and re-parse its file, and — for an LSP-tier language — cold-start a
+    whole language server per link. A resolver reads and parses each file
+    once (whatever the number of symbols anchored in it) and holds one LSP
+    session per server for its lifetime. Results are identical to a
+    one-shot ``resolve_symbol_span``; use as a context manager so the
+    sessions are shut down. Safe to share across threads, provided one file
+    is not resolved from two threads at once (``verify_links`` groups by
+    file, so it never is).
+    """
+
+    def __init__(self, target: str | Path, *, use_lsp: bool = True) -> None:
+        self.root = Path(target)
+        self._lsp = _LspSymbols(self.root) if use_lsp else None
+        self._files: dict[str, _SourceFile | str] = {}
+
+    def _file(self, relpath: str) -> _SourceFile | str:
+        cached = self._files.get(relpath)
+        if cached is None:
+            full = self.root / relpath
+            if not full.is_file():
+                cached = f"file not found: {relpath}"
+            else:
+                try:
+                    cached = _SourceFile(full, full.read_text(errors="replace"))
+                except OSError as exc:
+                    cached = f"cannot read {relpath}: {exc}"
+            self._files[relpath] = cached
+        return cached
+
+    def resolve(self, relpath: str, symbol: str) -> tuple[SymbolSpan | None, str | None]:
+        """See ``resolve_symbol_span`` — same tiers, same answers."""
+        source = self._file(relpath)
+        if isinstance(source, str):
+            return None, source
+        if source.suffix == ".py":
+            quals, error = source.ast()
+            if quals is None:
+                return None, error
+            return _ast_match(quals, source.lines, symbol)
+        if self._lsp is not None:
+            span = _lsp_span(self._lsp, source.full, source.text, source.lines, symbol)
+            if span is not None:
+                return span, None
+        if source.suffix in cw_languages.all_known_extensions():
+            return _regex_match(source.decls(), source.lines, symbol)
+        return None, (
+            f"no symbol-resolution tier for {source.suffix or '(no extension)'} files "
+            "(no LSP server, no regex tier — see config/languages.json)"
+        )
+
+    def close(self) -> None:
+        if self._lsp is not None:
+            self._lsp.close()
+
+    def __enter__(self) -> SymbolResolver:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 def resolve_symbol_span(
     target: str | Path, relpath: str, symbol: str, *, use_lsp: bool = True
 ) -> tuple[SymbolSpan | None, str | None]:
@@ -199,30 +347,11 @@ def resolve_symbol_span(
     reason is ALWAYS given on failure so callers can surface it (skip-with-
     warning, never a silent drop). Tier order: Python ast (native, exact),
     then LSP where a server is installed, then the emitters' declaration-regex
-    tier, then unresolved.
+    tier, then unresolved. For more than one anchor, hold a
+    :class:`SymbolResolver` instead.
     """
-    root = Path(target)
-    full = root / relpath
-    if not full.is_file():
-        return None, f"file not found: {relpath}"
-    try:
-        text = full.read_text(errors="replace")
-    except OSError as exc:
-        return None, f"cannot read {relpath}: {exc}"
-    lines = text.splitlines()
-    suffix = full.suffix
-    if suffix == ".py":
-        return _ast_span(text, symbol)
-    if use_lsp:
-        span = _lsp_span(root, full, symbol, lines)
-        if span is not None:
-            return span, None
-    if suffix in cw_languages.all_known_extensions():
-        return _regex_span(lines, symbol, suffix)
-    return None, (
-        f"no symbol-resolution tier for {suffix or '(no extension)'} files "
-        "(no LSP server, no regex tier — see config/languages.json)"
-    )
+    with SymbolResolver(target, use_lsp=use_lsp) as resolver:
+        return resolver.resolve(relpath, symbol)
 
 
 # --- store ------------------------------------------------------------------------
@@ -305,8 +434,32 @@ def add_link(
     return entry, ("; ".join(warnings) or None)
 
 
+def _verify_entry(resolver: SymbolResolver, entry: dict) -> tuple[str, dict]:
+    """Classify one well-formed stored link as ``ok``/``suspect``/``unresolved``."""
+    span, reason = resolver.resolve(entry["file"], entry["symbol"])
+    if span is None:
+        return "unresolved", {**entry, "reason": reason}
+    recorded = entry.get("symbol_hash")
+    if not recorded:
+        return "unresolved", {
+            **entry,
+            "reason": "recorded without a symbol hash (no resolution tier at add time) — re-add to anchor",
+        }
+    enriched = {**entry, "line": span.line, "tier": span.tier}
+    if span.hash == recorded:
+        return "ok", enriched
+    return "suspect", {**enriched, "current_hash": span.hash}
+
+
+# Files re-anchored concurrently by ``verify_links``. The ast/regex tiers are
+# CPU-bound and gain little; the win is overlapping file reads with the LSP
+# tier's round trips to the pooled sessions.
+DEFAULT_JOBS = 8
+
+
 def verify_links(
-    store_path: str | Path, target: str | Path, *, use_lsp: bool = True
+    store_path: str | Path, target: str | Path, *, use_lsp: bool = True,
+    jobs: int = DEFAULT_JOBS,
 ) -> dict:
     """Re-anchor every stored link against the target's CURRENT source.
 
@@ -321,34 +474,36 @@ def verify_links(
     - **unresolved** — the file/symbol can no longer be resolved (or the entry
       was recorded without a hash, or is malformed); entries gain ``reason``.
       Surfaced, never dropped.
+
+    Links are grouped by file and each file is resolved by one worker of a
+    ``jobs``-bounded pool, against one :class:`SymbolResolver` for the run —
+    each file is read and parsed once, and each language server is started
+    once. The result does not depend on ``jobs``.
     """
     result: dict[str, list[dict]] = {"ok": [], "suspect": [], "unresolved": []}
+    by_file: dict[str, list[dict]] = {}
     for entry in load_links(store_path).get("links", []):
         if not isinstance(entry, dict):
             continue
         rel, symbol, verb = entry.get("file"), entry.get("symbol"), entry.get("verb")
         if not rel or not symbol or verb not in VERBS or not entry.get("ids"):
-            result["unresolved"].append({
-                **(entry if isinstance(entry, dict) else {}),
-                "reason": "malformed entry (file/symbol/verb/ids required)",
-            })
-            continue
-        span, reason = resolve_symbol_span(target, rel, symbol, use_lsp=use_lsp)
-        if span is None:
-            result["unresolved"].append({**entry, "reason": reason})
-            continue
-        recorded = entry.get("symbol_hash")
-        if not recorded:
             result["unresolved"].append({
                 **entry,
-                "reason": "recorded without a symbol hash (no resolution tier at add time) — re-add to anchor",
+                "reason": "malformed entry (file/symbol/verb/ids required)",
             })
             continue
-        enriched = {**entry, "line": span.line, "tier": span.tier}
-        if span.hash == recorded:
-            result["ok"].append(enriched)
-        else:
-            result["suspect"].append({**enriched, "current_hash": span.hash})
+        by_file.setdefault(rel, []).append(entry)
+
+    with SymbolResolver(target, use_lsp=use_lsp) as resolver:
+
+        def verify_file(entries: list[dict]) -> list[tuple[str, dict]]:
+            return [_verify_entry(resolver, e) for e in entries]
+
+        groups = list(by_file.values())
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(groups) or 1))) as pool:
+            for group in pool.map(verify_file, groups):
+                for bucket, item in group:
+                    result[bucket].append(item)
     for key in result:
         result[key].sort(key=_sort_key)
     return result
@@ -403,6 +558,8 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument("store", help="path to external-links.json")
     p.add_argument("--target", required=True, help="target repo root to verify against")
     p.add_argument("--no-lsp", action="store_true", help="skip the LSP tier")
+    p.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                   help=f"files re-anchored concurrently (default {DEFAULT_JOBS})")
 
     args = parser.parse_args(argv)
 
@@ -426,7 +583,7 @@ def main(argv: list[str] | None = None) -> int:
     # measured denominator (chief-wiggum#313 item 3) is printed unconditionally
     # so a fully-broken store is visible even to a human skimming the counts,
     # not just to a downstream gate that checks "applicability".
-    result = verify_links(args.store, args.target, use_lsp=not args.no_lsp)
+    result = verify_links(args.store, args.target, use_lsp=not args.no_lsp, jobs=args.jobs)
     counts = {k: len(v) for k, v in result.items()}
     total = sum(counts.values())
     anchored = counts["ok"] + counts["suspect"]
@@ -53,6 +53,28 @@ always re-attempts on the next run rather than caching an absence (#289: a
 broken scanner must re-run and still report ``error``, never a cached
 false-clean).
 
+**Packed storage.** Entries live in ONE SQLite database per repo
+(``<cache root>/<repo id>.sqlite3``), keyed by the full ``(engine, rel,
+blob_sha, scanner_hash)`` tuple — no truncated digest, so no near-collision
+to defend against. The scanners use the bulk APIs: ``load_many`` serves a
+whole scan's hits from one query, ``store_many`` persists every fresh
+emission in one transaction (atomic — a crash mid-write leaves the previous
+committed state, never a torn entry). A warm 40k-file run is one ``SELECT``,
+not 40k ``open``/``json.loads`` calls, and the cache directory holds one file
+per repo instead of one inode per (file, content, scanner version). The
+per-entry JSON directories an older version left behind are removed the
+first time a repo's database is created.
+
+**Bounded size.** Every scanner edit starts a new ``(engine,
+scanner_hash)`` generation and orphans that engine's previous one wholesale.
+After a write pushes the database past ``CW_FINDINGS_CACHE_MAX_BYTES``
+(default ``DEFAULT_MAX_BYTES``), stale generations are evicted whole, least
+recently used first — but each engine's most recent generation is never
+stale, so a traceability run cannot evict single-writer's live entries (or
+vice versa); only if the database is still over budget are the writing
+engine's own least-recently-used live entries dropped. Eviction only ever
+turns a would-be hit into a miss — a re-scan, never a wrong answer.
+
 Escape hatch: ``CW_FINDINGS_NO_CACHE=1`` disables both the read and the write
 (each checker's own ``--no-cache`` CLI flag sets it for its own process) — the
 dual-run (cached vs ``--no-cache``) zero-diff is the validation gate for this
@@ -67,10 +89,37 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import shutil
+import sqlite3
+import time
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 
+from chief_wiggum import sqlite_store
+
 NO_CACHE_ENV = "CW_FINDINGS_NO_CACHE"
 CACHE_DIR_ENV = "CW_FINDINGS_CACHE_DIR"
+MAX_BYTES_ENV = "CW_FINDINGS_CACHE_MAX_BYTES"
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# A hit refreshes its entry's LRU stamp at most this often — a warm run
+# should not rewrite every row it reads just to move a timestamp by seconds.
+_TOUCH_GRANULARITY_S = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS findings (
+    engine       TEXT    NOT NULL,
+    rel          TEXT    NOT NULL,
+    blob_sha     TEXT    NOT NULL,
+    scanner_hash TEXT    NOT NULL,
+    findings     TEXT    NOT NULL,
+    size         INTEGER NOT NULL,
+    last_used    INTEGER NOT NULL,
+    PRIMARY KEY (engine, scanner_hash, rel, blob_sha)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS findings_lru ON findings (scanner_hash, last_used);
+"""
 
 
 def disabled() -> bool:
@@ -87,57 +136,181 @@ def _root() -> Path:
     return root
 
 
-def _entry_path(repo: str, engine: str, rel: str, blob_sha: str, scanner_hash: str) -> Path:
-    repo_id = hashlib.sha256(os.path.abspath(repo).encode()).hexdigest()[:16]
-    digest = hashlib.sha256(f"{rel}\x00{blob_sha}\x00{scanner_hash}".encode()).hexdigest()[:24]
-    d = _root() / repo_id / engine
-    d.mkdir(parents=True, exist_ok=True)
-    return d / f"{digest}.json"
+def _repo_id(repo: str) -> str:
+    return hashlib.sha256(os.path.abspath(repo).encode()).hexdigest()[:16]
+
+
+def _db_path(repo: str) -> Path:
+    return _root() / f"{_repo_id(repo)}.sqlite3"
+
+
+def _max_bytes() -> int:
+    try:
+        return max(0, int(os.environ.get(MAX_BYTES_ENV, "")))
+    except ValueError:
+        return DEFAULT_MAX_BYTES
+
+
+def _connect(repo: str, *, create: bool) -> sqlite3.Connection | None:
+    """The repo's cache database (``sqlite_store.open_store``), or ``None``
+    when there is none to read (``create=False`` and absent or unreadable)
+    or it cannot be opened at all."""
+    try:
+        path = _db_path(repo)
+    except OSError:
+        return None
+    if create and not path.is_file():
+        # The pre-SQLite layout: one JSON file per entry under <repo id>/.
+        shutil.rmtree(path.with_suffix(""), ignore_errors=True)
+    return sqlite_store.open_store(path, _SCHEMA, create=create)
+
+
+def load_many(
+    repo: str, engine: str, scanner_hash: str, blobs: Mapping[str, str]
+) -> dict[str, list[dict]]:
+    """Cached findings for every ``rel -> blob_sha`` in ``blobs`` that has a
+    valid entry under ``scanner_hash``: ``{rel: [finding dict, ...]}``. Paths
+    with no entry — or an unreadable/corrupt one — are simply absent from the
+    result (never raises: a broken cache degrades to a fresh scan)."""
+    if disabled() or not blobs:
+        return {}
+    conn = _connect(repo, create=False)
+    if conn is None:
+        return {}
+    out: dict[str, list[dict]] = {}
+    stale: list[tuple[str, str]] = []
+    now = int(time.time())
+    try:
+        rows = conn.execute(
+            "SELECT rel, blob_sha, findings, last_used FROM findings"
+            " WHERE engine = ? AND scanner_hash = ?",
+            (engine, scanner_hash),
+        )
+        for rel, blob_sha, payload, last_used in rows:
+            if blobs.get(rel) != blob_sha:
+                continue
+            try:
+                findings = json.loads(payload)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(findings, list):
+                continue
+            out[rel] = findings
+            if last_used < now - _TOUCH_GRANULARITY_S:
+                stale.append((rel, blob_sha))
+        if stale:
+            with conn:
+                conn.executemany(
+                    "UPDATE findings SET last_used = ? WHERE engine = ? AND scanner_hash = ?"
+                    " AND rel = ? AND blob_sha = ?",
+                    [(now, engine, scanner_hash, rel, sha) for rel, sha in stale],
+                )
+    except sqlite3.Error:
+        # A locked database only loses the LRU refresh; anything worse loses
+        # the hits too. Either way the caller re-scans what it didn't get.
+        pass
+    finally:
+        conn.close()
+    return out
 
 
 def load(repo: str, engine: str, rel: str, blob_sha: str, scanner_hash: str) -> list[dict] | None:
     """Cached findings — a list of plain dicts, one per emitted fact — for
     ``(rel, blob_sha, scanner_hash)``, or ``None`` on a miss: disabled,
-    absent, unreadable/corrupt, or a defensive key mismatch (never raises —
-    a broken cache entry degrades to a fresh scan, never a crash)."""
+    absent, or unreadable/corrupt (never raises — a broken cache entry
+    degrades to a fresh scan, never a crash). Single-key form of
+    ``load_many``."""
+    return load_many(repo, engine, scanner_hash, {rel: blob_sha}).get(rel)
+
+
+def store_many(
+    repo: str, engine: str, scanner_hash: str,
+    entries: Iterable[tuple[str, str, list[dict]]],
+) -> None:
+    """Best-effort, single-transaction write of GENUINE emission successes —
+    ``(rel, blob_sha, findings)`` triples. Callers must never include a file
+    that could not be read, or whose emission raised — only output the
+    scanner actually produced. A cache that can't be written (read-only FS,
+    disk full, a lock held past the timeout) must never fail the scan it
+    memoizes; the transaction either commits whole or not at all."""
     if disabled():
-        return None
-    path = _entry_path(repo, engine, rel, blob_sha, scanner_hash)
-    if not path.is_file():
-        return None
+        return
+    now = int(time.time())
+    rows = []
+    for rel, blob_sha, findings in entries:
+        payload = json.dumps(findings)
+        rows.append((engine, rel, blob_sha, scanner_hash, payload, len(payload), now))
+    if not rows:
+        return
+    conn = _connect(repo, create=True)
+    if conn is None:
+        return
     try:
-        data = json.loads(path.read_text())
-    except (OSError, json.JSONDecodeError):
-        return None
-    if not isinstance(data, dict):
-        return None
-    # The filename digest already encodes all three fields; this re-check
-    # guards a truncated-hash near-collision or a hand-edited file — treat
-    # either as a miss rather than risk serving a finding for the wrong key.
-    if (
-        data.get("rel") != rel
-        or data.get("blob_sha") != blob_sha
-        or data.get("scanner_hash") != scanner_hash
-    ):
-        return None
-    findings = data.get("findings")
-    return findings if isinstance(findings, list) else None
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO findings"
+                " (engine, rel, blob_sha, scanner_hash, findings, size, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            _evict(conn, engine, scanner_hash, _max_bytes())
+    except sqlite3.Error:
+        pass
+    finally:
+        conn.close()
 
 
 def store(
     repo: str, engine: str, rel: str, blob_sha: str, scanner_hash: str, findings: list[dict]
 ) -> None:
-    """Best-effort write of a GENUINE emission success. Callers must never
-    call this for a file that could not be read, or whose emission raised —
-    only for output the scanner actually produced. A cache that can't be
-    written (read-only FS, disk full) must never fail the scan it memoizes."""
-    if disabled():
+    """Single-entry form of ``store_many`` — same contract: only ever for
+    output the scanner actually produced."""
+    store_many(repo, engine, scanner_hash, [(rel, blob_sha, findings)])
+
+
+def _evict(conn: sqlite3.Connection, engine: str, live_hash: str, budget: int) -> None:
+    """Bring the stored payload under ``budget`` bytes. A generation is one
+    ``(engine, scanner_hash)`` pair — the two gate scanners version
+    independently, so one engine's live generation is never "stale" just
+    because another engine wrote last. Stale generations go first, whole,
+    least recently used first; every engine's most recently used generation
+    is spared, as is the caller's live one. Only if that still leaves the
+    database over budget are the caller's OWN least-recently-used live
+    entries dropped — a writer never trims another engine's working set.
+    Runs inside the caller's transaction."""
+    (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM findings").fetchone()
+    if total <= budget:
         return
-    path = _entry_path(repo, engine, rel, blob_sha, scanner_hash)
-    try:
-        path.write_text(json.dumps({
-            "rel": rel, "blob_sha": blob_sha, "scanner_hash": scanner_hash,
-            "findings": findings,
-        }))
-    except OSError:
-        pass
+    generations = conn.execute(
+        "SELECT engine, scanner_hash, SUM(size), MAX(last_used) FROM findings"
+        " GROUP BY engine, scanner_hash ORDER BY MAX(last_used), engine, scanner_hash"
+    ).fetchall()
+    newest: dict[str, str] = {}
+    for gen_engine, gen_hash, _size, _last_used in generations:
+        newest[gen_engine] = gen_hash  # ascending last_used: the last one wins
+    newest[engine] = live_hash
+    for gen_engine, gen_hash, size, _last_used in generations:
+        if total <= budget:
+            return
+        if newest[gen_engine] == gen_hash:
+            continue
+        conn.execute(
+            "DELETE FROM findings WHERE engine = ? AND scanner_hash = ?", (gen_engine, gen_hash)
+        )
+        total -= size
+    if total <= budget:
+        return
+    doomed: list[tuple[str, str]] = []
+    for rel, blob_sha, size in conn.execute(
+        "SELECT rel, blob_sha, size FROM findings WHERE engine = ? AND scanner_hash = ?"
+        " ORDER BY last_used, rel, blob_sha",
+        (engine, live_hash),
+    ):
+        if total <= budget:
+            break
+        doomed.append((rel, blob_sha))
+        total -= size
+    conn.executemany(
+        "DELETE FROM findings WHERE engine = ? AND scanner_hash = ? AND rel = ? AND blob_sha = ?",
+        [(engine, live_hash, rel, blob_sha) for rel, blob_sha in doomed],
+    )
@@ -0,0 +1,288 @@
+"""Sidecar byte-offset index for the append-only factory telemetry log.
+
+``factory_log.py``'s ledger is one JSON object per line, appended forever
+under ``CW_TELEMETRY=1``. Every reader used to ``read_text()`` the whole file
+and ``json.loads`` every line — ``aggregate --repo`` to keep one repo's
+records, ``cost-report`` to keep the ``claude_code`` turns, the transcript
+ingest to collect already-ingested request ids. After months of telemetry
+that is hundreds of MB parsed (and held in memory) to answer a question about
+a few thousand lines.
+
+**What is stored.** A SQLite file next to the log (``<log>.idx``) holding,
+per complete line, its byte offset (``pos``) and the four fields readers
+filter on — ``ts``, ``event``, ``repo``, ``ticket`` — plus the set of
+``claude_code`` ``request_id``s (the transcript ingest's dedup key) and the
+ingest's per-transcript resume checkpoints. A time window is a range
+scan on ``ts``, so "by day" needs no separate column. The log stays the only
+source of truth: a filtered read asks the index for matching offsets, seeks
+to each, and parses just those lines — and the caller re-applies its own
+predicate to every parsed record, so the index can only ever narrow what is
+read, never decide what matches.
+
+**Incremental.** ``meta`` records how many bytes of the log are indexed and a
+fingerprint of its head. Each use indexes only the complete lines appended
+since (a trailing line with no newline is a write in flight and is left for
+the next catch-up — readers scan that unindexed tail live). A log that shrank
+or whose head changed was rotated or rewritten, so the index is emptied and
+rebuilt from byte 0. Writers never touch the index: ``_append`` stays one
+``open("a")``, and the next reader pays for exactly the delta.
+
+Derived data, so every failure degrades rather than fails: a corrupt file is
+deleted and rebuilt, and an index that cannot be opened at all (read-only
+directory, no space) makes ``offsets``/``request_ids`` return ``None`` — the
+caller's signal to stream the log linearly, the pre-index behaviour.
+``CW_FACTORY_LOG_NO_INDEX=1`` forces that path."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+
+from chief_wiggum import sqlite_store
+
+NO_INDEX_ENV = "CW_FACTORY_LOG_NO_INDEX"
+SUFFIX = ".idx"
+
+# Bytes of the log's head hashed into the rewrite fingerprint. A rotation or
+# rewrite that keeps the same first 4 KiB AND grows past the indexed length is
+# not an append-only log any more; nothing in CW writes one.
+_HEAD_BYTES = 4096
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS records (
+    pos    INTEGER PRIMARY KEY,
+    ts     REAL,
+    event  TEXT,
+    repo   TEXT,
+    ticket TEXT
+);
+CREATE INDEX IF NOT EXISTS records_ts ON records (ts);
+CREATE INDEX IF NOT EXISTS records_event_ts ON records (event, ts);
+CREATE INDEX IF NOT EXISTS records_repo_ts ON records (repo, ts);
+CREATE INDEX IF NOT EXISTS records_ticket ON records (ticket);
+CREATE TABLE IF NOT EXISTS request_ids (
+    id TEXT PRIMARY KEY
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS transcripts (
+    path          TEXT PRIMARY KEY,
+    inode         INTEGER NOT NULL,
+    pos           INTEGER NOT NULL,
+    tail          TEXT NOT NULL,
+    since_skipped REAL
+) WITHOUT ROWID;
+"""
+
+
+def disabled() -> bool:
+    """True when the escape hatch is set — any non-empty, non-"0" value."""
+    return os.environ.get(NO_INDEX_ENV, "") not in ("", "0")
+
+
+def sidecar_path(log: Path) -> Path:
+    return log.with_name(log.name + SUFFIX)
+
+
+def _connect(log: Path) -> sqlite3.Connection | None:
+    return sqlite_store.open_store(sidecar_path(log), _SCHEMA, isolation_level=None)
+
+
+def _head(fh, size: int) -> str:
+    fh.seek(0)
+    return hashlib.sha256(fh.read(min(size, _HEAD_BYTES))).hexdigest()
+
+
+def _text(value) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+def _ts(value) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _catch_up(conn: sqlite3.Connection, log: Path) -> int:
+    """Index every complete line appended since the last catch-up and return
+    the indexed length — the byte offset from which the log is unindexed.
+    One write transaction, so two readers catching up at once serialize and
+    the second finds nothing left to do."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        meta = dict(conn.execute("SELECT key, value FROM meta"))
+        indexed = int(meta.get("indexed_bytes", "0"))
+        with log.open("rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if indexed and (size < indexed or _head(fh, indexed) != meta.get("head")):
+                conn.execute("DELETE FROM records")
+                conn.execute("DELETE FROM request_ids")
+                # A transcript checkpoint says "these turns are in THIS log";
+                # a rotated log no longer holds them, so re-read from byte 0.
+                conn.execute("DELETE FROM transcripts")
+                indexed = 0
+            fh.seek(indexed)
+            rows: list[tuple] = []
+            ids: list[tuple[str]] = []
+            offset = indexed
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    break  # a write in flight; the next catch-up takes it
+                start, offset = offset, offset + len(line)
+                try:
+                    r = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(r, dict):
+                    continue
+                ticket = r.get("ticket")
+                rows.append((start, _ts(r.get("ts")), _text(r.get("event")), _text(r.get("repo")),
+                             None if ticket is None else str(ticket)))
+                if r.get("event") == "claude_code" and isinstance(r.get("request_id"), str):
+                    ids.append((r["request_id"],))
+            if offset != int(meta.get("indexed_bytes", "-1")):
+                conn.executemany("INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?)", rows)
+                conn.executemany("INSERT OR IGNORE INTO request_ids VALUES (?)", ids)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [("indexed_bytes", str(offset)), ("head", _head(fh, offset))],
+                )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return offset
+
+
+def offsets(
+    log: Path,
+    *,
+    event: str | None = None,
+    repo: str | None = None,
+    ticket: str | None = None,
+    since: float | None = None,
+    until: float | None = None,
+) -> tuple[list[int], int] | None:
+    """``(offsets, indexed_bytes)``: the byte offset of every indexed line
+    whose fields match, in file order, and where the unindexed tail begins.
+    ``None`` when the index is disabled or unusable — stream the log instead."""
+    if disabled() or not log.is_file():
+        return None
+    conn = _connect(log)
+    if conn is None:
+        return None
+    try:
+        end = _catch_up(conn, log)
+        where: list[str] = []
+        params: list = []
+        for column, value in (("event", event), ("repo", repo), ("ticket", ticket)):
+            if value is not None:
+                where.append(f"{column} = ?")
+                params.append(str(value))
+        if since is not None:
+            where.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("ts <= ?")
+            params.append(until)
+        sql = "SELECT pos FROM records"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return [row[0] for row in conn.execute(sql + " ORDER BY pos", params)], end
+    except (OSError, sqlite3.Error):
+        return None
+    finally:
+        conn.close()
+
+
+def request_ids(log: Path) -> tuple[set[str], int] | None:
+    """``(ids, indexed_bytes)``: every ``claude_code`` ``request_id`` in the
+    indexed part of the log and where the unindexed tail begins (the caller
+    scans that tail itself), or ``None`` when the index is disabled or
+    unusable."""
+    if disabled() or not log.is_file():
+        return None
+    conn = _connect(log)
+    if conn is None:
+        return None
+    try:
+        end = _catch_up(conn, log)
+        return {row[0] for row in conn.execute("SELECT id FROM request_ids")}, end
+    except (OSError, sqlite3.Error):
+        return None
+    finally:
+        conn.close()
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """How far ``ingest_claude_transcripts`` has settled one transcript file.
+
+    Every line before ``pos`` was either ingested into THIS log, deduped, or
+    can never become a billable turn — except turns a ``since`` window
+    skipped, the newest of which is ``since_skipped``: a later run may resume
+    at ``pos`` only when its own ``since`` is past it (otherwise those turns
+    are back in its window and the file is re-read from byte 0). ``inode``
+    and ``tail`` (a hash of the bytes just before ``pos``) detect a file that
+    was replaced or rewritten rather than appended to."""
+
+    inode: int
+    pos: int
+    tail: str
+    since_skipped: float | None = None
+
+
+def transcript_checkpoints(log: Path) -> dict[str, Checkpoint]:
+    """Every stored checkpoint, keyed by transcript path. Empty when the
+    index is disabled or unusable, or the log does not exist yet — the
+    ingest then reads every transcript from byte 0, its pre-checkpoint
+    behaviour. Catches the index up first, so a rotated log has already
+    discarded its checkpoints."""
+    if disabled() or not log.is_file():
+        return {}
+    conn = _connect(log)
+    if conn is None:
+        return {}
+    try:
+        _catch_up(conn, log)
+        return {
+            path: Checkpoint(inode, pos, tail, since_skipped)
+            for path, inode, pos, tail, since_skipped in conn.execute(
+                "SELECT path, inode, pos, tail, since_skipped FROM transcripts"
+            )
+        }
+    except (OSError, sqlite3.Error):
+        return {}
+    finally:
+        conn.close()
+
+
+def store_transcript_checkpoints(log: Path, checkpoints: dict[str, Checkpoint]) -> None:
+    """Persist checkpoints AFTER their turns were appended to the log — a
+    crash in between leaves a checkpoint behind the log (re-read, deduped),
+    never ahead of it (a turn silently lost). Best effort: a failure only
+    costs the next ingest a longer read."""
+    if disabled() or not log.is_file() or not checkpoints:
+        return
+    conn = _connect(log)
+    if conn is None:
+        return
+    try:
+        _catch_up(conn, log)
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR REPLACE INTO transcripts (path, inode, pos, tail, since_skipped) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(path, cp.inode, cp.pos, cp.tail, cp.since_skipped) for path, cp in checkpoints.items()],
+            )
+    except (OSError, sqlite3.Error):
+        pass
+    finally:
+        conn.close()
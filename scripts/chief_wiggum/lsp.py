@@ -20,7 +20,8 @@ import shutil
 import subprocess
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -161,6 +162,17 @@ class LspClient:
         self._closed = False  # set when the transport dies (reader exits)
         self._lock = threading.Lock()
         self._cond = threading.Condition(self._lock)
+        # One writer at a time on stdin: a session shared across threads
+        # (LspPool) must never interleave two framed messages.
+        self._send_lock = threading.Lock()
+        # uri -> (version, text) of every document this session has open, so
+        # a long-lived session re-syncs an edited file instead of answering
+        # from the text it was first shown (sync_document).
+        self._docs: dict[str, tuple[int, str]] = {}
+        # uri -> how many ``document`` blocks hold it open right now; the
+        # last one out closes it (a pooled session shares documents).
+        self._holds: dict[str, int] = {}
+        self._docs_lock = threading.Lock()
 
     # -- transport --
     def start(self) -> None:
@@ -231,8 +243,9 @@ class LspClient:
     def _send(self, obj: dict) -> None:
         if not self._proc or not self._proc.stdin:
             raise LspError("server not started")
-        self._proc.stdin.write(encode_message(obj))
-        self._proc.stdin.flush()
+        with self._send_lock:
+            self._proc.stdin.write(encode_message(obj))
+            self._proc.stdin.flush()
 
     def _request(self, method: str, params: dict, *, timeout: float | None = None) -> object:
         with self._cond:
@@ -282,14 +295,90 @@ class LspClient:
         p = Path(path)
         if text is None:
             text = p.read_text()
-        self._notify("textDocument/didOpen", {
-            "textDocument": {
-                "uri": path_to_uri(p),
-                "languageId": self.server.language_id,
-                "version": 1,
-                "text": text,
-            }
-        })
+        with self._docs_lock:
+            self._docs[path_to_uri(p)] = (1, text)
+            self._notify("textDocument/didOpen", {
+                "textDocument": {
+                    "uri": path_to_uri(p),
+                    "languageId": self.server.language_id,
+                    "version": 1,
+                    "text": text,
+                }
+            })
+
+    def sync_document(self, path: str | Path, text: str | None = None) -> None:
+        """Make the server's copy of ``path`` match ``text`` (default: the file
+        on disk): ``didOpen`` the first time, a full-text ``didChange`` when
+        the text has changed since, nothing when it has not. The call for a
+        session that outlives one query — a fresh ``did_open`` per query would
+        re-open an already-open document, which the protocol forbids."""
+        p = Path(path)
+        if text is None:
+            text = p.read_text()
+        uri = path_to_uri(p)
+        with self._docs_lock:
+            prev = self._docs.get(uri)
+            if prev is not None and prev[1] == text:
+                return
+            if prev is None:
+                self._docs[uri] = (1, text)
+                with self._cond:
+                    # Anything still recorded was published before a close.
+                    self._diag_seen.discard(uri)
+                self._notify("textDocument/didOpen", {
+                    "textDocument": {
+                        "uri": uri, "languageId": self.server.language_id,
+                        "version": 1, "text": text,
+                    }
+                })
+                return
+            version = prev[0] + 1
+            self._docs[uri] = (version, text)
+            with self._cond:
+                # Diagnostics published for the old text no longer answer
+                # for this one: wait for the server's next publish.
+                self._diag_seen.discard(uri)
+            self._notify("textDocument/didChange", {
+                "textDocument": {"uri": uri, "version": version},
+                "contentChanges": [{"text": text}],
+            })
+
+    def did_close(self, path: str | Path) -> None:
+        """``didClose`` ``path`` if this session has it open (else nothing):
+        the server drops its copy and the diagnostics recorded for it go."""
+        uri = path_to_uri(path)
+        with self._docs_lock:
+            self._close_locked(uri)
+
+    def _close_locked(self, uri: str) -> None:
+        if self._docs.pop(uri, None) is None:
+            return
+        with self._cond:
+            self._diag_seen.discard(uri)
+            self._diagnostics.pop(uri, None)
+        self._notify("textDocument/didClose", {"textDocument": {"uri": uri}})
+
+    @contextmanager
+    def document(self, path: str | Path, text: str | None = None) -> Iterator[None]:
+        """``path`` synced (``sync_document``) for the ``with`` body and
+        closed after it, unless another thread's ``document`` block still
+        holds it. The call for a pooled session: a file is open only while a
+        query needs it, so the server's open set never grows with the run."""
+        uri = path_to_uri(path)
+        with self._docs_lock:
+            self._holds[uri] = self._holds.get(uri, 0) + 1
+        try:
+            self.sync_document(path, text)
+            yield
+        finally:
+            with self._docs_lock:
+                self._holds[uri] -= 1
+                if not self._holds[uri]:
+                    del self._holds[uri]
+                    try:
+                        self._close_locked(uri)
+                    except (LspError, OSError):
+                        pass  # transport gone: nothing left to close on
 
     # -- queries --
     def _loc_request(self, method: str, path, line, col, extra=None) -> list[dict]:
@@ -395,6 +484,101 @@ class LspClient:
         self.shutdown()
 
 
+class LspPool:
+    """Long-lived sessions for one run over one workspace: at most ONE started
+    server per :class:`LspServer`, handed to every caller that asks for it.
+
+    A per-query ``with LspClient(...)`` pays a full cold start and workspace
+    load (seconds for gopls) each time; a caller resolving many files against
+    the same root should hold a pool for the run instead. Sessions start
+    lazily on first use; a server that fails to start (or whose session has
+    died) is remembered as failed for the rest of the run, so one broken
+    server costs one attempt, not one per file. The client is safe to share
+    across threads — requests are matched by id and writes are serialized.
+    Use as a context manager; ``close`` shuts every session down.
+    """
+
+    def __init__(
+        self,
+        root_path: str | Path,
+        *,
+        spawner: Spawner = subprocess.Popen,
+        timeout: float = 30.0,
+    ) -> None:
+        self.root_path = Path(root_path).resolve()
+        self._spawner = spawner
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._clients: dict[str, LspClient] = {}
+        self._failed: dict[str, str] = {}
+
+    def client(self, server: LspServer) -> LspClient:
+        """The run's session for ``server``, started on first use. Raises
+        :class:`LspError` when the server cannot be (or could not be) started
+        or its session has since closed."""
+        with self._lock:
+            if server.name in self._failed:
+                raise LspError(self._failed[server.name])
+            client = self._clients.get(server.name)
+            if client is None:
+                client = LspClient(
+                    server, self.root_path, spawner=self._spawner, timeout=self._timeout
+                )
+                try:
+                    client.__enter__()
+                except (LspError, OSError) as exc:
+                    self._failed[server.name] = f"{server.name} failed to start: {exc}"
+                    raise LspError(self._failed[server.name]) from exc
+                self._clients[server.name] = client
+            elif client._closed:
+                self._failed[server.name] = f"{server.name} session closed"
+                raise LspError(self._failed[server.name])
+            return client
+
+    def live(self) -> list[str]:
+        """Names of the servers whose session started and is still open."""
+        with self._lock:
+            return sorted(name for name, c in self._clients.items() if not c._closed)
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.shutdown()
+
+    def __enter__(self) -> LspPool:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+QUERIES = ("definition", "references", "hover", "diagnostics", "symbols")
+
+
+def run_query(
+    client: LspClient, query: str, path: str | Path, *, line: int = 0, col: int = 0,
+    timeout: float = 30.0,
+) -> object:
+    """One ``lsp_query`` verb against a started session, shared by the
+    one-shot CLI and the broker (``lsp_broker``). The document is held open
+    (``LspClient.document``) for the query alone, so a warm session answers
+    for the file as it is now and never accumulates open files."""
+    if query not in QUERIES:
+        raise LspError(f"unknown query {query!r} (expected one of {QUERIES})")
+    with client.document(path):
+        if query == "definition":
+            return client.definition(path, line, col)
+        if query == "references":
+            return client.references(path, line, col)
+        if query == "hover":
+            return client.hover(path, line, col)
+        if query == "symbols":
+            return client.document_symbols(path)
+        return client.diagnostics(path, timeout=min(timeout, 15))
+
+
 # --- result normalization ---------------------------------------------------
 
 
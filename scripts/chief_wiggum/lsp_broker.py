@@ -0,0 +1,299 @@
+"""Persistent LSP broker: warm language servers shared across CLI calls.
+
+``lsp_query.py`` and ``external_links`` each start a language server, ask
+one question, and shut it down — so every definition/hover an agent asks for
+during an ``/implement`` session pays gopls' or pyright's full cold start and
+workspace load (seconds) for a millisecond answer. The broker is one
+background process per user that keeps ONE started session per ``(workspace
+root, server)`` (an ``lsp.LspPool`` per root) and answers ``lsp_query`` verbs
+for any caller over a Unix-domain socket.
+
+**Protocol.** Newline-delimited JSON, one request per connection:
+``{"op": <lsp.QUERIES verb>, "root", "file", "line"?, "col"?, "timeout"?}``
+answers with exactly the envelope ``lsp_query.py`` prints
+(``{"available": true, "server", "query", "result"}`` or ``{"available":
+false, "reason", ...}``); ``{"op": "ping"}`` reports the broker's version and
+live sessions (started and still open); ``{"op": "shutdown"}`` stops it after replying.
+
+**Freshness.** Every query opens its file in the session as it is on disk
+and closes it once answered (``LspClient.document``; concurrent queries on
+one file share a single open), so a warm server never answers for stale text
+and its open-document set never grows with the broker's lifetime. The
+broker's own code is covered too: when ``lsp.py`` or this
+module no longer hash to the version it started with, it replies ``{"stale":
+true}`` and exits, and callers answer locally.
+
+**Lifetime.** The broker exits — shutting every session down — after
+``idle_timeout`` seconds without a request (default 10 minutes), on
+``shutdown``, or when stale. A session whose server fails to start or dies is
+remembered as failed for that root until the broker restarts (the pool's
+rule).
+
+**Attaching.** ``lsp_query.py --broker`` (or ``CW_LSP_BROKER=1``) asks the
+broker first and starts one when none is listening. ``external_links`` only
+ATTACHES — a gate never spawns a daemon — and uses the broker's sessions when
+one is already listening. Every caller falls back to its own local session
+when the broker is absent, stale, or errors: the broker can make an answer
+fast, never different. The socket is ``~/.chief-wiggum/run/lsp-broker.sock``
+(``CW_LSP_BROKER_SOCKET`` overrides).
+
+As a CLI:
+    python3 scripts/chief_wiggum/lsp_broker.py serve [--idle-timeout 600]
+    python3 scripts/chief_wiggum/lsp_broker.py stop
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+if __package__ in (None, ""):  # direct CLI invocation: put scripts/ on the path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from chief_wiggum import lsp  # noqa: E402
+from chief_wiggum.hashing import scanner_version  # noqa: E402
+
+SOCKET_ENV = "CW_LSP_BROKER_SOCKET"
+# Opt-in for lsp_query: any non-empty, non-"0" value means --broker.
+BROKER_ENV = "CW_LSP_BROKER"
+DEFAULT_IDLE_TIMEOUT = 600.0
+
+
+def default_socket_path() -> Path:
+    """``CW_LSP_BROKER_SOCKET``, else one broker per user under
+    ``~/.chief-wiggum/run/`` (kept short: AF_UNIX paths cap near 100 bytes)."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / ".chief-wiggum" / "run" / "lsp-broker.sock"
+
+
+def enabled() -> bool:
+    return os.environ.get(BROKER_ENV, "") not in ("", "0")
+
+
+def _version() -> str:
+    here = Path(__file__).resolve()
+    return scanner_version(here, here.parent / "lsp.py")
+
+
+# --- broker side --------------------------------------------------------------
+
+
+class _Sessions:
+    """One ``lsp.LspPool`` per workspace root, created on first use."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pools: dict[Path, lsp.LspPool] = {}
+
+    def client(self, root: Path, server: lsp.LspServer) -> lsp.LspClient:
+        with self._lock:
+            pool = self._pools.get(root)
+            if pool is None:
+                pool = self._pools[root] = lsp.LspPool(root)
+        return pool.client(server)
+
+    def live(self) -> list[list[str]]:
+        """``[root, server]`` for every session that started and is still
+        open — read from the pools, so a failed start or a dead server is
+        never reported."""
+        with self._lock:
+            pools = sorted(self._pools.items())
+        return [[str(root), name] for root, pool in pools for name in pool.live()]
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.close()
+
+
+def answer(sessions: _Sessions, request: dict) -> dict:
+    """One ``lsp_query`` verb -> the envelope ``lsp_query.py`` would print."""
+    query, root, file = request.get("op"), request.get("root"), request.get("file")
+    if not isinstance(root, str) or not isinstance(file, str):
+        return {"error": "root and file are required"}
+    path = Path(file)
+    if not path.is_absolute():
+        path = Path(root) / path
+    server = lsp.server_for_file(path)
+    if server is None:
+        return {"available": False, "reason": f"no LSP server for {path.suffix or 'this file'}"}
+    if not lsp.server_available(server):
+        return {
+            "available": False, "server": server.name,
+            "reason": f"{server.command[0]} not installed; falling back to existing behavior",
+        }
+    try:
+        client = sessions.client(Path(root).resolve(), server)
+        result = lsp.run_query(
+            client, query, path, line=int(request.get("line") or 0),
+            col=int(request.get("col") or 0), timeout=float(request.get("timeout") or 30.0),
+        )
+    except (lsp.LspError, OSError, ValueError) as exc:
+        return {"available": False, "server": server.name, "reason": str(exc)}
+    return {"available": True, "server": server.name, "query": query, "result": result}
+
+
+def serve(socket_path: Path, *, idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT) -> int:
+    """Answer requests on ``socket_path`` until ``shutdown``, ``idle_timeout``
+    seconds without a connection, or the broker's own code changes. Requests
+    are handled on their own threads (sessions are thread-safe). Returns the
+    exit code."""
+    if socket_path.exists():
+        if request(socket_path, {"op": "ping"}, timeout=2.0) is not None:
+            print(f"Error: an LSP broker is already serving {socket_path}", file=sys.stderr)
+            return 2
+        socket_path.unlink(missing_ok=True)  # stale: its broker is gone
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    started_version = _version()
+    sessions = _Sessions()
+    state = {"stop": False, "exit": 0, "active": 0, "last": time.monotonic()}
+    state_lock = threading.Lock()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            with state_lock:
+                state["active"] += 1
+            try:
+                self._handle()
+            finally:
+                with state_lock:
+                    state["active"] -= 1
+                    state["last"] = time.monotonic()
+
+        def _handle(self) -> None:
+            line = self.rfile.readline()
+            try:
+                req = json.loads(line)
+            except json.JSONDecodeError as exc:
+                reply: dict = {"error": f"malformed request: {exc}"}
+            else:
+                if not isinstance(req, dict):
+                    reply = {"error": "request must be a JSON object"}
+                elif _version() != started_version:
+                    reply = {"error": "the LSP broker changed since it started; restart it",
+                             "stale": True}
+                    state.update(stop=True, exit=1)
+                elif req.get("op") == "ping":
+                    reply = {"ok": True, "version": started_version, "sessions": sessions.live()}
+                elif req.get("op") == "shutdown":
+                    reply = {"ok": True}
+                    state["stop"] = True
+                else:
+                    reply = answer(sessions, req)
+            self.wfile.write((json.dumps(reply) + "\n").encode())
+            self.wfile.flush()
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    old_umask = os.umask(0o177)  # the socket answers for this user only
+    try:
+        server = Server(str(socket_path), Handler)
+    except OSError as exc:  # e.g. a path past the AF_UNIX length limit
+        print(f"Error: cannot listen on {socket_path}: {exc}", file=sys.stderr)
+        return 2
+    finally:
+        os.umask(old_umask)
+    # Requests run on their own threads, so the accept loop wakes on a short
+    # tick to notice a shutdown (or the idle deadline) set by one of them.
+    server.timeout = 0.2
+    print(f"lsp_broker: serving on {socket_path}", file=sys.stderr, flush=True)
+    try:
+        while not state["stop"]:
+            server.handle_request()
+            with state_lock:
+                idle = not state["active"] and time.monotonic() - state["last"]
+            if idle_timeout is not None and idle and idle > idle_timeout:
+                break
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+        sessions.close()
+    return state["exit"]
+
+
+# --- caller side --------------------------------------------------------------
+
+
+def request(socket_path: Path, payload: dict, *, timeout: float = 60.0) -> dict | None:
+    """Send one request; ``None`` when no broker is listening or it replied
+    with something other than a JSON object."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(socket_path))
+        sock.sendall((json.dumps(payload) + "\n").encode())
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    except OSError:
+        return None
+    finally:
+        sock.close()
+    try:
+        reply = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return reply if isinstance(reply, dict) else None
+
+
+def query(socket_path: Path, payload: dict, *, timeout: float = 60.0) -> dict | None:
+    """A verb's envelope from the broker, or ``None`` when the caller must
+    answer locally (no broker, a stale one, or a broker-side error)."""
+    reply = request(socket_path, payload, timeout=timeout)
+    if reply is None or reply.get("stale") or "error" in reply or "available" not in reply:
+        return None
+    return reply
+
+
+def spawn(socket_path: Path, *, idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+          wait: float = 5.0) -> bool:
+    """Start a detached broker on ``socket_path`` and wait (up to ``wait``
+    seconds) until it answers. True when a broker is listening afterwards —
+    including one another caller started first."""
+    try:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "serve",
+             "--socket", str(socket_path), "--idle-timeout", str(idle_timeout)],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        return False
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if request(socket_path, {"op": "ping"}, timeout=1.0) is not None:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Persistent LSP broker (warm servers over a Unix socket)")
+    parser.add_argument("cmd", choices=["serve", "stop", "ping"])
+    parser.add_argument("--socket", help=f"socket path (default ${SOCKET_ENV} or ~/.chief-wiggum/run/lsp-broker.sock)")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="exit after this many seconds without a request")
+    args = parser.parse_args(argv)
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+    if args.cmd == "serve":
+        return serve(socket_path, idle_timeout=args.idle_timeout)
+    reply = request(socket_path, {"op": "shutdown" if args.cmd == "stop" else "ping"})
+    print(json.dumps(reply if reply is not None else {"ok": False, "reason": "no broker listening"}))
+    return 0 if reply is not None else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
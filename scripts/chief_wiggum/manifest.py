@@ -29,17 +29,49 @@ The result is filtered through a caller-supplied ``predicate(path) -> bool` —
 each scanner has its own file-selection rule (extension allow-list, skipped
 directories, ``--exclude`` globs), and the manifest must reflect exactly the
 set of files that scanner would otherwise walk, no more and no less.
+
+**Batched re-hashing.** Every dirty/untracked path that needs a working-tree
+hash goes through ONE ``git hash-object --stdin-paths`` process
+(``_hash_objects``), not one fork per file — after a large codegen step or in
+a fresh worktree that is the difference between one process and thousands.
+Git itself still does the hashing, so clean/smudge filters and ``autocrlf``
+apply exactly as they would on ``git add``; an in-process SHA-1 over raw bytes
+would silently diverge from the committed blob hash for any filtered file.
+
+**Stat-keyed hash cache.** A path whose ``(mtime_ns, size, inode)`` is
+unchanged since the last run reuses its previous hash instead of being re-read
+— the same trick git's own index uses to avoid re-hashing a clean working
+tree. One small JSON file per repo under ``~/.chief-wiggum/cache/manifest/``
+(``CW_MANIFEST_CACHE_DIR`` overrides; ``tests/conftest.py`` isolates it). Git's
+racy-clean rule applies: a file modified within ``_RACY_WINDOW_NS`` of the
+hash is never cached, since a same-timestamp rewrite inside the filesystem's
+mtime granularity would otherwise look unchanged. ``CW_MANIFEST_NO_CACHE=1``
+disables both the read and the write. A cache that cannot be read or written
+degrades to hashing everything — never a crash, never a stale hash.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import stat
 import subprocess
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Collection
 from pathlib import Path
 
 Predicate = Callable[[str], bool]
 
+NO_CACHE_ENV = "CW_MANIFEST_NO_CACHE"
+CACHE_DIR_ENV = "CW_MANIFEST_CACHE_DIR"
+
+# Files modified this recently are "racily clean" (git's term): their mtime
+# may not yet differ from a rewrite that lands in the same timestamp tick, so
+# their hash is used for this run but not remembered. 2s covers the coarsest
+# common mtime granularity (FAT/exFAT).
+_RACY_WINDOW_NS = 2_000_000_000
+
 
 class ManifestError(RuntimeError):
     """A git invocation underlying the manifest failed — bad ref, ``repo_root``
@@ -48,10 +80,10 @@ class ManifestError(RuntimeError):
     instead of a traceback."""
 
 
-def _run_git(args: list[str], cwd: Path) -> str:
+def _run_git(args: list[str], cwd: Path, stdin: str | None = None) -> str:
     try:
         result = subprocess.run(
-            ["git", *args], cwd=str(cwd), capture_output=True, text=True, check=True
+            ["git", *args], cwd=str(cwd), input=stdin, capture_output=True, text=True, check=True
         )
     except FileNotFoundError as exc:
         raise ManifestError("git executable not found") from exc
@@ -62,7 +94,7 @@ def _run_git(args: list[str], cwd: Path) -> str:
     return result.stdout
 
 
-def walk_source_files(root: str | Path) -> list[str]:
+def walk_source_files(root: str | Path, *, skip_dirs: Collection[str] = ()) -> list[str]:
     """Sorted repo-relative paths of every file under ``root``, pruning nested
     git checkouts: any directory below the root that contains a ``.git`` entry
     (a submodule's gitlink file, or a vendored/nested repo's ``.git`` dir) is
@@ -72,12 +104,20 @@ def walk_source_files(root: str | Path) -> list[str]:
     files — a submodule is a single non-blob gitlink entry there, not blobs
     (see ``_ls_tree``/``build_manifest``). Submodule contents belong to the
     submodule's own repo and its own gates; they are excluded from BOTH scan
-    modes rather than visible to one and invisible to the other."""
+    modes rather than visible to one and invisible to the other.
+
+    ``skip_dirs`` names directories (matched by name, at any depth below the
+    root) the walk never descends into — a scanner whose selection rule drops
+    every path with a ``node_modules``/``vendor``/build-output component
+    passes those names here so the excluded trees are pruned during traversal
+    instead of listed in full and filtered afterwards."""
     root_path = Path(root)
     out: list[str] = []
     for dirpath, dirnames, filenames in os.walk(root_path):
         dpath = Path(dirpath)
-        dirnames[:] = [d for d in dirnames if not (dpath / d / ".git").exists()]
+        dirnames[:] = [
+            d for d in dirnames if d not in skip_dirs and not (dpath / d / ".git").exists()
+        ]
         for name in filenames:
             out.append(str((dpath / name).relative_to(root_path)))
     return sorted(out)
@@ -108,10 +148,18 @@ def _dirty_and_untracked(repo_root: Path) -> tuple[set[str], set[str]]:
     index) plus untracked non-ignored paths, split by whether the path still
     exists on disk. Rename detection is disabled (``--no-renames``) so a rename
     surfaces as a plain delete + add pair — simpler and unambiguous for a
-    content-addressed manifest (the new path's content is hashed either way)."""
+    content-addressed manifest (the new path's content is hashed either way).
+
+    ``--relative``: ``ls-tree`` and ``ls-files`` report paths relative to
+    ``repo_root`` (and only beneath it) when it is a subdirectory of the
+    checkout, but ``git diff`` would report them from the toplevel — an edited
+    ``sub/a.go`` would then miss its ``a.go`` key and keep its HEAD blob
+    sha, letting a content-keyed cache serve the unedited file's results."""
     present: set[str] = set()
     deleted: set[str] = set()
-    diff_out = _run_git(["diff", "--no-renames", "--name-status", "-z", "HEAD"], repo_root)
+    diff_out = _run_git(
+        ["diff", "--relative", "--no-renames", "--name-status", "-z", "HEAD"], repo_root
+    )
     tokens = [t for t in diff_out.split("\0") if t]
     i = 0
     while i < len(tokens):
@@ -130,6 +178,127 @@ def _hash_object(repo_root: Path, path: Path) -> str:
     return _run_git(["hash-object", str(path)], repo_root).strip()
 
 
+def _hash_objects(repo_root: Path, paths: list[str]) -> dict[str, str]:
+    """``{path: blob sha}`` for repo-relative ``paths`` via ONE ``git
+    hash-object --stdin-paths`` process. ``--stdin-paths`` is
+    newline-delimited and C-unquotes any line that starts with ``"``, so the
+    (vanishingly rare) path containing a newline, or starting with a double
+    quote, falls back to its own ``git hash-object`` call rather than
+    corrupting the batch or hashing the wrong file.
+
+    ``--stdin-paths`` resolves its paths from the checkout's toplevel, not
+    the working directory, so the batch runs there with the subdirectory
+    prefix (``rev-parse --show-prefix``) applied — ``repo_root`` may be a
+    subdirectory of the checkout."""
+    out: dict[str, str] = {}
+    loose = [p for p in paths if "\n" in p]
+    batch = [p for p in paths if "\n" not in p]
+    if batch:
+        toplevel, _, prefix = _run_git(
+            ["rev-parse", "--show-toplevel", "--show-prefix"], repo_root
+        ).partition("\n")
+        prefix = prefix.strip("\n")
+        loose += [p for p in batch if f"{prefix}{p}".startswith('"')]
+        batch = [p for p in batch if not f"{prefix}{p}".startswith('"')]
+    if batch:
+        stdin = "".join(f"{prefix}{p}\n" for p in batch)
+        shas = _run_git(["hash-object", "--stdin-paths"], Path(toplevel), stdin).split()
+        if len(shas) != len(batch):
+            raise ManifestError(
+                f"git hash-object --stdin-paths returned {len(shas)} hashes for {len(batch)} paths"
+            )
+        out.update(zip(batch, shas, strict=True))
+    for path in loose:
+        out[path] = _hash_object(repo_root, Path(os.path.abspath(repo_root / path)))
+    return out
+
+
+def _cache_disabled() -> bool:
+    return os.environ.get(NO_CACHE_ENV, "") not in ("", "0")
+
+
+def _stat_cache_path(repo_root: Path) -> Path:
+    base = Path(
+        os.environ.get(CACHE_DIR_ENV)
+        or (Path.home() / ".chief-wiggum" / "cache" / "manifest")
+    )
+    repo_id = hashlib.sha256(os.path.abspath(repo_root).encode()).hexdigest()[:16]
+    return base / f"{repo_id}.json"
+
+
+def _load_stat_cache(repo_root: Path) -> dict[str, list]:
+    """``{path: [mtime_ns, size, inode, sha]}`` from the previous run, or
+    ``{}`` when disabled/absent/corrupt."""
+    if _cache_disabled():
+        return {}
+    try:
+        data = json.loads(_stat_cache_path(repo_root).read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    entries = data.get("entries") if isinstance(data, dict) else None
+    return entries if isinstance(entries, dict) else {}
+
+
+def _store_stat_cache(repo_root: Path, entries: dict[str, list]) -> None:
+    """Best-effort atomic rewrite (temp file + ``os.replace``) — a concurrent
+    reader sees the old file or the new one, never a torn write."""
+    if _cache_disabled():
+        return
+    path = _stat_cache_path(repo_root)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps({"repo": os.path.abspath(repo_root), "entries": entries}))
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _rehash_present(root: Path, present: set[str], manifest: dict[str, str]) -> None:
+    """Overlay working-tree hashes for ``present`` (dirty tracked + untracked)
+    onto ``manifest`` in place: stat-cache hits are reused, everything else
+    goes through one batched ``_hash_objects`` call."""
+    cache = _load_stat_cache(root)
+    keep: dict[str, list] = {}
+    stat_keys: dict[str, list[int]] = {}
+    for path in sorted(present):
+        try:
+            st = (root / path).stat()
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            # Not a regular file: a submodule whose pointer changed shows up in
+            # `git diff` as its gitlink PATH (a directory on disk), and a file
+            # can be raced out from under us (deleted/replaced by a dir) between
+            # the git status read and the hash-object call. Drop rather than
+            # surface a stale or non-blob entry — submodule contents are
+            # excluded from the manifest just as `_ls_tree` skips their
+            # gitlinks, matching `walk_source_files`' full-scan pruning.
+            manifest.pop(path, None)
+            continue
+        key = [st.st_mtime_ns, st.st_size, st.st_ino]
+        hit = cache.get(path)
+        if isinstance(hit, list) and len(hit) == 4 and hit[:3] == key:
+            manifest[path] = hit[3]
+            keep[path] = hit
+            continue
+        stat_keys[path] = key
+    if stat_keys:
+        # The stat was taken BEFORE hashing, so a file rewritten in between is
+        # remembered under its older key and simply re-hashed next run.
+        hashed = _hash_objects(root, list(stat_keys))
+        racy_after = time.time_ns() - _RACY_WINDOW_NS
+        for path, sha in hashed.items():
+            manifest[path] = sha
+            if stat_keys[path][0] < racy_after:
+                keep[path] = [*stat_keys[path], sha]
+    # Rewritten only when something changed; entries for paths no longer
+    # dirty/untracked drop out here, so the file stays bounded by the current
+    # dirty set rather than growing with history.
+    if keep != cache:
+        _store_stat_cache(root, keep)
+
+
 def build_manifest(repo_root: str | Path, predicate: Predicate | None = None) -> dict[str, str]:
     """``{path: content_hash}`` for the current working tree: ``git ls-tree -r
     HEAD`` unioned with re-hashed dirty tracked + untracked non-ignored files,
@@ -140,19 +309,7 @@ def build_manifest(repo_root: str | Path, predicate: Predicate | None = None) ->
     present, deleted = _dirty_and_untracked(root)
     for path in deleted:
         manifest.pop(path, None)
-    for path in present:
-        full = root / path
-        if not full.is_file():
-            # Not a regular file: a submodule whose pointer changed shows up in
-            # `git diff` as its gitlink PATH (a directory on disk), and a file
-            # can be raced out from under us (deleted/replaced by a dir) between
-            # the git status read and the hash-object call. Drop rather than
-            # surface a stale or non-blob entry — submodule contents are
-            # excluded from the manifest just as `_ls_tree` skips their
-            # gitlinks, matching `walk_source_files`' full-scan pruning.
-            manifest.pop(path, None)
-            continue
-        manifest[path] = _hash_object(root, full)
+    _rehash_present(root, present, manifest)
     return {p: h for p, h in manifest.items() if pred(p)}
 
 
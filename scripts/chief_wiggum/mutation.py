@@ -0,0 +1,393 @@
+"""Native mutation testing for gate scripts (stdlib only; pytest as the runner).
+
+``gate_validation_designer.py mutate`` used to shell out to ``mutmut``: one
+serial ``pytest -x`` over the gate's WHOLE unit-test file per mutant, with
+the whole run bounded by ``max_mutants * per_mutant_seconds`` — so on any
+real gate it timed out and reported ``partial``, and the next audit started
+from scratch. This engine does the same job in four steps, each of which
+removes one of those costs:
+
+1. **Generate** mutants from the gate's AST (``generate_mutants``): flipped
+   comparisons (``==``/``!=``, ``<``/``>=``, ``>``/``<=``, ``in``/``not in``,
+   ``is``/``is not``), swapped ``and``/``or``, a dropped ``not``, ``True``/
+   ``False`` swapped, integer constants bumped by one, ``+``/``-`` swapped.
+   Each is a byte-span replacement of one expression in the original source,
+   so every other line — and every line number before it — is untouched, and
+   each is compiled up front (a mutant that is not valid Python is dropped,
+   never "killed"). Docstrings, annotations, f-string internals, and the
+   ``if __name__ == "__main__":`` block are not mutated.
+2. **Map** each mutant to the tests that can see it (``trace_tests``): ONE
+   unmutated pytest run with ``chief_wiggum.mutation_plugin`` tracing which
+   test executes which line of the gate. A mutant runs only against the tests
+   that executed one of its lines; a mutant on a line run only while
+   importing the gate (module body) runs against every traced test; a mutant
+   on a line no test executes is reported ``no-coverage`` without running —
+   the survivor no test could ever have killed. Tests that fail unmutated are
+   excluded (their failure says nothing about the mutant). The map sees only
+   in-process execution: a test that runs the gate as a subprocess does not
+   map to its lines.
+3. **Execute** mutants side by side (``run_mutants``): each in its own pytest
+   subprocess with ``-x`` over its selected tests, the mutant injected into
+   ``sys.modules`` by the plugin (the gate file on disk is never written), up
+   to ``jobs`` at a time. A test that loads the gate by path with
+   ``importlib.util.spec_from_file_location`` gets the mutant too; one that
+   reaches it through ``runpy``, its own ``exec`` or a subprocess runs the
+   original, so its mutants can survive no matter what it asserts. A pytest exit 1 (a test failed) is ``killed``, 0 is
+   ``survived``, running past ``per_mutant_seconds`` is ``timeout`` (counted
+   as killed, as mutmut does); anything else is an ``error`` — never a
+   verdict. A total wall-time budget still bounds the run: mutants not
+   STARTED before it expires are ``not-run`` and the result is ``partial``.
+4. **Cache** verdicts and the test map (``MutationCache``) keyed by (gate
+   source hash, test hash): the gate hash is the gate's own
+   ``--scanner-version`` (its source plus its ``chief_wiggum`` deps, via
+   ``scanner_registry``), the test hash covers the test file, its
+   ``conftest.py``, and this engine. An unchanged gate re-audited skips the
+   trace run and every mutant already judged — only new mutants (a higher
+   budget, a previously ``not-run`` tail) execute. ``error`` results are
+   never cached. Entries live in ``~/.chief-wiggum/cache/mutation``
+   (``CW_MUTATION_CACHE_DIR``; ``tests/conftest.py`` isolates it);
+   ``CW_MUTATION_NO_CACHE=1`` disables read and write.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from chief_wiggum.hashing import scanner_version, stable_hash
+
+CACHE_DIR_ENV = "CW_MUTATION_CACHE_DIR"
+NO_CACHE_ENV = "CW_MUTATION_NO_CACHE"
+# Read by chief_wiggum.mutation_plugin inside the pytest subprocesses.
+TRACE_ENV = "CW_MUTATION_TRACE"
+MUTANT_ENV = "CW_MUTANT"
+# The trace key for gate lines executed outside any test (module import).
+COLLECTION = "<collection>"
+
+PLUGIN = "chief_wiggum.mutation_plugin"
+CACHE_FORMAT = 1
+
+KILLED, SURVIVED, TIMEOUT = "killed", "survived", "timeout"
+NO_COVERAGE, NOT_RUN, ERROR = "no-coverage", "not-run", "error"
+# Verdicts that are a property of (gate, tests, mutant) and safe to replay.
+_CACHEABLE = frozenset({KILLED, SURVIVED, TIMEOUT, NO_COVERAGE})
+
+_COMPARE_SWAP: dict[type, type] = {
+    ast.Eq: ast.NotEq, ast.NotEq: ast.Eq,
+    ast.Lt: ast.GtE, ast.GtE: ast.Lt,
+    ast.Gt: ast.LtE, ast.LtE: ast.Gt,
+    ast.In: ast.NotIn, ast.NotIn: ast.In,
+    ast.Is: ast.IsNot, ast.IsNot: ast.Is,
+}
+_BINOP_SWAP: dict[type, type] = {ast.Add: ast.Sub, ast.Sub: ast.Add}
+
+
+@dataclass(frozen=True)
+class Mutant:
+    """One mutation: replace source bytes ``[start, end)`` with ``replacement``."""
+
+    mutant_id: str
+    line: int
+    end_line: int
+    operator: str
+    original: str
+    replacement: str
+    start: int
+    end: int
+
+    def apply(self, source: bytes) -> bytes:
+        return source[:self.start] + self.replacement.encode() + source[self.end:]
+
+    def describe(self) -> str:
+        return f"line {self.line}: {self.original} -> {self.replacement} ({self.operator})"
+
+
+# --- 1. generate ------------------------------------------------------------------
+
+
+def _skipped_nodes(tree: ast.Module) -> set[int]:
+    """ids of nodes whose subtrees are never mutated: docstrings, annotations,
+    f-strings, and the ``if __name__ == "__main__":`` block (never run by an
+    importing test)."""
+    roots: list[ast.AST] = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            body = node.body
+            if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+                roots.append(body[0])
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.returns:
+            roots.append(node.returns)
+        if isinstance(node, ast.arg) and node.annotation:
+            roots.append(node.annotation)
+        if isinstance(node, ast.AnnAssign):
+            roots.append(node.annotation)
+        if isinstance(node, ast.JoinedStr):
+            roots.append(node)
+        if (
+            isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+            and isinstance(node.test.left, ast.Name) and node.test.left.id == "__name__"
+        ):
+            roots.append(node)
+    return {id(sub) for root in roots for sub in ast.walk(root)}
+
+
+def _mutations(node: ast.AST) -> Iterator[tuple[str, ast.expr]]:
+    """``(operator, replacement_node)`` for every mutation of ``node`` itself."""
+    if isinstance(node, ast.Compare):
+        for i, op in enumerate(node.ops):
+            swap = _COMPARE_SWAP.get(type(op))
+            if swap is None:
+                continue
+            ops = list(node.ops)
+            ops[i] = swap()
+            yield (f"{type(op).__name__}->{swap.__name__}#{i}",
+                   ast.Compare(left=node.left, ops=ops, comparators=node.comparators))
+    elif isinstance(node, ast.BoolOp):
+        swap = ast.Or if isinstance(node.op, ast.And) else ast.And
+        yield f"{type(node.op).__name__}->{swap.__name__}", ast.BoolOp(op=swap(), values=node.values)
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        yield "drop-not", node.operand
+    elif isinstance(node, ast.BinOp) and type(node.op) in _BINOP_SWAP:
+        swap = _BINOP_SWAP[type(node.op)]
+        yield (f"{type(node.op).__name__}->{swap.__name__}",
+               ast.BinOp(left=node.left, op=swap(), right=node.right))
+    elif isinstance(node, ast.Constant) and isinstance(node.value, bool):
+        yield f"{node.value}->{not node.value}", ast.Constant(value=not node.value)
+    elif isinstance(node, ast.Constant) and type(node.value) is int:
+        yield f"{node.value}->{node.value + 1}", ast.Constant(value=node.value + 1)
+
+
+def generate_mutants(source: str | bytes, filename: str = "<gate>") -> list[Mutant]:
+    """Every mutant of ``source``, in source order, each verified to compile."""
+    data = source.encode() if isinstance(source, str) else source
+    tree = ast.parse(data, filename=filename)
+    line_starts = [0]
+    for line in data.splitlines(keepends=True):
+        line_starts.append(line_starts[-1] + len(line))
+    skipped = _skipped_nodes(tree)
+    mutants: list[Mutant] = []
+    seen: set[tuple[int, int, str]] = set()
+    for node in ast.walk(tree):
+        if id(node) in skipped or not isinstance(node, ast.expr) or node.end_lineno is None:
+            continue
+        start = line_starts[node.lineno - 1] + node.col_offset
+        end = line_starts[node.end_lineno - 1] + node.end_col_offset
+        original = data[start:end].decode()
+        for operator, replacement_node in _mutations(node):
+            replacement = f"({ast.unparse(replacement_node)})"
+            key = (start, end, replacement)
+            if key in seen:
+                continue
+            seen.add(key)
+            mutant = Mutant(
+                mutant_id=f"L{node.lineno}C{node.col_offset}:{operator}",
+                line=node.lineno, end_line=node.end_lineno, operator=operator,
+                original=" ".join(original.split()), replacement=replacement,
+                start=start, end=end,
+            )
+            try:
+                compile(mutant.apply(data), filename, "exec")
+            except (SyntaxError, ValueError):
+                continue
+            mutants.append(mutant)
+    mutants.sort(key=lambda m: (m.start, m.end, m.mutant_id))
+    return mutants
+
+
+# --- 2. map -----------------------------------------------------------------------
+
+
+@dataclass
+class TestMap:
+    """Which traced test executed which gate line, and which tests failed."""
+
+    __test__ = False  # not a pytest test class
+
+    lines: dict[str, list[int]]
+    failed: list[str]
+
+    def tests_for(self, mutant: Mutant) -> list[str]:
+        """The passing tests that executed any line of ``mutant``, in node-id
+        order; every passing test when only the module body reached it."""
+        span = set(range(mutant.line, mutant.end_line + 1))
+        failed = set(self.failed)
+        tests = [
+            nodeid for nodeid, lines in self.lines.items()
+            if nodeid != COLLECTION and nodeid not in failed and span.intersection(lines)
+        ]
+        if not tests and span.intersection(self.lines.get(COLLECTION, ())):
+            tests = [n for n in self.lines if n != COLLECTION and n not in failed]
+        return sorted(tests)
+
+
+def _pytest_cmd(tests: list[str]) -> list[str]:
+    return [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "-p", PLUGIN, *tests]
+
+
+def _subprocess_env(scripts_dir: Path, extra: dict[str, str]) -> dict[str, str]:
+    env = dict(os.environ)
+    # The plugin is imported before the project's own ``pythonpath`` ini
+    # setting is applied, so both it (this package's parent) and the gate's
+    # scripts dir must already be importable — they differ when auditing a
+    # target repo's own gates.
+    engine_dir = str(Path(__file__).resolve().parents[1])
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(scripts_dir), engine_dir, env.get("PYTHONPATH", "")) if p
+    )
+    env.pop(TRACE_ENV, None)
+    env.pop(MUTANT_ENV, None)
+    env.update(extra)
+    return env
+
+
+def trace_tests(script: Path, tests_path: Path, scripts_dir: Path, cwd: Path,
+                timeout: float) -> tuple[TestMap | None, str]:
+    """One unmutated run of ``tests_path`` recording the line map; ``(None,
+    detail)`` when pytest could not produce one (collection error, timeout)."""
+    with tempfile.TemporaryDirectory(prefix="cw-mutation-") as tmp:
+        out = Path(tmp) / "trace.json"
+        env = _subprocess_env(scripts_dir, {
+            TRACE_ENV: json.dumps({"target": str(script), "out": str(out)}),
+        })
+        try:
+            proc = subprocess.run(_pytest_cmd([str(tests_path)]), capture_output=True,
+                                  text=True, timeout=timeout, cwd=cwd, env=env)
+        except subprocess.TimeoutExpired:
+            return None, f"unmutated test run timed out after {timeout:.0f}s"
+        except OSError as exc:
+            return None, f"could not run pytest: {exc}"
+        if proc.returncode not in (0, 1) or not out.is_file():
+            tail = "\n".join((proc.stdout + proc.stderr).strip().splitlines()[-10:])
+            return None, f"unmutated test run exited {proc.returncode}:\n{tail or '(no output)'}"
+        data = json.loads(out.read_text())
+    return TestMap(lines=data["lines"], failed=data["failed"]), ""
+
+
+# --- 3. execute -------------------------------------------------------------------
+
+
+def _run_one(mutant: Mutant, source: bytes, module: str, script: Path, tests: list[str],
+             scripts_dir: Path, cwd: Path, timeout: float) -> str:
+    with tempfile.TemporaryDirectory(prefix="cw-mutant-") as tmp:
+        spec = Path(tmp) / "mutant.json"
+        spec.write_text(json.dumps({
+            "module": module, "path": str(script), "source": mutant.apply(source).decode(),
+        }))
+        env = _subprocess_env(scripts_dir, {MUTANT_ENV: str(spec)})
+        try:
+            proc = subprocess.run(_pytest_cmd(["-x", *tests]), capture_output=True,
+                                  text=True, timeout=timeout, cwd=cwd, env=env)
+        except subprocess.TimeoutExpired:
+            return TIMEOUT
+        except OSError:
+            return ERROR
+    return {0: SURVIVED, 1: KILLED}.get(proc.returncode, ERROR)
+
+
+def run_mutants(mutants: list[Mutant], source: bytes, module: str, script: Path,
+                test_map: TestMap, scripts_dir: Path, cwd: Path, *,
+                per_mutant_seconds: float, budget_seconds: float, jobs: int,
+                on_verdict: Callable[[Mutant, str], None] | None = None) -> dict[str, str]:
+    """``{mutant_id: verdict}`` for ``mutants``; ``jobs`` pytest processes at
+    a time, none started after ``budget_seconds`` have elapsed."""
+    deadline = time.monotonic() + budget_seconds
+    lock = threading.Lock()
+    verdicts: dict[str, str] = {}
+
+    def judge(mutant: Mutant) -> None:
+        tests = test_map.tests_for(mutant)
+        if not tests:
+            verdict = NO_COVERAGE
+        elif time.monotonic() >= deadline:
+            verdict = NOT_RUN
+        else:
+            verdict = _run_one(mutant, source, module, script, tests, scripts_dir, cwd,
+                               per_mutant_seconds)
+        with lock:
+            verdicts[mutant.mutant_id] = verdict
+            if on_verdict is not None:
+                on_verdict(mutant, verdict)
+
+    if jobs <= 1 or len(mutants) <= 1:
+        for mutant in mutants:
+            judge(mutant)
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            list(pool.map(judge, mutants))
+    return verdicts
+
+
+# --- 4. cache ---------------------------------------------------------------------
+
+
+def engine_version() -> str:
+    here = Path(__file__).resolve()
+    return scanner_version(here, here.parent / "mutation_plugin.py")
+
+
+def tests_hash(tests_path: Path) -> str:
+    """The test half of the cache key: the test file and its directory's
+    ``conftest.py`` (when present), by content."""
+    parts = [tests_path.read_text()]
+    conftest = tests_path.parent / "conftest.py"
+    if conftest.is_file():
+        parts.append(conftest.read_text())
+    return stable_hash(*parts)
+
+
+class MutationCache:
+    """Persisted test map and verdicts for one (gate hash, test hash) pair."""
+
+    def __init__(self, gate: str, gate_hash: str, test_hash: str) -> None:
+        self.key = stable_hash(gate_hash, test_hash, engine_version())
+        self.disabled = os.environ.get(NO_CACHE_ENV, "") not in ("", "0")
+        base = Path(
+            os.environ.get(CACHE_DIR_ENV)
+            or (Path.home() / ".chief-wiggum" / "cache" / "mutation")
+        )
+        self.path = base / f"{gate}-{self.key[:20]}.json"
+        self.test_map: TestMap | None = None
+        self.verdicts: dict[str, str] = {}
+        if self.disabled:
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT or data.get("key") != self.key:
+            return
+        trace = data.get("trace")
+        if isinstance(trace, dict) and isinstance(trace.get("lines"), dict):
+            self.test_map = TestMap(lines=trace["lines"], failed=list(trace.get("failed", [])))
+        verdicts = data.get("verdicts")
+        if isinstance(verdicts, dict):
+            self.verdicts = {k: v for k, v in verdicts.items() if v in _CACHEABLE}
+
+    def store(self) -> None:
+        """Best-effort atomic rewrite (temp file + ``os.replace``)."""
+        if self.disabled:
+            return
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        payload = {
+            "format": CACHE_FORMAT, "key": self.key,
+            "trace": None if self.test_map is None else {
+                "lines": self.test_map.lines, "failed": self.test_map.failed,
+            },
+            "verdicts": {k: v for k, v in sorted(self.verdicts.items()) if v in _CACHEABLE},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload))
+            os.replace(tmp, self.path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
@@ -0,0 +1,128 @@
+"""pytest plugin half of the native mutation engine (``chief_wiggum.mutation``).
+
+Loaded with ``-p chief_wiggum.mutation_plugin`` into the pytest subprocesses
+the engine launches; inert unless one of its two environment variables is
+set, so it never changes an ordinary test run.
+
+- ``CW_MUTATION_TRACE`` (a JSON object ``{"target": <gate path>, "out":
+  <json path>}``): record, per test node id, which lines of the gate file the
+  test executed, and which tests failed. Lines run while no test is active
+  (the gate's module body, executed when a test module or conftest imports
+  it) are recorded under ``mutation.COLLECTION``. A ``sys.settrace`` tracer
+  that only returns a local tracer for frames of the target file, so the rest
+  of the suite pays one filename check per call, not per line.
+- ``CW_MUTANT`` (a path to a JSON object ``{"module", "path", "source"}``):
+  before any test module is collected, execute the mutated source as module
+  ``module`` — with ``__file__`` and code filenames pointing at the real gate
+  file — and register it in ``sys.modules``, so every ``import <gate>`` in
+  the tests binds the mutant. A test that loads the gate by path instead
+  (``importlib.util.spec_from_file_location(<name>, <gate path>)`` then
+  ``exec_module``, the idiom for scripts that are not importable by name) is
+  handed a spec whose loader executes the same mutated source. The gate file
+  on disk is never touched, which is what lets mutants run side by side. A
+  gate read any other way — ``runpy``, a raw ``open``/``exec``, or a
+  subprocess — still runs the original.
+
+Both act at plugin IMPORT, not in ``pytest_configure``: ``-p`` plugins are
+imported before the initial conftests, and a conftest that imports the gate
+must already see the mutant (and be traced).
+"""
+
+from __future__ import annotations
+
+import importlib.abc
+import importlib.util
+import json
+import os
+import sys
+import threading
+import types
+
+import pytest
+
+from chief_wiggum.mutation import COLLECTION, MUTANT_ENV, TRACE_ENV
+
+_trace_spec = json.loads(os.environ[TRACE_ENV]) if os.environ.get(TRACE_ENV) else None
+_lines: dict[str, set[int]] = {COLLECTION: set()}
+_failed: set[str] = set()
+_current: list[set[int]] = [_lines[COLLECTION]]
+
+
+if _trace_spec is not None:
+    _target = os.path.realpath(_trace_spec["target"])
+    _is_target: dict[str, bool] = {}
+
+    def _local(frame, event, arg):
+        if event == "line":
+            _current[0].add(frame.f_lineno)
+        return _local
+
+    def _global(frame, event, arg):
+        filename = frame.f_code.co_filename
+        hit = _is_target.get(filename)
+        if hit is None:
+            hit = _is_target[filename] = os.path.realpath(filename) == _target
+        if not hit:
+            return None
+        _current[0].add(frame.f_lineno)
+        return _local
+
+    sys.settrace(_global)
+    threading.settrace(_global)
+
+
+if os.environ.get(MUTANT_ENV):
+    with open(os.environ[MUTANT_ENV], encoding="utf-8") as fh:
+        _mutant = json.load(fh)
+    _module = types.ModuleType(_mutant["module"])
+    _module.__file__ = _mutant["path"]
+    sys.modules[_mutant["module"]] = _module
+    _code = compile(_mutant["source"], _mutant["path"], "exec")
+    exec(_code, _module.__dict__)  # noqa: S102
+
+    class _MutantLoader(importlib.abc.Loader):
+        def create_module(self, spec):
+            return None
+
+        def exec_module(self, module):
+            module.__file__ = _mutant["path"]
+            exec(_code, module.__dict__)  # noqa: S102
+
+    _gate_path = os.path.realpath(_mutant["path"])
+    _spec_from_file_location = importlib.util.spec_from_file_location
+
+    def _mutant_spec(name, location=None, *args, **kwargs):
+        if location is not None and os.path.realpath(os.fspath(location)) == _gate_path:
+            return importlib.util.spec_from_loader(name, _MutantLoader(), origin=_mutant["path"])
+        return _spec_from_file_location(name, location, *args, **kwargs)
+
+    importlib.util.spec_from_file_location = _mutant_spec
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    if _trace_spec is None:
+        yield
+        return
+    _current[0] = _lines.setdefault(item.nodeid, set())
+    try:
+        yield
+    finally:
+        _current[0] = _lines[COLLECTION]
+
+
+def pytest_runtest_logreport(report):
+    if _trace_spec is not None and report.failed:
+        _failed.add(report.nodeid)
+
+
+def pytest_unconfigure(config):
+    if _trace_spec is None:
+        return
+    sys.settrace(None)
+    threading.settrace(None)
+    with open(_trace_spec["out"], "w", encoding="utf-8") as fh:
+        json.dump({
+            "lines": {nodeid: sorted(lines) for nodeid, lines in _lines.items()},
+            "failed": sorted(_failed),
+        }, fh)
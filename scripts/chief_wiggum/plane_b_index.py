@@ -0,0 +1,268 @@
+"""Persistent, incrementally-maintained Plane B index for ``code_query.py``.
+
+``code_query.py``'s two-plane doctrine names Plane B — per-file code
+emissions (``@cw-trace`` sites, candidate write sites) — as the only
+cacheable plane. Before this index, every ``governs``/``writers``/
+``guards``/``verifies``/``annotations``/``trace`` call re-walked the tree
+and re-derived every file's emission through the scanners' own entry
+points; on a large repo that is seconds per question, and an agent asks
+dozens of them a session.
+
+**What is stored.** One row per ``(engine, rel)`` — the emission dicts the
+engine's module-level ``emit_one`` produced for the file (the exact payload
+``findings_cache`` persists for the gates), tagged with the file's manifest
+``blob_sha``. The index mirrors the CURRENT tree, not its history: a row is
+replaced when its file's blob changes and deleted when the file leaves the
+candidate set, so its size tracks the repo, not the number of edits.
+
+**Freshness — the same two-part proof as the findings cache.**
+
+- ``blob_sha`` — from ``chief_wiggum.manifest.build_manifest`` (stat-keyed,
+  so a refresh only re-hashes files whose ``(mtime, size, inode)`` moved). A
+  row is served only when its stored blob equals the file's current one.
+- ``scanner_hash`` — the caller's hash-derived version (code_query's own
+  ``_scanner_version()``, which covers both scanners' emission logic). A
+  different hash empties the index before anything is served.
+
+A file with no manifest entry (non-git repo, gitignored-but-present) is
+emitted live on every refresh and never stored; a file that cannot be read
+lands in ``unscanned`` and is never stored either — the index never caches
+an absence.
+
+**Incremental refresh.** ``refresh`` diffs the manifest against the stored
+``(engine, rel) -> blob_sha`` map, emits only the misses (through
+``chief_wiggum.emission_pool``, so a cold index on a big repo fans out
+across cores), and commits the new and vanished rows in one transaction. A
+query against an unchanged tree is one manifest build plus one ``SELECT``
+— no file is opened.
+
+**Plane A is untouched.** Only emission is indexed. Every claim (which
+annotation targets which declared ID, which write site is an unsanctioned
+writer) is still joined live against epic artifacts read fresh per query.
+
+Escape hatch: ``CW_PLANE_B_NO_INDEX=1`` (``code_query.py --no-index``)
+skips the database entirely — every refresh is a full live scan, the
+phase-1 behaviour, and the dual-run (indexed vs ``--no-index``) zero-diff
+is this index's validation gate. ``CW_PLANE_B_INDEX_DIR`` relocates the
+store (default ``~/.chief-wiggum/cache/plane-b``)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from chief_wiggum import emission_pool, sqlite_store
+from chief_wiggum.manifest import ManifestError, build_manifest, walk_source_files
+
+NO_INDEX_ENV = "CW_PLANE_B_NO_INDEX"
+INDEX_DIR_ENV = "CW_PLANE_B_INDEX_DIR"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS emissions (
+    engine   TEXT NOT NULL,
+    rel      TEXT NOT NULL,
+    blob_sha TEXT NOT NULL,
+    findings TEXT NOT NULL,
+    PRIMARY KEY (engine, rel)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True)
+class Engine:
+    """One Plane B emission source: ``name`` keys its rows, ``select`` is the
+    scanner's exact file-selection predicate over repo-relative paths, and
+    ``emit_one`` its module-level (picklable) per-file emitter — the same
+    ``(findings, skip_reason)`` contract ``emission_pool`` ships to workers."""
+
+    name: str
+    select: Callable[[str], bool]
+    emit_one: emission_pool.EmitOne
+
+
+@dataclass
+class Snapshot:
+    """Plane B as of one ``refresh``. ``emissions[engine]`` maps every
+    readable candidate to its emission dicts, in candidate (walk) order —
+    the order the scanners themselves assemble reports in.
+    ``unscanned[engine]`` lists ``{"file", "reason"}`` for candidates that
+    could not be read. ``served`` holds the paths whose emission came from
+    the persisted index rather than a live read during this refresh."""
+
+    emissions: dict[str, dict[str, list[dict]]] = field(default_factory=dict)
+    unscanned: dict[str, list[dict]] = field(default_factory=dict)
+    served: set[str] = field(default_factory=set)
+    manifest: dict[str, str] | None = None
+
+
+def disabled() -> bool:
+    """True when the escape hatch is set — any non-empty, non-"0" value."""
+    return os.environ.get(NO_INDEX_ENV, "") not in ("", "0")
+
+
+def _db_path(repo: str) -> Path:
+    root = Path(
+        os.environ.get(INDEX_DIR_ENV)
+        or (Path.home() / ".chief-wiggum" / "cache" / "plane-b")
+    )
+    root.mkdir(parents=True, exist_ok=True)
+    repo_id = hashlib.sha256(os.path.abspath(repo).encode()).hexdigest()[:16]
+    return root / f"{repo_id}.sqlite3"
+
+
+def _connect(repo: str) -> sqlite3.Connection | None:
+    """The repo's index (``sqlite_store.open_store``), created on first use.
+    ``None`` when it cannot be opened at all: the caller degrades to a live
+    scan."""
+    try:
+        path = _db_path(repo)
+    except OSError:
+        return None
+    return sqlite_store.open_store(path, _SCHEMA)
+
+
+def _load(
+    conn: sqlite3.Connection, scanner_hash: str
+) -> tuple[dict[tuple[str, str], str], dict[tuple[str, str], list[dict]]]:
+    """``(blobs, payloads)`` for the stored generation: every row's
+    ``blob_sha`` and the decoded findings of every NON-EMPTY row (an empty
+    emission is most files, and needs no decode to serve). A row written
+    under a different ``scanner_hash`` is never returned — the whole table
+    is emptied before the new generation's first write."""
+    row = conn.execute("SELECT value FROM meta WHERE key = 'scanner_hash'").fetchone()
+    if row is None or row[0] != scanner_hash:
+        return {}, {}
+    blobs = {
+        (engine, rel): blob_sha
+        for engine, rel, blob_sha in conn.execute("SELECT engine, rel, blob_sha FROM emissions")
+    }
+    payloads: dict[tuple[str, str], list[dict]] = {}
+    for engine, rel, payload in conn.execute(
+        "SELECT engine, rel, findings FROM emissions WHERE findings != '[]'"
+    ):
+        try:
+            findings = json.loads(payload)
+        except json.JSONDecodeError:
+            findings = None
+        if isinstance(findings, list):
+            payloads[(engine, rel)] = findings
+        else:
+            blobs.pop((engine, rel), None)  # unreadable row: a miss, re-emitted below
+    return blobs, payloads
+
+
+Tree = tuple[list[str], dict[str, str] | None]
+
+
+def scan_tree(repo_root: str | Path) -> Tree:
+    """``(candidates, manifest)`` for the working tree as it is now: every
+    walked file (``walk_source_files``) and the ``rel -> blob_sha`` manifest,
+    or ``None`` for the manifest when it cannot be built (not a git repo).
+    Exposed so a resident caller (``code_query.py serve``) can decide from one
+    scan whether anything changed, then hand the same scan to ``refresh``."""
+    root = Path(repo_root)
+    candidates = walk_source_files(root)
+    try:
+        manifest: dict[str, str] | None = build_manifest(root)
+    except ManifestError:
+        manifest = None
+    return candidates, manifest
+
+
+def refresh(
+    repo_root: str | Path, engines: Sequence[Engine], scanner_hash: str, *, tree: Tree | None = None,
+) -> Snapshot:
+    """Bring the repo's index up to date with its working tree and return
+    the resulting ``Snapshot``. ``tree`` is a ``scan_tree`` result the caller
+    already holds (taken just before this call); omitted, the tree is scanned
+    here. Never raises on an index problem — an unopenable or locked
+    database degrades to a live scan of the misses it could not serve (or of
+    everything), exactly the phase-1 answer."""
+    root = Path(repo_root)
+    snap = Snapshot()
+    if not root.exists():
+        return snap
+    candidates, snap.manifest = tree if tree is not None else scan_tree(root)
+    manifest = snap.manifest or {}
+
+    conn = None if disabled() or snap.manifest is None else _connect(str(root))
+    stored_blobs: dict[tuple[str, str], str] = {}
+    payloads: dict[tuple[str, str], list[dict]] = {}
+    if conn is not None:
+        try:
+            stored_blobs, payloads = _load(conn, scanner_hash)
+        except sqlite3.Error:
+            stored_blobs, payloads = {}, {}
+
+    fresh: list[tuple[str, str, str, str]] = []
+    live_keys: set[tuple[str, str]] = set()
+    for engine in engines:
+        selected = [rel for rel in candidates if engine.select(rel)]
+        hits = {
+            rel for rel in selected
+            if rel in manifest and stored_blobs.get((engine.name, rel)) == manifest[rel]
+        }
+        misses = [rel for rel in selected if rel not in hits]
+        emitted = dict(zip(misses, emission_pool.emit_files(str(root), misses, engine.emit_one), strict=True))
+        out: dict[str, list[dict]] = {}
+        unscanned: list[dict] = []
+        for rel in selected:
+            if rel in hits:
+                out[rel] = payloads.get((engine.name, rel), [])
+                snap.served.add(rel)
+                live_keys.add((engine.name, rel))
+                continue
+            findings, skip_reason = emitted[rel]
+            if skip_reason is not None:
+                unscanned.append({"file": rel, "reason": skip_reason})
+                continue
+            out[rel] = findings
+            if rel in manifest:
+                fresh.append((engine.name, rel, manifest[rel], json.dumps(findings)))
+                live_keys.add((engine.name, rel))
+        snap.emissions[engine.name] = out
+        snap.unscanned[engine.name] = unscanned
+
+    if conn is not None:
+        vanished = [key for key in stored_blobs if key not in live_keys]
+        try:
+            if fresh or vanished or not stored_blobs:
+                _commit(conn, scanner_hash, fresh, vanished, reset=not stored_blobs)
+        except sqlite3.Error:
+            pass  # the answer is already computed; the next refresh re-emits
+        finally:
+            conn.close()
+    return snap
+
+
+def _commit(
+    conn: sqlite3.Connection,
+    scanner_hash: str,
+    fresh: list[tuple[str, str, str, str]],
+    vanished: list[tuple[str, str]],
+    *,
+    reset: bool,
+) -> None:
+    """Write one refresh's delta in a single transaction. ``reset`` empties
+    the table first — a new ``scanner_hash`` generation (or an empty index)
+    must never inherit a row emitted by a different scanner."""
+    with conn:
+        if reset:
+            conn.execute("DELETE FROM emissions")
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('scanner_hash', ?)", (scanner_hash,)
+            )
+        conn.executemany("DELETE FROM emissions WHERE engine = ? AND rel = ?", vanished)
+        conn.executemany(
+            "INSERT OR REPLACE INTO emissions (engine, rel, blob_sha, findings) VALUES (?, ?, ?, ?)",
+            fresh,
+        )
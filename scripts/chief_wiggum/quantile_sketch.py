@@ -0,0 +1,217 @@
+"""Mergeable quantile sketches for raw latency/spend samples (stdlib only).
+
+``check_budget_tree.py --measured`` used to read only a k6 summary export —
+one precomputed ``p95`` per metric — so a budget node declaring ``alpha:
+0.01`` was judged against the 95th percentile, and our own span/latency dumps
+(tens of millions of raw samples, often split across load-test shards) could
+not be evaluated at all. Exact quantiles need every sample in memory;
+averaging per-shard percentiles is simply wrong (percentiles do not average
+any more than they sum — the same fact the budget tree's union-bound
+arithmetic is built on).
+
+``QuantileSketch`` is a log-bucketed histogram (the DDSketch construction):
+a sample ``v > 0`` is counted in bucket ``ceil(log(v) / log(gamma))`` with
+``gamma = (1 + a) / (1 - a)``, so every quantile it answers is within
+relative error ``a`` (``relative_accuracy``, default 1%) of a true sample at
+that rank. Its properties are the ones ingestion needs:
+
+- **Bounded memory.** Bucket count grows with the log of the value RANGE, not
+  the sample count: 1 ms .. 1 hour at 1% is ~760 buckets, whatever the
+  sample count. ``max_buckets`` (at least 2) is a hard cap — past it the
+  LOWEST buckets are folded together, which coarsens only the low quantiles a tail budget
+  never asks about.
+- **Exactly mergeable.** Two sketches with the same accuracy merge by adding
+  bucket counts, and the merge is exactly the sketch of the concatenated
+  samples — so per-shard sketches (``to_dict``/``from_dict``) combine into
+  the same answer one pass over all shards would give.
+- **Any quantile after the fact.** ``quantile(q)`` for every node's own
+  ``1 - alpha``, not a percentile chosen at export time.
+
+Zero (and values within ``1e-9`` of it) have their own counter; negative
+values mirror into a second bucket store, so a signed metric (a spend delta)
+is still ordered correctly.
+"""
+
+from __future__ import annotations
+
+import math
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 4096
+# The serialized form's tag, checked on load: a sketch file is never
+# mistaken for (or silently merged with) some other JSON document.
+SKETCH_FORMAT = "cw-quantile-sketch/1"
+_ZERO_THRESHOLD = 1e-9
+
+
+class QuantileSketch:
+    """A relative-error quantile sketch: ``add`` samples, ``merge`` shards,
+    ask ``quantile(q)``."""
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be in (0, 1), got {relative_accuracy}")
+        # One bucket per sign is the floor: folding a negative bucket into a
+        # positive one would misorder every sample between them.
+        if max_buckets < 2:
+            raise ValueError(f"max_buckets must be >= 2, got {max_buckets}")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._pos: dict[int, int] = {}
+        self._neg: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    # --- ingestion ------------------------------------------------------------
+
+    def _index(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        # The bucket's midpoint in relative terms: within `a` of every value
+        # the bucket holds.
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def add(self, value: float, n: int = 1) -> None:
+        """Count ``value`` ``n`` times. NaN and infinities are rejected —
+        a sketch that silently swallowed them would answer for data it
+        never ordered."""
+        if not math.isfinite(value):
+            raise ValueError(f"cannot sketch non-finite value {value!r}")
+        if n <= 0:
+            return
+        if value > _ZERO_THRESHOLD:
+            self._bump(self._pos, self._index(value), n)
+        elif value < -_ZERO_THRESHOLD:
+            self._bump(self._neg, self._index(-value), n)
+        else:
+            self.zero_count += n
+        self.count += n
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def _bump(self, store: dict[int, int], index: int, n: int) -> None:
+        if index in store:
+            store[index] += n
+            return
+        store[index] = n
+        if len(self._pos) + len(self._neg) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self) -> None:
+        """Fold the lowest-value buckets together until the cap holds — the
+        most negative values first, then the smallest positives — so only
+        the low quantiles lose resolution."""
+        excess = len(self._pos) + len(self._neg) - self.max_buckets
+        if excess <= 0:
+            return
+        if self._neg:
+            keys = sorted(self._neg, reverse=True)  # most negative values first
+            take = min(excess, len(keys) - 1)
+            if take > 0:
+                into = keys[take]
+                self._neg[into] += sum(self._neg.pop(k) for k in keys[:take])
+                excess -= take
+        if excess > 0 and len(self._pos) > 1:
+            keys = sorted(self._pos)
+            take = min(excess, len(keys) - 1)
+            into = keys[take]
+            self._pos[into] += sum(self._pos.pop(k) for k in keys[:take])
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Add ``other``'s samples into this sketch. Both must share a
+        relative accuracy: buckets of different widths do not line up."""
+        if not math.isclose(self.relative_accuracy, other.relative_accuracy):
+            raise ValueError(
+                f"cannot merge sketches of relative accuracy {self.relative_accuracy} "
+                f"and {other.relative_accuracy}"
+            )
+        for store, theirs in ((self._pos, other._pos), (self._neg, other._neg)):
+            for index, n in theirs.items():
+                store[index] = store.get(index, 0) + n
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._collapse()
+
+    # --- queries --------------------------------------------------------------
+
+    def quantile(self, q: float) -> float | None:
+        """The value at quantile ``q`` (0..1), or ``None`` for an empty
+        sketch. ``quantile(0)`` and ``quantile(1)`` are the exact observed
+        min and max, and every estimate is clamped between them."""
+        if not 0 <= q <= 1:
+            raise ValueError(f"quantile must be in [0, 1], got {q}")
+        if self.count == 0:
+            return None
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = 0
+        estimate: float | None = None
+        for index in sorted(self._neg, reverse=True):
+            seen += self._neg[index]
+            if seen > rank:
+                estimate = -self._value(index)
+                break
+        else:
+            seen += self.zero_count
+            if seen > rank:
+                estimate = 0.0
+            else:
+                for index in sorted(self._pos):
+                    seen += self._pos[index]
+                    if seen > rank:
+                        estimate = self._value(index)
+                        break
+        if estimate is None:  # float rounding just below q == 1
+            estimate = self.max
+        return min(max(estimate, self.min), self.max)
+
+    @property
+    def bucket_count(self) -> int:
+        return len(self._pos) + len(self._neg)
+
+    # --- serialization ----------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_buckets": self.max_buckets,
+            "count": self.count,
+            "zero_count": self.zero_count,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            # JSON object keys are strings; pairs keep the ints ints.
+            "positive": sorted(self._pos.items()),
+            "negative": sorted(self._neg.items()),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> QuantileSketch:
+        """Rebuild a sketch from ``to_dict`` output; ``ValueError`` on a
+        shape that is not one (so a wrong file is never merged as empty)."""
+        try:
+            sketch = cls(float(data["relative_accuracy"]), int(data.get("max_buckets", DEFAULT_MAX_BUCKETS)))
+            sketch._pos = {int(i): int(n) for i, n in data["positive"]}
+            sketch._neg = {int(i): int(n) for i, n in data["negative"]}
+            sketch.zero_count = int(data["zero_count"])
+            sketch.count = int(data["count"])
+            if sketch.count:
+                sketch.min, sketch.max = float(data["min"]), float(data["max"])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"not a quantile sketch: {exc}") from exc
+        if sketch.count != sketch.zero_count + sum(sketch._pos.values()) + sum(sketch._neg.values()):
+            raise ValueError("not a quantile sketch: bucket counts do not sum to count")
+        return sketch
@@ -11,10 +11,13 @@ unit-testable; git and provider execution are injected.
 
 from __future__ import annotations
 
+import io
 import json
 import re
 import subprocess
 import sys
+import tempfile
+import threading
 import warnings
 from collections.abc import Callable, Iterable
 from dataclasses import asdict, dataclass, field
@@ -22,6 +25,7 @@ from pathlib import Path
 
 import providers
 
+from chief_wiggum.diff_index import DiffIndex, index_diff, truncated_head
 from chief_wiggum.hashing import stable_hash
 from chief_wiggum.trace_ids import MD_DEFINE_RE, canonical_id
 
@@ -404,8 +408,7 @@ def truncate_text(text: str, max_bytes: int, *, label: str = "content") -> str:
     encoded = text.encode("utf-8")
     if len(encoded) <= max_bytes:
         return text
-    head = encoded[:max_bytes].decode("utf-8", errors="ignore")
-    return head + f"\n\n... [{label} truncated at {max_bytes} bytes of {len(encoded)}] ..."
+    return truncated_head(encoded, max_bytes, len(encoded), label)
 
 
 def assemble_review_prompt(
@@ -481,12 +484,17 @@ def truncate_diff(diff: str, max_bytes: int = DEFAULT_MAX_DIFF_BYTES) -> str:
 # slicing tool already exists and is used one step later in /implement Step
 # 8 (code_query.py orient/trace/guards). Review context assembly reuses the
 # SAME locator rather than re-deriving "what governs this file" from
-# scratch: for each file the diff touches, ask code_query.py orient for its
-# governing stable IDs, then keep only those IDs' declaration blocks from
-# each epic artifact. Any failure (code_query.py missing, a non-zero exit,
+# scratch: ask code_query.py orient (one call for every file the diff
+# touches) for their governing stable IDs, then keep only those IDs'
+# declaration blocks from each epic artifact. Any failure (code_query.py missing, a non-zero exit,
 # malformed JSON, zero IDs resolved) degrades to including the WHOLE
 # artifact — never a broken or silently empty review section.
 
+# The one batched orient call's timeout: a fixed start-up allowance plus a
+# per-file share, so a large diff is not cut off at a single file's budget.
+_ORIENT_TIMEOUT_SECONDS = 30
+_ORIENT_SECONDS_PER_FILE = 1
+
 _DIFF_GIT_HEADER_RE = re.compile(r"^diff --git a/(.+?) b/(.+?)$", re.MULTILINE)
 
 
@@ -494,7 +502,10 @@ def _touched_files(diff_text: str) -> list[str]:
     """Deterministic, deduped list of post-image paths a unified diff
     touches — mirrors consult_ai._touched_files_from_diff's discipline (a
     small, self-contained duplicate rather than an import across modules
-    with very different dependency weights)."""
+    with very different dependency weights). ``run_review`` itself takes the
+    list from its streamed ``DiffIndex.paths`` (same header pattern) rather
+    than re-scanning diff text; this is the form for a caller holding only
+    a diff string."""
     paths: list[str] = []
     seen: set[str] = set()
     for match in _DIFF_GIT_HEADER_RE.finditer(diff_text):
@@ -552,38 +563,45 @@ def slice_markdown_by_ids(text: str, ids: set[str]) -> str:
 def _governing_ids_for_files(
     repo_root: str | Path, epic_slug: str, files: list[str], *, runner: Runner = subprocess.run,
 ) -> set[str]:
-    """Best-effort: ask ``code_query.py orient`` for each touched file's
+    """Best-effort: ask ``code_query.py orient`` for the touched files'
     governing stable IDs (chief-wiggum#332) — the same locator /implement
     Step 8 already uses, reused here so review context assembly stops
-    re-deriving "what governs this file" from scratch. ANY failure (script
-    missing, non-zero exit, malformed JSON, an unscanned/errored envelope)
-    degrades to an empty set — the caller falls back to whole-file
-    inclusion, never a broken review."""
+    re-deriving "what governs this file" from scratch. ONE invocation for
+    every file: a multi-path ``orient`` parses the epic tree and builds its
+    provenance index once and returns the merged ``ids`` (not a process and
+    an epic-tree walk per file, which a 200-file PR turned into hundreds of
+    cold starts). An envelope without ``ids`` (a single path) is read from
+    its ``facts``. ANY failure (script missing, non-zero exit, timeout,
+    malformed JSON) degrades to an empty set — the caller falls back to
+    whole-file inclusion, never a broken review."""
     ids: set[str] = set()
-    if not CODE_QUERY_SCRIPT.is_file():
+    if not files or not CODE_QUERY_SCRIPT.is_file():
         return ids
-    for f in files:
-        try:
-            result = runner(
-                [
-                    sys.executable, str(CODE_QUERY_SCRIPT),
-                    "--repo", str(repo_root), "--epic", epic_slug,
-                    "--format", "json", "orient", f,
-                ],
-                capture_output=True, text=True, timeout=30,
-            )
-            if result.returncode != 0:
+    try:
+        result = runner(
+            [
+                sys.executable, str(CODE_QUERY_SCRIPT),
+                "--repo", str(repo_root), "--epic", epic_slug,
+                "--format", "json", "orient", *files,
+            ],
+            capture_output=True, text=True,
+            timeout=_ORIENT_TIMEOUT_SECONDS + _ORIENT_SECONDS_PER_FILE * len(files),
+        )
+        if result.returncode != 0:
+            return ids
+        envelope = json.loads(result.stdout)
+    except Exception:  # noqa: BLE001 - best-effort; never break the review
+        return ids
+    raw = envelope.get("ids")
+    if not isinstance(raw, list):
+        facts = envelope.get("facts", []) or []
+        raw = [fact.get("id") for fact in facts if isinstance(fact, dict)]
+    for fid in raw:
+        if isinstance(fid, str):
+            try:
+                ids.add(canonical_id(fid))
+            except Exception:  # noqa: BLE001 - a malformed id string, skip it
                 continue
-            envelope = json.loads(result.stdout)
-        except Exception:  # noqa: BLE001 - best-effort; never break the review
-            continue
-        for fact in envelope.get("facts", []) or []:
-            fid = fact.get("id") if isinstance(fact, dict) else None
-            if isinstance(fid, str):
-                try:
-                    ids.add(canonical_id(fid))
-                except Exception:  # noqa: BLE001 - a malformed id string, skip it
-                    continue
     return ids
 
 
@@ -601,6 +619,52 @@ def assert_git_repo(worktree: str | Path, *, runner: Runner = subprocess.run) ->
     return Path(result.stdout.strip())
 
 
+def _stream_git_diff(worktree: str | Path, base: str, timeout: float = 60) -> DiffIndex:
+    """``git diff base...HEAD`` read incrementally into a ``DiffIndex`` — the
+    diff text is spooled to disk, never held whole in memory. ``timeout``
+    bounds the whole run, as ``_git``'s does."""
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(
+            ["git", "diff", f"{base}...HEAD"], cwd=str(worktree),
+            stdout=subprocess.PIPE, stderr=stderr,
+        )
+        watchdog = threading.Timer(timeout, proc.kill)
+        watchdog.start()
+        try:
+            index = index_diff(proc.stdout)
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+            watchdog.cancel()
+        if returncode != 0:
+            index.close()
+            stderr.seek(0)
+            detail = stderr.read().decode("utf-8", errors="replace").strip()
+            raise ReviewError(f"git diff failed: {detail or f'exit {returncode}'}")
+    return index
+
+
+def capture_diff_index(
+    worktree: str | Path, base: str, *, runner: Runner = subprocess.run,
+) -> DiffIndex:
+    """Capture ``base...HEAD`` as a streamed, per-file ``DiffIndex``
+    (``chief_wiggum.diff_index``), refusing if the base ref can't be resolved.
+    The caller closes it (it is a context manager).
+
+    Only the real ``subprocess.run`` streams: an injected ``runner`` returns
+    its output whole, which is then indexed from memory — same index, same
+    rendering."""
+    check = _git(["rev-parse", "--verify", base], worktree, runner)
+    if check.returncode != 0:
+        raise ReviewError(f"base ref cannot be resolved: {base}")
+    if runner is subprocess.run:
+        return _stream_git_diff(worktree, base)
+    result = _git(["diff", f"{base}...HEAD"], worktree, runner)
+    if result.returncode != 0:
+        raise ReviewError(f"git diff failed: {(result.stderr or '').strip()}")
+    return index_diff(io.BytesIO((result.stdout or "").encode("utf-8")))
+
+
 def capture_diff(
     worktree: str | Path,
     base: str,
@@ -608,14 +672,13 @@ def capture_diff(
     runner: Runner = subprocess.run,
     max_bytes: int = DEFAULT_MAX_DIFF_BYTES,
 ) -> str:
-    """Capture ``base...HEAD`` diff, refusing if the base ref can't be resolved."""
-    check = _git(["rev-parse", "--verify", base], worktree, runner)
-    if check.returncode != 0:
-        raise ReviewError(f"base ref cannot be resolved: {base}")
-    result = _git(["diff", f"{base}...HEAD"], worktree, runner)
-    if result.returncode != 0:
-        raise ReviewError(f"git diff failed: {(result.stderr or '').strip()}")
-    return truncate_diff(result.stdout, max_bytes)
+    """Capture ``base...HEAD`` diff, refusing if the base ref can't be resolved.
+
+    Over ``max_bytes``, whole files are kept by relevance and the rest listed
+    (``DiffIndex.render``) rather than cutting the raw text at the byte
+    limit; a diff within the limit is returned unchanged."""
+    with capture_diff_index(worktree, base, runner=runner) as index:
+        return index.render(max_bytes)
 
 
 @dataclass
@@ -852,7 +915,13 @@ def run_review(
     # ref rather than trusting the local ref name, which a fresh worktree
     # routinely leaves stale the moment anything else merges upstream.
     resolved = resolve_review_base(worktree, base, runner=runner)
-    diff = capture_diff(worktree, resolved.ref, runner=runner, max_bytes=max_diff_bytes)
+    # The diff is streamed into a per-file index (spooled to disk, never
+    # held whole): only the files that fit max_diff_bytes are read back, and
+    # the touched-file list covers EVERY file, including the ones the budget
+    # left out.
+    with capture_diff_index(worktree, resolved.ref, runner=runner) as diff_index:
+        diff = diff_index.render(max_diff_bytes)
+        touched = diff_index.paths
     diff_path = out / "impl-diff.txt"
     diff_path.write_text(diff)
     diff_stat = diff_shortstat(worktree, resolved.ref, runner=runner)
@@ -865,7 +934,6 @@ def run_review(
     # or a PARTICULAR artifact whose slice would be empty).
     epic_sections = list(epic_sections)
     if epic_sections and epic_slug:
-        touched = _touched_files(diff)
         if touched:
             governing_ids = _governing_ids_for_files(
                 worktree, epic_slug, touched, runner=code_query_runner
@@ -0,0 +1,139 @@
+"""In-process ``--scanner-version`` for gate scripts, without importing them.
+
+Every versioned gate computes its ``--scanner-version`` the same way: a
+module-level ``_scanner_version()`` whose whole body is ``scanner_version(
+here, cw_dir / "x.py", ...)`` over paths derived from ``Path(__file__)``
+(``chief_wiggum.hashing``, INV-fh-005). ``check_gate_validation`` used to get
+that hash by launching ``python <gate>.py --scanner-version`` — an
+interpreter start plus an import of the whole gate (ratchet.py alone pulls in
+half of ``chief_wiggum``) just to print one hash, once per gate per check.
+
+``static_scanner_deps`` reads the gate's source with ``ast`` and evaluates
+ONLY that function's path arithmetic — ``Path(__file__).resolve()``,
+``.parent``, ``/ "name"``, and local names bound to those — yielding the
+exact ordered path list the gate itself would hash. ``live_scanner_version``
+then hashes them with the same ``scanner_version``, so the result is the
+gate's own answer by construction, not a re-implementation of it.
+
+Anything outside that vocabulary — no ``_scanner_version``, a call other
+than ``Path(__file__).resolve()``, a computed name, a conditional — makes
+``static_scanner_deps`` return ``None``: the caller falls back to the
+subprocess probe, which stays the authority for any gate this reader does
+not fully understand. It never guesses.
+
+The parsed dependency list is memoized per script keyed by the script's
+``(mtime_ns, size, inode)``, so a ``--all`` run parses each gate once; the
+version itself is re-hashed on every call (a dependency edited mid-process
+must still show as stale).
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+import threading
+from pathlib import Path
+
+from chief_wiggum.hashing import scanner_version
+
+_FUNCTION = "_scanner_version"
+
+_lock = threading.Lock()
+_deps_memo: dict[str, tuple[tuple[int, int, int], list[Path] | None]] = {}
+
+
+class _Unsupported(Exception):
+    """The function body uses something this evaluator does not model."""
+
+
+def _eval(node: ast.expr, env: dict[str, Path], script: Path) -> Path:
+    if isinstance(node, ast.Name):
+        if node.id not in env:
+            raise _Unsupported(node.id)
+        return env[node.id]
+    if isinstance(node, ast.Attribute) and node.attr == "parent":
+        return _eval(node.value, env, script).parent
+    if (
+        isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div)
+        and isinstance(node.right, ast.Constant) and isinstance(node.right.value, str)
+    ):
+        return _eval(node.left, env, script) / node.right.value
+    # Path(__file__).resolve() — the only call a _scanner_version makes
+    # before handing paths to scanner_version.
+    if (
+        isinstance(node, ast.Call) and not node.args and not node.keywords
+        and isinstance(node.func, ast.Attribute) and node.func.attr == "resolve"
+        and isinstance(node.func.value, ast.Call)
+        and isinstance(node.func.value.func, ast.Name) and node.func.value.func.id == "Path"
+        and len(node.func.value.args) == 1 and not node.func.value.keywords
+        and isinstance(node.func.value.args[0], ast.Name) and node.func.value.args[0].id == "__file__"
+    ):
+        return script.resolve()
+    raise _Unsupported(ast.dump(node))
+
+
+def _parse_deps(script: Path) -> list[Path] | None:
+    try:
+        tree = ast.parse(script.read_text(), filename=str(script))
+    except (OSError, SyntaxError, ValueError):
+        return None
+    func = next(
+        (n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == _FUNCTION),
+        None,
+    )
+    if func is None or func.args.args or func.args.vararg or func.args.kwarg or func.decorator_list:
+        return None
+    env: dict[str, Path] = {}
+    try:
+        for i, stmt in enumerate(func.body):
+            if i == 0 and isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant):
+                continue  # docstring
+            if (
+                isinstance(stmt, ast.Assign) and len(stmt.targets) == 1
+                and isinstance(stmt.targets[0], ast.Name)
+            ):
+                env[stmt.targets[0].id] = _eval(stmt.value, env, script)
+                continue
+            if (
+                isinstance(stmt, ast.Return) and isinstance(stmt.value, ast.Call)
+                and isinstance(stmt.value.func, ast.Name) and stmt.value.func.id == "scanner_version"
+                and not stmt.value.keywords and stmt.value.args
+                and i == len(func.body) - 1
+            ):
+                return [_eval(arg, env, script) for arg in stmt.value.args]
+            return None
+    except _Unsupported:
+        return None
+    return None
+
+
+def static_scanner_deps(script: str | Path) -> list[Path] | None:
+    """The ordered paths ``script``'s ``_scanner_version()`` hashes, read from
+    its source without importing it; ``None`` when the function is absent or
+    does anything beyond the path arithmetic described in the module doc."""
+    script = Path(script)
+    try:
+        st = os.stat(script)
+    except OSError:
+        return None
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    memo_key = str(script.resolve())
+    with _lock:
+        hit = _deps_memo.get(memo_key)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    deps = _parse_deps(script)
+    with _lock:
+        _deps_memo[memo_key] = (key, deps)
+    return deps
+
+
+def live_scanner_version(script: str | Path) -> str | None:
+    """``script``'s current ``--scanner-version``, computed in process;
+    ``None`` when ``static_scanner_deps`` cannot read it (probe instead).
+    ``OSError`` propagates: a declared dependency that cannot be read is a
+    broken probe, not an absent one."""
+    deps = static_scanner_deps(script)
+    if deps is None:
+        return None
+    return scanner_version(*deps)
@@ -0,0 +1,81 @@
+"""One opener for the derived-data SQLite stores.
+
+The per-file findings cache (``findings_cache``), code_query's plane-B index
+(``plane_b_index``), the factory log's sidecar index (``log_index``) and the
+quality engines' commit, identifier and clone stores (``quality/history.py``,
+``quality/tokens.py``, ``quality/fingerprints.py``) each keep one SQLite file
+of DERIVED data: every row can be recomputed from the repo or the log it
+indexes. They all open it the same way, so that way lives here once:
+
+- WAL journaling, so a reader never blocks on a concurrent writer;
+- the caller's schema applied idempotently (``CREATE ... IF NOT EXISTS``);
+- with a ``version`` mapping, a ``meta (key, value)`` table holding it: a
+  store written under any other version (an index format bump, a changed
+  tokenizer pattern) has every table emptied and ``meta`` rewritten before
+  the connection is returned, so old rows are never read under new rules;
+- a file that is not a database, or that the schema cannot be applied to,
+  is deleted (with its ``-wal``/``-shm`` companions) and created afresh.
+
+Throwing a derived store away costs one cold pass, never a wrong answer — so
+``open_store`` never raises: ``None`` means no store could be opened at all
+(read-only home, no space, or ``create=False`` with nothing on disk) and the
+caller computes live, exactly as it does with its own cache disabled.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Mapping
+from pathlib import Path
+
+_META_SCHEMA = "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+
+
+def _open(
+    path: Path, schema: str, version: Mapping[str, str] | None, timeout: float,
+    isolation_level: str | None,
+) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path), timeout=timeout, isolation_level=isolation_level)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(schema)
+        if version is not None:
+            conn.executescript(_META_SCHEMA)
+            if dict(conn.execute("SELECT key, value FROM meta")) != dict(version):
+                conn.execute("BEGIN IMMEDIATE")
+                tables = [name for (name,) in conn.execute(
+                    "SELECT name FROM sqlite_master"
+                    " WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")]
+                for name in tables:
+                    conn.execute(f'DELETE FROM "{name}"')  # noqa: S608 - names from sqlite_master
+                conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", version.items())
+                conn.execute("COMMIT")
+    except sqlite3.DatabaseError:
+        conn.close()
+        raise
+    return conn
+
+
+def open_store(
+    path: Path, schema: str, version: Mapping[str, str] | None = None, *,
+    create: bool = True, timeout: float = 10, isolation_level: str | None = "",
+) -> sqlite3.Connection | None:
+    """The store at ``path`` with ``schema`` applied, or ``None`` (see the
+    module doc). ``create=False`` is the read path: an absent or unreadable
+    file is ``None`` rather than created or discarded. ``timeout`` and
+    ``isolation_level`` pass through to ``sqlite3.connect``."""
+    try:
+        if not create and not path.is_file():
+            return None
+        return _open(path, schema, version, timeout, isolation_level)
+    except OSError:
+        return None
+    except sqlite3.DatabaseError:
+        if not create:
+            return None
+    try:
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{path}{suffix}").unlink(missing_ok=True)
+        return _open(path, schema, version, timeout, isolation_level)
+    except (OSError, sqlite3.DatabaseError):
+        return None
@@ -0,0 +1,166 @@
+"""Per-suite result reuse for ``ratchet.py score``, keyed by the suite's inputs.
+
+``score`` runs every configured suite on every call — the Go, pytest, and
+jest suites of a polyglot repo one after another — even when the change under
+review touched one of them. A suite's pass-set is a function of its command
+and the files it reads; when neither changed since a run that is still on
+record, re-running it buys nothing.
+
+**The key.** Per suite, a SHA-256 over its definition (``name``, ``cmd``,
+``parser``, ``cwd``, ``report``, ``inputs``) and the git blob listing of its
+inputs *as they are in the working tree* — not ``HEAD``: a throwaway copy of
+the index is ``git add -A``'d (the copy keeps the real index's stat cache, so
+only modified files are re-hashed; the real index is never touched, and the
+blobs ``add`` writes go to a throwaway object directory that borrows the
+repo's own as an alternate, so ``.git/objects`` is never written either) and
+``git ls-files -s`` over the suite's ``inputs`` pathspecs is hashed. Untracked,
+non-ignored files count; ignored ones (build output, ``node_modules``) do not.
+``inputs`` defaults to the whole repo, so an undeclared suite is reused only
+when NOTHING it could have read changed. Every suite's ``report`` and the
+ratchet's own state directory are excluded — ``score`` writes them itself, and
+a key that moved on every run would never hit.
+
+**What the key cannot see.** Toolchain upgrades, environment variables,
+services the suite talks to, and ignored files are outside the tree. So the
+cache is OPT-IN — ``score --suite-cache`` or ``CW_RATCHET_SUITE_CACHE=1``, for
+local iteration; CI should never set either — and a replay is never silent:
+``score`` prints which suites it replayed, and the scorecard records
+``source: "cached"`` per suite so a reviewer can tell a reused measurement
+from a fresh one.
+
+Only measurements are stored: a run with ZERO passing cases is a broken
+instrument (#289) and is re-run next time, never replayed. Entries live in the
+user cache (``~/.chief-wiggum/cache/ratchet-suites``, or
+``CW_RATCHET_SUITE_CACHE_DIR``), never in the target repo. Derived data: a
+missing or corrupt entry, or a tree git cannot list, costs one run, never a
+wrong answer. Without the opt-in nothing is read or written."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+CACHE_DIR_ENV = "CW_RATCHET_SUITE_CACHE_DIR"
+ENABLE_ENV = "CW_RATCHET_SUITE_CACHE"
+
+# Bumped when the stored payload or the key derivation changes shape.
+_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class Result:
+    ids: frozenset[str]
+    files: dict[str, str]
+    exit_code: int | None
+
+
+def enabled() -> bool:
+    """True when the opt-in is set — any non-empty, non-"0" value."""
+    return os.environ.get(ENABLE_ENV, "") not in ("", "0")
+
+
+def _dir() -> Path:
+    return Path(
+        os.environ.get(CACHE_DIR_ENV)
+        or (Path.home() / ".chief-wiggum" / "cache" / "ratchet-suites")
+    )
+
+
+def _git(repo: Path, *args: str, env: dict | None = None) -> str | None:
+    try:
+        proc = subprocess.run(
+            ["git", *args], cwd=repo, capture_output=True, text=True, env=env
+        )
+    except OSError:
+        return None
+    return proc.stdout if proc.returncode == 0 else None
+
+
+def input_listings(
+    repo: Path, pathspecs: Sequence[Sequence[str]], exclude: Sequence[str]
+) -> list[str | None]:
+    """The working-tree blob listing (``git ls-files -s``) under each entry of
+    ``pathspecs`` (an empty entry means the whole repo), minus the repo-relative
+    ``exclude`` paths — one throwaway index (and object directory) for all of
+    them; the repo itself is only read. ``None`` per entry when the repo is
+    not a git work tree or git fails: no key, so no reuse."""
+    none: list[str | None] = [None] * len(pathspecs)
+    if not pathspecs:
+        return none
+    paths = _git(repo, "rev-parse", "--path-format=absolute",
+                 "--git-path", "index", "--git-path", "objects")
+    if paths is None or len(paths.splitlines()) != 2:
+        return none
+    index, objects = paths.splitlines()
+    # Pathspecs are relative to ``repo`` (git runs there), which is also what
+    # a ``--repo`` pointing below the git toplevel scores.
+    magic = [f":(exclude){p}" for p in exclude]
+    with tempfile.TemporaryDirectory(prefix="cw-suite-index-") as tmp:
+        scratch = Path(tmp) / "index"
+        try:
+            shutil.copyfile(index, scratch)
+        except OSError:
+            pass  # no index yet (fresh repo): add -A builds one from scratch
+        # ``add`` writes a blob for every new or modified file; send those to
+        # the throwaway directory and read existing objects through the
+        # repo's store as an alternate.
+        (Path(tmp) / "objects").mkdir()  # git refuses an absent object directory
+        alternates = [objects, *filter(None, [os.environ.get("GIT_ALTERNATE_OBJECT_DIRECTORIES")])]
+        env = {
+            **os.environ,
+            "GIT_INDEX_FILE": str(scratch),
+            "GIT_OBJECT_DIRECTORY": str(Path(tmp) / "objects"),
+            "GIT_ALTERNATE_OBJECT_DIRECTORIES": os.pathsep.join(alternates),
+        }
+        if _git(repo, "add", "-A", "--", ".", *magic, env=env) is None:
+            return none
+        return [
+            _git(repo, "ls-files", "-s", "-z", "--", *(spec or ["."]), *magic, env=env)
+            for spec in pathspecs
+        ]
+
+
+def key(definition: dict, listing: str) -> str:
+    payload = json.dumps({"format": _FORMAT, "suite": definition}, sort_keys=True)
+    h = hashlib.sha256(payload.encode())
+    h.update(b"\0")
+    h.update(listing.encode())
+    return h.hexdigest()
+
+
+def load(cache_key: str) -> Result | None:
+    try:
+        raw = json.loads((_dir() / f"{cache_key}.json").read_text())
+        ids = frozenset(str(i) for i in raw["ids"])
+        files = {str(k): str(v) for k, v in raw["files"].items()}
+        exit_code = raw["exit_code"]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if not ids or (exit_code is not None and not isinstance(exit_code, int)):
+        return None
+    return Result(ids=ids, files=files, exit_code=exit_code)
+
+
+def store(cache_key: str, result: Result) -> None:
+    """Persist a measurement (atomically). Best effort: a failure only costs
+    the next ``score`` a run. Zero-case results are never stored."""
+    if not result.ids:
+        return
+    path = _dir() / f"{cache_key}.json"
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{id(result)}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(
+            {"ids": sorted(result.ids), "files": result.files, "exit_code": result.exit_code},
+            sort_keys=True,
+        ))
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
@@ -14,9 +14,12 @@ from the epic artifacts plus code annotations.
   content store: it returns stable IDs and `file:line` handles, never paraphrased
   contract bodies — callers that want the actual text call `show`.
 - **Plane B — per-file code emissions**: `@cw-trace` sites (`check_traceability`),
-  candidate writer sites (`check_single_writer`). The only cacheable plane
-  (caching is a later issue) — phase 1 here is live-scan, exactly like the two
-  checkers this module builds on.
+  candidate writer sites (`check_single_writer`). The only cacheable plane —
+  served from a persistent per-repo index (`chief_wiggum/plane_b_index.py`)
+  keyed by each file's manifest blob SHA and this module's scanner version,
+  refreshed incrementally on every query so only files whose content changed
+  are re-read. `--no-index` (`CW_PLANE_B_NO_INDEX=1`) is the phase-1
+  live-scan, kept as the index's zero-diff validation.
 
 Every claim (orphans, coverage, writer verdicts, artifact bindings) is computed
 FRESH by joining Plane B onto Plane A at query time — never persisted.
@@ -44,15 +47,19 @@ count beyond the returned window. Ranking (see `_rank_key`): exact ID/path hits
 first, then violations/unsanctioned findings, then proximity (same file >
 package/dir > epic > other), then prod-before-tests (inverted for `verifies`,
 where the test/probe/policy/telemetry side IS the point). Each fact carries its
-own `provenance` (`blob_sha`, `dirty`, `from_cache: false` — phase 1 never
-caches). The envelope's top-level `provenance` is query-level: repo root, epics
+own `provenance` (`blob_sha`, `dirty`, `from_cache` — true when the fact's
+file emission was served from the Plane B index instead of read during this
+query). The envelope's top-level `provenance` is query-level: repo root, epics
 scanned, scanner version.
 
 Verbs (phase 1): `orient`, `governs`, `writers`, `guards`, `verifies`,
-`annotations`, `trace`, `contract`, `state`, `show`. See `docs/code-query.md`.
+`annotations`, `trace`, `contract`, `state`, `show`. `orient` takes several
+paths in one query (`cmd_orient_many`: shared epic model and provenance index,
+merged `ids` plus a per-file breakdown). See `docs/code-query.md`.
 
-Explicitly out of phase 1: a persisted cache, tree-sitter/symbol outlines,
-sqlite, any new annotation convention, a `map` verb beyond module level.
+Explicitly out of phase 1: tree-sitter/symbol outlines, any new annotation
+convention, a `map` verb beyond module level. (The Plane B index above is the
+one persisted store — emission only, never a claim or a Plane A artifact.)
 
 Exit codes: 0 = ok (including a genuinely-empty or unscanned answer),
 2 = usage error (bad repo root, unknown verb).
@@ -61,7 +68,9 @@ Exit codes: 0 = ok (including a genuinely-empty or unscanned answer),
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import subprocess
 import sys
@@ -74,7 +83,10 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 import artifacts  # noqa: E402 — meta-location resolver (chief-wiggum#213)
 import check_single_writer  # noqa: E402
 import check_traceability  # noqa: E402
-from chief_wiggum import external_links  # noqa: E402 — sidecar link store (#213 Phase C)
+
+# external_links: sidecar link store (#213 Phase C); plane_b_index: the
+# persistent Plane B emission index.
+from chief_wiggum import external_links, plane_b_index  # noqa: E402
 
 # Single epic-tree walk (#326): _locate_definitions used to independently
 # rglob + read_text every epic dir it discovers — build_epic_model now backs
@@ -157,7 +169,15 @@ def _locate_definitions(epic_dir: Path) -> dict[str, tuple[str, int]]:
 
 def discover_epics(repo_root: Path, epic: str | None = None) -> list[Epic]:
     """Discover epics under `docs/epics/*` (or just `epic` if given). Plane A is
-    parsed fresh every call — never memoized across queries."""
+    parsed fresh every call — never memoized across queries. The one exception
+    is a `serve` process (see `_Resident`), which re-parses whenever any file
+    under the epics root changes and otherwise serves the parse it holds."""
+    if _RESIDENT is not None and _RESIDENT.serves(repo_root):
+        return _RESIDENT.epics(epic)
+    return _discover_epics_live(repo_root, epic)
+
+
+def _discover_epics_live(repo_root: Path, epic: str | None = None) -> list[Epic]:
     # Resolved through the #213 meta resolver: <repo>/docs/epics in embedded
     # mode (the status quo, byte-identical), the sidecar epics dir otherwise.
     epics_root = artifacts.Resolver.resolve(Path(repo_root)).epics_dir()
@@ -337,7 +357,16 @@ def _build_provenance_index(repo_root: Path) -> ProvenanceIndex | None:
     doesn't consult ``.gitignore``). Annotation/writer/epic-doc provenance
     targets are always real tracked source or docs files in practice; this
     is a deliberate, documented scope boundary, not a silent one.
+
+    Under `serve`, the index is built once per tree state and reused until the
+    manifest or HEAD moves (see `_Resident`).
     """
+    if _RESIDENT is not None and _RESIDENT.serves(repo_root):
+        return _RESIDENT.provenance_index()
+    return _build_provenance_index_live(repo_root)
+
+
+def _build_provenance_index_live(repo_root: Path) -> ProvenanceIndex | None:
     try:
         from chief_wiggum.manifest import (  # noqa: PLC0415
             ManifestError,
@@ -354,8 +383,11 @@ def _build_provenance_index(repo_root: Path) -> ProvenanceIndex | None:
     return manifest, dirty
 
 
-def _file_provenance(repo_root: Path, rel: str, index: ProvenanceIndex | None = None) -> dict:
-    """Per-fact provenance: current blob hash + dirty flag.
+def _file_provenance(
+    repo_root: Path, rel: str, index: ProvenanceIndex | None = None, *, from_cache: bool = False,
+) -> dict:
+    """Per-fact provenance: current blob hash + dirty flag, plus whether the
+    fact's emission was served from the Plane B index (``from_cache``).
 
     When ``index`` (see ``_build_provenance_index``) is given, this is a pure
     dict/set lookup — zero subprocesses. Without one, degrades to the
@@ -374,7 +406,7 @@ def _file_provenance(repo_root: Path, rel: str, index: ProvenanceIndex | None =
         # is_file()-gated check would give a since-deleted tracked file.
         manifest, dirty_paths = index
         blob_sha = manifest.get(rel) if full.is_file() else None
-        return {"blob_sha": blob_sha, "dirty": rel in dirty_paths, "from_cache": False}
+        return {"blob_sha": blob_sha, "dirty": rel in dirty_paths, "from_cache": from_cache}
     blob_sha: str | None = None
     dirty: bool | None = None
     try:
@@ -389,7 +421,7 @@ def _file_provenance(repo_root: Path, rel: str, index: ProvenanceIndex | None =
         dirty = bool(st.stdout.strip())
     except (OSError, subprocess.CalledProcessError):
         pass
-    return {"blob_sha": blob_sha, "dirty": dirty, "from_cache": False}
+    return {"blob_sha": blob_sha, "dirty": dirty, "from_cache": from_cache}
 
 
 def _scanner_version() -> str:
@@ -410,6 +442,10 @@ def _scanner_version() -> str:
     # check_traceability/check_single_writer: a decode-policy change there
     # changes whether a queried file's facts are computed at all, or the
     # query instead reports it `unscanned`/`error`.
+    # plane_b_index.py / emission_pool.py decide which persisted emissions a
+    # query is served and how misses are re-emitted — and this version is the
+    # index's own generation key, so they must move it too; sqlite_store.py
+    # opens (and on a version or corruption mismatch, resets) that index.
     return scanner_version(
         here,
         here.parent / "artifacts.py",
@@ -421,9 +457,43 @@ def _scanner_version() -> str:
         cw_dir / "languages.py",
         cw_dir / "manifest.py", cw_dir / "hashing.py",
         cw_dir / "textio.py",
+        cw_dir / "plane_b_index.py", cw_dir / "emission_pool.py",
+        cw_dir / "sqlite_store.py",
+    )
+
+
+def _single_writer_candidate(rel: str) -> bool:
+    """``check_single_writer``'s file-selection rule, minus the per-query
+    ``exclude`` list (applied at claim time, in ``_scan_writers_union``)."""
+    return Path(rel).suffix in check_single_writer.SOURCE_EXTS and not any(
+        part in check_single_writer.SKIP_PARTS for part in Path(rel).parts
     )
 
 
+# Plane B's two emission sources, in the exact shape each checker emits for
+# its own gate — the index stores what the checkers would have computed, so
+# the golden-parity tests hold whether a fact was indexed or read live.
+_PLANE_B_ENGINES = (
+    plane_b_index.Engine(
+        "check_traceability", check_traceability._file_predicate, check_traceability._emit_file,
+    ),
+    plane_b_index.Engine(
+        "check_single_writer", _single_writer_candidate, check_single_writer._emit_file,
+    ),
+)
+
+
+def _plane_b(repo_root: Path) -> plane_b_index.Snapshot:
+    """Refresh and read the repo's Plane B index — one manifest build, one
+    query, and a live read of only the files whose blob changed since the
+    last refresh (every file under ``--no-index``). Emission only: callers
+    still claim every returned site against Plane A, fresh, per query. Under
+    `serve`, the snapshot is held until the tree changes (see `_Resident`)."""
+    if _RESIDENT is not None and _RESIDENT.serves(repo_root):
+        return _RESIDENT.plane_b()
+    return plane_b_index.refresh(repo_root, _PLANE_B_ENGINES, _scanner_version())
+
+
 def _unscanned_envelope(
     reason: str, *, query_provenance: dict, applicability: str = "inapplicable"
 ) -> dict:
@@ -700,8 +770,34 @@ _SUSPECT_NOTE = (
 )
 
 
+@dataclass
+class _OrientShared:
+    """Everything `orient` reads that does not depend on the path being
+    oriented, computed ONCE for a multi-path `orient` (one query = one
+    process, the #325 same-request batching — never carried across queries):
+    the per-epic word document frequencies, the verified external-link
+    entries, the provenance index, and the hotspot/debt inventories. A
+    single-path `orient` passes none and reads each live, as it always has."""
+
+    doc_freq: dict[str, dict[str, float]]
+    external: tuple[list[dict], list[dict]]
+    provenance: ProvenanceIndex | None
+    hotspots: dict | None
+    debt: dict | None
+
+
+def _orient_shared(repo_root: Path, epics: list[Epic]) -> _OrientShared:
+    return _OrientShared(
+        doc_freq={e.slug: _word_document_frequency(_epic_path_documents(e)) for e in epics},
+        external=_external_link_entries(repo_root),
+        provenance=_build_provenance_index(repo_root),
+        hotspots=_load_hotspots(repo_root),
+        debt=_load_debt(repo_root),
+    )
+
+
 def governing_facts_for_file(
-    repo_root: Path, rel: str, epics: list[Epic]
+    repo_root: Path, rel: str, epics: list[Epic], *, shared: _OrientShared | None = None,
 ) -> tuple[list[Fact], list[str], str | None]:
     """Shared computation behind `orient` and `governs <path>`: every fact that
     governs `rel`, tagged `exact` (direct annotation / precise code_location
@@ -712,7 +808,8 @@ def governing_facts_for_file(
     naming the file when it exists but could not be decoded (#282/#289) — the
     caller turns that into an `error`-applicability envelope rather than
     letting a bare ``read_text()`` crash the whole query with an uncaught
-    ``UnicodeDecodeError``."""
+    ``UnicodeDecodeError``. ``shared`` (a multi-path `orient`) supplies the
+    path-independent inputs instead of re-reading them for this file."""
     root = Path(repo_root)
     full = root / rel
     text, skip_reason = read_text_safe(full)
@@ -720,19 +817,25 @@ def governing_facts_for_file(
         return [], [], f"{rel}: {skip_reason}"
     suffix = full.suffix
     direct_anns = check_traceability.emit_source_annotations(rel, text, suffix)
-    all_ext, all_unresolved = _external_link_entries(root)
+    all_ext, all_unresolved = shared.external if shared else _external_link_entries(root)
     ext_entries = [e for e in all_ext if _norm(e.get("file", "")) == rel]
     warnings = _external_unresolved_warnings(
         [e for e in all_unresolved if _norm(e.get("file", "")) == rel]
     )
-    prov = _file_provenance(root, rel)
+    prov = _file_provenance(root, rel, shared.provenance if shared else None)
+    # Write sites depend on the file alone — emitted once, matched against
+    # every epic's single-write-path invariants in (e).
+    write_sites: list | None = None
 
     facts: list[Fact] = []
     for epic in epics:
         # Corpus-derived word specificity (CTR-fh-050/051): computed once per
         # epic, live from THIS epic's own artifacts, and reused by both
         # inferred-binding call sites (c)/(d) below.
-        doc_freq = _word_document_frequency(_epic_path_documents(epic))
+        doc_freq = (
+            shared.doc_freq[epic.slug] if shared
+            else _word_document_frequency(_epic_path_documents(epic))
+        )
 
         # (a) Direct: @cw-trace annotations in THIS file targeting a defined ID.
         for ann in direct_anns:
@@ -891,8 +994,9 @@ def governing_facts_for_file(
 
         # (e) Single-write-path invariants: is this file a (sanctioned?) writer?
         for inv in epic.sw_invariants:
-            sites = check_single_writer.emit_write_sites(rel, text)
-            for w in check_single_writer.match_writers(sites, inv):
+            if write_sites is None:
+                write_sites = check_single_writer.emit_write_sites(rel, text)
+            for w in check_single_writer.match_writers(write_sites, inv):
                 facts.append(Fact(
                     kind="writer",
                     id=inv.id,
@@ -930,7 +1034,9 @@ def _load_hotspots(repo_root: Path) -> dict | None:
     return doc
 
 
-def _hotspot_facts_for_file(repo_root: Path, rel: str) -> list[Fact]:
+def _hotspot_facts_for_file(
+    repo_root: Path, rel: str, shared: _OrientShared | None = None,
+) -> list[Fact]:
     """The #187 `measured` fact tier: EXACT file-path membership in
     `docs/quality/hotspots.json` ONLY — never `_path_matches_literal_segments`
     or any other lexical channel (INV-fh-007/012). A file gets a hotspot fact
@@ -941,7 +1047,7 @@ def _hotspot_facts_for_file(repo_root: Path, rel: str) -> list[Fact]:
 
     @cw-trace guards CTR-fh-033 CTR-fh-034 INV-fh-007 INV-fh-012
     """
-    doc = _load_hotspots(repo_root)
+    doc = shared.hotspots if shared else _load_hotspots(repo_root)
     if not doc:
         return []
     sha = doc.get("git_sha")
@@ -951,7 +1057,7 @@ def _hotspot_facts_for_file(repo_root: Path, rel: str) -> list[Fact]:
     # #325: `rel` is the SAME file for every fact this function can produce
     # (own-hotspot OR coupled-partner) — compute provenance once rather than
     # once per branch/loop-iteration that happens to match.
-    prov = _file_provenance(repo_root, rel)
+    prov = _file_provenance(repo_root, rel, shared.provenance if shared else None)
     own = by_file.get(rel)
     facts: list[Fact] = []
     if own is not None and own.get("decile") == 10:
@@ -1041,14 +1147,16 @@ def _load_debt(repo_root: Path) -> dict | None:
     return doc
 
 
-def _debt_facts_for_file(repo_root: Path, rel: str) -> list[Fact]:
+def _debt_facts_for_file(
+    repo_root: Path, rel: str, shared: _OrientShared | None = None,
+) -> list[Fact]:
     """The #214 `measured` fact tier: EXACT file-path membership in a debt
     item's `locations` ONLY — never a lexical channel (the same INV-fh-007/012
     discipline as `_hotspot_facts_for_file`). Ranked low by the `measured`
     relation tier; `source: "debt-inventory"` marks the producing layer, and
     provenance carries the generating `target_sha` so a stale inventory is
     visibly attributable."""
-    doc = _load_debt(repo_root)
+    doc = shared.debt if shared else _load_debt(repo_root)
     if not doc:
         return []
     sha = doc.get("target_sha")
@@ -1067,7 +1175,7 @@ def _debt_facts_for_file(repo_root: Path, rel: str) -> list[Fact]:
         if not locs:
             continue
         if prov is None:
-            prov = _file_provenance(repo_root, rel)
+            prov = _file_provenance(repo_root, rel, shared.provenance if shared else None)
         # Grandfathered labeling (#215): a pre-adoption-baseline item is
         # STATED as such (and an expired grandfather loudly so) — the fact
         # stays in the answer either way; only the label changes. Expired-ness
@@ -1114,40 +1222,116 @@ def _debt_facts_for_file(repo_root: Path, rel: str) -> list[Fact]:
     return facts
 
 
-def cmd_orient(repo_root: Path, path: str, epic: str | None, limit: int = DEFAULT_LIMIT, cursor: str | None = None) -> dict:
-    epics = discover_epics(repo_root, epic)
-    rel = _norm(path)
-    full = Path(repo_root) / rel
-    if not full.is_file():
-        return _unscanned_envelope(
-            f"{rel} not found under {repo_root}",
-            query_provenance=_query_provenance(repo_root, epics),
-        )
-    facts, ext_warnings, unscanned_reason = governing_facts_for_file(repo_root, rel, epics)
+def _orient_file(
+    repo_root: Path, rel: str, epics: list[Epic], shared: _OrientShared | None = None,
+) -> tuple[list[Fact], list[str], tuple[str, str] | None]:
+    """One path's `orient` answer: ``(facts, warnings, unscanned)``, where
+    ``unscanned`` is ``(reason, applicability)`` when the path was not read —
+    ``inapplicable`` for a path that does not exist, ``error`` for one that
+    exists but could not be decoded (#289)."""
+    if not (Path(repo_root) / rel).is_file():
+        return [], [], (f"{rel} not found under {repo_root}", "inapplicable")
+    facts, ext_warnings, unscanned_reason = governing_facts_for_file(
+        repo_root, rel, epics, shared=shared,
+    )
     if unscanned_reason is not None:
         # File exists (checked above) but couldn't be read/decoded — a broken
         # instrument, not an honest absence (#289).
+        return [], [], (f"could not read {unscanned_reason}", "error")
+    facts += _hotspot_facts_for_file(repo_root, rel, shared)
+    facts += _debt_facts_for_file(repo_root, rel, shared)
+    return facts, ext_warnings, None
+
+
+def _orient_summary(facts: list[Fact], rel: str, n_epics: int) -> str:
+    return (
+        f"orient: {len(facts)} governing fact(s) for {rel} across {n_epics} epic(s)"
+        if facts else f"orient: scanned, nothing governs {rel} (no annotation or artifact binding found)"
+    )
+
+
+_NO_EPICS_WARNING = "no docs/epics/* found — orienting on annotations/design only would need epic context"
+
+
+def cmd_orient(repo_root: Path, path: str, epic: str | None, limit: int = DEFAULT_LIMIT, cursor: str | None = None) -> dict:
+    epics = discover_epics(repo_root, epic)
+    rel = _norm(path)
+    facts, ext_warnings, unscanned = _orient_file(repo_root, rel, epics)
+    if unscanned is not None:
+        reason, applicability = unscanned
         return _unscanned_envelope(
-            f"could not read {unscanned_reason}",
-            query_provenance=_query_provenance(repo_root, epics),
-            applicability="error",
+            reason, query_provenance=_query_provenance(repo_root, epics), applicability=applicability,
         )
-    facts += _hotspot_facts_for_file(repo_root, rel)
-    facts += _debt_facts_for_file(repo_root, rel)
     warnings = [w for e in epics for w in e.warnings] + ext_warnings
     if not epics:
-        warnings.append("no docs/epics/* found — orienting on annotations/design only would need epic context")
-    summary = (
-        f"orient: {len(facts)} governing fact(s) for {rel} across {len(epics)} epic(s)"
-        if facts else f"orient: scanned, nothing governs {rel} (no annotation or artifact binding found)"
-    )
+        warnings.append(_NO_EPICS_WARNING)
     return build_envelope(
-        facts, verb="orient", summary=summary, warnings=warnings,
+        facts, verb="orient", summary=_orient_summary(facts, rel, len(epics)), warnings=warnings,
         query_provenance=_query_provenance(repo_root, epics),
         limit=limit, cursor=cursor,
     )
 
 
+def cmd_orient_many(
+    repo_root: Path, paths: list[str], epic: str | None, limit: int = DEFAULT_LIMIT, cursor: str | None = None,
+) -> dict:
+    """`orient` over many paths in ONE query — what review context assembly
+    asks for every file a diff touches. One epic-tree parse, one provenance
+    index, one read of the external links and hotspot/debt inventories
+    (``_OrientShared``), then each path oriented exactly as `cmd_orient`
+    would (same facts, same per-file answer).
+
+    Returns the standard envelope over the MERGED facts (ranked and paged
+    like any verb's), plus two batch-only keys: ``ids`` — every distinct
+    stable ID any path's facts carry, never paged away — and ``files`` —
+    per path (normalized, deduplicated, in the order given) its
+    ``applicability``, ``summary``, fact count, and ``ids``. A path that is
+    missing or unreadable is reported as such under ``files`` and in
+    ``warnings``; it never fails the batch. The batch is ``applicable`` when
+    any path was scanned."""
+    epics = discover_epics(repo_root, epic)
+    shared = _orient_shared(repo_root, epics)
+    rels = list(dict.fromkeys(_norm(p) for p in paths))
+    facts: list[Fact] = []
+    warnings = [w for e in epics for w in e.warnings]
+    files: dict[str, dict] = {}
+    for rel in rels:
+        file_facts, ext_warnings, unscanned = _orient_file(repo_root, rel, epics, shared)
+        warnings += ext_warnings
+        if unscanned is not None:
+            reason, applicability = unscanned
+            warnings.append(f"unscanned — {reason}")
+            files[rel] = {"applicability": applicability, "summary": f"unscanned: {reason}",
+                          "facts": 0, "ids": []}
+            continue
+        facts += file_facts
+        files[rel] = {
+            "applicability": "applicable",
+            "summary": _orient_summary(file_facts, rel, len(epics)),
+            "facts": len(file_facts),
+            "ids": sorted({f.id for f in file_facts if f.id}),
+        }
+    if not epics:
+        warnings.append(_NO_EPICS_WARNING)
+    verdicts = {f["applicability"] for f in files.values()}
+    applicability = next(
+        (v for v in ("applicable", "error") if v in verdicts), "inapplicable",
+    )
+    scanned = sum(1 for f in files.values() if f["applicability"] == "applicable")
+    envelope = build_envelope(
+        facts, verb="orient",
+        summary=(
+            f"orient: {len(facts)} governing fact(s) for {scanned} of {len(rels)} path(s) "
+            f"across {len(epics)} epic(s)"
+        ),
+        warnings=warnings, query_provenance=_query_provenance(repo_root, epics),
+        limit=limit, cursor=cursor, applicability=applicability,
+    )
+    envelope["ids"] = sorted({f.id for f in facts if f.id})
+    envelope["files"] = files
+    return envelope
+
+
 # --- verb: governs --------------------------------------------------------------
 
 
@@ -1182,7 +1366,21 @@ def _scan_writers_union(
     if not matching_all:
         return [], inv_to_epic, matching_all
     exclude = sorted({str(Path("docs") / "epics" / e.slug) for e in inv_to_epic.values()})
-    writers = check_single_writer.scan_writers(repo_root, matching_all, exclude=exclude)
+    # Sites come from the Plane B index; the claim runs here, fresh, in the
+    # same per-file order and via the same claim_writers the checker uses, so
+    # the writer list is identical to a live scan_writers call.
+    snap = _plane_b(repo_root)
+    forms = [check_single_writer._distinct_field_forms(inv) for inv in matching_all]
+    writers = []
+    for rel, findings in snap.emissions.get("check_single_writer", {}).items():
+        if check_single_writer._excluded(rel, exclude):
+            continue
+        sites = [check_single_writer.WriteSite(**d) for d in findings]
+        for w in check_single_writer.claim_writers(sites, matching_all, forms):
+            # Rides along like external_symbol on annotations: provenance
+            # only, never part of the Writer's serialized shape.
+            w.from_cache = rel in snap.served
+            writers.append(w)
     return writers, inv_to_epic, matching_all
 
 
@@ -1239,7 +1437,8 @@ def cmd_governs(repo_root: Path, target: str, epic: str | None, limit: int = DEF
             handle=f"{w.file}:{w.line}",
             epic=owner.slug if owner else None,
             extra=w.to_dict(),
-            provenance=_file_provenance(repo_root, w.file, index=index),
+            provenance=_file_provenance(
+                repo_root, w.file, index=index, from_cache=getattr(w, "from_cache", False)),
             exact=True,
             violation=not w.sanctioned,
             proximity=2,
@@ -1308,7 +1507,8 @@ def cmd_writers(repo_root: Path, target: str, epic: str | None, limit: int = DEF
             handle=f"{w.file}:{w.line}",
             epic=owner.slug if owner else None,
             extra=w.to_dict(),
-            provenance=_file_provenance(repo_root, w.file, index=index),
+            provenance=_file_provenance(
+                repo_root, w.file, index=index, from_cache=getattr(w, "from_cache", False)),
             exact=True,
             violation=not w.sanctioned,
             proximity=0,
@@ -1359,7 +1559,15 @@ def cmd_writers(repo_root: Path, target: str, epic: str | None, limit: int = DEF
 
 
 def _all_source_annotations(repo_root: Path) -> tuple[list, list[str]]:
-    anns = check_traceability.scan_source(repo_root)
+    # Plane B index: the same annotations, in the same order, scan_source
+    # would emit — served per file when its blob is unchanged.
+    snap = _plane_b(repo_root)
+    anns = []
+    for rel, findings in snap.emissions.get("check_traceability", {}).items():
+        for d in findings:
+            ann = check_traceability.Annotation(**d)
+            ann.from_cache = rel in snap.served
+            anns.append(ann)
     # Second annotation source (#213 Phase C): external-link-store entries fold
     # into the same Annotation stream (sidecar mode only — embedded yields
     # nothing). Entries are VERIFIED first (F7): ok entries fold in as exact,
@@ -1433,7 +1641,8 @@ def _annotation_fact(
         handle=handle,
         epic=owner.slug if owner else None,
         extra=extra,
-        provenance=_file_provenance(repo_root, handle_file, index=index),
+        provenance=_file_provenance(
+            repo_root, handle_file, index=index, from_cache=getattr(ann, "from_cache", False)),
         exact=exact,
         proximity=0,
         prod=prod,
@@ -2094,6 +2303,328 @@ def render_text(envelope: dict) -> str:
     return "\n".join(lines) + "\n"
 
 
+# --- serve: resident state over a Unix socket ----------------------------------
+#
+# A wave run asks hundreds of structural questions; as one process per question,
+# each pays the interpreter + checker imports, a full epic-tree parse, a
+# manifest build and a Plane B index read before it can answer. `serve` keeps
+# all of that resident in one process and answers the same verbs, with the
+# same envelopes, over a Unix-domain socket.
+#
+# Freshness is re-proved on EVERY request, never assumed from elapsed time:
+#
+# - Plane A is re-parsed when any file under the epics root changes (path,
+#   mtime, size). This is the one place the "read live" doctrine is relaxed
+#   to "read live unless provably unchanged".
+# - Plane B and the provenance index are rebuilt when HEAD, the manifest, or
+#   the stat of a candidate the manifest cannot see (a gitignored file) moves.
+# - The daemon's own code is covered too: if `_scanner_version()` no longer
+#   matches the version it started with, it answers with an error and exits
+#   rather than serve facts computed by superseded logic.
+
+SOCKET_ENV = "CW_CODE_QUERY_SOCKET"
+# One positional argument per verb: its request field / argparse dest.
+_VERB_ARGS = {
+    "orient": "path", "governs": "target", "writers": "target", "guards": "ctr_id",
+    "verifies": "ctr_id", "annotations": "id", "trace": "id", "contract": "query",
+    "state": "query", "show": "handle",
+}
+
+
+class UsageError(Exception):
+    """A request the CLI would reject with exit 2 (unknown verb, missing
+    argument, nonexistent epic slug). `serve` returns it as `{"error": ...}`."""
+
+
+def run_verb(
+    repo_root: Path, verb: str, arg: str, *, epic: str | None = None, limit: int = DEFAULT_LIMIT,
+    cursor: str | None = None, verb_filter: str | None = None,
+) -> dict:
+    """One verb call, shared by the CLI and `serve`. Raises `UsageError`.
+    `orient` also takes a LIST of paths — answered by `cmd_orient_many`."""
+    if verb not in _VERB_ARGS:
+        raise UsageError(f"unknown verb: {verb}")
+    batch = verb == "orient" and isinstance(arg, list)
+    if batch:
+        if not arg or not all(isinstance(a, str) and a for a in arg):
+            raise UsageError("orient requires one or more path arguments")
+    elif not isinstance(arg, str) or not arg:
+        raise UsageError(f"{verb} requires a {_VERB_ARGS[verb]} argument")
+    epic_check_dir = artifacts.Resolver.resolve(repo_root).epic_dir(epic) if epic else None
+    if epic_check_dir is not None and not epic_check_dir.is_dir():
+        # A nonexistent epic slug is a usage error (a typo), exactly like the
+        # other checkers' missing epic_dir — NOT a "scanned, nothing governs"
+        # empty answer, which would serve absence of knowledge as knowledge.
+        raise UsageError(f"epic dir not found: {epic_check_dir}")
+    kw = {"limit": limit, "cursor": cursor}
+    if batch:
+        return cmd_orient_many(repo_root, arg, epic, **kw)
+    if verb == "annotations":
+        return cmd_annotations(repo_root, arg, epic, verb_filter, **kw)
+    handler = {
+        "orient": cmd_orient, "governs": cmd_governs, "writers": cmd_writers,
+        "guards": cmd_guards, "verifies": cmd_verifies, "trace": cmd_trace,
+        "contract": cmd_contract, "state": cmd_state, "show": cmd_show,
+    }[verb]
+    return handler(repo_root, arg, epic, **kw)
+
+
+def _emit_query_telemetry(verb: str, repo: str, target: str | list | None, envelope: dict) -> None:
+    if isinstance(target, list):  # a multi-path orient has no single path
+        target = None
+    try:  # factory telemetry; no-op unless enabled, never breaks the query
+        _here = os.path.dirname(os.path.abspath(__file__))
+        if _here not in sys.path:
+            sys.path.insert(0, _here)
+        from factory_log import emit_query
+        hit_count = len(envelope["facts"]) + envelope["omitted"]
+        emit_query(verb, repo=repo, path=target, hit_count=hit_count)
+    except Exception:
+        pass
+
+
+class _Resident:
+    """Everything `serve` keeps between requests, each piece tagged with the
+    tree state it was computed from (see the section comment above)."""
+
+    def __init__(self, repo_root: Path):
+        self.repo_root = Path(repo_root)
+        self._resolved = self.repo_root.resolve()
+        self._epics: dict[str | None, tuple[tuple, list[Epic]]] = {}
+        self._tree_key: tuple | None = None
+        self._tree: plane_b_index.Tree | None = None
+        self._plane_b: plane_b_index.Snapshot | None = None
+        self._provenance: tuple[ProvenanceIndex | None] | None = None
+        self._checked = False
+        self.refreshes = 0
+
+    def serves(self, repo_root: Path) -> bool:
+        return Path(repo_root).resolve() == self._resolved
+
+    def begin_request(self) -> None:
+        """Mark the tree state unverified for this request. The check itself
+        runs on first use, so a Plane-A-only verb (`contract`, `show`) never
+        pays for a manifest build."""
+        self._checked = False
+
+    def _check_tree(self) -> None:
+        """Re-key the tree state once per request. Anything computed from a
+        different state is dropped; a tree that cannot be keyed (no git) is
+        never reused."""
+        if self._checked:
+            return
+        self._checked = True
+        tree = plane_b_index.scan_tree(self.repo_root)
+        key = self._key_for(tree)
+        if key is None or key != self._tree_key:
+            self._plane_b = None
+            self._provenance = None
+        self._tree_key, self._tree = key, tree
+
+    def _key_for(self, tree: plane_b_index.Tree) -> tuple | None:
+        candidates, manifest = tree
+        if manifest is None:
+            return None
+        try:
+            head = subprocess.run(
+                ["git", "rev-parse", "--verify", "-q", "HEAD"], cwd=str(self.repo_root),
+                capture_output=True, text=True,
+            ).stdout.strip()
+        except OSError:
+            return None
+        unmanifested = []
+        for rel in candidates:
+            if rel in manifest or not any(e.select(rel) for e in _PLANE_B_ENGINES):
+                continue
+            try:
+                st = (self.repo_root / rel).stat()
+            except OSError:
+                continue
+            unmanifested.append((rel, st.st_mtime_ns, st.st_size))
+        return head, manifest, tuple(unmanifested)
+
+    def epics(self, epic: str | None) -> list[Epic]:
+        fingerprint = _plane_a_fingerprint(self.repo_root)
+        held = self._epics.get(epic)
+        if held is None or held[0] != fingerprint:
+            held = (fingerprint, _discover_epics_live(self.repo_root, epic))
+            self._epics[epic] = held
+        return list(held[1])
+
+    def plane_b(self) -> plane_b_index.Snapshot:
+        self._check_tree()
+        if self._plane_b is None:
+            self._plane_b = plane_b_index.refresh(
+                self.repo_root, _PLANE_B_ENGINES, _scanner_version(), tree=self._tree,
+            )
+            self.refreshes += 1
+        return self._plane_b
+
+    def provenance_index(self) -> ProvenanceIndex | None:
+        self._check_tree()
+        if self._provenance is None:
+            self._provenance = (_build_provenance_index_live(self.repo_root),)
+        return self._provenance[0]
+
+
+def _plane_a_fingerprint(repo_root: Path) -> tuple:
+    """Every file under the resolved epics root with its mtime and size —
+    plus the root itself, so a sidecar re-election re-parses too."""
+    epics_root = artifacts.Resolver.resolve(Path(repo_root)).epics_dir()
+    entries = []
+    for dirpath, _dirnames, filenames in os.walk(epics_root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, st.st_mtime_ns, st.st_size))
+    return str(epics_root), tuple(sorted(entries))
+
+
+# Set only inside a `serve` process; every other code path sees None and
+# behaves exactly as a one-shot CLI call.
+_RESIDENT: _Resident | None = None
+
+
+def default_socket_path(repo_root: Path) -> Path:
+    """`CW_CODE_QUERY_SOCKET`, else one socket per repo under
+    `~/.chief-wiggum/run/` (kept short: AF_UNIX paths cap near 100 bytes)."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    repo_id = hashlib.sha256(os.path.abspath(repo_root).encode()).hexdigest()[:16]
+    return Path.home() / ".chief-wiggum" / "run" / f"code-query-{repo_id}.sock"
+
+
+def handle_request(repo_root: Path, request: object) -> dict:
+    """One decoded request -> one JSON-serializable reply. Requests are
+    `{"verb", "arg", "epic"?, "limit"?, "cursor"?, "verb_filter"?}`; the
+    reply is the verb's envelope, or `{"error", "repo"}` (an `orient` "arg"
+    may be a list of paths: the batch envelope). `{"verb": "ping"}`
+    reports the daemon's repo and scanner version; `{"verb": "shutdown"}`
+    stops it after replying."""
+    if not isinstance(request, dict):
+        return {"error": "request must be a JSON object", "repo": str(repo_root)}
+    verb = request.get("verb")
+    if verb == "ping":
+        return {"ok": True, "repo": str(repo_root), "scanner_version": _scanner_version()}
+    if verb == "shutdown":
+        return {"ok": True}
+    limit = request.get("limit", DEFAULT_LIMIT)
+    if not isinstance(limit, int) or isinstance(limit, bool):
+        return {"error": "limit must be an integer", "repo": str(repo_root)}
+    if _RESIDENT is not None:
+        _RESIDENT.begin_request()
+    try:
+        envelope = run_verb(
+            repo_root, str(verb), request.get("arg"), epic=request.get("epic"), limit=limit,
+            cursor=request.get("cursor"), verb_filter=request.get("verb_filter"),
+        )
+    except UsageError as exc:
+        return {"error": str(exc), "repo": str(repo_root)}
+    _emit_query_telemetry(str(verb), str(repo_root), request.get("arg"), envelope)
+    return envelope
+
+
+def serve(repo_root: Path, socket_path: Path, *, idle_timeout: float | None = None) -> int:
+    """Answer newline-delimited JSON requests on `socket_path` until a
+    `shutdown` request, `idle_timeout` seconds without a connection, or the
+    daemon's own code changes. Requests are handled one at a time — the
+    resident state is not shared across threads. Returns the exit code."""
+    global _RESIDENT
+    import socket  # noqa: PLC0415 — only the daemon needs it
+    import socketserver  # noqa: PLC0415
+
+    if socket_path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()  # stale: its daemon is gone
+        else:
+            print(f"Error: a code_query daemon is already serving {socket_path}", file=sys.stderr)
+            return 2
+        finally:
+            probe.close()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    started_version = _scanner_version()
+    _RESIDENT = _Resident(repo_root)
+    state = {"stop": False, "exit": 0}
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    reply: dict = {"error": f"malformed request: {exc}"}
+                else:
+                    if _scanner_version() != started_version:
+                        reply = {"error": "code_query changed since this daemon started; restart it",
+                                 "stale": True}
+                        state.update(stop=True, exit=1)
+                    else:
+                        reply = handle_request(repo_root, request)
+                        if isinstance(request, dict) and request.get("verb") == "shutdown":
+                            state["stop"] = True
+                self.wfile.write((json.dumps(reply) + "\n").encode())
+                self.wfile.flush()
+                if state["stop"]:
+                    return
+
+    class Server(socketserver.UnixStreamServer):
+        def handle_timeout(self) -> None:
+            state["stop"] = True
+
+    old_umask = os.umask(0o177)  # the socket answers for this user only
+    try:
+        server = Server(str(socket_path), Handler)
+    except OSError as exc:  # e.g. a path past the AF_UNIX length limit
+        _RESIDENT = None
+        print(f"Error: cannot listen on {socket_path}: {exc}", file=sys.stderr)
+        return 2
+    finally:
+        os.umask(old_umask)
+    server.timeout = idle_timeout
+    print(f"code_query: serving {repo_root} on {socket_path}", file=sys.stderr, flush=True)
+    try:
+        while not state["stop"]:
+            server.handle_request()
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+        _RESIDENT = None
+    return state["exit"]
+
+
+def query_daemon(socket_path: Path, request: dict, *, timeout: float = 60.0) -> dict | None:
+    """Send one request to a running daemon; `None` when none is listening
+    (the caller answers locally instead)."""
+    import socket  # noqa: PLC0415
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(socket_path))
+        sock.sendall((json.dumps(request) + "\n").encode())
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    except OSError:
+        return None
+    finally:
+        sock.close()
+    try:
+        reply = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return reply if isinstance(reply, dict) else None
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Agent-facing architecture knowledge CLI (contracts/invariants/state machines/ui-spec + code annotations)"
@@ -2104,10 +2635,17 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
     parser.add_argument("--cursor")
     parser.add_argument("--scanner-version", action="store_true", help="Print the hash-derived scanner version and exit")
+    parser.add_argument(
+        "--no-index", action="store_true",
+        help="Bypass the persistent Plane B index: read every source file live for this query "
+        "(sets CW_PLANE_B_NO_INDEX — see chief_wiggum/plane_b_index.py).",
+    )
     sub = parser.add_subparsers(dest="verb")
 
-    p = sub.add_parser("orient")
-    p.add_argument("path")
+    p = sub.add_parser(
+        "orient", help="What governs a file; several paths are answered as one batch (ids + per-file)",
+    )
+    p.add_argument("path", nargs="+")
     p = sub.add_parser("governs")
     p.add_argument("target")
     p = sub.add_parser("writers")
@@ -2118,7 +2656,7 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument("ctr_id")
     p = sub.add_parser("annotations")
     p.add_argument("id")
-    p.add_argument("--verb")
+    p.add_argument("--verb", dest="verb_filter")
     p = sub.add_parser("trace")
     p.add_argument("id")
     p = sub.add_parser("contract")
@@ -2127,6 +2665,15 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument("query")
     p = sub.add_parser("show")
     p.add_argument("handle")
+    p = sub.add_parser("serve", help="Keep Plane A/B resident and answer verbs over a Unix socket")
+    p.add_argument("--idle-timeout", type=float, default=None,
+                   help="Exit after this many seconds without a connection (default: never)")
+    parser.add_argument(
+        "--socket", nargs="?", const="", default=None,
+        help="serve: listen here; any other verb: ask the daemon here first, answering locally "
+        "if none is listening. Bare --socket means the per-repo default "
+        f"(~/.chief-wiggum/run/, or ${SOCKET_ENV}).",
+    )
 
     args = parser.parse_args(argv)
 
@@ -2134,6 +2681,9 @@ def main(argv: list[str] | None = None) -> int:
         print(_scanner_version())
         return 0
 
+    if args.no_index:
+        os.environ[plane_b_index.NO_INDEX_ENV] = "1"
+
     if not args.verb:
         print("Error: a verb is required unless --scanner-version is given", file=sys.stderr)
         return 2
@@ -2144,41 +2694,44 @@ def main(argv: list[str] | None = None) -> int:
     if not repo_root.is_dir():
         print(f"Error: repo not found: {args.repo}", file=sys.stderr)
         return 2
-    epic_check_dir = artifacts.Resolver.resolve(repo_root).epic_dir(args.epic) if args.epic else None
-    if epic_check_dir is not None and not epic_check_dir.is_dir():
-        # A nonexistent epic slug is a usage error (a typo), exactly like the
-        # other checkers' missing epic_dir — NOT a "scanned, nothing governs"
-        # empty answer, which would serve absence of knowledge as knowledge.
-        print(f"Error: epic dir not found: {epic_check_dir}", file=sys.stderr)
-        return 2
-
-    kw = {"limit": args.limit, "cursor": args.cursor}
-    dispatch = {
-        "orient": lambda: cmd_orient(repo_root, args.path, args.epic, **kw),
-        "governs": lambda: cmd_governs(repo_root, args.target, args.epic, **kw),
-        "writers": lambda: cmd_writers(repo_root, args.target, args.epic, **kw),
-        "guards": lambda: cmd_guards(repo_root, args.ctr_id, args.epic, **kw),
-        "verifies": lambda: cmd_verifies(repo_root, args.ctr_id, args.epic, **kw),
-        "annotations": lambda: cmd_annotations(repo_root, args.id, args.epic, args.verb, **kw),
-        "trace": lambda: cmd_trace(repo_root, args.id, args.epic, **kw),
-        "contract": lambda: cmd_contract(repo_root, args.query, args.epic, **kw),
-        "state": lambda: cmd_state(repo_root, args.query, args.epic, **kw),
-        "show": lambda: cmd_show(repo_root, args.handle, args.epic, **kw),
-    }
-    envelope = dispatch[args.verb]()
-
-    target_arg = getattr(args, "path", None) or getattr(args, "target", None) or getattr(args, "ctr_id", None) \
-        or getattr(args, "id", None) or getattr(args, "query", None) or getattr(args, "handle", None)
-    try:  # factory telemetry; no-op unless enabled, never breaks the query
-        import os
-        _here = os.path.dirname(os.path.abspath(__file__))
-        if _here not in sys.path:
-            sys.path.insert(0, _here)
-        from factory_log import emit_query
-        hit_count = len(envelope["facts"]) + envelope["omitted"]
-        emit_query(args.verb, repo=args.repo, path=target_arg, hit_count=hit_count)
-    except Exception:
-        pass
+    socket_path = None
+    if args.socket is not None:
+        socket_path = Path(args.socket) if args.socket else default_socket_path(repo_root)
+    if args.verb == "serve":
+        return serve(repo_root, socket_path or default_socket_path(repo_root), idle_timeout=args.idle_timeout)
+
+    target_arg = getattr(args, _VERB_ARGS[args.verb])
+    if args.verb == "orient" and len(target_arg) == 1:
+        target_arg = target_arg[0]  # one path: the single-file envelope, as ever
+    verb_filter = args.verb_filter if args.verb == "annotations" else None
+    envelope = None
+    if socket_path is not None:
+        # The daemon answers for the repo it was started on; a reply for a
+        # different repo (a reused socket path) is never passed off as ours.
+        # Telemetry is the daemon's to emit for requests it answers.
+        reply = query_daemon(socket_path, {
+            "verb": args.verb, "arg": target_arg, "epic": args.epic, "limit": args.limit,
+            "cursor": args.cursor, "verb_filter": verb_filter,
+        })
+        served_repo = (reply or {}).get("repo") or (reply or {}).get("provenance", {}).get("repo")
+        if reply is None or reply.get("stale") or not served_repo \
+                or Path(served_repo).resolve() != repo_root.resolve():
+            pass  # no daemon, an exiting one, or another repo's: answer locally
+        elif "error" in reply:
+            print(f"Error: {reply['error']}", file=sys.stderr)
+            return 2
+        else:
+            envelope = reply
+    if envelope is None:
+        try:
+            envelope = run_verb(
+                repo_root, args.verb, target_arg, epic=args.epic, limit=args.limit,
+                cursor=args.cursor, verb_filter=verb_filter,
+            )
+        except UsageError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 2
+        _emit_query_telemetry(args.verb, args.repo, target_arg, envelope)
 
     if args.format == "json":
         print(json.dumps(envelope, indent=2))
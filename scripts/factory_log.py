@@ -62,14 +62,18 @@ Event schema (one JSON object per line):
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+from chief_wiggum import emission_pool, log_index  # noqa: E402
 from chief_wiggum.hashing import stable_hash  # noqa: E402
 
 DEFAULT_LOG = Path.home() / ".chief-wiggum" / "factory-log.jsonl"
@@ -522,25 +526,16 @@ def ingested_request_ids() -> set[str]:
     files that keep their old turns — without this, every re-run would re-add
     every previously-ingested turn and inflate cost without bound. Keyed on the
     API request ID, which is unique per turn and stable across re-reads.
+
+    Served from the sidecar index's persisted id set (``chief_wiggum.log_index``)
+    plus a live scan of whatever the index has not caught up to yet, so a
+    re-run parses only the lines appended since the last read — not the ledger.
     """
-    seen: set[str] = set()
     path = log_path()
-    if not path.is_file():
-        return seen
-    try:
-        with path.open() as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    r = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if r.get("event") == CLAUDE_CODE and r.get("request_id"):
-                    seen.add(r["request_id"])
-    except OSError:
-        return seen
+    indexed = log_index.request_ids(path)
+    seen, end = indexed if indexed is not None else (set(), 0)
+    seen.update(r["request_id"] for r in _stream(path, end, event=CLAUDE_CODE)
+                if r.get("request_id"))
     return seen
 
 
@@ -594,106 +589,95 @@ def ingest_claude_transcripts(root: Path | None = None, repo: str | None = None,
     ticket's turns. Dedup is by request id and tagging happens at first
     ingest, so an unbounded catch-up run during a build would permanently
     strand that build's turns untagged.
+
+    **Incremental.** Transcripts are append-only, so each file's progress is
+    checkpointed in the log's sidecar index (``log_index.Checkpoint``: inode,
+    byte offset, a hash of the bytes before it) and a re-run reads only what
+    was appended since — a file that did not grow is not even opened, which is
+    what makes running this after every session cheap. A checkpoint never
+    moves past a turn this run did not settle: one beyond ``until`` (or whose
+    append failed) is re-read next time, and one before ``since`` voids the
+    checkpoint for any later run whose window reaches back over it. Dedup
+    reads the index's persisted request-id set, not the ledger. The unread
+    bytes are parsed across a process pool when there are enough of them
+    (``_scan_transcripts``); dedup, attribution and the append stay here, in
+    file order, so the ledger is written exactly as a serial run writes it.
+    ``CW_FACTORY_LOG_NO_INDEX=1`` disables the checkpoints with the index.
     """
     root = Path(root) if root is not None else DEFAULT_TRANSCRIPT_ROOT
     if ticket is not None and repo is None and cwd_prefix is None:
         raise ValueError("ingest ticket tagging needs an attribution guard: pass repo and/or cwd_prefix")
     pricing, multipliers = load_pricing(), load_cache_multipliers()
-    seen = ingested_request_ids()
-    n = 0
+    log = log_path()
+    checkpoints = log_index.transcript_checkpoints(log)
+    jobs: list[tuple[str, int, int, str, float | None]] = []
     for f in _iter_transcript_files(root):
         try:
-            lines = f.read_text(errors="ignore").splitlines()
+            st = f.stat()
         except OSError:
             continue
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                e = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if e.get("type") != "assistant":
-                continue
-            msg = e.get("message")
-            if not isinstance(msg, dict):
-                continue
-            usage = msg.get("usage")
-            if not isinstance(usage, dict):
-                continue
-            req = e.get("requestId") or e.get("uuid")
-            if not req or req in seen:
-                continue
+        cp = checkpoints.get(str(f))
+        if (cp is not None and cp.inode == st.st_ino and cp.pos <= st.st_size
+                and (cp.since_skipped is None or (since is not None and since > cp.since_skipped))):
+            if cp.pos == st.st_size:
+                continue  # nothing appended since the last ingest: not even opened
+            jobs.append((str(f), st.st_ino, cp.pos, cp.tail, cp.since_skipped))
+        else:
+            jobs.append((str(f), st.st_ino, 0, "", None))
 
-            ts = _parse_iso_ts(e.get("timestamp"))
+    seen: set[str] | None = None
+    settled: dict[str, log_index.Checkpoint] = {}
+    n = 0
+    for (f, inode, _pos, _tail, since_skipped), (start, turns, end) in zip(
+            jobs, _scan_transcripts(jobs), strict=True):
+        if start == 0:
+            since_skipped = None  # re-read from byte 0 (new, replaced or rewritten file)
+        if turns and seen is None:
+            seen = ingested_request_ids()
+        for pos, t in turns:
+            req = t["req"]
+            if req in seen:
+                continue
+            ts = t["ts"]
             if since is not None and ts is not None and ts < since:
+                since_skipped = ts if since_skipped is None else max(since_skipped, ts)
                 continue
             if until is not None and ts is not None and ts > until:
-                continue
-
-            tin = _coerce_token(usage.get("input_tokens")) or 0
-            tout = _coerce_token(usage.get("output_tokens")) or 0
-            cache_read = _coerce_token(usage.get("cache_read_input_tokens")) or 0
-            creation = usage.get("cache_creation")
-            creation = creation if isinstance(creation, dict) else {}
-            w5 = _coerce_token(creation.get("ephemeral_5m_input_tokens"))
-            w1 = _coerce_token(creation.get("ephemeral_1h_input_tokens"))
-            if w5 is None and w1 is None:
-                # Older/flatter shape: one undifferentiated cache-creation count.
-                # Price it at the 5m rate — the default TTL, and the cheaper of
-                # the two, so an unknown TTL can't silently overstate cost.
-                w5 = _coerce_token(usage.get("cache_creation_input_tokens")) or 0
-                w1 = 0
-            w5, w1 = w5 or 0, w1 or 0
-
-            model = msg.get("model")
-            # `<synthetic>` turns are harness-generated (e.g. cancellations) and
-            # were never billed — they carry no real model to price.
-            if not model or model == "<synthetic>":
-                continue
-
-            # An all-zero usage line is not a billable turn. It matters because a
-            # request's usage is repeated on EVERY content-block line it produced
-            # (thinking, text, tool_use), and dedup keeps the first line seen — so
-            # a stray zero line arriving first would shadow the real usage and
-            # undercount the request. Skipping zeros makes the dedup
-            # order-independent instead of relying on file ordering.
-            if (tin + tout + cache_read + w5 + w1) == 0:
+                end = min(end, pos)  # still in flight for a later run: never checkpoint past it
                 continue
 
             rec = {
                 "ts": ts or 0,
                 "event": CLAUDE_CODE,
                 "request_id": req,
-                "model": model,
+                "model": t["model"],
                 # Belt-and-braces: `isSidechain` is the primary signal, but a
                 # sub-agent transcript living under a `/subagents/` path
                 # counts too, even on an older record shape that omits the
                 # flag (chief-wiggum#345).
-                "query_source": ("subagent" if (e.get("isSidechain") or "/subagents/" in str(f))
+                "query_source": ("subagent" if (t["sidechain"] or "/subagents/" in f)
                                  else "repl_main_thread"),
-                "tokens_in": tin,
-                "tokens_out": tout,
-                "cache_read": cache_read,
-                "cache_creation": w5 + w1,
+                "tokens_in": t["tin"],
+                "tokens_out": t["tout"],
+                "cache_read": t["cache_read"],
+                "cache_creation": t["w5"] + t["w1"],
                 # Split by TTL as well as totalled: a 5m write bills 1.25x and a
                 # 1h write 2x, so the mix is the difference between two very
                 # different bills for identical work (session_cost_report).
-                "cache_write_5m": w5,
-                "cache_write_1h": w1,
+                "cache_write_5m": t["w5"],
+                "cache_write_1h": t["w1"],
                 "source": "transcript",
             }
-            if e.get("sessionId"):
-                rec["session_id"] = e["sessionId"]
-            cwd = e.get("cwd")
+            if t["session_id"]:
+                rec["session_id"] = t["session_id"]
+            cwd = t["cwd"]
             if cwd:
                 # Recorded so a turn can be attributed to a ticket at READ time
                 # (ticket_cost's cwd+window slice) as well as by the tag applied
                 # here — dedup is by request id, so a turn ingested untagged by a
                 # catch-up run could otherwise never be attributed (#345).
                 rec["cwd"] = str(cwd)
-            agent = e.get("attributionAgent")
+            agent = t["agent"]
             if agent:
                 # The sub-agent TYPE (e.g. general-purpose, Explore) — a type
                 # name, never prompt content. Deliberately NOT stored in `skill`:
@@ -714,17 +698,151 @@ def ingest_claude_transcripts(root: Path | None = None, repo: str | None = None,
                     tag = bool(derived) and derived in (repo, str(repo).split("/")[-1])
                 if tag:
                     rec["ticket"] = str(ticket)
-            cost = cost_for_usage(model, tin, tout, cache_read=cache_read,
-                                  cache_write_5m=w5, cache_write_1h=w1,
+            cost = cost_for_usage(t["model"], t["tin"], t["tout"], cache_read=t["cache_read"],
+                                  cache_write_5m=t["w5"], cache_write_1h=t["w1"],
                                   pricing=pricing, multipliers=multipliers)
             if cost is not None:
                 rec["cost_usd"] = cost
             if _append(rec):
                 seen.add(req)
                 n += 1
+            else:
+                end = min(end, pos)  # not written: the next run retries it
+        tail = _tail_hash(f, end)
+        if tail is not None:
+            settled[f] = log_index.Checkpoint(inode, end, tail, since_skipped)
+    log_index.store_transcript_checkpoints(log, settled)
     return n
 
 
+# Below this many unread transcript bytes a process pool's startup cost exceeds
+# the parse it would parallelize — read in-process instead.
+_PARALLEL_TRANSCRIPT_BYTES = 8 << 20
+
+# Bytes just before a checkpoint's offset that are hashed to prove the file was
+# appended to, not rewritten in place, since the checkpoint was taken.
+_TAIL_BYTES = 256
+
+
+def _tail_hash(path: str, pos: int) -> str | None:
+    try:
+        with open(path, "rb") as fh:
+            fh.seek(max(0, pos - _TAIL_BYTES))
+            return hashlib.sha256(fh.read(pos - max(0, pos - _TAIL_BYTES))).hexdigest()
+    except OSError:
+        return None
+
+
+def _scan_transcript(path: str, start: int, tail: str) -> tuple[int, list[tuple[int, dict]], int]:
+    """The billable assistant turns in one transcript from byte ``start`` on.
+
+    Returns ``(start, turns, end)``: the offset actually read from (``0``
+    when the bytes before ``start`` no longer hash to ``tail`` — the file was
+    rewritten, so the checkpoint is void), ``[(line_offset, turn)]`` for every
+    line that is an assistant turn with a real model and non-zero usage, and
+    the offset just past the last newline-terminated line. An unterminated
+    tail is parsed too — a transcript need not end in a newline — but lies
+    beyond ``end``, so it is re-read until its newline lands.
+
+    Pure per file and module-level, so ``_scan_transcripts`` can shard it
+    across processes; everything that depends on the log (dedup, windows,
+    attribution, pricing) stays in the caller. A ``turn`` carries only the
+    usage fields the ingest prices — never message content.
+    """
+    if start and _tail_hash(path, start) != tail:
+        start = 0
+    turns: list[tuple[int, dict]] = []
+    end = start
+    try:
+        with open(path, "rb") as fh:
+            fh.seek(start)
+            for line in fh:
+                # An unterminated final line is either still being written or
+                # the file's last record without a trailing newline. Parse it
+                # either way (a half-written record fails to decode), but never
+                # checkpoint past it: the next run re-reads it, and request-id
+                # dedup keeps a turn taken now from being counted twice.
+                pos = end
+                if line.endswith(b"\n"):
+                    end += len(line)
+                try:
+                    e = json.loads(line.decode("utf-8", errors="ignore"))
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(e, dict) or e.get("type") != "assistant":
+                    continue
+                msg = e.get("message")
+                if not isinstance(msg, dict):
+                    continue
+                usage = msg.get("usage")
+                if not isinstance(usage, dict):
+                    continue
+                req = e.get("requestId") or e.get("uuid")
+                if not req:
+                    continue
+
+                tin = _coerce_token(usage.get("input_tokens")) or 0
+                tout = _coerce_token(usage.get("output_tokens")) or 0
+                cache_read = _coerce_token(usage.get("cache_read_input_tokens")) or 0
+                creation = usage.get("cache_creation")
+                creation = creation if isinstance(creation, dict) else {}
+                w5 = _coerce_token(creation.get("ephemeral_5m_input_tokens"))
+                w1 = _coerce_token(creation.get("ephemeral_1h_input_tokens"))
+                if w5 is None and w1 is None:
+                    # Older/flatter shape: one undifferentiated cache-creation count.
+                    # Price it at the 5m rate — the default TTL, and the cheaper of
+                    # the two, so an unknown TTL can't silently overstate cost.
+                    w5 = _coerce_token(usage.get("cache_creation_input_tokens")) or 0
+                    w1 = 0
+                w5, w1 = w5 or 0, w1 or 0
+
+                model = msg.get("model")
+                # `<synthetic>` turns are harness-generated (e.g. cancellations) and
+                # were never billed — they carry no real model to price.
+                if not model or model == "<synthetic>":
+                    continue
+
+                # An all-zero usage line is not a billable turn. It matters because a
+                # request's usage is repeated on EVERY content-block line it produced
+                # (thinking, text, tool_use), and dedup keeps the first line seen — so
+                # a stray zero line arriving first would shadow the real usage and
+                # undercount the request. Skipping zeros makes the dedup
+                # order-independent instead of relying on file ordering.
+                if (tin + tout + cache_read + w5 + w1) == 0:
+                    continue
+
+                turns.append((pos, {
+                    "req": req, "ts": _parse_iso_ts(e.get("timestamp")), "model": model,
+                    "tin": tin, "tout": tout, "cache_read": cache_read, "w5": w5, "w1": w1,
+                    "sidechain": bool(e.get("isSidechain")), "session_id": e.get("sessionId"),
+                    "cwd": e.get("cwd"), "agent": e.get("attributionAgent"),
+                }))
+    except OSError:
+        return start, [], start
+    return start, turns, end
+
+
+def _scan_transcripts(jobs: list[tuple[str, int, int, str, float | None]]) -> list:
+    """``_scan_transcript`` over every job, in job order — across a process
+    pool (``CW_SCAN_WORKERS``, as for the gate scanners) when enough unread
+    bytes justify one, in-process otherwise or when a pool cannot start."""
+    args = [(f, pos, tail) for f, _inode, pos, tail, _since in jobs]
+    unread = 0
+    for f, pos, _tail in args:
+        try:
+            unread += max(0, os.path.getsize(f) - pos)
+        except OSError:
+            continue
+    n = min(emission_pool.workers(), len(args))
+    if n > 1 and unread >= _PARALLEL_TRANSCRIPT_BYTES:
+        try:
+            with ProcessPoolExecutor(max_workers=n) as pool:
+                return list(pool.map(_scan_transcript, *zip(*args, strict=True)))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass
+    return [_scan_transcript(*a) for a in args]
+
+
 def count_transcript_turns(root: Path | None = None, *, since: float | None = None,
                           until: float | None = None, repo: str | None = None,
                           cwd_prefix: str | None = None) -> dict:
@@ -897,19 +1015,93 @@ def ingest_claude_code(path: Path, repo: str | None = None, ticket: str | None =
 
 # ---- reading / aggregation ---------------------------------------------------
 
-def read_log(path: Path | None = None) -> list[dict]:
+def _matches(r, *, event: str | None = None, repo: str | None = None, ticket: str | None = None,
+             since: float | None = None, until: float | None = None) -> bool:
+    """The push-down predicate, applied to every parsed record whether or not
+    the index pre-selected it — the index narrows what is read, this decides
+    what matches. A record with no numeric ``ts`` is outside every window."""
+    if not isinstance(r, dict):
+        return all(v is None for v in (event, repo, ticket, since, until))
+    if event is not None and r.get("event") != event:
+        return False
+    if repo is not None and r.get("repo") != repo:
+        return False
+    if ticket is not None and (r.get("ticket") is None or str(r["ticket"]) != str(ticket)):
+        return False
+    if since is not None or until is not None:
+        ts = r.get("ts")
+        if isinstance(ts, bool) or not isinstance(ts, (int, float)):
+            return False
+        if since is not None and ts < since:
+            return False
+        if until is not None and ts > until:
+            return False
+    return True
+
+
+def _stream(path: Path, start: int = 0, **filters):
+    """Matching records from byte ``start`` to EOF, one line at a time."""
+    try:
+        with path.open("rb") as fh:
+            fh.seek(start)
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    r = json.loads(line)
+                except ValueError:
+                    continue
+                if _matches(r, **filters):
+                    yield r
+    except OSError:
+        return
+
+
+def iter_log(path: Path | None = None, *, event: str | None = None, repo: str | None = None,
+             ticket: str | None = None, since: float | None = None, until: float | None = None):
+    """Stream the log's records in file order, keeping only those matching
+    every given filter: ``event`` and ``repo`` by equality, ``ticket`` by its
+    string form (consults tag ``42``, ingests ``"42"``), and ``since``/``until``
+    as an inclusive window on ``ts``.
+
+    Constant memory — one line at a time, never the whole ledger. With any
+    filter set, the sidecar index (``chief_wiggum.log_index``) supplies the
+    byte offsets of the candidate lines so only those are read and parsed;
+    without one (or with the index disabled/unusable) the file is streamed
+    linearly. Both paths yield exactly the same records.
+    """
     path = path or log_path()
     if not path.is_file():
-        return []
-    out = []
-    for line in path.read_text().splitlines():
-        line = line.strip()
-        if line:
-            try:
-                out.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return out
+        return
+    filters = {"event": event, "repo": repo, "ticket": ticket, "since": since, "until": until}
+    hit = None
+    if any(v is not None for v in filters.values()):
+        hit = log_index.offsets(path, **filters)
+    if hit is None:
+        yield from _stream(path, **filters)
+        return
+    positions, end = hit
+    try:
+        with path.open("rb") as fh:
+            for pos in positions:
+                fh.seek(pos)
+                try:
+                    r = json.loads(fh.readline())
+                except ValueError:
+                    continue
+                if _matches(r, **filters):
+                    yield r
+    except OSError:
+        return
+    yield from _stream(path, end, **filters)
+
+
+def read_log(path: Path | None = None, **filters) -> list[dict]:
+    """``list(iter_log(path, **filters))`` — for callers that need the whole
+    slice at once (``aggregate`` counts it). Pass filters rather than slicing
+    the result: they are pushed down to the index."""
+    return list(iter_log(path, **filters))
 
 
 def aggregate(records: list[dict], repo: str | None = None) -> dict:
@@ -1461,9 +1653,7 @@ def main() -> int:
         print(f"factory_log: ingested {n} api_request event(s) from {args.otel_file}")
         return 0
     if args.cmd == "cost-report":
-        records = read_log()
-        if args.repo:
-            records = [r for r in records if r.get("repo") == args.repo]
+        records = read_log(event=CLAUDE_CODE, repo=args.repo)
         rep = session_cost_report(records, top=args.top)
         # Always exit 0 — report-only by construction (see session_cost_report).
         print(json.dumps(rep, indent=2) if args.format == "json" else render_cost_report(rep))
@@ -1513,7 +1703,7 @@ def main() -> int:
             emit_demotion(demotion["gate"], demotion["seed_class"], repo=args.repo, ticket=args.ticket)
         return 0
     if args.cmd == "aggregate":
-        agg = aggregate(read_log(), repo=args.repo)
+        agg = aggregate(read_log(repo=args.repo), repo=args.repo)
         print(render_report(agg, repo=args.repo) if args.format == "text"
               else json.dumps(agg, indent=2))
         return 0
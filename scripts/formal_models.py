@@ -7,6 +7,7 @@ templates/formal-models/. Provides:
 
 - Schema validation
 - Pure-Python state machine graph analysis (reachable states, dead states, etc.)
+- Path analysis: covering test paths, shortest paths, simple-path counts
 - Conversion to XState v5 JSON
 - Hypothesis RuleBasedStateMachine code generation
 - deal/icontract DbC decorator code generation
@@ -14,7 +15,8 @@ templates/formal-models/. Provides:
 
 CLI:
     python3 scripts/formal_models.py validate <model.json>
-    python3 scripts/formal_models.py graph <state-machine.json>
+    python3 scripts/formal_models.py graph <state-machine.json> [--coverage all|transition|edge-pair] [--max-paths N]
+    python3 scripts/formal_models.py paths <state-machine.json|models-dir>... [--full]
     python3 scripts/formal_models.py convert <state-machine.json> --format xstate
     python3 scripts/formal_models.py generate <model.json> --format hypothesis|deal|guards-py|guards-go
 """
@@ -22,10 +24,13 @@ CLI:
 from __future__ import annotations
 
 import argparse
+import copy
+import hashlib
 import json
 import re
 import sys
 from collections import defaultdict, deque
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -195,51 +200,340 @@ def analyze_graph(sm: dict) -> GraphAnalysis:
     )
 
 
-def enumerate_paths(sm: dict, max_depth: int = 20) -> list[list[dict]]:
-    """Enumerate all simple paths from initial state to terminal states (DFS, no cycles).
-
-    Returns a list of paths, where each path is a list of
-    {state, event, next_state, guards} dicts.
-    """
-    initial = sm["initial"]
-    terminal_states = {
-        s for s, defn in sm["states"].items()
-        if defn.get("type") == "terminal"
+def _step(t: dict) -> dict:
+    """One path step: ``{state, event, next_state, guards}``."""
+    return {
+        "state": t["from"],
+        "event": t["event"],
+        "next_state": t["to"],
+        "guards": [g.get("description", "") for g in t.get("guards", [])],
     }
 
-    # Build transition lookup: from_state → [(to, event, guards, actions)]
+
+def _terminal_states(sm: dict) -> set[str]:
+    return {s for s, defn in sm["states"].items() if defn.get("type") == "terminal"}
+
+
+def _transitions_by_source(sm: dict) -> dict[str, list[dict]]:
     tx_by_source: dict[str, list[dict]] = defaultdict(list)
     for t in sm.get("transitions", []):
         tx_by_source[t["from"]].append(t)
+    return tx_by_source
 
-    paths: list[list[dict]] = []
 
-    def dfs(state: str, path: list[dict], visited: set[str]) -> None:
-        if state in terminal_states:
-            paths.append(list(path))
-            return
+def iter_paths(
+    sm: dict, max_depth: int = 20, max_paths: int | None = None
+) -> Iterator[list[dict]]:
+    """Stream every simple path from the initial state to a terminal state.
+
+    The same paths, in the same order, as the recursive DFS ``enumerate_paths``
+    always returned — but yielded one at a time from an explicit stack, so a
+    caller that prints, writes or counts them never holds the whole set, and
+    ``max_paths`` stops the walk itself (not just the output) once that many
+    have been produced. The number of simple paths is exponential in the
+    density of the machine: a few dozen states with cross-links run to
+    millions. Use ``covering_paths`` when the goal is a test suite.
+    """
+    if max_paths is not None and max_paths <= 0:
+        return
+    initial = sm["initial"]
+    terminal_states = _terminal_states(sm)
+    tx_by_source = _transitions_by_source(sm)
+
+    if initial in terminal_states:
+        yield []
+        return
+    produced = 0
+    path: list[dict] = []
+    visited = {initial}
+    # One iterator per depth over the outgoing transitions still to try.
+    stack = [iter(tx_by_source.get(initial, []))]
+    while stack:
+        t = next(stack[-1], None)
+        if t is None:
+            stack.pop()
+            if path:
+                visited.discard(path.pop()["next_state"])
+            continue
+        next_state = t["to"]
+        if next_state in visited:
+            continue
+        path.append(_step(t))
+        if next_state in terminal_states:
+            yield list(path)
+            produced += 1
+            if max_paths is not None and produced >= max_paths:
+                return
+            path.pop()
+            continue
         if len(path) >= max_depth:
-            return
-        for t in tx_by_source.get(state, []):
-            next_state = t["to"]
-            if next_state in visited:
-                continue
-            step = {
-                "state": state,
-                "event": t["event"],
-                "next_state": next_state,
-                "guards": [g.get("description", "") for g in t.get("guards", [])],
-            }
-            path.append(step)
-            visited.add(next_state)
-            dfs(next_state, path, visited)
-            visited.discard(next_state)
             path.pop()
+            continue
+        visited.add(next_state)
+        stack.append(iter(tx_by_source.get(next_state, [])))
+
+
+def enumerate_paths(
+    sm: dict, max_depth: int = 20, max_paths: int | None = None
+) -> list[list[dict]]:
+    """Enumerate all simple paths from initial state to terminal states (DFS, no cycles).
+
+    Returns a list of paths, where each path is a list of
+    {state, event, next_state, guards} dicts. ``max_paths`` caps the list
+    (see ``iter_paths``, which this materializes).
+    """
+    return list(iter_paths(sm, max_depth=max_depth, max_paths=max_paths))
+
+
+COVERAGE_CRITERIA = ("transition", "edge-pair")
+
+
+def covering_paths(
+    sm: dict, criterion: str = "transition", max_paths: int | None = None
+) -> Iterator[list[dict]]:
+    """Stream a bounded path set that covers every reachable transition
+    (``criterion="transition"``) or every reachable pair of consecutive
+    transitions (``"edge-pair"``).
+
+    Each path is built around the first requirement not yet covered, in model
+    order: the shortest route from the initial state to where it starts, the
+    transition (or pair) itself, then the shortest way on to a terminal state
+    — preferring, at each step of that tail, a transition not yet covered
+    among those that get equally close. Everything a path walks counts as
+    covered, so the set is far smaller than one path per requirement. Paths
+    may revisit states (a cycle's back edge is a requirement like any other);
+    a path whose last state cannot reach any terminal ends there.
+
+    Cost is one BFS from the initial state and one backward BFS from the
+    terminals, then O(path length) per path: at most one path per transition
+    (per pair for edge-pair), against the exponential simple-path count of
+    ``iter_paths``. Requirements unreachable from the initial state are never
+    attempted (``analyze_graph`` already reports their states unreachable).
+    ``max_paths`` stops the stream early.
+    """
+    if criterion not in COVERAGE_CRITERIA:
+        raise ValueError(f"unknown coverage criterion {criterion!r} (expected one of {COVERAGE_CRITERIA})")
+    if max_paths is not None and max_paths <= 0:
+        return
+    initial = sm["initial"]
+    terminal_states = _terminal_states(sm)
+    transitions = sm.get("transitions", [])
+    tx_by_source = _transitions_by_source(sm)
+
+    # Shortest route from initial to every reachable state (BFS tree).
+    parent: dict[str, int | None] = {initial: None}
+    queue: deque[str] = deque([initial])
+    index_of = {id(t): i for i, t in enumerate(transitions)}
+    while queue:
+        state = queue.popleft()
+        for t in tx_by_source.get(state, []):
+            if t["to"] not in parent:
+                parent[t["to"]] = index_of[id(t)]
+                queue.append(t["to"])
+
+    # Distance from every state to its nearest terminal (backward BFS).
+    tx_by_target: dict[str, list[dict]] = defaultdict(list)
+    for t in transitions:
+        tx_by_target[t["to"]].append(t)
+    to_terminal = {s: 0 for s in terminal_states}
+    queue = deque(terminal_states)
+    while queue:
+        state = queue.popleft()
+        for t in tx_by_target.get(state, []):
+            if t["from"] not in to_terminal:
+                to_terminal[t["from"]] = to_terminal[state] + 1
+                queue.append(t["from"])
+
+    def prefix(state: str) -> list[int]:
+        route: list[int] = []
+        while (i := parent[state]) is not None:
+            route.append(i)
+            state = transitions[i]["from"]
+        route.reverse()
+        return route
+
+    # A requirement is a tuple of transition indices. Under edge-pair, a
+    # transition with no successor has no pair to be part of, so it stands
+    # as its own requirement — edge-pair coverage implies transition coverage.
+    requirements: list[tuple[int, ...]] = []
+    for i, t in enumerate(transitions):
+        if t["from"] not in parent:
+            continue
+        successors = tx_by_source.get(t["to"], []) if criterion == "edge-pair" else []
+        if not successors:
+            requirements.append((i,))
+        requirements.extend((i, index_of[id(u)]) for u in successors)
+    covered: set[tuple[int, ...]] = set()
+
+    def walked(route: list[int]) -> set[tuple[int, ...]]:
+        done: set[tuple[int, ...]] = {(i,) for i in route}
+        if criterion == "edge-pair":
+            done.update(zip(route, route[1:], strict=False))
+        return done
+
+    produced = 0
+    for req in requirements:
+        if req in covered:
+            continue
+        route = prefix(transitions[req[0]]["from"]) + list(req)
+        state = transitions[route[-1]]["to"]
+        # The tail: shortest way on to a terminal, uncovered steps first.
+        # Every step strictly lowers the distance, so it cannot loop.
+        while state not in terminal_states and state in to_terminal:
+            closer = [
+                index_of[id(t)] for t in tx_by_source.get(state, [])
+                if to_terminal.get(t["to"], -1) == to_terminal[state] - 1
+            ]
+            last = route[-1]
+            fresh = [i for i in closer if ((i,) if criterion == "transition" else (last, i)) not in covered]
+            route.append((fresh or closer)[0])
+            state = transitions[route[-1]]["to"]
+        covered |= walked(route)
+        yield [_step(transitions[i]) for i in route]
+        produced += 1
+        if max_paths is not None and produced >= max_paths:
+            return
+
+
+# ---------------------------------------------------------------------------
+# Path analysis engine — in process, replacing the Node @xstate/graph bridge
+# ---------------------------------------------------------------------------
+
+# Past this many simple paths a cyclic machine's count is reported as a lower
+# bound (``simple_paths_exact: false``) instead of walked to the end.
+SIMPLE_PATH_COUNT_BUDGET = 100_000
+
+# model_hash -> path_report. One process (an /architect or /implement run
+# rendering every model in an epic) analyses each distinct model once.
+_PATH_REPORTS: dict[str, dict] = {}
 
-    dfs(initial, [], {initial})
+
+def model_hash(sm: dict) -> str:
+    """Content hash of a model: key order and whitespace do not matter."""
+    canonical = json.dumps(sm, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def shortest_paths(sm: dict) -> dict[str, list[dict]]:
+    """The shortest path (fewest transitions) from the initial state to every
+    reachable state, in BFS discovery order; the initial state maps to ``[]``.
+    One BFS — ``getShortestPaths``' answer without the Dijkstra per state."""
+    initial = sm["initial"]
+    tx_by_source = _transitions_by_source(sm)
+    paths: dict[str, list[dict]] = {initial: []}
+    queue: deque[str] = deque([initial])
+    while queue:
+        state = queue.popleft()
+        for t in tx_by_source.get(state, []):
+            if t["to"] not in paths:
+                paths[t["to"]] = [*paths[state], _step(t)]
+                queue.append(t["to"])
     return paths
 
 
+def count_simple_paths(sm: dict, budget: int = SIMPLE_PATH_COUNT_BUDGET) -> tuple[int, bool]:
+    """``(count, exact)``: how many simple paths lead from the initial state
+    to a terminal state — what ``iter_paths`` would yield with no depth cap.
+
+    When the part of the machine reachable from the initial state (a path
+    ends at its first terminal) has no cycle, every path is simple and the
+    count is one memoized sum per state: linear, however many millions it
+    comes to. A machine with a cycle is counted by walking, and stops at
+    ``budget`` with ``exact=False`` — counting simple paths in a general graph
+    has no shortcut, and the count is a summary figure, not a test suite.
+    """
+    initial = sm["initial"]
+    terminal_states = _terminal_states(sm)
+    tx_by_source = _transitions_by_source(sm)
+
+    counts: dict[str, int] = {}
+    on_stack: set[str] = set()
+    cyclic = False
+    # Post-order DFS: a state's count is the sum over its transitions of the
+    # target's count; a terminal counts 1 and is never walked out of.
+    stack: list[tuple[str, Iterator[dict]]] = []
+
+    def enter(state: str) -> None:
+        if state in terminal_states:
+            counts[state] = 1
+            return
+        on_stack.add(state)
+        stack.append((state, iter(tx_by_source.get(state, []))))
+
+    enter(initial)
+    while stack and not cyclic:
+        state, pending = stack[-1]
+        t = next(pending, None)
+        if t is not None:
+            if t["to"] in on_stack:
+                cyclic = True
+            elif t["to"] not in counts:
+                enter(t["to"])
+            continue
+        stack.pop()
+        on_stack.discard(state)
+        counts[state] = sum(counts[u["to"]] for u in tx_by_source.get(state, []))
+    if not cyclic:
+        return counts[initial], True
+
+    walked = 0
+    for _ in iter_paths(sm, max_depth=len(sm["states"]), max_paths=budget + 1):
+        walked += 1
+    return (budget, False) if walked > budget else (walked, True)
+
+
+def path_report(sm: dict) -> dict:
+    """The test-path analysis for one state machine: ``{"paths": [{target,
+    steps, length}], "summary": {...}}`` — the shape ``test-paths.json`` has
+    always had, computed in this process.
+
+    ``paths`` is the transition cover (``covering_paths``), which reaches
+    every reachable state and walks every reachable transition in a handful
+    of paths, where the Node bridge listed every simple path to every state —
+    exponential, and the slow half of each render. The summary keeps its
+    keys (``shortest_paths_count`` is the number of reachable states, one
+    shortest path each) and adds the reachability split, the simple-path
+    count (exact, or a lower bound), and the model hash.
+
+    Memoized per process by ``model_hash``: rendering the same model for
+    several views, or the models of a whole epic, analyses each once. The
+    returned dict is a copy, safe to mutate.
+    """
+    key = model_hash(sm)
+    cached = _PATH_REPORTS.get(key)
+    if cached is None:
+        paths = [
+            {"target": p[-1]["next_state"], "steps": p, "length": len(p)}
+            for p in covering_paths(sm, "transition")
+            if p
+        ]
+        states_covered = {sm["initial"]} if paths else set()
+        triples: set[tuple[str, str, str]] = set()
+        for path in paths:
+            for step in path["steps"]:
+                states_covered.update((step["state"], step["next_state"]))
+                triples.add((step["state"], step["event"], step["next_state"]))
+        reachable = shortest_paths(sm)
+        simple, exact = count_simple_paths(sm)
+        cached = _PATH_REPORTS[key] = {
+            "paths": paths,
+            "summary": {
+                "total_paths": len(paths),
+                "coverage": "transition",
+                "states_covered": len(states_covered),
+                "states_total": len(sm["states"]),
+                "transitions_covered": len(triples),
+                "shortest_paths_count": len(reachable),
+                "reachable_states": sorted(reachable),
+                "unreachable_states": sorted(set(sm["states"]) - set(reachable)),
+                "simple_paths": simple,
+                "simple_paths_exact": exact,
+                "model_hash": key,
+            },
+        }
+    return copy.deepcopy(cached)
+
+
 # ---------------------------------------------------------------------------
 # Conversion: state machine → XState v5 JSON
 # ---------------------------------------------------------------------------
@@ -783,15 +1077,43 @@ def cmd_graph(args: argparse.Namespace) -> int:
         print(f"  DEAD (non-terminal, no outgoing): {', '.join(sorted(analysis.dead_states))}")
     print(f"  All terminals reachable: {analysis.all_terminals_reachable}")
 
-    paths = enumerate_paths(data)
-    print(f"  Paths to terminal states: {len(paths)}")
-    for i, path in enumerate(paths):
+    # Streamed: a dense machine's simple paths never sit in memory at once,
+    # and --max-paths bounds the walk itself.
+    if args.coverage == "all":
+        label, paths = "Paths to terminal states", iter_paths(data, max_paths=args.max_paths)
+    else:
+        label = f"{args.coverage.capitalize()}-covering paths"
+        paths = covering_paths(data, args.coverage, max_paths=args.max_paths)
+    print(f"  {label}:")
+    count = 0
+    for count, path in enumerate(paths, 1):
         steps = " → ".join(f"{s['state']}--{s['event']}-->{s['next_state']}" for s in path)
-        print(f"    [{i+1}] {steps}")
+        print(f"    [{count}] {steps}")
+    capped = args.max_paths is not None and count >= args.max_paths
+    print(f"  {label}: {count}{' (--max-paths reached)' if capped else ''}")
 
     return 0
 
 
+def cmd_paths(args: argparse.Namespace) -> int:
+    """Path analysis for every state machine named (files, or directories
+    searched for ``*.json``) in this one process — non-state-machine JSON in
+    a directory is skipped."""
+    files: list[Path] = []
+    for arg in args.models:
+        p = Path(arg)
+        files.extend(sorted(p.glob("*.json")) if p.is_dir() else [p])
+    reports: dict[str, dict] = {}
+    for f in files:
+        data = _load_json(f)
+        if "states" not in data or "transitions" not in data:
+            continue
+        report = path_report(data)
+        reports[str(f)] = report if args.full else report["summary"]
+    print(json.dumps(reports, indent=2))
+    return 0
+
+
 def cmd_convert(args: argparse.Namespace) -> int:
     data = _load_json(Path(args.model))
     if args.format == "xstate":
@@ -839,6 +1161,16 @@ def main() -> int:
 
     p_graph = sub.add_parser("graph", help="Analyze state machine graph properties")
     p_graph.add_argument("model", help="Path to state machine JSON file")
+    p_graph.add_argument(
+        "--coverage", choices=["all", *COVERAGE_CRITERIA], default="all",
+        help="Paths to list: every simple path to a terminal (all — exponential on dense "
+        "machines), or a bounded set covering every transition / every transition pair",
+    )
+    p_graph.add_argument("--max-paths", type=int, metavar="N", help="Stop after N paths")
+
+    p_paths = sub.add_parser("paths", help="Path analysis for state machines, in one process")
+    p_paths.add_argument("models", nargs="+", help="State machine JSON files or directories of them")
+    p_paths.add_argument("--full", action="store_true", help="Include the covering paths, not just summaries")
 
     p_convert = sub.add_parser("convert", help="Convert model to another format")
     p_convert.add_argument("model", help="Path to model JSON file")
@@ -856,6 +1188,7 @@ def main() -> int:
     dispatch = {
         "validate": cmd_validate,
         "graph": cmd_graph,
+        "paths": cmd_paths,
         "convert": cmd_convert,
         "generate": cmd_generate,
     }
@@ -44,16 +44,20 @@ Subcommands:
   independently of gate code (``seed_version`` never moves with
   ``scanner_version``). The file is a DERIVED artifact: re-authoring a
   record means re-running extract-seeds, and ``audit`` reports drift.
-- ``mutate <gate>`` — best-effort mutation-testing leg: runs mutmut (when
-  installed) scoped to the gate's script with the gate's own unit tests as
-  the runner. A mutant that SURVIVES the gate's tests is detection logic no
-  seed pins — each survivor is proposed as a new seed-class candidate.
-  When mutmut is absent: skipped WITH instructions, never silent. A run
-  that exits nonzero is reported ``failed`` with the stderr tail — no
-  mutation signal, never presented as a clean zero-survivor result. Runtime
-  is bounded: the run gets ``--max-mutants x --per-mutant-seconds`` wall
-  time (defaults 20 x 30s) and the candidate list is capped at
-  ``--max-mutants``.
+- ``mutate <gate>`` — best-effort mutation-testing leg scoped to the gate's
+  script with the gate's own unit tests as the runner. A mutant that
+  SURVIVES the gate's tests is detection logic no seed pins — each survivor
+  is proposed as a new seed-class candidate. The default native engine
+  (``chief_wiggum.mutation``) generates AST mutants, runs each against only
+  the tests that execute its lines (``--jobs`` at a time), and caches
+  verdicts per (gate source hash, test hash), so a re-audit runs only new
+  mutants; a mutated line no test executes is itself a candidate.
+  ``--engine mutmut`` runs mutmut instead — when mutmut is absent: skipped
+  WITH instructions, never silent. A run that yields no signal (mutmut
+  exiting nonzero, the gate's tests unable to run unmutated) is reported
+  ``failed`` — never presented as a clean zero-survivor result. Runtime is
+  bounded: the run gets ``--max-mutants x --per-mutant-seconds`` wall time
+  (defaults 20 x 30s) and the candidate list is capped at ``--max-mutants``.
 
 Exit codes: 0 always (report-only; it proposes, never blocks). 2 = usage.
 """
@@ -63,9 +67,11 @@ from __future__ import annotations
 import argparse
 import importlib.util
 import json
+import os
 import re
 import subprocess
 import sys
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
@@ -76,6 +82,9 @@ from check_gate_validation import (  # noqa: E402
     required_seed_classes,
     trial_genuinely_passed,
 )
+from chief_wiggum import mutation  # noqa: E402
+from chief_wiggum.hashing import stable_hash  # noqa: E402
+from chief_wiggum.scanner_registry import live_scanner_version  # noqa: E402
 from factory_log import DEFAULT_VALIDATION_DIR, log_path  # noqa: E402
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -572,7 +581,7 @@ def escapes_view(log_file: str | Path, validation_dir: str | Path,
     return rows
 
 
-# --- mutate: best-effort mutmut leg --------------------------------------------
+# --- mutate: best-effort mutation leg ------------------------------------------
 
 
 _MUTMUT_VERSION_CAVEAT = (
@@ -611,11 +620,12 @@ def _parse_surviving(results_stdout: str) -> list[int]:
     return sorted(set(survivors))
 
 
-def mutate_gate(gate: str, scripts_dir: str | Path, tests_path: str | Path | None = None,
-                max_mutants: int = 20, per_mutant_seconds: int = 30,
-                runner=subprocess.run, mutmut_available: bool | None = None) -> dict:
-    """Best-effort mutation run scoped to the gate's script file, using the
-    gate's own unit tests as the runner. Surviving mutants = detection logic
+def _mutate_with_mutmut(gate: str, scripts_dir: Path, tests_path: str | Path | None,
+                        max_mutants: int, per_mutant_seconds: int,
+                        runner, mutmut_available: bool | None) -> dict:
+    """``--engine mutmut``: mutmut scoped to the gate's script file, using the
+    gate's own unit tests as the runner (one serial ``pytest -x`` over the
+    whole file per mutant). Surviving mutants = detection logic
     not pinned by any seed -> each is a proposed new seed-class candidate.
 
     Bounded: the mutmut run gets max_mutants * per_mutant_seconds seconds of
@@ -623,14 +633,13 @@ def mutate_gate(gate: str, scripts_dir: str | Path, tests_path: str | Path | Non
     is reported, never silent), and the candidate list is capped at
     max_mutants. When mutmut is not installed the result is
     skipped-with-instructions, never silent."""
-    scripts_dir = Path(scripts_dir)
     if mutmut_available is None:
         mutmut_available = _mutmut_available()
     if not mutmut_available:
         return {"status": "skipped", "instructions": (
             "mutmut is not installed — the mutation leg is skipped. To run it:\n"
             "  pip install mutmut   # in the CW venv (feedback: use a venv)\n"
-            f"  python3 scripts/gate_validation_designer.py mutate {gate}\n"
+            f"  python3 scripts/gate_validation_designer.py mutate {gate} --engine mutmut\n"
             "Surviving mutants indicate detection logic no seed pins; each is a "
             "proposed new seed-class candidate for the record + seeds file.\n"
             f"{_MUTMUT_VERSION_CAVEAT}")}
@@ -679,6 +688,113 @@ def mutate_gate(gate: str, scripts_dir: str | Path, tests_path: str | Path | Non
             "raw_results": results.stdout or ""}
 
 
+def _mutate_native(gate: str, scripts_dir: Path, tests_path: str | Path | None,
+                   max_mutants: int, per_mutant_seconds: int, jobs: int | None,
+                   use_cache: bool) -> dict:
+    """``--engine native`` (``chief_wiggum.mutation``): AST mutants, each run
+    against only the tests that execute its lines, in parallel, with verdicts
+    cached per (gate source hash, test hash)."""
+    script = scripts_dir / f"{gate}.py"
+    if not script.is_file():
+        return {"status": "error", "detail": f"gate script not found: {script.name} "
+                                             f"(looked in {scripts_dir})"}
+    tests_path = Path(tests_path) if tests_path else scripts_dir.parent / "tests" / f"test_{gate}.py"
+    if not tests_path.is_file():
+        return {"status": "error", "detail": f"gate unit tests not found: {tests_path}"}
+    source = script.read_bytes()
+    try:
+        mutants = mutation.generate_mutants(source, str(script))
+    except (SyntaxError, ValueError) as exc:
+        return {"status": "error", "detail": f"cannot parse {script.name}: {exc}"}
+    try:
+        gate_hash = live_scanner_version(script)
+    except OSError:
+        gate_hash = None
+    if gate_hash is None:  # no statically readable _scanner_version: own source only
+        gate_hash = stable_hash(source.decode())
+    cache = mutation.MutationCache(gate, gate_hash, mutation.tests_hash(tests_path))
+    if not use_cache:
+        cache.disabled, cache.test_map, cache.verdicts = True, None, {}
+    budget = max_mutants * per_mutant_seconds
+    cwd = scripts_dir.parent
+    started = time.monotonic()
+    if cache.test_map is None:
+        test_map, trace_error = mutation.trace_tests(script, tests_path, scripts_dir, cwd, budget)
+        if test_map is None:
+            return {"status": "failed", "detail": (
+                f"could not map tests to mutants — no mutation signal; NOT a clean "
+                f"result. {trace_error}")}
+        cache.test_map = test_map
+        cache.store()
+    pending = [m for m in mutants if m.mutant_id not in cache.verdicts]
+    workers = jobs if jobs is not None else min(8, os.cpu_count() or 1)
+    verdicts = mutation.run_mutants(
+        pending, source, gate, script, cache.test_map, scripts_dir, cwd,
+        per_mutant_seconds=per_mutant_seconds,
+        budget_seconds=max(0.0, budget - (time.monotonic() - started)), jobs=workers,
+    )
+    cache.verdicts.update(verdicts)
+    cache.store()
+    by_id = {m.mutant_id: m for m in mutants}
+    results = {m.mutant_id: cache.verdicts.get(m.mutant_id, mutation.NOT_RUN) for m in mutants}
+    counts: dict[str, int] = {}
+    for verdict in results.values():
+        counts[verdict] = counts.get(verdict, 0) + 1
+    counts["cached"] = len(mutants) - len(pending)
+    survivors = [mid for mid, v in results.items() if v == mutation.SURVIVED]
+    uncovered = [mid for mid, v in results.items() if v == mutation.NO_COVERAGE]
+    status, detail = "ran", ""
+    if counts.get(mutation.NOT_RUN) or counts.get(mutation.ERROR):
+        status = "partial"
+        detail = (f"{counts.get(mutation.NOT_RUN, 0)} mutant(s) not run within the "
+                  f"{budget}s budget (--max-mutants x --per-mutant-seconds), "
+                  f"{counts.get(mutation.ERROR, 0)} errored; re-run to continue — "
+                  "judged mutants are cached")
+    if cache.test_map.failed:
+        detail = (detail + "\n" if detail else "") + (
+            f"{len(cache.test_map.failed)} test(s) fail unmutated and were excluded: "
+            + ", ".join(cache.test_map.failed[:5]))
+    candidates = [
+        {"mutant_id": mid,
+         "show": by_id[mid].describe(),
+         "proposal": ("surviving mutant — detection logic not pinned by any seed; "
+                      "derive a seed that kills it (a new seed-class candidate) and "
+                      "add it to the record + seeds file")
+                     if results[mid] == mutation.SURVIVED else
+                     ("no test executes this line — nothing could kill a mutant "
+                      "here; a seed exercising it is a new seed-class candidate")}
+        for mid in [*survivors, *uncovered][:max_mutants]
+    ]
+    return {"status": status, "detail": detail, "engine": "native",
+            "surviving_mutants": survivors, "uncovered_mutants": uncovered,
+            "candidates": candidates,
+            "truncated": len(survivors) + len(uncovered) > max_mutants,
+            "counts": counts, "mutants": len(mutants), "raw_results": ""}
+
+
+def mutate_gate(gate: str, scripts_dir: str | Path, tests_path: str | Path | None = None,
+                max_mutants: int = 20, per_mutant_seconds: int = 30,
+                runner=subprocess.run, mutmut_available: bool | None = None, *,
+                engine: str = "native", jobs: int | None = None,
+                use_cache: bool = True) -> dict:
+    """Best-effort mutation run scoped to the gate's script file, using the
+    gate's own unit tests as the runner. Surviving mutants = detection logic
+    not pinned by any seed -> each is a proposed new seed-class candidate.
+
+    ``engine="native"`` (the default) is ``chief_wiggum.mutation``; ``jobs``
+    and ``use_cache`` apply to it only. ``engine="mutmut"`` is the original
+    mutmut leg; ``runner`` and ``mutmut_available`` apply to it only. Both are
+    bounded by ``max_mutants * per_mutant_seconds`` of wall time and cap the
+    candidate list at ``max_mutants``; neither presents a run that produced no
+    signal as a clean zero-survivor result."""
+    scripts_dir = Path(scripts_dir)
+    if engine == "mutmut":
+        return _mutate_with_mutmut(gate, scripts_dir, tests_path, max_mutants,
+                                   per_mutant_seconds, runner, mutmut_available)
+    return _mutate_native(gate, scripts_dir, tests_path, max_mutants, per_mutant_seconds,
+                          jobs, use_cache)
+
+
 # --- rendering -----------------------------------------------------------------
 
 
@@ -743,12 +859,17 @@ def render_mutate(gate: str, result: dict) -> str:
         if result.get("detail"):
             lines.append(result["detail"])
         survivors = result.get("surviving_mutants", [])
+        if result.get("counts"):
+            counts = ", ".join(f"{k} {v}" for k, v in sorted(result["counts"].items()))
+            lines.append(f"Mutants: {result.get('mutants', 0)} ({counts})")
         lines.append(f"Surviving mutants: {len(survivors)}"
                      + (" (candidate list truncated to --max-mutants)"
                         if result.get("truncated") else ""))
         for c in result.get("candidates", []):
             lines.append(f"- mutant {c['mutant_id']}: {c['show']} — {c['proposal']}")
-        if not survivors:
+        if not survivors and result.get("engine") == "native":
+            lines.append("No survivors: every mutant a test executes was killed.")
+        elif not survivors:
             lines.append("No survivors parsed — either every mutant was killed (good: the "
                          "gate's tests pin its detection logic) or the mutmut output "
                          "format was unrecognized; raw output follows.")
@@ -794,8 +915,8 @@ def main(argv: list[str] | None = None) -> int:
     x.add_argument("--all", action="store_true")
     x.add_argument("--validation-dir", default=DEFAULT_VALIDATION_DIR)
 
-    mu = sub.add_parser("mutate", help="Best-effort mutmut leg (skipped-with-instructions "
-                                       "when mutmut is absent)")
+    mu = sub.add_parser("mutate", help="Best-effort mutation leg (native engine; mutmut "
+                                       "via --engine mutmut)")
     mu.add_argument("gate", help="Gate name")
     mu.add_argument("--scripts-dir", default=str(Path(__file__).resolve().parent))
     mu.add_argument("--tests", default=None, help="Unit-test file for the gate "
@@ -806,6 +927,17 @@ def main(argv: list[str] | None = None) -> int:
     mu.add_argument("--per-mutant-seconds", type=int, default=30,
                     help="Per-mutant wall-time budget used to derive the run timeout "
                          "(default 30)")
+    mu.add_argument("--engine", choices=["native", "mutmut"], default="native",
+                    help="native (default): AST mutants run in parallel against only "
+                         "the tests covering their lines, verdicts cached; tests must "
+                         "load the gate by import or spec_from_file_location (runpy, "
+                         "exec and subprocess runs see the original); mutmut: the "
+                         "mutmut 2.x leg (skipped-with-instructions when absent)")
+    mu.add_argument("--jobs", type=int, default=None, metavar="N",
+                    help="Native engine: mutants run concurrently (default: "
+                         "min(8, CPU count))")
+    mu.add_argument("--no-cache", action="store_true",
+                    help="Native engine: ignore and do not write cached verdicts")
     mu.add_argument("--format", choices=["text", "json"], default="text")
 
     args = parser.parse_args(argv)
@@ -856,7 +988,9 @@ def main(argv: list[str] | None = None) -> int:
     elif args.cmd == "mutate":
         result = mutate_gate(args.gate, scripts_dir=args.scripts_dir,
                              tests_path=args.tests, max_mutants=args.max_mutants,
-                             per_mutant_seconds=args.per_mutant_seconds)
+                             per_mutant_seconds=args.per_mutant_seconds,
+                             engine=args.engine, jobs=args.jobs,
+                             use_cache=not args.no_cache)
         if out_json:
             print(json.dumps({"report_only": True, "gate": args.gate, **result}, indent=2))
         else:
@@ -9,10 +9,17 @@ consume. Picks the server from the file extension.
 prints ``{"available": false, "reason": ...}`` and exits 0 — it never blocks the
 workflow; the caller falls back to its existing behavior.
 
+**Warm servers**: with ``--broker`` (or ``CW_LSP_BROKER=1`` for a whole session)
+the query goes to the persistent LSP broker (``chief_wiggum/lsp_broker.py``),
+started on first use, which keeps one indexed server per (root, language) —
+repeated queries answer in milliseconds instead of a cold start each. Any
+broker trouble falls back to a one-shot local session; the answer is the same.
+
 Examples:
     python3 scripts/lsp_query.py --root . diagnostics path/to/file.go
     python3 scripts/lsp_query.py --root . --line 41 --col 6 definition app/x.py
     python3 scripts/lsp_query.py --root . --line 41 --col 6 hover app/x.py
+    python3 scripts/lsp_query.py --broker --root . symbols app/x.py
 """
 
 from __future__ import annotations
@@ -24,17 +31,38 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from chief_wiggum import lsp  # noqa: E402
+from chief_wiggum import lsp, lsp_broker  # noqa: E402
+
+
+def _ask_broker(args: argparse.Namespace, file_path: Path) -> dict | None:
+    """The broker's envelope for this query, starting a broker when none is
+    listening; ``None`` means answer locally. An unavailable answer from the
+    broker is not trusted over a local attempt — only a real result is."""
+    socket_path = lsp_broker.default_socket_path()
+    payload = {
+        "op": args.query, "root": str(Path(args.root).resolve()),
+        "file": str(file_path.resolve()), "line": args.line, "col": args.col,
+        "timeout": args.timeout,
+    }
+    envelope = lsp_broker.query(socket_path, payload, timeout=args.timeout + 5)
+    if envelope is None and lsp_broker.spawn(socket_path):
+        envelope = lsp_broker.query(socket_path, payload, timeout=args.timeout + 5)
+    return envelope if envelope is not None and envelope.get("available") else None
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Semantic code intelligence via LSP")
-    parser.add_argument("query", choices=["definition", "references", "hover", "diagnostics"])
+    parser.add_argument("query", choices=list(lsp.QUERIES))
     parser.add_argument("file", help="Source file to query")
     parser.add_argument("--root", default=".", help="Project/repo root (resolved by the server)")
     parser.add_argument("--line", type=int, default=0, help="0-based line (LSP)")
     parser.add_argument("--col", type=int, default=0, help="0-based UTF-16 character (LSP)")
     parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument(
+        "--broker", action="store_true",
+        help="Ask the persistent LSP broker (starting it if needed) before a local server "
+        f"(also ${lsp_broker.BROKER_ENV}=1)",
+    )
     args = parser.parse_args(argv)
 
     file_path = Path(args.file)
@@ -50,17 +78,17 @@ def main(argv: list[str] | None = None) -> int:
         }))
         return 0
 
+    if args.broker or lsp_broker.enabled():
+        envelope = _ask_broker(args, file_path)
+        if envelope is not None:
+            print(json.dumps(envelope, indent=2))
+            return 0
+
     try:
         with lsp.LspClient(server, args.root, timeout=args.timeout) as client:
-            client.did_open(file_path)
-            if args.query == "definition":
-                result = client.definition(file_path, args.line, args.col)
-            elif args.query == "references":
-                result = client.references(file_path, args.line, args.col)
-            elif args.query == "hover":
-                result = client.hover(file_path, args.line, args.col)
-            else:  # diagnostics
-                result = client.diagnostics(file_path, timeout=min(args.timeout, 15))
+            result = lsp.run_query(
+                client, args.query, file_path, line=args.line, col=args.col, timeout=args.timeout,
+            )
     except lsp.LspError as exc:
         # A server error must not block the workflow either.
         print(json.dumps({"available": False, "server": server.name, "reason": str(exc)}))
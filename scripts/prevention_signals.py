@@ -7,16 +7,24 @@ information only**. Given a diff range (``--base``), it emits three
 diff-scoped signals:
 
   (a) **new_duplication** — the diff clones existing code: the clones engine
-      (jscpd via the shared #214 runner) runs live at HEAD, and any clone
-      class with at least one member span inside the diff's ADDED lines *and*
-      at least one member outside them means an added hunk duplicates a span
-      that already existed. Skipped (stated) when jscpd/node is absent.
+      runs live at HEAD, and any clone class with at least one member span
+      inside the diff's ADDED lines *and* at least one member outside them
+      means an added hunk duplicates a span that already existed. By default
+      the native detector (``quality/fingerprints.py``) answers it focused on
+      the changed files: per-file fingerprints are stored by blob sha, so a
+      review re-fingerprints only what changed since the last look and looks
+      up only the diff's own windows. ``--clone-engine jscpd`` runs the
+      shared #214 jscpd runner instead (skipped, stated, when jscpd/node is
+      absent).
   (b) **dead_code_introduced** — added exports unused anywhere: the
       dead-code engine's conservative ``builtin-ast`` tier runs on the
       changed Python files with the identifier corpus **repo-wide**
       (detection repo-wide, as everywhere in #214), keeping only symbols
-      whose ``def`` line is an added line. Non-Python changed files are
-      counted unscanned, never silently clean.
+      whose ``def`` line is an added line. The repo-wide counts come from
+      the persistent identifier index (``quality/tokens.py``), so a review
+      re-reads only the files changed since the index last looked — the
+      diff's own, typically — not the whole repo. Non-Python changed files
+      are counted unscanned, never silently clean.
   (c) **assertion_free_tests_added** — test functions added by this diff
       that assert nothing (test_health's Python-AST / Go-regex tiers on the
       changed test files, filtered to added lines). JS/TS is unscanned in v1
@@ -29,7 +37,8 @@ ships it report-only per ``docs/gate-rollout.md``).
 
 Usage:
     python3 scripts/prevention_signals.py [owner/repo] [--repo PATH]
-        --base REF [--workdir DIR] [--format text|json]
+        --base REF [--workdir DIR] [--clone-engine native|jscpd]
+        [--format text|json]
 """
 
 from __future__ import annotations
@@ -166,13 +175,22 @@ def duplication_findings(clone_classes: list[dict],
 
 
 def _new_duplication(repo: str, workdir: str,
-                     added: dict[str, list[tuple[int, int]]]) -> dict:
-    result = clones.analyze(repo, os.path.join(workdir, "jscpd"))
+                     added: dict[str, list[tuple[int, int]]],
+                     engine: str = "native") -> dict:
+    focus = None
+    if engine == "native":
+        # The changed production files that resolve (F7: unquoted diff-side
+        # names) — clone classes without a member in them cannot be findings.
+        focus = sorted(f for f in added
+                       if population.lang_of(f) and not population.is_test_file(f)
+                       and (Path(repo) / f).is_file())
+    result = clones.analyze(repo, os.path.join(workdir, "jscpd"), engine=engine, focus=focus)
     if result.get("skipped"):
         return {"skipped": result["skipped"],
                 "note": "duplication signal not computed — absence is stated, not health"}
     findings = duplication_findings(result.get("clone_classes") or [], added)
-    return {"findings": findings, "clone_classes_scanned": len(result.get("clone_classes") or [])}
+    return {"findings": findings, "detector": engine,
+            "clone_classes_scanned": len(result.get("clone_classes") or [])}
 
 
 # --- (b) dead code introduced -------------------------------------------------
@@ -236,14 +254,14 @@ def _assertion_free_added(repo: str, added: dict[str, list[tuple[int, int]]]) ->
 # --- composition --------------------------------------------------------------
 
 
-def build_signals(repo: str, base: str, workdir: str) -> dict:
+def build_signals(repo: str, base: str, workdir: str, clone_engine: str = "native") -> dict:
     added = parse_added_ranges(_git_diff(repo, base))
     # F7: a changed path that does not resolve in the working tree (a quoting
     # form we failed to decode, or a path outside the checkout) is counted as
     # UNSCANNED with a reason — never silently treated as clean.
     unresolved = sorted(f for f in added if not (Path(repo) / f).is_file())
     signals = {
-        "new_duplication": _new_duplication(repo, workdir, added),
+        "new_duplication": _new_duplication(repo, workdir, added, clone_engine),
         "dead_code_introduced": _dead_code_introduced(repo, added),
         "assertion_free_tests_added": _assertion_free_added(repo, added),
     }
@@ -323,6 +341,11 @@ def main() -> int:
     parser.add_argument("--repo", default=None, help="direct local repo path")
     parser.add_argument("--base", required=True, help="diff base ref (base...HEAD)")
     parser.add_argument("--workdir", default=None, help="scratch dir for jscpd output")
+    parser.add_argument(
+        "--clone-engine", choices=clones.ENGINES, default="native",
+        help="new-duplication detector: native (incremental fingerprints, "
+             "diff-focused; default) or jscpd (full-corpus run)",
+    )
     parser.add_argument("--format", choices=["text", "json"], default="text")
     args = parser.parse_args()
 
@@ -334,7 +357,7 @@ def main() -> int:
         workdir = os.path.join(str(env.create_tmp()), "prevention", Path(target).name)
 
     try:
-        envelope = build_signals(target, args.base, workdir)
+        envelope = build_signals(target, args.base, workdir, args.clone_engine)
     except Exception as exc:  # noqa: BLE001 — C4: NO failure may vanish
         # Even a broken diff range — or any unexpected engine crash — must
         # not block a workflow that calls this unconditionally, AND must not
@@ -8,7 +8,7 @@ crashes the orchestrator.
 Engines:
   - churn:       git-history churn / attribution / hotspots (pure git)
   - complexity:  cyclomatic (lizard), cognitive (gocognit/complexipy), MI (radon)
-  - trend:       complexity/scale sampled across history (git worktree + lizard)
+  - trend:       complexity/scale sampled across history (git object database + lizard)
   - survival:    code survival / 2-week churn (git-of-theseus)
   - process:     change coupling, entropy, ownership/bus-factor, commit size, fixes
   - duplication: production copy/paste ratio (jscpd)
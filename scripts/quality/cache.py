@@ -40,12 +40,19 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import sqlite3
 import subprocess
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from pathlib import Path
 
 NO_CACHE_ENV = "CW_QUALITY_NO_CACHE"
 CACHE_DIR_ENV = "CW_QUALITY_CACHE_DIR"
 
+# SQLite's default bound-parameter ceiling is 999; the stores' ``IN (...)``
+# lookups bind at most this many values per statement.
+LOOKUP_CHUNK = 500
+
 
 def disabled() -> bool:
     """True when the escape hatch is set — any non-empty, non-"0" value."""
@@ -61,9 +68,16 @@ def _root() -> Path:
     return root
 
 
+def repo_dir(repo: str) -> Path:
+    """This repo's directory under the cache root — shared by the per-engine
+    JSON entries below and ``history.py``'s commit store."""
+    d = _root() / hashlib.sha256(os.path.abspath(repo).encode()).hexdigest()[:16]
+    d.mkdir(parents=True, exist_ok=True)
+    return d
+
+
 def _entry_path(repo: str, engine: str, key: str) -> Path:
-    repo_id = hashlib.sha256(os.path.abspath(repo).encode()).hexdigest()[:16]
-    d = _root() / repo_id / engine
+    d = repo_dir(repo) / engine
     d.mkdir(parents=True, exist_ok=True)
     return d / f"{key}.json"
 
@@ -95,6 +109,22 @@ def store(repo: str, engine: str, key: str, value: dict) -> None:
         pass
 
 
+def manifest(repo: str, files: set[str] | None) -> dict[str, str] | None:
+    """``{rel: blob sha}`` for the repo-relative ``files`` (``None``: the
+    whole repo) via ``chief_wiggum.manifest.build_manifest`` — stat-keyed, so
+    an unchanged file is not re-read to prove it unchanged. ``None`` when it
+    can't be built (not a git repo, git absent, ``chief_wiggum`` not
+    importable)."""
+    try:
+        from chief_wiggum.manifest import ManifestError, build_manifest  # noqa: PLC0415
+    except ImportError:
+        return None
+    try:
+        return build_manifest(repo, None if files is None else files.__contains__)
+    except ManifestError:
+        return None
+
+
 def manifest_key(repo: str, files: list[str] | None) -> str | None:
     """Content-hash cache key for a jscpd-style corpus.
 
@@ -108,16 +138,10 @@ def manifest_key(repo: str, files: list[str] | None) -> str | None:
     repo, or git itself is absent — so the caller falls back to always
     running the tool rather than crashing.
     """
-    try:
-        from chief_wiggum.manifest import ManifestError, build_manifest  # noqa: PLC0415
-    except ImportError:
+    found = manifest(repo, None if files is None else set(files))
+    if found is None:
         return None
-    predicate = (lambda p, _s=set(files): p in _s) if files is not None else None
-    try:
-        manifest = build_manifest(repo, predicate)
-    except ManifestError:
-        return None
-    blob = "\n".join(f"{p}:{h}" for p, h in sorted(manifest.items()))
+    blob = "\n".join(f"{p}:{h}" for p, h in sorted(found.items()))
     return hashlib.sha256(blob.encode()).hexdigest()[:24]
 
 
@@ -139,3 +163,65 @@ def head_sha(repo: str) -> str | None:
         return None
     sha = out.stdout.strip()
     return sha or None
+
+
+def open_store(
+    repo: str, name: str, schema: str, version: Mapping[str, str] | None = None,
+) -> sqlite3.Connection | None:
+    """This repo's SQLite store ``name`` under ``repo_dir`` — the commit
+    (``history.py``), identifier (``tokens.py``) and clone
+    (``fingerprints.py``) stores — opened by
+    ``chief_wiggum.sqlite_store.open_store`` in autocommit mode (callers
+    issue their own ``BEGIN IMMEDIATE``). ``None`` when it cannot be opened
+    or ``chief_wiggum`` is not importable: the caller computes live."""
+    try:
+        from chief_wiggum import sqlite_store  # noqa: PLC0415
+    except ImportError:
+        return None
+    try:
+        path = repo_dir(repo) / name
+    except OSError:
+        return None
+    return sqlite_store.open_store(path, schema, version, timeout=30, isolation_level=None)
+
+
+@contextmanager
+def write_transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    """One ``BEGIN IMMEDIATE`` transaction on an ``open_store`` connection:
+    committed whole, or rolled back on any exception (re-raised)."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def blob_sha(data: bytes) -> str:
+    """Git's blob hash of ``data`` — what ``manifest`` reports."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()  # noqa: S324 - git's object id
+
+
+def read_bytes(repo: str, rel: str) -> bytes | None:
+    """A corpus file's bytes, or ``None`` when it can't be read — an
+    unreadable file contributes nothing to any store's answer."""
+    try:
+        return (Path(repo) / rel).read_bytes()
+    except OSError:
+        return None
+
+
+def read_changed(
+    repo: str, found: Mapping[str, str], rels: Iterable[str],
+) -> Iterator[tuple[str, bytes, bool]]:
+    """``(rel, data, storable)`` for each readable file in ``rels``, in
+    sorted order — the per-file read behind a store's sync. ``storable`` is
+    whether the bytes read hash to the manifest's (``found``) blob sha: one
+    that does not (edited mid-run, eol conversion, a symlink) must be used
+    live and never stored, so it is re-read next time rather than served
+    stale."""
+    for rel in sorted(rels):
+        data = read_bytes(repo, rel)
+        if data is not None:
+            yield rel, data, blob_sha(data) == found[rel]
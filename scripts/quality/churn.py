@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """churn.py — language-agnostic git-history churn metrics for a repo.
 
-Pure ``git log`` analysis (no checkout, non-destructive). Returns a dict:
+Pure git-history analysis (no checkout, non-destructive) over the shared
+commit store in ``history.py``. Returns a dict:
   - scale: commits, date range, active days
   - churn: total added/deleted, net, churn-over-time (per month)
   - hotspots: top files by (added+deleted), with churn/commit and a churn score
@@ -26,10 +27,11 @@ import argparse
 import json
 import re
 import statistics
-import subprocess
 from collections import Counter, defaultdict
 from datetime import datetime
 
+from . import history
+
 # Files that are generated / vendored / binary — excluded from churn hotspots
 EXCLUDE_RE = re.compile(
     r"(^|/)(node_modules|dist|build|out|\.next|vendor|\.venv|venv|__pycache__|"
@@ -47,26 +49,6 @@ CONVENTIONAL_RE = re.compile(
 TICKET_RE = re.compile(r"#\d+")
 MERGE_RE = re.compile(r"Merge pull request|\(#\d+\)$")
 
-SENT = "@@@COMMIT@@@"
-
-
-def _git_log(repo: str, no_merges: bool, since: str | None = None) -> str:
-    scope = "--no-merges" if no_merges else "--all"
-    cmd = [
-        "git", "-C", repo, "log", scope,
-        f"--format={SENT}%H\t%an\t%ae\t%ad\t%s",
-        "--numstat", "--date=short",
-    ]
-    if since:
-        # Native `git log --since` — reuses the SAME log/parse path with one
-        # extra native flag; not a second git-log parser. #187's hotspots.py
-        # uses this (via `analyze(..., since=...)`) to derive a per-file
-        # recent-activity trend without hand-rolling date-range parsing.
-        cmd.insert(4, f"--since={since}")
-    # No check=True: a repo with no commits exits 128; we treat that as empty.
-    return subprocess.run(cmd, capture_output=True, text=True).stdout
-
-
 def analyze(
     repo: str, top_n: int = 25, no_merges: bool = True, since: str | None = None,
     path_filter=None,
@@ -84,28 +66,25 @@ def analyze(
     path contributes to no total, no per-file entry, no per-commit add/del.
     ``None`` (the default) is the unchanged whole-repo behavior.
     """
-    log = _git_log(repo, no_merges, since=since)
+    revs = ["--no-merges", "HEAD"] if no_merges else ["--all"]
+    if since:
+        # Native `git log --since` semantics, via the same flag on the
+        # store's rev-list — not hand-rolled date parsing. #187's hotspots.py
+        # uses this (via `analyze(..., since=...)`) to derive a per-file
+        # recent-activity trend.
+        revs.insert(0, f"--since={since}")
 
     commits: list[dict] = []
-    cur: dict | None = None
     file_churn: dict[str, dict] = defaultdict(lambda: {"add": 0, "del": 0, "commits": 0})
-    for line in log.splitlines():
-        if line.startswith(SENT):
-            h, an, ae, ad, s = line[len(SENT):].split("\t", 4)
-            cur = {
-                "hash": h, "author": an, "email": ae, "date": ad, "subject": s,
-                "add": 0, "del": 0, "files": 0,
-            }
-            commits.append(cur)
-        elif line.strip() and cur is not None:
-            parts = line.split("\t")
-            if len(parts) != 3:
-                continue
-            a, d, path = parts
+    for c in history.commits(repo, *revs):
+        cur = {
+            "hash": c.sha, "author": c.author, "email": c.email, "date": c.date,
+            "subject": c.subject, "add": 0, "del": 0, "files": 0,
+        }
+        commits.append(cur)
+        for path, add, dele in c.changes:
             if path_filter is not None and not path_filter(path):
                 continue
-            add = 0 if a == "-" else int(a)
-            dele = 0 if d == "-" else int(d)
             cur["add"] += add
             cur["del"] += dele
             cur["files"] += 1
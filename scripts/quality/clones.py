@@ -21,12 +21,24 @@ referrals (chief-wiggum#216 C2) instead of losing them at the engine.
 Skipped (``{"skipped": ...}``) when jscpd/node is absent — same graceful
 degrade as ``duplication.py``.
 
+Two detectors feed the same clustering. ``jscpd`` (the default) is the
+calibrated instrument the debt inventory and slop gate were validated
+against. ``native`` is ``fingerprints.py``'s in-process detector: per-file
+fingerprints stored by blob sha, so a re-run re-reads only changed files, and
+a ``focus`` file set (a review's diff) is answered from an indexed lookup —
+what makes ``prevention_signals``' diff-scoped duplication signal cheap
+enough to run on every review. It needs neither node nor a scratch corpus,
+and never skips. ``CW_CLONE_ENGINE`` picks the default for callers that do
+not choose (``debt_inventory``, the slop gate).
+
 As a module:
     from quality.clones import analyze
     result = analyze("/path/to/repo", workdir="/tmp/clones")
+    result = analyze("/path/to/repo", workdir="/tmp/clones", engine="native",
+                     focus=["src/changed.py"])
 
 As a CLI:
-    python3 -m quality.clones <repo> --workdir <dir>
+    python3 -m quality.clones <repo> --workdir <dir> [--engine native]
 """
 
 from __future__ import annotations
@@ -38,9 +50,11 @@ import os
 import sys
 from pathlib import Path
 
-from . import duplication, population
+from . import duplication, fingerprints, population
 
 CONTENT_HASH_LEN = 16
+ENGINES = ("jscpd", "native")
+ENGINE_ENV = "CW_CLONE_ENGINE"
 
 
 def _normalize_span(fragment: str) -> str:
@@ -181,12 +195,29 @@ BOUNDARY_UNOBSERVABLE = (
 )
 
 
-def analyze(repo: str, workdir: str, path_filter=None, name: str | None = None) -> dict:
-    """Clone classes for ``repo`` via the shared jscpd runner."""
+def default_engine() -> str:
+    """``CW_CLONE_ENGINE`` when it names a known detector, else ``jscpd``."""
+    chosen = os.environ.get(ENGINE_ENV, "")
+    return chosen if chosen in ENGINES else "jscpd"
+
+
+def analyze(repo: str, workdir: str, path_filter=None, name: str | None = None, *,
+            engine: str | None = None, focus=None) -> dict:
+    """Clone classes for ``repo`` via the shared jscpd runner, or the native
+    fingerprint detector (``engine="native"``).
+
+    ``focus`` (native only) restricts the result to clone classes with a
+    member in those repo-relative files, which always join the corpus: a
+    changed file whose name ``git ls-files`` C-quotes (#216 F7) is still
+    matched. jscpd has no cheaper focused mode, so it ignores ``focus`` and
+    returns every class — a superset the caller filters anyway."""
+    engine = engine or default_engine()
+    if engine not in ENGINES:
+        raise ValueError(f"unknown clone engine {engine!r} (expected one of {ENGINES})")
     name = name or repo.rstrip("/").split("/")[-1]
-    base: dict = {"repo": name, "engine": "clones"}
+    base: dict = {"repo": name, "engine": "clones", "detector": engine}
 
-    if path_filter is None:
+    if path_filter is None and engine == "jscpd":
         # Nothing to narrow, so keep the historical whole-repo walk. Building an
         # explicit list here would buy no reduction (it IS the whole population)
         # while a big unscoped repo would cross the argv budget and warn about
@@ -194,21 +225,27 @@ def analyze(repo: str, workdir: str, path_filter=None, name: str | None = None)
         files = None
     else:
         files = corpus(repo, path_filter=path_filter)
+    if path_filter is not None:
         base["files_in_corpus"] = len(files)
         # Narrowing means an out-of-scope clone partner is never scanned, so
         # #216's boundary referrals cannot be observed. Say so — the other three
         # engines are narrowed at the source too, and the envelope's boundary
         # note already warns that absence there is not evidence of cleanliness.
         base["boundary_detection"] = BOUNDARY_UNOBSERVABLE
-        if not files:
+        if not files and not focus:
             # A scope selecting nothing was MEASURED and found nothing. Claiming
             # a skip (or a crash) is the same over-claim #259 warns about.
             return {**base, "status": "measured", "clone_pairs_reported": 0,
                     "clone_classes": [], "boundary_classes": []}
 
-    data, problem = duplication.run_jscpd(repo, workdir, files=files)
-    if problem is not None:
-        return {**base, **{k: v for k, v in problem.items() if v is not None}}
+    if engine == "native":
+        data = {"duplicates": fingerprints.duplicates(repo, files, focus=focus)}
+        if focus is not None:
+            base["focus_files"] = len(set(focus))
+    else:
+        data, problem = duplication.run_jscpd(repo, workdir, files=files)
+        if problem is not None:
+            return {**base, **{k: v for k, v in problem.items() if v is not None}}
 
     duplicates = data.get("duplicates") or []
     boundary: list[dict] = []
@@ -239,15 +276,21 @@ def main() -> int:
     parser = argparse.ArgumentParser(description="clone classes from jscpd locations")
     parser.add_argument("repo", help="path to the git repository")
     parser.add_argument("--workdir", required=True, help="scratch dir for jscpd output")
+    parser.add_argument(
+        "--engine", choices=ENGINES, default=None,
+        help=f"clone detector (default: ${ENGINE_ENV}, else jscpd); native is the "
+             "in-process incremental fingerprint detector",
+    )
     parser.add_argument(
         "--no-cache", action="store_true",
         help="force a fresh jscpd run, bypassing the content-hash result cache (#328) "
-             "shared with duplication.py's aggregate percentage",
+             "shared with duplication.py's aggregate percentage (and, for native, "
+             "the stored fingerprints)",
     )
     args = parser.parse_args()
     if args.no_cache:
         os.environ[duplication.cache.NO_CACHE_ENV] = "1"
-    print(json.dumps(analyze(args.repo, args.workdir), indent=2))
+    print(json.dumps(analyze(args.repo, args.workdir, engine=args.engine), indent=2))
     return 0
 
 
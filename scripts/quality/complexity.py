@@ -20,6 +20,19 @@ contract-DSL files are excluded so metrics reflect product code.
 Tools are auto-discovered (venv/bin then PATH). Any missing tool degrades to a
 ``None`` sub-metric with a note — the battery never crashes.
 
+Per-file results are cached. Every tool here reports per function (or, for
+radon, per file), so a file's rows are a pure function of its content, its
+path (the extension picks the parser) and the tool itself. Given the repo
+(``analyze`` and ``hotspots`` pass it), each tool's per-file output is stored in
+the per-file findings store (``chief_wiggum.findings_cache``), keyed by the
+file's git blob sha (``chief_wiggum.manifest.build_manifest``) and the tool's
+identity (resolved binary, its stat, its ``--version`` output). Only files with
+no entry are handed to the tool, in chunks run concurrently across
+``CW_QUALITY_JOBS`` threads (default: one per CPU, at most 8). A chunk whose
+output cannot be attributed file by file, or whose tool run crashed, is used
+for this run and never stored. ``CW_QUALITY_NO_CACHE=1`` (the battery's shared
+escape hatch, see ``cache.py``) — or no git manifest — runs every file live.
+
 As a module:
     from quality.complexity import analyze
     result = analyze("/path/to/repo", venv=None, gobin=None)
@@ -33,6 +46,7 @@ from __future__ import annotations
 import argparse
 import csv
 import functools
+import hashlib
 import io
 import json
 import os
@@ -42,6 +56,10 @@ import subprocess
 import sys
 import tempfile
 from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from . import cache
 
 # Extension -> language for the quality/debt population. Kept in step with
 # config/languages.json (a language absent here is invisible to every debt
@@ -93,10 +111,11 @@ def _tool(name: str, venv: str | None = None, gobin: str | None = None) -> str |
 
 def _git_index_path(repo: str) -> str | None:
     """Path to the index file that actually backs ``repo`` — handling a
-    linked ``git worktree`` (#328: ``trend.py`` throwaway-checks out one per
-    sampled commit), where ``.git`` is a FILE containing a ``gitdir:``
-    pointer rather than the index directory itself. ``None`` when it can't be
-    resolved (no ``.git`` at all, or an unreadable pointer file)."""
+    linked ``git worktree`` (#328: ``trend.py`` used to check one out per
+    sampled commit, and any linked worktree can still be scanned), where
+    ``.git`` is a FILE containing a ``gitdir:`` pointer rather than the index
+    directory itself. ``None`` when it can't be resolved (no ``.git`` at
+    all, or an unreadable pointer file)."""
     git_path = os.path.join(repo, ".git")
     if os.path.isdir(git_path):
         return os.path.join(git_path, "index")
@@ -167,18 +186,182 @@ def bucket(repo: str, path_filter=None) -> dict:
     for rel in tracked_files(repo):
         if path_filter is not None and not path_filter(rel):
             continue
-        ext = os.path.splitext(rel)[1].lower()
-        lang = EXT_LANG.get(ext)
-        if not lang:
+        kind = classify(rel)
+        if kind is None:
             continue
         absf = os.path.join(repo, rel)
         if not os.path.exists(absf):
             continue
-        (b[lang]["test"] if TEST_RE.search(rel) else b[lang]["src"]).append(absf)
+        b[kind[0]][kind[1]].append(absf)
     return b
 
 
-def lizard_ccn(files: list[str], lizard_bin: str | None) -> list[dict]:
+def classify(rel: str) -> tuple[str, str] | None:
+    """``(language, "src" | "test")`` for a repo-relative path that already
+    passed ``EXCLUDE_RE``, or ``None`` for a non-source extension — the
+    per-path half of ``bucket``, shared with ``trend``'s tree reads."""
+    lang = EXT_LANG.get(os.path.splitext(rel)[1].lower())
+    if not lang:
+        return None
+    return lang, "test" if TEST_RE.search(rel) else "src"
+
+
+# Files per tool invocation (argv limits). A cold run's misses are split
+# further so every worker gets a share.
+LIZARD_CHUNK = 400
+COGNITIVE_CHUNK = 200
+
+JOBS_ENV = "CW_QUALITY_JOBS"
+DEFAULT_JOBS = 8
+
+# Bumped when a cached per-file payload changes shape.
+_PAYLOAD_VERSION = "1"
+
+# ``(per-file payloads, rows that could not be attributed to an input file,
+# whether the run is clean enough to store)`` for one chunk of files.
+ChunkResult = tuple[dict[str, list[dict]], list[dict], bool]
+
+
+def _jobs() -> int:
+    """``CW_QUALITY_JOBS`` when set to a positive integer, else one per CPU
+    capped at ``DEFAULT_JOBS``. A malformed value is serial."""
+    raw = os.environ.get(JOBS_ENV, "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            return 1
+    return min(DEFAULT_JOBS, os.cpu_count() or 1)
+
+
+@functools.cache
+def _tool_identity(tool_bin: str) -> str:
+    """Cache-key half naming the tool that produced a payload: its resolved
+    path and stat plus whatever ``--version`` prints. An upgrade or a
+    different install never serves the other one's numbers."""
+    real = os.path.realpath(tool_bin)
+    try:
+        st = os.stat(real)
+        stamp = f"{st.st_mtime_ns}:{st.st_size}"
+    except OSError:
+        stamp = "?"
+    try:
+        r = run(tool_bin, "--version", timeout=60)
+        version = (r.stdout or r.stderr or "").strip()
+    except (OSError, subprocess.SubprocessError):
+        version = "?"
+    blob = "\0".join([_PAYLOAD_VERSION, real, stamp, version])
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def _blobs(repo: str | None, files: list[str]) -> dict[str, tuple[str, str]]:
+    """``{abs file: (repo-relative path, blob sha)}`` for every file the
+    working-tree manifest covers; empty when caching is off or unavailable."""
+    if repo is None or cache.disabled():
+        return {}
+    rels: dict[str, str] = {}
+    for f in files:
+        rel = os.path.relpath(f, repo).replace(os.sep, "/")
+        if not rel.startswith("../"):
+            rels[f] = rel
+    manifest = cache.manifest(repo, set(rels.values()))
+    if manifest is None:
+        return {}
+    return {f: (rel, manifest[rel]) for f, rel in rels.items() if rel in manifest}
+
+
+def _findings_cache():
+    try:
+        from chief_wiggum import findings_cache  # noqa: PLC0415
+    except ImportError:
+        return None
+    return findings_cache
+
+
+def _measure(
+    engine: str, files: list[str], tool_bin: str, chunk_size: int,
+    run_chunk: Callable[[str, list[str]], ChunkResult], repo: str | None,
+    blobs: dict[str, tuple[str, str]] | None = None,
+    prepare: Callable[[list[str]], None] | None = None,
+) -> tuple[dict[str, list[dict]], list[dict]]:
+    """Per-file payloads for ``files`` (cache hits served, misses measured by
+    ``run_chunk`` concurrently and stored), plus any unattributed rows.
+    ``blobs`` overrides the working-tree manifest's keys; ``prepare`` is
+    handed the misses before any tool runs (see ``lizard_ccn``)."""
+    per_file: dict[str, list[dict]] = {}
+    if blobs is None:
+        blobs = _blobs(repo, files)
+    elif cache.disabled():
+        blobs = {}
+    fc = _findings_cache() if blobs else None
+    key = _tool_identity(tool_bin) if fc is not None else ""
+    if fc is not None:
+        by_rel = {rel: f for f, (rel, _sha) in blobs.items()}
+        hits = fc.load_many(repo, engine, key, {rel: sha for rel, sha in blobs.values()})
+        per_file.update((by_rel[rel], payload) for rel, payload in hits.items())
+
+    misses = [f for f in files if f not in per_file]
+    if prepare is not None and misses:
+        prepare(misses)
+    workers = _jobs()
+    size = max(1, min(chunk_size, -(-len(misses) // workers)))
+    chunks = [misses[i:i + size] for i in range(0, len(misses), size)]
+    if len(chunks) > 1 and workers > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = list(pool.map(lambda chunk: run_chunk(tool_bin, chunk), chunks))
+    else:
+        results = [run_chunk(tool_bin, chunk) for chunk in chunks]
+
+    unattributed: list[dict] = []
+    fresh: list[tuple[str, str, list[dict]]] = []
+    for chunk, (by_file, leftovers, clean) in zip(chunks, results, strict=True):
+        unattributed += leftovers
+        for f in chunk:
+            per_file[f] = by_file.get(f, [])
+            if clean and not leftovers and f in blobs:
+                fresh.append((*blobs[f], per_file[f]))
+    if fc is not None and fresh:
+        fc.store_many(repo, engine, key, fresh)
+    return per_file, unattributed
+
+
+def _attribute(reported: str, chunk: list[str]) -> str | None:
+    """The input path a tool's reported file name refers to, if any."""
+    if reported in chunk:
+        return reported
+    norm = os.path.normpath(reported)
+    for f in chunk:
+        if os.path.normpath(f) == norm:
+            return f
+    return None
+
+
+def _lizard_chunk(lizard_bin: str, chunk: list[str]) -> ChunkResult:
+    r = run(lizard_bin, "--csv", *chunk)
+    by_file: dict[str, list[dict]] = {}
+    leftovers: list[dict] = []
+    for line in csv.reader(io.StringIO(r.stdout)):
+        # lizard csv: nloc,ccn,token,param,length,location,file,func,longname,start,end
+        if len(line) < 7:
+            continue
+        try:
+            row = {"nloc": int(line[0]), "ccn": int(line[1]), "length": int(line[4])}
+        except ValueError:
+            continue
+        f = _attribute(line[6], chunk)
+        if f is None:
+            leftovers.append({**row, "file": line[6]})
+        else:
+            by_file.setdefault(f, []).append(row)
+    # lizard exits non-zero for threshold warnings too; a crash is a traceback.
+    return by_file, leftovers, "Traceback (most recent call last)" not in (r.stderr or "")
+
+
+def lizard_ccn(
+    files: list[str], lizard_bin: str | None, *, repo: str | None = None,
+    blobs: dict[str, tuple[str, str]] | None = None,
+    prepare: Callable[[list[str]], None] | None = None,
+) -> list[dict]:
     """Per-function CCN + length via lizard --csv. Returns list of dicts.
 
     Each row also carries the source ``file`` lizard reported it against
@@ -188,25 +371,20 @@ def lizard_ccn(files: list[str], lizard_bin: str | None) -> list[dict]:
     existing caller ignore unknown dict keys, so this is additive: reusing
     ``lizard_ccn`` itself (CTR-fh-030's "complexity.lizard_ccn" reuse target)
     rather than a second lizard invocation path.
+
+    ``repo`` (the root ``files`` live under) enables the per-file cache (see
+    the module doc); rows come back grouped in ``files`` order either way.
+    A caller measuring files that are not in ``repo``'s working tree (``trend``
+    reading a historical commit) passes ``blobs`` — ``{file: (repo-relative
+    path, blob sha)}`` — as the cache keys instead, and ``prepare``, which is
+    called with only the cache misses so it can write just those to disk.
     """
     if not files or not lizard_bin:
         return []
-    rows: list[dict] = []
-    for i in range(0, len(files), 400):  # chunk to avoid arg limits
-        chunk = files[i:i + 400]
-        r = run(lizard_bin, "--csv", *chunk)
-        for line in csv.reader(io.StringIO(r.stdout)):
-            # lizard csv: nloc,ccn,token,param,length,location,file,func,longname,start,end
-            if len(line) < 7:
-                continue
-            try:
-                rows.append({
-                    "nloc": int(line[0]), "ccn": int(line[1]), "length": int(line[4]),
-                    "file": line[6],
-                })
-            except ValueError:
-                continue
-    return rows
+    per_file, unattributed = _measure(
+        "lizard", files, lizard_bin, LIZARD_CHUNK, _lizard_chunk, repo, blobs, prepare,
+    )
+    return [{**row, "file": f} for f in files for row in per_file[f]] + unattributed
 
 
 def dist(rows: list[dict]) -> dict | None:
@@ -229,15 +407,32 @@ def dist(rows: list[dict]) -> dict | None:
     }
 
 
-def radon_mi(files: list[str], radon_bin: str | None) -> dict | None:
-    if not files or not radon_bin:
-        return None
-    r = run(radon_bin, "mi", "-j", *files)
+def _radon_chunk(radon_bin: str, chunk: list[str]) -> ChunkResult:
+    r = run(radon_bin, "mi", "-j", *chunk)
     try:
         data = json.loads(r.stdout)
     except json.JSONDecodeError:
+        return {}, [], False
+    if not isinstance(data, dict):
+        return {}, [], False
+    by_file: dict[str, list[dict]] = {}
+    leftovers: list[dict] = []
+    for reported, v in data.items():
+        item = {"mi": v["mi"]} if isinstance(v, dict) and "mi" in v else None
+        f = _attribute(reported, chunk)
+        if f is None:
+            leftovers += [item] if item else [{}]
+        elif item:
+            by_file.setdefault(f, []).append(item)
+    return by_file, leftovers, True
+
+
+def radon_mi(files: list[str], radon_bin: str | None, *, repo: str | None = None) -> dict | None:
+    if not files or not radon_bin:
         return None
-    mis = [v["mi"] for v in data.values() if isinstance(v, dict) and "mi" in v]
+    per_file, unattributed = _measure("radon-mi", files, radon_bin, LIZARD_CHUNK, _radon_chunk, repo)
+    items = [item for f in files for item in per_file[f]] + unattributed
+    mis = [item["mi"] for item in items if "mi" in item]
     if not mis:
         return None
     mis.sort()
@@ -249,50 +444,73 @@ def radon_mi(files: list[str], radon_bin: str | None) -> dict | None:
     }
 
 
-def gocognit_dist(files: list[str], gocognit_bin: str | None) -> dict | None:
-    if not files or not gocognit_bin:
-        return None
-    vals: list[int] = []
-    for i in range(0, len(files), 200):
-        r = run(gocognit_bin, "-json", *files[i:i + 200])
+def _cognitive_items(items: list, chunk: list[str], value_key: str,
+                     file_of: Callable[[dict], str | None]) -> ChunkResult:
+    by_file: dict[str, list[dict]] = {}
+    leftovers: list[dict] = []
+    clean = True
+    for item in items:
         try:
-            for item in json.loads(r.stdout or "[]"):
-                vals.append(item["Complexity"])
-        except (json.JSONDecodeError, KeyError, TypeError):
+            row = {"complexity": item[value_key]}
+        except (KeyError, TypeError):
+            clean = False
             continue
-    if not vals:
-        return None
-    vals.sort()
-    n = len(vals)
-    return {
-        "functions": n, "cognitive_mean": round(sum(vals) / n, 2),
-        "cognitive_max": vals[-1], "cognitive_p95": vals[int(0.95 * (n - 1))],
-        "pct_gt15": round(100 * sum(v > 15 for v in vals) / n, 1),
-    }
+        reported = file_of(item)
+        f = _attribute(reported, chunk) if reported else None
+        if f is None:
+            leftovers.append(row)
+        else:
+            by_file.setdefault(f, []).append(row)
+    return by_file, leftovers, clean
 
 
-def complexipy_dist(files: list[str], complexipy_bin: str | None) -> dict | None:
-    if not files or not complexipy_bin:
-        return None
-    vals: list[int] = []
-    for i in range(0, len(files), 200):
-        with tempfile.NamedTemporaryFile("r", suffix=".json", delete=False) as tf:
-            outp = tf.name
-        run(complexipy_bin, "-q", "--output-format", "json", "--output", outp, *files[i:i + 200])
+def _gocognit_chunk(gocognit_bin: str, chunk: list[str]) -> ChunkResult:
+    r = run(gocognit_bin, "-json", *chunk)
+    try:
+        items = json.loads(r.stdout or "[]")
+    except json.JSONDecodeError:
+        return {}, [], False
+    if not isinstance(items, list):
+        return {}, [], False
+
+    def file_of(item: dict) -> str | None:
+        pos = item.get("Pos") if isinstance(item, dict) else None
+        return pos.get("Filename") if isinstance(pos, dict) else None
+
+    return _cognitive_items(items, chunk, "Complexity", file_of)
+
+
+def _complexipy_chunk(complexipy_bin: str, chunk: list[str]) -> ChunkResult:
+    with tempfile.NamedTemporaryFile("r", suffix=".json", delete=False) as tf:
+        outp = tf.name
+    run(complexipy_bin, "-q", "--output-format", "json", "--output", outp, *chunk)
+    try:
+        with open(outp) as fh:
+            items = json.load(fh)
+    except (json.JSONDecodeError, OSError):
+        return {}, [], False
+    finally:
         try:
-            with open(outp) as fh:
-                for item in json.load(fh):
-                    vals.append(item["complexity"])
-        except (json.JSONDecodeError, KeyError, TypeError, OSError):
+            os.unlink(outp)
+        except OSError:
             pass
-        finally:
-            try:
-                os.unlink(outp)
-            except OSError:
-                pass
+    if not isinstance(items, list):
+        return {}, [], False
+
+    def file_of(item: dict) -> str | None:
+        return item.get("path") if isinstance(item, dict) else None
+
+    return _cognitive_items(items, chunk, "complexity", file_of)
+
+
+def _cognitive_dist(per_file: dict[str, list[dict]], unattributed: list[dict],
+                    files: list[str]) -> dict | None:
+    vals = sorted(
+        [row["complexity"] for f in files for row in per_file[f]]
+        + [row["complexity"] for row in unattributed]
+    )
     if not vals:
         return None
-    vals.sort()
     n = len(vals)
     return {
         "functions": n, "cognitive_mean": round(sum(vals) / n, 2),
@@ -301,6 +519,24 @@ def complexipy_dist(files: list[str], complexipy_bin: str | None) -> dict | None
     }
 
 
+def gocognit_dist(files: list[str], gocognit_bin: str | None, *, repo: str | None = None) -> dict | None:
+    if not files or not gocognit_bin:
+        return None
+    per_file, unattributed = _measure(
+        "gocognit", files, gocognit_bin, COGNITIVE_CHUNK, _gocognit_chunk, repo,
+    )
+    return _cognitive_dist(per_file, unattributed, files)
+
+
+def complexipy_dist(files: list[str], complexipy_bin: str | None, *, repo: str | None = None) -> dict | None:
+    if not files or not complexipy_bin:
+        return None
+    per_file, unattributed = _measure(
+        "complexipy", files, complexipy_bin, COGNITIVE_CHUNK, _complexipy_chunk, repo,
+    )
+    return _cognitive_dist(per_file, unattributed, files)
+
+
 def loc_counts(files: list[str]) -> int:
     tot = 0
     for f in files:
@@ -341,13 +577,13 @@ def analyze(repo: str, venv: str | None = None, gobin: str | None = None, path_f
         entry = {
             "src_files": len(sets["src"]), "test_files": len(sets["test"]),
             "src_loc": src_loc, "test_loc": test_loc,
-            "cyclomatic_src": dist(lizard_ccn(sets["src"], lizard_bin)),
+            "cyclomatic_src": dist(lizard_ccn(sets["src"], lizard_bin, repo=repo)),
         }
         if lang == "python":
-            entry["maintainability_index"] = radon_mi(sets["src"], radon_bin)
-            entry["cognitive_src"] = complexipy_dist(sets["src"], complexipy_bin)
+            entry["maintainability_index"] = radon_mi(sets["src"], radon_bin, repo=repo)
+            entry["cognitive_src"] = complexipy_dist(sets["src"], complexipy_bin, repo=repo)
         elif lang == "go":
-            entry["cognitive_src"] = gocognit_dist(sets["src"], gocognit_bin)
+            entry["cognitive_src"] = gocognit_dist(sets["src"], gocognit_bin, repo=repo)
         langs[lang] = entry
 
     return {
@@ -17,6 +17,9 @@ Per-language tiers, mirroring the emitters layer's tiered posture:
         the symbol with a framework — routes, CLI commands, fixtures);
       * underscore-prefixed and dunder names are skipped (private-by-
         convention symbols are not "exports"), as is ``main``.
+    The repo-wide token counts come from a persistent, incrementally
+    maintained identifier index (``tokens.py``, keyed by blob sha): only the
+    files that changed since the last query are re-read.
   - **Go**: ``staticcheck`` when on PATH (its ``U1000``-class "unused"
     diagnostics, parsed from ``-f json``); else the Go tier is skipped and
     Go files are reported as unscanned.
@@ -47,11 +50,12 @@ import re
 import shutil
 import subprocess
 import sys
-from collections import Counter
 from pathlib import Path
 
-from . import complexity, population
+from . import complexity, population, tokens
 
+# The identifier-token grammar of the built-in tier; ``tokens.py`` counts the
+# same pattern over raw bytes for its persistent index.
 IDENT_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
 SKIP_NAMES = {"main"}
 STATICCHECK_TIMEOUT = 600
@@ -92,29 +96,30 @@ def _builtin_python_pass(
     """Conservative AST pass: (findings, unparsable_files). A symbol is dead
     only when its identifier token appears exactly once (the definition)
     across the WHOLE corpus — any other mention, in any file, in any context,
-    counts as a use."""
-    token_counts: Counter = Counter()
-    texts: dict[str, str] = {}
-    for rel in corpus:
-        try:
-            texts[rel] = (Path(repo) / rel).read_text(errors="replace")
-        except OSError:
-            continue
-        token_counts.update(IDENT_RE.findall(texts[rel]))
-
-    findings: list[dict] = []
+    counts as a use.
+
+    Only ``py_prod`` is read here (to parse its candidates); the corpus-wide
+    counts come from the persistent identifier index (``tokens.py``), which
+    re-reads only the corpus files whose content changed since it last
+    looked."""
+    in_corpus = set(corpus)
+    candidates: list[dict] = []
     unparsable: list[str] = []
     for rel in py_prod:
-        text = texts.get(rel)
-        if text is None:
+        if rel not in in_corpus:
             continue
-        candidates = _python_candidates(rel, text)
-        if candidates is None:
+        try:
+            text = (Path(repo) / rel).read_text(errors="replace")
+        except OSError:
+            continue
+        file_candidates = _python_candidates(rel, text)
+        if file_candidates is None:
             unparsable.append(rel)
             continue
-        for c in candidates:
-            if token_counts.get(c["symbol"], 0) == 1:
-                findings.append({**c, "tier": "builtin-ast"})
+        candidates.extend(file_candidates)
+
+    counts = tokens.occurrences(repo, corpus, (c["symbol"] for c in candidates))
+    findings = [{**c, "tier": "builtin-ast"} for c in candidates if counts.get(c["symbol"], 0) == 1]
     return findings, unparsable
 
 
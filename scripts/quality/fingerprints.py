@@ -0,0 +1,455 @@
+"""fingerprints.py — in-process, incremental clone detection: the native
+detector behind ``clones.analyze(engine="native")`` and the review-time
+``prevention_signals`` new-duplication signal.
+
+jscpd answers "which spans of this corpus are copies of each other?" by
+re-tokenizing the WHOLE corpus on every run — and ``prevention_signals``
+paid that again for every diff review, even when the diff touched three
+files (the #328 result cache only helps when nothing changed at all). The
+question is a pure function of each file's content, so this module keeps the
+per-file half of the work and redoes only the cross-file half:
+
+**Fingerprints.** A file is lexed into tokens (identifiers, numbers, string
+literals, single punctuation characters; whitespace and comments — ``#`` for
+Python, ``//`` and ``/* */`` for the C-family languages — dropped) and every
+window of ``MIN_TOKENS`` consecutive tokens gets a Rabin-Karp rolling hash.
+Lexical, not grammatical: it is jscpd's ``strict`` mode in spirit (no
+identifier renaming is forgiven), not its exact tokenizer, so span edges can
+differ from jscpd's by a token or a line.
+
+**What is stored.** One SQLite file per repo under the quality cache
+(``<CW_QUALITY_CACHE_DIR>/<repo-id>/clones.sqlite``, next to ``tokens.py``'s
+index): per file, its window hashes and the line of every token, keyed by the
+file's git blob sha — the source of truth every match is verified against —
+and a WINNOWED inverted index, ``anchor hash -> file``. Anchors are hashes of
+shorter ``ANCHOR_TOKENS``-token grams; of every ``ANCHOR_SPAN`` consecutive
+grams only the minimum is kept (robust winnowing), so the index holds roughly
+one row per dozen windows instead of one per window. Nothing is lost: a
+copied run of ``MIN_TOKENS`` tokens spans ``ANCHOR_SPAN`` whole grams, whose
+minimum both copies select — every duplicate shares at least one anchor.
+
+**How a query is answered.** ``duplicates(repo, corpus)`` builds the
+working-tree manifest for ``corpus`` (``quality.cache.manifest``) and brings
+the corpus's stored files in step with it in ONE transaction — only files
+whose blob sha moved are re-read and re-fingerprinted (their anchors deleted
+by ``rel``, one indexed statement per file), exactly as ``tokens.py`` does.
+Stored files OUTSIDE the corpus are left alone (a scoped
+``clones.analyze(path_filter=...)`` run must not discard what the next
+unscoped one needs) and are simply invisible to the query; only a file that
+no longer exists is dropped. Every anchor two files share (or one file
+selects twice) makes that pair a candidate, and the candidates' stored
+window hashes are matched exactly; each maximal run of consecutive matching
+window pairs becomes one duplicate, reported in jscpd's ``duplicates`` shape
+(``firstFile``/``secondFile`` name/start/end, ``lines``, ``tokens``,
+``fragment``) so ``clones.cluster`` stays the one clustering both detectors
+share. With ``focus`` (a review's changed files) only those files' anchors
+are looked up, by primary key, and only pairs with a member in them are
+kept: the clone classes a diff takes part in, from an indexed lookup instead
+of a corpus-wide scan. The unfocused query reads the anchor table once — it
+has to: it reports every clone in the corpus.
+
+Bounds, stated rather than hidden:
+
+- a duplicate must span ``MIN_TOKENS`` tokens and ``MIN_LINES`` lines
+  (jscpd's own defaults);
+- an anchor in more than ``MAX_OCCURRENCES`` files, or a window hash
+  occurring more than ``MAX_OCCURRENCES`` times in a candidate pair, is
+  boilerplate (a run of identical table rows, a license header) and pairs
+  nothing — the pair count is quadratic in it;
+- a file is stored only when the bytes read hash to the manifest's blob sha;
+  one that does not (edited mid-run, eol conversion, a symlink), and corpus
+  files with no manifest entry, are fingerprinted live on every query and
+  never served stale.
+
+Derived data: a corrupt store is deleted and rebuilt; a store that cannot be
+opened, a repo whose manifest cannot be built, or ``CW_QUALITY_NO_CACHE=1``
+(the quality battery's shared escape hatch, see ``cache.py``) fingerprints the
+whole corpus in memory — the same answer, just without the reuse, and the
+dual-run parity reference.
+
+As a module:
+    from quality.fingerprints import duplicates
+    duplicates("/path/to/repo", corpus)                  # whole corpus
+    duplicates("/path/to/repo", corpus, focus=changed)   # diff-scoped
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import zlib
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from . import cache, population
+
+MIN_TOKENS = 50
+MIN_LINES = 5
+MAX_OCCURRENCES = 100
+# Winnowing window: one anchor is kept per ANCHOR_SPAN consecutive anchor
+# grams, each ANCHOR_TOKENS long — so any run of MIN_TOKENS shared tokens
+# spans ANCHOR_SPAN whole grams and shares at least one anchor.
+ANCHOR_SPAN = 24
+ANCHOR_TOKENS = MIN_TOKENS - ANCHOR_SPAN + 1
+INDEX_VERSION = "2"
+_DB_NAME = "clones.sqlite"
+
+# Rolling hash over token hashes, mod the Mersenne prime 2**61 - 1 so every
+# window hash fits SQLite's signed 64-bit INTEGER.
+_BASE = 1_000_003
+_MOD = (1 << 61) - 1
+
+# An unterminated string literal runs to the end of its line.
+TOKEN_PATTERN = r"""
+    "(?:\\.|[^"\\])*"?
+  | '(?:\\.|[^'\\])*'?
+  | `[^`]*`?
+  | //|/\*|\*/
+  | [A-Za-z_$][\w$]*
+  | \d[\w.]*
+  | \S
+"""
+_TOKEN_RE = re.compile(TOKEN_PATTERN, re.VERBOSE)
+
+# ``windows`` is the v1 per-window inverted index, superseded by ``anchors``.
+_SCHEMA = """
+DROP TABLE IF EXISTS windows;
+CREATE TABLE IF NOT EXISTS files (
+    rel      TEXT PRIMARY KEY,
+    blob_sha TEXT NOT NULL,
+    windows  BLOB NOT NULL,
+    lines    BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS anchors (
+    hash INTEGER NOT NULL,
+    rel  TEXT NOT NULL,
+    n    INTEGER NOT NULL,
+    PRIMARY KEY (hash, rel)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS anchors_rel ON anchors (rel);
+"""
+
+# (window hashes, line of every token): window ``i`` covers tokens
+# ``i .. i + MIN_TOKENS - 1``.
+Fingerprint = tuple[array, array]
+# anchor hash -> how many positions of the file selected it.
+Anchors = dict[int, int]
+
+
+def _lex(text: str, lang: str | None) -> tuple[list[int], array]:
+    """Token hashes and their 1-indexed lines, comments and whitespace
+    dropped. Lines are ``str.splitlines`` lines — the numbering
+    ``clones._span_fragment`` reads spans back with."""
+    hashes: list[int] = []
+    lines = array("i")
+    c_family = lang != "python"
+    in_block = False
+    for lineno, line in enumerate(text.splitlines(), 1):
+        pos = 0
+        while True:
+            if in_block:
+                end = line.find("*/", pos)
+                if end < 0:
+                    break
+                in_block, pos = False, end + 2
+            m = _TOKEN_RE.search(line, pos)
+            if m is None:
+                break
+            tok, pos = m.group(), m.end()
+            if (c_family and tok == "//") or (not c_family and tok == "#"):
+                break
+            if c_family and tok == "/*":
+                in_block = True
+                continue
+            hashes.append(zlib.crc32(tok.encode("utf-8", errors="replace")))
+            lines.append(lineno)
+    return hashes, lines
+
+
+def _rolling(tokens: list[int], k: int) -> array:
+    """The hash of every run of ``k`` consecutive tokens."""
+    out = array("q")
+    if len(tokens) >= k:
+        top = pow(_BASE, k - 1, _MOD)
+        h = 0
+        for t in tokens[:k]:
+            h = (h * _BASE + t) % _MOD
+        out.append(h)
+        for i in range(k, len(tokens)):
+            h = ((h - tokens[i - k] * top) * _BASE + tokens[i]) % _MOD
+            out.append(h)
+    return out
+
+
+def _winnow(grams: array) -> Anchors:
+    """Robust winnowing: the minimum (rightmost on ties) of every
+    ``ANCHOR_SPAN`` consecutive gram hashes, counted once per position
+    selected. The choice depends only on the window's own hashes, so two
+    files sharing ``ANCHOR_SPAN`` consecutive grams select the same hash."""
+    out: Anchors = {}
+    window: deque[int] = deque()
+    last = -1
+    for i, h in enumerate(grams):
+        while window and grams[window[-1]] >= h:
+            window.pop()
+        window.append(i)
+        if window[0] <= i - ANCHOR_SPAN:
+            window.popleft()
+        if i >= ANCHOR_SPAN - 1 and window[0] != last:
+            last = window[0]
+            out[grams[last]] = out.get(grams[last], 0) + 1
+    return out
+
+
+def fingerprint(data: bytes, lang: str | None) -> tuple[Fingerprint, Anchors]:
+    """Window hashes and token lines of one file's bytes, plus its anchors."""
+    tokens, lines = _lex(data.decode("utf-8", errors="replace"), lang)
+    windows = _rolling(tokens, MIN_TOKENS)
+    return (windows, lines), (_winnow(_rolling(tokens, ANCHOR_TOKENS)) if windows else {})
+
+
+def _text_lines(repo: str, rel: str) -> list[str]:
+    """A duplicate's fragment source — read once per reporting file, never
+    fingerprinted."""
+    try:
+        return (Path(repo) / rel).read_text(errors="replace").splitlines()
+    except OSError:
+        return []
+
+
+def _live(repo: str, files: Iterable[str]) -> dict[str, tuple[Fingerprint, Anchors]]:
+    out = {}
+    for rel in sorted(files):
+        data = cache.read_bytes(repo, rel)
+        if data is not None:
+            out[rel] = fingerprint(data, population.lang_of(rel))
+    return out
+
+
+def _pack(values: array) -> bytes:
+    return zlib.compress(values.tobytes())
+
+
+def _unpack(typecode: str, blob: bytes) -> array:
+    out = array(typecode)
+    out.frombytes(zlib.decompress(blob))
+    return out
+
+
+def _connect(repo: str) -> sqlite3.Connection | None:
+    return cache.open_store(repo, _DB_NAME, _SCHEMA, {
+        "version": INDEX_VERSION, "min_tokens": str(MIN_TOKENS),
+        "anchor_span": str(ANCHOR_SPAN), "pattern": TOKEN_PATTERN,
+    })
+
+
+def _sync(
+    conn: sqlite3.Connection, repo: str, files: set[str], manifest: dict[str, str],
+) -> dict[str, tuple[Fingerprint, Anchors]]:
+    """Bring the stored files of this query (``files``) in step with
+    ``manifest``, re-fingerprinting only those whose blob changed. A stored
+    file outside the query is left as it is — a scoped run must not discard
+    what an unscoped one will need — unless it no longer exists at all.
+    Returns the fingerprints of files read but not stored (their bytes did
+    not match the manifest)."""
+    unindexed: dict[str, tuple[Fingerprint, Anchors]] = {}
+    with cache.write_transaction(conn):
+        indexed = dict(conn.execute("SELECT rel, blob_sha FROM files"))
+        stale = [
+            (rel,) for rel, sha in indexed.items()
+            if (manifest.get(rel) != sha if rel in files else not (Path(repo) / rel).is_file())
+        ]
+        fresh = [rel for rel, sha in manifest.items() if indexed.get(rel) != sha]
+        conn.executemany("DELETE FROM anchors WHERE rel = ?", stale)
+        conn.executemany("DELETE FROM files WHERE rel = ?", stale)
+        for rel, data, storable in cache.read_changed(repo, manifest, fresh):
+            fp = fingerprint(data, population.lang_of(rel))
+            if not storable:
+                unindexed[rel] = fp
+                continue
+            (windows, lines), anchors = fp
+            conn.execute("INSERT INTO files VALUES (?, ?, ?, ?)",
+                         (rel, manifest[rel], _pack(windows), _pack(lines)))
+            conn.executemany("INSERT INTO anchors VALUES (?, ?, ?)",
+                             [(h, rel, n) for h, n in anchors.items()])
+    return unindexed
+
+
+class _Corpus:
+    """The query's files — stored ones (``conn``, may be None) plus the ones
+    fingerprinted live this query — behind one lookup interface. Stored
+    files outside ``scope`` are invisible."""
+
+    def __init__(self, conn: sqlite3.Connection | None,
+                 live: dict[str, tuple[Fingerprint, Anchors]], scope: set[str]) -> None:
+        self._conn = conn
+        self._scope = scope
+        self._live = live
+        self._fps = {rel: fp for rel, (fp, _anchors) in live.items()}
+        self._positions: dict[str, dict[int, list[int]]] = {}
+        self._live_occ: dict[int, list[tuple[str, int]]] = {}
+        for rel, (_fp, anchors) in live.items():
+            for h, n in anchors.items():
+                self._live_occ.setdefault(h, []).append((rel, n))
+
+    def _stored(self, rel: str) -> bool:
+        return rel in self._scope and rel not in self._live
+
+    def fingerprint(self, rel: str) -> Fingerprint:
+        if rel not in self._fps:
+            row = None
+            if self._conn is not None and self._stored(rel):
+                row = self._conn.execute(
+                    "SELECT windows, lines FROM files WHERE rel = ?", (rel,)).fetchone()
+            self._fps[rel] = ((_unpack("q", row[0]), _unpack("i", row[1]))
+                              if row else (array("q"), array("i")))
+        return self._fps[rel]
+
+    def positions(self, rel: str) -> dict[int, list[int]]:
+        """Window hash -> every window index holding it, in ``rel``."""
+        if rel not in self._positions:
+            where: dict[int, list[int]] = {}
+            for i, h in enumerate(self.fingerprint(rel)[0]):
+                where.setdefault(h, []).append(i)
+            self._positions[rel] = where
+        return self._positions[rel]
+
+    def anchors(self, rel: str) -> list[int]:
+        if rel in self._live:
+            return list(self._live[rel][1])
+        if self._conn is None or not self._stored(rel):
+            return []
+        return [h for (h,) in self._conn.execute("SELECT hash FROM anchors WHERE rel = ?", (rel,))]
+
+    def occurrences(self, hashes: Iterable[int]) -> dict[int, list[tuple[str, int]]]:
+        """Every in-scope ``(file, selections)`` of each anchor hash."""
+        occ = {h: list(self._live_occ.get(h, ())) for h in hashes}
+        if self._conn is not None:
+            wanted = sorted(occ)
+            for i in range(0, len(wanted), cache.LOOKUP_CHUNK):
+                chunk = wanted[i:i + cache.LOOKUP_CHUNK]
+                for h, rel, n in self._conn.execute(
+                    f"SELECT hash, rel, n FROM anchors WHERE hash IN ({','.join('?' * len(chunk))})",  # noqa: S608
+                    chunk,
+                ):
+                    if self._stored(rel):
+                        occ[h].append((rel, n))
+        return occ
+
+    def repeated(self) -> dict[int, list[tuple[str, int]]]:
+        """Every in-scope anchor selected more than once, with its
+        occurrences — the whole-corpus query, one pass over the (winnowed)
+        anchor table's primary key."""
+        occ = {h: where for h, where in self.occurrences(self._live_occ).items()
+               if len(where) > 1 or where[0][1] > 1}
+        if self._conn is not None:
+            for h, rel, n in self._conn.execute(
+                "SELECT hash, rel, n FROM anchors WHERE hash IN"
+                " (SELECT hash FROM anchors GROUP BY hash HAVING COUNT(*) > 1 OR SUM(n) > 1)"
+            ):
+                if h not in self._live_occ and self._stored(rel):
+                    occ.setdefault(h, []).append((rel, n))
+        return {h: where for h, where in occ.items() if len(where) > 1 or where[0][1] > 1}
+
+
+def _candidates(occ: dict[int, list[tuple[str, int]]], focus: set[str] | None) -> set[tuple[str, str]]:
+    """File pairs ``(a, b)``, a <= b, sharing an anchor — ``(a, a)`` when a
+    file selected one anchor at two positions."""
+    pairs: set[tuple[str, str]] = set()
+    for where in occ.values():
+        if len(where) > MAX_OCCURRENCES:
+            continue
+        rels = sorted(where)
+        for a, (ra, n) in enumerate(rels):
+            if n > 1 and (focus is None or ra in focus):
+                pairs.add((ra, ra))
+            for rb, _n in rels[a + 1:]:
+                if focus is None or ra in focus or rb in focus:
+                    pairs.add((ra, rb))
+    return pairs
+
+
+def _window_pairs(src: _Corpus, ra: str, rb: str) -> Iterator[tuple[str, int, str, int]]:
+    """Matching window pairs ``(file_a, win_a, file_b, win_b)`` between two
+    candidate files, ``(a, win_a) < (b, win_b)``."""
+    pa = src.positions(ra)
+    if ra == rb:
+        for where in pa.values():
+            if not 2 <= len(where) <= MAX_OCCURRENCES:
+                continue
+            for a, ia in enumerate(where):
+                for ib in where[a + 1:]:
+                    if ib - ia >= MIN_TOKENS:  # never a window overlapping itself
+                        yield ra, ia, ra, ib
+        return
+    pb = src.positions(rb)
+    for h, where_a in pa.items():
+        where_b = pb.get(h)
+        if where_b is None or len(where_a) + len(where_b) > MAX_OCCURRENCES:
+            continue
+        for ia in where_a:
+            for ib in where_b:
+                yield ra, ia, rb, ib
+
+
+def _detect(repo: str, src: _Corpus, focus: set[str] | None) -> list[dict]:
+    if focus is None:
+        occ = src.repeated()
+    else:
+        wanted: set[int] = set()
+        for rel in focus:
+            wanted.update(src.anchors(rel))
+        occ = src.occurrences(wanted)
+    pairs: set[tuple] = set()
+    for ra, rb in _candidates(occ, focus):
+        pairs.update(_window_pairs(src, ra, rb))
+    texts: dict[str, list[str]] = {}
+    out = []
+    for ra, ia, rb, ib in sorted(pairs):
+        if (ra, ia - 1, rb, ib - 1) in pairs:
+            continue  # not the start of its run
+        k = 0
+        while (ra, ia + k + 1, rb, ib + k + 1) in pairs:
+            k += 1
+        span = k + MIN_TOKENS - 1
+        lines_a, lines_b = src.fingerprint(ra)[1], src.fingerprint(rb)[1]
+        start, end = lines_a[ia], lines_a[ia + span]
+        if end - start + 1 < MIN_LINES:
+            continue
+        if ra not in texts:
+            texts[ra] = _text_lines(repo, ra)
+        out.append({
+            "format": population.lang_of(ra),
+            "lines": end - start + 1,
+            "tokens": span + 1,
+            "fragment": "\n".join(texts[ra][start - 1:end]),
+            "firstFile": {"name": ra, "start": start, "end": end},
+            "secondFile": {"name": rb, "start": lines_b[ib], "end": lines_b[ib + span]},
+        })
+    return out
+
+
+def duplicates(repo: str, corpus: Iterable[str], *, focus: Iterable[str] | None = None) -> list[dict]:
+    """Duplicated spans across the repo-relative files in ``corpus``, in
+    jscpd's ``duplicates`` shape, sorted by (first file, position). With
+    ``focus``, only duplicates with a member in those files (each is part of
+    the corpus). Maintains the persistent store as a side effect — see the
+    module doc for what is read and when."""
+    files = set(corpus)
+    wanted = None if focus is None else set(focus)
+    if wanted is not None:
+        files |= wanted
+    manifest = None if cache.disabled() else cache.manifest(repo, files)
+    conn = _connect(repo) if manifest is not None else None
+    if conn is None:
+        return _detect(repo, _Corpus(None, _live(repo, files), files), wanted)
+    try:
+        live = _sync(conn, repo, files, manifest)
+        live.update(_live(repo, files - manifest.keys()))
+        return _detect(repo, _Corpus(conn, live, files), wanted)
+    except sqlite3.Error:
+        return _detect(repo, _Corpus(None, _live(repo, files), files), wanted)
+    finally:
+        conn.close()
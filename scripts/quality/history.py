@@ -0,0 +1,297 @@
+"""history.py — the ONE git-history extractor behind churn, process, hotspots,
+trend and survival.
+
+Every history engine in ``scripts/quality/`` used to run its own ``git log``:
+``churn.analyze`` a full ``--numstat`` walk, ``process._parse_commits`` a
+second one, ``hotspots.discover`` both of those plus a ``--since`` churn pass,
+``trend.sample_commits`` a first-parent walk, and ``survival`` a ``git show``
+for author times. On a 100k-commit repo the diff-stat half of that work is
+minutes, and it was done four to five times per battery run — every run.
+
+**What is stored.** One row per commit — sha, parents, author, email, short
+author date, author timestamp, subject — and one row per ``--numstat`` line
+(path, added, deleted; a binary ``-`` is stored as ``0``, exactly as every
+engine already read it). A commit is immutable by sha, so a row is written
+once and never revisited: the store is a SQLite file under the quality cache
+(``<CW_QUALITY_CACHE_DIR>/<repo-id>/history.sqlite``), with paths interned in
+their own table.
+
+**How a query is answered.** ``commits(repo, *revs)`` asks ``git rev-list``
+for the commit list — the same revision arguments and therefore the same
+commits, in the same order, as the ``git log`` it replaces (``--since``,
+``--no-merges``, ``--all``, ``--first-parent``, ``--reverse``): a walk
+without diffs, a fraction of a second even on a very large repo. Commits
+not yet stored are extracted in ONE streamed ``git log --no-walk --stdin
+--numstat`` over exactly those shas and appended (a sha git cannot show —
+unknown, or not a commit — is dropped first, so it never fails the rest of
+the batch). A new commit on HEAD costs one commit's diff stat; an unchanged
+HEAD costs the ``rev-list`` alone. Only the requested shas are read from the
+store, and what is read stays in a per-process memo, so ``hotspots``' three
+engine calls cost one load.
+
+Per-commit numstat output does not depend on how the commit was reached
+(it is always the diff against the first parent; merges print none), so a
+stored commit is byte-for-byte what the engine's own walk would have parsed.
+
+Derived data: a corrupt store is deleted and rebuilt, and a store that
+cannot be opened at all degrades to extracting in memory.
+``CW_QUALITY_NO_CACHE=1`` (the quality battery's shared escape hatch, see
+``cache.py``) bypasses the store and the in-process memo — every query is a
+fresh extraction, for the dual-run parity check.
+
+As a module:
+    from quality.history import commits
+    for c in commits("/path/to/repo", "--no-merges", "HEAD"):
+        ...
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import subprocess
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from . import cache
+
+SENT = "@@@COMMIT@@@"
+# Subject last: it is the only field that may itself contain a tab.
+_FORMAT = f"{SENT}%H\t%P\t%an\t%ae\t%ad\t%at\t%s"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS commits (
+    id       INTEGER PRIMARY KEY,
+    sha      TEXT NOT NULL UNIQUE,
+    parents  TEXT NOT NULL,
+    author   TEXT NOT NULL,
+    email    TEXT NOT NULL,
+    date     TEXT NOT NULL,
+    authored INTEGER NOT NULL,
+    subject  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS paths (
+    id   INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS changes (
+    commit_id INTEGER NOT NULL,
+    path_id   INTEGER NOT NULL,
+    added     INTEGER NOT NULL,
+    deleted   INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS changes_commit ON changes (commit_id);
+"""
+
+# ``(path, added, deleted)`` — one ``--numstat`` line.
+Change = tuple[str, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class Commit:
+    sha: str
+    parents: tuple[str, ...]
+    author: str
+    email: str
+    date: str  # author date, YYYY-MM-DD (``--date=short``)
+    authored: int  # author time, unix seconds
+    subject: str
+    changes: tuple[Change, ...]
+
+
+# Per-process view of the part of each repo's store this process asked for:
+# sha -> Commit. Only ever grows — a commit never changes — so it can never
+# serve a stale row.
+_MEMO: dict[str, dict[str, Commit]] = {}
+
+
+def _git(repo: str, *args: str) -> str | None:
+    try:
+        proc = subprocess.run(["git", "-C", repo, *args], capture_output=True, text=True)
+    except OSError:
+        return None
+    return proc.stdout if proc.returncode == 0 else None
+
+
+def _connect(repo: str) -> sqlite3.Connection | None:
+    return cache.open_store(repo, "history.sqlite", _SCHEMA)
+
+
+def _load(conn: sqlite3.Connection, shas: list[str]) -> dict[str, Commit]:
+    """The stored commits among ``shas``, queried in chunks of
+    ``cache.LOOKUP_CHUNK`` — never the whole store."""
+    out: dict[str, Commit] = {}
+    for i in range(0, len(shas), cache.LOOKUP_CHUNK):
+        chunk = shas[i:i + cache.LOOKUP_CHUNK]
+        marks = ",".join("?" * len(chunk))
+        heads = conn.execute(
+            "SELECT id, sha, parents, author, email, date, authored, subject FROM commits"
+            f" WHERE sha IN ({marks})", chunk,  # noqa: S608 - placeholders only
+        ).fetchall()
+        if not heads:
+            continue
+        ids = [row[0] for row in heads]
+        changes: dict[int, list[Change]] = {}
+        for commit_id, path, added, deleted in conn.execute(
+            "SELECT changes.commit_id, paths.path, changes.added, changes.deleted"
+            " FROM changes JOIN paths ON paths.id = changes.path_id"
+            f" WHERE changes.commit_id IN ({','.join('?' * len(ids))})"  # noqa: S608
+            " ORDER BY changes.rowid", ids,
+        ):
+            changes.setdefault(commit_id, []).append((path, added, deleted))
+        for cid, sha, parents, author, email, date, authored, subject in heads:
+            out[sha] = Commit(sha, tuple(parents.split()), author, email, date, authored,
+                              subject, tuple(changes.get(cid, ())))
+    return out
+
+
+def _path_ids(conn: sqlite3.Connection, paths: set[str]) -> dict[str, int]:
+    """``{path: id}`` for ``paths``, interning the ones not yet stored."""
+    want = sorted(paths)
+    ids: dict[str, int] = {}
+    for i in range(0, len(want), cache.LOOKUP_CHUNK):
+        chunk = want[i:i + cache.LOOKUP_CHUNK]
+        ids.update(conn.execute(
+            f"SELECT path, id FROM paths WHERE path IN ({','.join('?' * len(chunk))})",  # noqa: S608
+            chunk,
+        ))
+    for path in want:
+        if path not in ids:
+            ids[path] = conn.execute("INSERT INTO paths (path) VALUES (?)", (path,)).lastrowid
+    return ids
+
+
+def _append(conn: sqlite3.Connection, fresh: Iterable[Commit]) -> None:
+    """Store newly extracted commits — one write transaction, skipping any a
+    concurrent process stored first (so no commit's changes land twice)."""
+    fresh = list(fresh)
+    with cache.write_transaction(conn):
+        path_ids = _path_ids(conn, {path for c in fresh for path, _a, _d in c.changes})
+        for c in fresh:
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO commits (sha, parents, author, email, date, authored, subject) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (c.sha, " ".join(c.parents), c.author, c.email, c.date, c.authored, c.subject),
+            )
+            if not cur.rowcount:
+                continue
+            conn.executemany("INSERT INTO changes VALUES (?, ?, ?, ?)", [
+                (cur.lastrowid, path_ids[path], added, deleted)
+                for path, added, deleted in c.changes
+            ])
+
+
+def _showable(repo: str, shas: list[str]) -> list[str]:
+    """The ``shas`` that name a commit, in order — asked of one ``git
+    cat-file --batch-check``, which answers every line (``<sha> missing``
+    for an unknown one) instead of failing the batch."""
+    try:
+        proc = subprocess.run(
+            ["git", "-C", repo, "cat-file", "--batch-check=%(objecttype)"],
+            input="".join(f"{s}\n" for s in shas), capture_output=True, text=True,
+        )
+    except OSError:
+        return []
+    kinds = proc.stdout.splitlines()
+    if proc.returncode != 0 or len(kinds) != len(shas):
+        return []
+    return [s for s, kind in zip(shas, kinds, strict=True) if kind == "commit"]
+
+
+def _extract(repo: str, shas: list[str]) -> dict[str, Commit]:
+    """ONE streamed ``git log --numstat`` over exactly ``shas``. git rejects
+    the whole batch if any one of them is not a commit, so a failed batch is
+    retried once over just the ``_showable`` ones."""
+    out = _log(repo, shas)
+    if out is None:
+        out = _log(repo, _showable(repo, shas)) or {}
+    return out
+
+
+def _log(repo: str, shas: list[str]) -> dict[str, Commit] | None:
+    """``_extract``'s one ``git log``; ``None`` when git refused the batch."""
+    out: dict[str, Commit] = {}
+    if not shas:
+        return out
+    try:
+        proc = subprocess.Popen(
+            ["git", "-C", repo, "log", "--no-walk=unsorted", "--stdin",
+             f"--format={_FORMAT}", "--numstat", "--date=short"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except OSError:
+        return {}
+    # git reads every revision from stdin before it prints anything, so the
+    # whole list can be written before the output is drained.
+    try:
+        proc.stdin.write("".join(f"{s}\n" for s in shas))
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass
+    head: list[str] | None = None
+    changes: list[Change] = []
+
+    def flush() -> None:
+        if head is not None:
+            sha, parents, author, email, date, authored, subject = head
+            out[sha] = Commit(sha, tuple(parents.split()), author, email, date,
+                              int(authored or 0), subject, tuple(changes))
+
+    for raw in proc.stdout:
+        line = raw.rstrip("\n")
+        if line.startswith(SENT):
+            flush()
+            head = line[len(SENT):].split("\t", 6)
+            changes = []
+        elif line.strip() and head is not None:
+            parts = line.split("\t")
+            if len(parts) != 3:
+                continue
+            a, d, path = parts
+            changes.append((path, 0 if a == "-" else int(a), 0 if d == "-" else int(d)))
+    flush()
+    return out if proc.wait() == 0 else None
+
+
+def lookup(repo: str, shas: Iterable[str]) -> dict[str, Commit]:
+    """The stored commit for each of ``shas`` (extracting and storing the
+    ones not yet seen). A sha git does not know is absent from the result."""
+    wanted = list(dict.fromkeys(shas))
+    if cache.disabled():
+        return _extract(repo, wanted)
+    known = _MEMO.setdefault(os.path.abspath(repo), {})
+    missing = [s for s in wanted if s not in known]
+    if not missing:
+        return {s: known[s] for s in wanted}
+    conn = _connect(repo)
+    try:
+        if conn is not None:
+            try:
+                known.update(_load(conn, missing))
+            except sqlite3.Error:
+                pass  # derived data: extract instead
+        fresh = _extract(repo, [s for s in missing if s not in known])
+        if fresh:
+            known.update(fresh)
+            if conn is not None:
+                try:
+                    _append(conn, fresh.values())
+                except sqlite3.Error:
+                    pass  # derived data: the next process re-extracts
+    finally:
+        if conn is not None:
+            conn.close()
+    return {s: known[s] for s in wanted if s in known}
+
+
+def commits(repo: str, *revs: str) -> list[Commit]:
+    """The commits ``git log <revs>`` would print, in its order, each with
+    its ``--numstat`` changes. An empty list for an empty repo, an unborn
+    HEAD, or a path that is not a repo — never raises."""
+    listed = _git(repo, "rev-list", *revs)
+    if not listed:
+        return []
+    order = listed.split()
+    stored = lookup(repo, order)
+    return [stored[s] for s in order if s in stored]
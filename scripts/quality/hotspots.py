@@ -177,7 +177,7 @@ def _file_complexity(repo: str, lizard_bin: str | None) -> tuple[dict[str, int],
     all_src: list[str] = []
     for _lang, sets in bucketed.items():
         all_src += sets["src"]
-    rows = complexity_mod.lizard_ccn(all_src, lizard_bin)
+    rows = complexity_mod.lizard_ccn(all_src, lizard_bin, repo=repo)
     totals: dict[str, int] = defaultdict(int)
     for row in rows:
         f = row.get("file")
@@ -192,7 +192,10 @@ def _compute_trend(repo: str, churn_result: dict, window_days: int) -> dict[str,
     """Directional trend: recent-half churn share vs. the share you'd expect
     if churn were spread evenly across the window. Reuses ``churn.analyze``
     a second time with ``since`` bounding it to the recent half — the SAME
-    engine, date-bounded, not a new history parser."""
+    engine, date-bounded, not a new history parser. Both calls (and
+    ``process.compute_coupling``'s) read the shared commit store
+    (``history.py``), so the second pass costs a ``rev-list``, not another
+    diff-stat walk."""
     try:
         first = datetime.strptime(churn_result["scale"]["first"], "%Y-%m-%d")
         last = datetime.strptime(churn_result["scale"]["last"], "%Y-%m-%d")
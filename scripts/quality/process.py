@@ -2,7 +2,8 @@
 """process.py — process/history metrics (the literature's strongest signals).
 
 Rahman & Devanbu (2013): process metrics outperform static product metrics for
-defect prediction, and are more stable across releases. Computed from ``git log``:
+defect prediction, and are more stable across releases. Computed from git history
+(the shared commit store, ``history.py``):
   - Change (temporal) coupling  — Tornhill: files that change together.
   - Change entropy (HCM)        — Hassan 2009: Shannon entropy of change spread.
   - Ownership / bus-factor      — Bird et al. 2011: top-owner share, minor authors.
@@ -27,11 +28,12 @@ import argparse
 import json
 import math
 import re
-import subprocess
 import sys
 from collections import Counter, defaultdict
 from itertools import combinations
 
+from . import history
+
 CODE = (".py", ".go", ".ts", ".tsx", ".js", ".jsx")
 EXCLUDE = re.compile(
     r"(^|/)(node_modules|dist|build|out|\.next|vendor|\.venv|"
@@ -41,9 +43,6 @@ EXCLUDE = re.compile(
 )
 FIX = re.compile(r"^(fix|bugfix|hotfix)(\(|:|\b)", re.I)
 
-SENT = "@@@"
-
-
 def is_code(p: str) -> bool:
     return p.endswith(CODE) and not EXCLUDE.search(p)
 
@@ -58,30 +57,21 @@ DEFAULT_MIN_CO = 4
 
 
 def _parse_commits(repo: str) -> list[dict]:
-    """Parse ``git log --numstat`` into ``[{author, subject, files:[(path, churn)]}]``,
-    restricted to code files (``is_code``). The ONE git-log parse this module
-    does — ``analyze()`` and ``compute_coupling()`` both build on this instead
-    of each re-invoking/re-parsing ``git log`` (INV-fh-001: a second parser of
-    the same history is how a second coupling definition would sneak in)."""
-    log = subprocess.run(
-        ["git", "-C", repo, "log", "--no-merges", f"--format={SENT}%H\t%an\t%s", "--numstat"],
-        capture_output=True, text=True,
-    ).stdout
-
-    commits: list[dict] = []
-    cur: dict | None = None
-    for line in log.splitlines():
-        if line.startswith(SENT):
-            h, an, s = line[len(SENT):].split("\t", 2)
-            cur = {"author": an, "subject": s, "files": []}
-            commits.append(cur)
-        elif line.strip() and cur is not None:
-            parts = line.split("\t")
-            if len(parts) == 3 and is_code(parts[2]):
-                add = 0 if parts[0] == "-" else int(parts[0])
-                dele = 0 if parts[1] == "-" else int(parts[1])
-                cur["files"].append((parts[2], add + dele))
-    return commits
+    """``[{author, subject, files:[(path, churn)]}]`` for every non-merge
+    commit on HEAD, restricted to code files (``is_code``). The ONE history
+    read this module does — ``analyze()`` and ``compute_coupling()`` both
+    build on this instead of each re-reading history (INV-fh-001: a second
+    parser of the same history is how a second coupling definition would
+    sneak in) — served from the shared commit store (``history.py``) that
+    churn reads too."""
+    return [
+        {
+            "author": c.author,
+            "subject": c.subject,
+            "files": [(path, add + dele) for path, add, dele in c.changes if is_code(path)],
+        }
+        for c in history.commits(repo, "--no-merges", "HEAD")
+    ]
 
 
 def _coupling_from_commits(commits: list[dict], min_co: int = DEFAULT_MIN_CO) -> list[dict]:
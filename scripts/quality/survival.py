@@ -34,7 +34,7 @@ import shutil
 import subprocess
 import sys
 
-from . import cache
+from . import cache, history
 
 AGES = [7, 14, 30, 60, 90]
 
@@ -103,17 +103,9 @@ def analyze_survival_json(survival_path: str, repo: str, name: str | None = None
     with open(survival_path) as fh:
         surv = json.load(fh)
 
-    hashes = list(surv)
-    authored: dict[str, int] = {}
-    if hashes:
-        out = subprocess.run(
-            ["git", "-C", repo, "show", "-s", "--format=%H %at", *hashes],
-            capture_output=True, text=True,
-        ).stdout
-        for line in out.splitlines():
-            if " " in line:
-                h, at = line.split()
-                authored[h] = int(at)
+    # Author times from the shared commit store (``history.py``) — the same
+    # ``%at`` a ``git show -s`` per hash would print, without another walk.
+    authored = {h: c.authored for h, c in history.lookup(repo, surv).items()}
 
     agg = {a: {"num": 0.0, "den": 0.0} for a in AGES}
     curve: list[tuple[float, float, int]] = []
@@ -0,0 +1,171 @@
+"""tokens.py — persistent identifier-occurrence index behind the built-in
+dead-code tier (``dead_code._builtin_python_pass``) and the review-time
+``prevention_signals`` dead-code signal.
+
+The built-in tier's question is tiny — "does this symbol's identifier appear
+anywhere but its own ``def`` line?" — but answering it used to mean reading
+EVERY file in the repo population and running the identifier regex over all
+of it, on every ``dead_code.analyze`` and, worse, on every diff review, even
+when the diff touched three files. The answer is a pure function of the
+corpus's content, so this module keeps it:
+
+**What is stored.** One SQLite file per repo under the quality cache
+(``<CW_QUALITY_CACHE_DIR>/<repo-id>/tokens.sqlite``, next to ``history.py``'s
+store): per file, its identifier-token counts (a zlib-compressed JSON
+object), keyed by the file's git blob sha; and the MERGED counts across
+every indexed file, one ``(token, n)`` row each.
+
+**How a query is answered.** ``occurrences(repo, corpus, names)`` builds the
+working-tree manifest for ``corpus`` (``chief_wiggum.manifest`` — a stat-keyed
+hash, so an unchanged file is not re-read to prove it unchanged), then
+brings the index in step with it in ONE transaction: a file whose blob sha
+moved, or that left the corpus, has its stored counts subtracted from the
+totals; a new or changed file is read and its counts added. Only those files
+are read. The requested names are then looked up in the merged totals. A
+review over a three-file diff reads three files, not the repo.
+
+Exactness, not approximation:
+
+- a file is stored only when the bytes actually read hash to the manifest's
+  blob sha — a file edited between the manifest and the read (or one whose
+  working-tree bytes never match its blob: eol conversion, a symlink) is
+  counted live and left unindexed, so it is re-read next time, never served
+  stale;
+- corpus files with no manifest entry (outside git, ignored) are read and
+  counted live on every query;
+- tokens are counted on raw bytes with the ASCII-only identifier pattern,
+  which yields exactly the tokens the old ``read_text(errors="replace")`` +
+  ``IDENT_RE.findall`` did: no decoder turns ASCII bytes into anything but
+  themselves, and replacement characters are never identifier characters;
+- an index written by a different ``INDEX_VERSION`` or pattern is discarded.
+
+Derived data: a corrupt store is deleted and rebuilt; a store that cannot be
+opened, a repo whose manifest cannot be built, or ``CW_QUALITY_NO_CACHE=1``
+(the quality battery's shared escape hatch, see ``cache.py``) degrades to
+counting the whole corpus in memory — the pre-index behavior, kept as the
+dual-run parity reference.
+
+As a module:
+    from quality.tokens import occurrences
+    occurrences("/path/to/repo", corpus, ["helper", "Widget"])  # {"helper": 1, ...}
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import zlib
+from collections import Counter
+from collections.abc import Iterable
+
+from . import cache
+
+# The ``dead_code.IDENT_RE`` pattern over bytes (see the module doc).
+IDENT_BYTES_RE_PATTERN = rb"[A-Za-z_][A-Za-z0-9_]*"
+INDEX_VERSION = "1"
+_DB_NAME = "tokens.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    rel      TEXT PRIMARY KEY,
+    blob_sha TEXT NOT NULL,
+    counts   BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS totals (
+    token TEXT PRIMARY KEY,
+    n     INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+_IDENT_BYTES_RE = re.compile(IDENT_BYTES_RE_PATTERN)
+
+
+def file_counts(data: bytes) -> Counter:
+    """Identifier-token counts of one file's bytes."""
+    return Counter(t.decode("ascii") for t in _IDENT_BYTES_RE.findall(data))
+
+
+def _live(repo: str, corpus: Iterable[str]) -> Counter:
+    totals: Counter = Counter()
+    for rel in corpus:
+        data = cache.read_bytes(repo, rel)
+        if data is not None:
+            totals.update(file_counts(data))
+    return totals
+
+
+def _connect(repo: str) -> sqlite3.Connection | None:
+    return cache.open_store(repo, _DB_NAME, _SCHEMA, {
+        "version": INDEX_VERSION, "pattern": IDENT_BYTES_RE_PATTERN.decode(),
+    })
+
+
+def _sync(conn: sqlite3.Connection, repo: str, manifest: dict[str, str]) -> Counter:
+    """Bring the indexed file set to exactly ``manifest``, reading only the
+    files whose blob changed. Returns the live counts of files read but not
+    indexed (their bytes did not match the manifest)."""
+    unindexed: Counter = Counter()
+    with cache.write_transaction(conn):
+        indexed = dict(conn.execute("SELECT rel, blob_sha FROM files"))
+        stale = [rel for rel, sha in indexed.items() if manifest.get(rel) != sha]
+        fresh = [rel for rel, sha in manifest.items() if indexed.get(rel) != sha]
+        delta: Counter = Counter()
+        for rel in stale:
+            (blob,) = conn.execute("SELECT counts FROM files WHERE rel = ?", (rel,)).fetchone()
+            delta.subtract(json.loads(zlib.decompress(blob)))
+        conn.executemany("DELETE FROM files WHERE rel = ?", [(rel,) for rel in stale])
+        rows = []
+        for rel, data, storable in cache.read_changed(repo, manifest, fresh):
+            counts = file_counts(data)
+            if not storable:
+                unindexed.update(counts)
+                continue
+            delta.update(counts)
+            payload = zlib.compress(json.dumps(counts, separators=(",", ":")).encode())
+            rows.append((rel, manifest[rel], payload))
+        conn.executemany("INSERT INTO files VALUES (?, ?, ?)", rows)
+        conn.executemany(
+            "INSERT INTO totals VALUES (?, ?) ON CONFLICT(token) DO UPDATE SET n = n + excluded.n",
+            [(token, n) for token, n in delta.items() if n],
+        )
+        if stale:
+            conn.execute("DELETE FROM totals WHERE n <= 0")
+    return unindexed
+
+
+def _lookup(conn: sqlite3.Connection, names: list[str]) -> dict[str, int]:
+    found: dict[str, int] = {}
+    for i in range(0, len(names), cache.LOOKUP_CHUNK):
+        chunk = names[i:i + cache.LOOKUP_CHUNK]
+        found.update(conn.execute(
+            f"SELECT token, n FROM totals WHERE token IN ({','.join('?' * len(chunk))})",  # noqa: S608
+            chunk,
+        ))
+    return found
+
+
+def occurrences(repo: str, corpus: Iterable[str], names: Iterable[str]) -> dict[str, int]:
+    """How many times each of ``names`` occurs as an identifier token across
+    the repo-relative files in ``corpus`` (every name is keyed; absent ones
+    are 0). Maintains the persistent index as a side effect — see the module
+    doc for what is read and when."""
+    wanted = sorted(set(names))
+    if not wanted:
+        return {}
+    files = set(corpus)
+    manifest = None if cache.disabled() else cache.manifest(repo, files)
+    conn = _connect(repo) if manifest is not None else None
+    if conn is None:
+        totals = _live(repo, sorted(files))
+        return {n: totals.get(n, 0) for n in wanted}
+    try:
+        extra = _sync(conn, repo, manifest)
+        found = _lookup(conn, wanted)
+    except sqlite3.Error:
+        totals = _live(repo, sorted(files))
+        return {n: totals.get(n, 0) for n in wanted}
+    finally:
+        conn.close()
+    extra.update(_live(repo, sorted(files - manifest.keys())))
+    return {n: found.get(n, 0) + extra.get(n, 0) for n in wanted}
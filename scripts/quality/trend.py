@@ -1,12 +1,33 @@
 #!/usr/bin/env python3
 """trend.py — complexity/scale trend across git history for one repo.
 
-Samples N evenly-spaced commits on the first-parent (main) line, checks each
-out into a throwaway ``git worktree`` (non-destructive), and recomputes a core
-metric set so we can see whether complexity/test-ratio drift as the pipeline
-adds code over time. Literature motivation: a HEAD snapshot suffers survivorship
-bias — mine history to see whether complexity grows WITH size (the SLOC confound)
-or stays flat (good).
+Samples N evenly-spaced commits on the first-parent (main) line and recomputes
+a core metric set at each, so we can see whether complexity/test-ratio drift as
+the pipeline adds code over time. Literature motivation: a HEAD snapshot suffers
+survivorship bias — mine history to see whether complexity grows WITH size (the
+SLOC confound) or stays flat (good).
+
+Nothing is checked out. A sample's population is read from its tree (``git
+ls-tree``, filtered exactly as ``complexity.bucket`` filters ``git ls-files``)
+and file contents come straight from the object database through one ``git
+cat-file --batch`` stream:
+
+- LOC is counted from blob bytes, once per distinct blob across the whole run —
+  most files are unchanged between samples;
+- lizard rows are cached per (path, blob sha, lizard identity) in the same
+  per-file store ``complexity.analyze`` uses, so only source blobs never
+  measured before are written to a scratch directory under ``--workdir`` and
+  handed to lizard;
+- the source files of every sample are measured in ONE ``lizard_ccn`` call
+  over their union, so a file unchanged across samples is measured once even
+  with the cache off, and lizard's own ``CW_QUALITY_JOBS`` pool is the only
+  level of parallelism (a pool of samples each opening a pool of lizards
+  would run ``CW_QUALITY_JOBS`` squared processes). Rows lizard reports
+  against a file it was not given cannot be placed in a sample and are left
+  out.
+
+Symlinks and submodules are not source files here (a symlink's blob is its
+target path, a submodule has no blob).
 
 Per sample point: date, commit, src_loc, test_loc, test_ratio, functions,
 ccn_mean, pct_ccn_gt10, pct_len_gt60.
@@ -27,9 +48,15 @@ import os
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+
+from . import cache, history
+from .complexity import EXCLUDE_RE, _tool, classify, dist, lizard_ccn
 
-from . import cache
-from .complexity import _tool, bucket, dist, lizard_ccn, loc_counts
+# ls-tree modes of a regular (possibly executable) file blob.
+_FILE_MODES = ("100644", "100755")
 
 
 def run(*a, **kw):
@@ -37,11 +64,12 @@ def run(*a, **kw):
 
 
 def sample_commits(repo: str, n: int) -> list[list[str]]:
-    out = run(
-        "git", "-C", repo, "log", "--first-parent", "--reverse",
-        "--format=%H\t%ad", "--date=short",
-    ).stdout.splitlines()
-    rows = [line.split("\t") for line in out if "\t" in line]
+    """``[sha, short date]`` for ``n`` evenly spaced first-parent commits,
+    oldest first — read from the shared commit store (``history.py``), so a
+    battery run that already walked history for churn pays nothing here."""
+    rows = [
+        [c.sha, c.date] for c in history.commits(repo, "--first-parent", "--reverse", "HEAD")
+    ]
     if len(rows) <= n:
         return rows
     step = (len(rows) - 1) / (n - 1)
@@ -51,43 +79,149 @@ def sample_commits(repo: str, n: int) -> list[list[str]]:
     return picks
 
 
-def measure_at(repo: str, commit: str, lizard_bin: str | None, workdir: str) -> dict:
+def tree_population(repo: str, commit: str) -> dict[str, dict[str, str]]:
+    """``{"src": {rel: blob sha}, "test": {...}}`` at ``commit`` — the files
+    ``complexity.bucket`` would have found in a checkout of it."""
+    out = run("git", "-C", repo, "ls-tree", "-r", "-z", "--full-tree", commit).stdout
+    pop: dict[str, dict[str, str]] = {"src": {}, "test": {}}
+    for entry in out.split("\0"):
+        meta, _, rel = entry.partition("\t")
+        parts = meta.split()
+        if len(parts) != 3 or parts[0] not in _FILE_MODES or EXCLUDE_RE.search(rel):
+            continue
+        kind = classify(rel)
+        if kind is not None:
+            pop[kind[1]][rel] = parts[2]
+    return pop
+
+
+def _cat_blobs(repo: str, shas: Iterable[str]) -> Iterator[tuple[str, bytes]]:
+    """``(sha, content)`` for each blob, streamed from one ``git cat-file
+    --batch`` process; an object git cannot produce is skipped."""
+    want = list(dict.fromkeys(shas))
+    if not want:
+        return
+    proc = subprocess.Popen(
+        ["git", "-C", repo, "cat-file", "--batch"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+
+    def feed() -> None:
+        try:
+            proc.stdin.write("".join(f"{sha}\n" for sha in want).encode())
+            proc.stdin.close()
+        except OSError:
+            pass
+
+    writer = threading.Thread(target=feed, daemon=True)
+    writer.start()
+    try:
+        for _ in want:
+            header = proc.stdout.readline().split()
+            if not header:
+                break
+            if len(header) != 3:
+                continue  # "<sha> missing"
+            data = proc.stdout.read(int(header[2]))
+            proc.stdout.read(1)
+            yield header[0].decode(), data
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        writer.join()
+
+
+def _line_count(data: bytes) -> int:
+    """Lines as ``complexity.loc_counts`` counts them in a file."""
+    return data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+
+
+def measure_at(
+    repo: str, commit: str, lizard_bin: str | None, workdir: str,
+    loc_memo: dict[str, int] | None = None,
+) -> dict:
     """Metrics for ``repo`` at ``commit``. A historical commit's tree is
     IMMUTABLE by definition, so this is a pure function of ``commit`` alone
-    (a full 40-char sha, not the truncated worktree-dirname prefix) — cached
-    on disk keyed by that sha (#328): the second call for the SAME commit,
-    even in a LATER process, performs zero ``git worktree`` checkouts.
-    ``CW_QUALITY_NO_CACHE=1`` (or ``--no-cache`` on this module's CLI)
-    bypasses both the read and the write."""
-    cached = cache.load(repo, "trend", commit)
-    if cached is not None:
-        return cached
-    wt = os.path.join(workdir, "wt_" + commit[:10])
-    run("git", "-C", repo, "worktree", "add", "--detach", "--force", wt, commit)
+    (a full 40-char sha, not a truncated prefix) — cached on disk keyed by
+    that sha (#328): the second call for the SAME commit, even in a LATER
+    process, reads no tree or blob at all. ``CW_QUALITY_NO_CACHE=1`` (or
+    ``--no-cache`` on this module's CLI) bypasses both the read and the
+    write. ``loc_memo`` (blob sha -> line count) is shared across one run's
+    samples so an unchanged blob is counted once."""
+    return _measure_commits(repo, [commit], lizard_bin, workdir, loc_memo)[0]
+
+
+def _measure_commits(
+    repo: str, commits: list[str], lizard_bin: str | None, workdir: str,
+    loc_memo: dict[str, int] | None = None,
+) -> list[dict]:
+    """``measure_at`` for each of ``commits``, in order, with the source
+    files of all the uncached ones handed to ``lizard_ccn`` together (see the
+    module doc)."""
+    results: dict[str, dict] = {}
+    pops: dict[str, dict[str, dict[str, str]]] = {}
+    for commit in dict.fromkeys(commits):
+        cached = cache.load(repo, "trend", commit)
+        if cached is not None:
+            results[commit] = cached
+        else:
+            pops[commit] = tree_population(repo, commit)
+    if not pops:
+        return [results[commit] for commit in commits]
+
+    memo = {} if loc_memo is None else loc_memo
+    blobs = [sha for pop in pops.values() for kind in ("src", "test") for sha in pop[kind].values()]
+    for sha, data in _cat_blobs(repo, (sha for sha in blobs if sha not in memo)):
+        memo[sha] = _line_count(data)
+
+    os.makedirs(workdir, exist_ok=True)
+    scratch = tempfile.mkdtemp(prefix="trend_", dir=workdir)
     try:
-        b = bucket(wt)
-        src_files: list[str] = []
-        test_files: list[str] = []
-        for _lang, sets in b.items():
-            src_files += sets["src"]
-            test_files += sets["test"]
-        src_loc = loc_counts(src_files)
-        test_loc = loc_counts(test_files)
-        d = dist(lizard_ccn(src_files, lizard_bin)) or {}
+        # One scratch file per distinct (path, blob): a file unchanged across
+        # samples is one path, so lizard sees it once.
+        keys = {
+            os.path.join(scratch, sha, rel): (rel, sha)
+            for pop in pops.values() for rel, sha in pop["src"].items()
+        }
+
+        def materialize(paths: list[str]) -> None:
+            by_sha: dict[str, list[str]] = {}
+            for path in paths:
+                by_sha.setdefault(keys[path][1], []).append(path)
+            for sha, data in _cat_blobs(repo, by_sha):
+                for path in by_sha[sha]:
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with open(path, "wb") as fh:
+                        fh.write(data)
+
+        rows = lizard_ccn(list(keys), lizard_bin, repo=repo, blobs=keys, prepare=materialize)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    by_file: dict[str, list[dict]] = {}
+    for row in rows:
+        by_file.setdefault(row["file"], []).append(row)
+
+    for commit, pop in pops.items():
+        src_loc = sum(memo.get(sha, 0) for sha in pop["src"].values())
+        test_loc = sum(memo.get(sha, 0) for sha in pop["test"].values())
+        d = dist([
+            row for rel, sha in pop["src"].items()
+            for row in by_file.get(os.path.join(scratch, sha, rel), [])
+        ]) or {}
         result = {
             "src_loc": src_loc, "test_loc": test_loc,
             "test_ratio": round(test_loc / src_loc, 2) if src_loc else 0,
-            "src_files": len(src_files),
+            "src_files": len(pop["src"]),
             "functions": d.get("functions"),
             "ccn_mean": d.get("ccn_mean"),
             "pct_ccn_gt10": d.get("pct_ccn_gt10"),
             "pct_len_gt60": d.get("pct_len_gt60"),
         }
         cache.store(repo, "trend", commit, result)
-        return result
-    finally:
-        run("git", "-C", repo, "worktree", "remove", "--force", wt)
-        shutil.rmtree(wt, ignore_errors=True)
+        results[commit] = result
+    return [results[commit] for commit in commits]
 
 
 def analyze(
@@ -103,12 +237,11 @@ def analyze(
             "note": "trend sampling requires lizard (pip install lizard)",
         }
     os.makedirs(workdir, exist_ok=True)
+    samples = sample_commits(repo, n)
+    measured = _measure_commits(repo, [commit for commit, _date in samples], lizard_bin, workdir)
     series: list[dict] = []
-    for commit, date in sample_commits(repo, n):
-        m = measure_at(repo, commit, lizard_bin, workdir)
-        m["commit"] = commit[:10]
-        m["date"] = date
-        series.append(m)
+    for (commit, date), m in zip(samples, measured, strict=True):
+        series.append({**m, "commit": commit[:10], "date": date})
     return {
         "repo": repo.rstrip("/").split("/")[-1],
         "points": len(series),
@@ -119,13 +252,13 @@ def analyze(
 def main() -> int:
     parser = argparse.ArgumentParser(description="complexity/scale trend over history")
     parser.add_argument("repo", help="path to the git repository")
-    parser.add_argument("--workdir", required=True, help="scratch dir for worktrees")
+    parser.add_argument("--workdir", required=True, help="scratch dir for blobs handed to lizard")
     parser.add_argument("--n", type=int, default=10, help="number of sample points")
     parser.add_argument("--venv", default=None, help="virtualenv with lizard")
     parser.add_argument("--gobin", default=None, help="dir containing go tools")
     parser.add_argument(
         "--no-cache", action="store_true",
-        help="force fresh checkouts, bypassing the per-commit result cache (#328)",
+        help="force fresh measurements, bypassing the per-commit and per-file caches (#328)",
     )
     args = parser.parse_args()
     if args.no_cache:
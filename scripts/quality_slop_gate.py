@@ -452,6 +452,8 @@ def _scanner_version() -> str:
         # gate's numbers came from a fresh measurement or a reused one, so
         # it is a finding-affecting dependency like the engines themselves.
         q_dir / "cache.py",
+        # survival's author times are read from the shared history store.
+        q_dir / "history.py",
     )
 
 
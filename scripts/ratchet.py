@@ -92,14 +92,18 @@ from __future__ import annotations
 
 import argparse
 import fnmatch
+import io
 import json
+import os
 import re
 import shlex
+import signal
 import subprocess
 import sys
 import time
 import xml.etree.ElementTree as ET
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
@@ -127,7 +131,7 @@ import artifacts  # noqa: E402 — meta-location resolver (chief-wiggum#213)
 # one + scan_malformed_ids' one). chief_wiggum.hashing's own
 # find_id_bearing_artifacts/hash_epic_definitions/scan_malformed_ids stay
 # available (and unchanged) for any OTHER standalone caller (e.g. adopt.py).
-from chief_wiggum import grandfather  # noqa: E402
+from chief_wiggum import chain_checkpoint, grandfather, suite_cache  # noqa: E402
 from chief_wiggum.epic_model import build_epic_model  # noqa: E402
 from chief_wiggum.hashing import hash_markdown_defs as _hash_markdown_defs  # noqa: E402,F401
 from chief_wiggum.hashing import (  # noqa: E402
@@ -239,6 +243,13 @@ class Suite:
     # trx: the results DIRECTORY the cmd writes (`dotnet test` emits one
     # uniquely-named .trx per test project); a single file also works.
     report: str | None = None
+    # Repo-relative git pathspecs the suite reads — its result is reused by
+    # `score` while they are unchanged (chief_wiggum/suite_cache.py). None
+    # means the whole repo: reused only when nothing at all changed.
+    inputs: list[str] | None = None
+    # Seconds before the suite's whole process group is killed and `score`
+    # fails loudly; None falls back to `score --suite-timeout` (default: none).
+    timeout: float | None = None
 
 
 @dataclass
@@ -276,6 +287,33 @@ def repo_root(repo_arg: str | None) -> Path:
     return Path(proc.stdout.strip())
 
 
+def _load_suite(path: Path, spec: dict) -> Suite:
+    """One ``suites`` entry, with the fields ``score`` hands straight to git
+    and the process runner shape-checked here: a string ``inputs`` would be
+    iterated into one-character pathspecs, and a non-numeric ``timeout`` would
+    only surface as a TypeError mid-run."""
+    if not isinstance(spec, dict):
+        raise RatchetError(f"{path}: each 'suites' entry must be a JSON object, got {spec!r}")
+    name = spec.get("name", "?")
+    inputs = spec.get("inputs")
+    if inputs is not None and not (
+        isinstance(inputs, list) and all(isinstance(i, str) for i in inputs)
+    ):
+        raise RatchetError(
+            f"{path}: suite {name!r} 'inputs' must be a list of pathspec strings, "
+            f"got {inputs!r}"
+        )
+    timeout = spec.get("timeout")
+    if timeout is not None and (
+        isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0
+    ):
+        raise RatchetError(
+            f"{path}: suite {name!r} 'timeout' must be a positive number of seconds, "
+            f"got {timeout!r}"
+        )
+    return Suite(**spec)
+
+
 def load_config(repo: Path) -> Config:
     path = default_state_dir(repo) / CONFIG_NAME
     if not path.is_file():
@@ -283,7 +321,7 @@ def load_config(repo: Path) -> Config:
             f"no ratchet config at {path} — run `ratchet.py init --repo {repo}` first"
         )
     raw = json.loads(path.read_text())
-    suites = [Suite(**s) for s in raw.get("suites", [])]
+    suites = [_load_suite(path, s) for s in raw.get("suites", [])]
     tol = dict(DEFAULT_QUALITY_TOLERANCE)
     tol.update(raw.get("quality_tolerance", {}) or {})
     return Config(
@@ -485,16 +523,44 @@ def parse_go_test_json(stdout: str) -> set[str]:
     return passed - failed
 
 
+# junit-xml and TRX reports are STREAMED (``ET.iterparse``, each case element
+# cleared as soon as it is read) rather than parsed into a whole document. A
+# large suite's report is mostly captured stdout/stderr per case — hundreds
+# of MB for a chatty jest or dotnet run — and the pass-set needs a few
+# attributes per case, so the parse stays proportional to the case count.
+# The public text-taking parsers below keep their signatures for callers that
+# already hold a document; ``score`` hands the report PATH straight through.
+
+_JUNIT_NOT_PASSING = frozenset({"failure", "error", "skipped"})
+
+# ``(classname-or-file, name, file attribute, passed)`` per junit <testcase>.
+JunitCase = tuple[str, str, str | None, bool]
+
+
+def _junit_cases(source) -> list[JunitCase]:
+    """Every ``<testcase>`` in a junit report, in document order. ``source``
+    is a path or a file object; raises ``ET.ParseError`` on malformed XML."""
+    cases: list[JunitCase] = []
+    for _event, elem in ET.iterparse(source, events=("end",)):
+        if elem.tag == "testcase":
+            cases.append((
+                elem.get("classname") or elem.get("file") or "",
+                elem.get("name", ""),
+                elem.get("file"),
+                not any(child.tag in _JUNIT_NOT_PASSING for child in elem),
+            ))
+            elem.clear()
+        elif elem.tag == "testsuite":
+            elem.clear()  # its cases are already read; drop their subtrees
+    return cases
+
+
+def _junit_passed(cases: Iterable[JunitCase]) -> set[str]:
+    return {f"{cls}::{name}" for cls, name, _file, passed in cases if passed}
+
+
 def parse_junit_xml(xml_text: str) -> set[str]:
-    root = ET.fromstring(xml_text)
-    passed = set()
-    for case in root.iter("testcase"):
-        outcomes = {c.tag for c in case}
-        if outcomes & {"failure", "error", "skipped"}:
-            continue
-        cls = case.get("classname") or case.get("file") or ""
-        passed.add(f"{cls}::{case.get('name', '')}")
-    return passed
+    return _junit_passed(_junit_cases(io.StringIO(xml_text)))
 
 
 # TRX (Visual Studio Test Results) — what `dotnet test --logger trx` writes.
@@ -515,15 +581,40 @@ def _trx_case_id(test_name: str, class_name: str | None) -> str:
     return test_name
 
 
-def _trx_class_by_test_id(root: ET.Element) -> dict[str, str]:
-    """``testId -> className`` from ``<TestDefinitions>``."""
-    out: dict[str, str] = {}
-    for unit in root.iter(f"{TRX_NS}UnitTest"):
-        tid = unit.get("id")
-        method = unit.find(f"{TRX_NS}TestMethod")
-        if tid and method is not None and method.get("className"):
-            out[tid] = method.get("className", "")
-    return out
+# ``(testName, testId, outcome)`` per <UnitTestResult>, and the document's
+# ``testId -> className`` map from <TestDefinitions>.
+TrxDocument = tuple[list[tuple[str, str, str | None]], dict[str, str]]
+
+
+def _trx_parse(source) -> TrxDocument:
+    """One TRX document, streamed. <Results> precedes <TestDefinitions> in
+    what `dotnet test` writes, so results are collected compactly and joined
+    to their classes by the caller once the whole document is read."""
+    results: list[tuple[str, str, str | None]] = []
+    classes: dict[str, str] = {}
+    for _event, elem in ET.iterparse(source, events=("end",)):
+        if elem.tag == f"{TRX_NS}UnitTestResult":
+            name = elem.get("testName")
+            if name:
+                results.append((name, elem.get("testId") or "", elem.get("outcome")))
+            elem.clear()  # drops the captured Output/StdOut with it
+        elif elem.tag == f"{TRX_NS}UnitTest":
+            tid = elem.get("id")
+            method = elem.find(f"{TRX_NS}TestMethod")
+            if tid and method is not None and method.get("className"):
+                classes[tid] = method.get("className", "")
+            elem.clear()
+    return results, classes
+
+
+def _trx_passed(documents: Iterable[TrxDocument]) -> set[str]:
+    passed: set[str] = set()
+    other: set[str] = set()
+    for results, classes in documents:
+        for name, tid, outcome in results:
+            cid = _trx_case_id(name, classes.get(tid))
+            (passed if outcome == "Passed" else other).add(cid)
+    return passed - other
 
 
 def parse_trx(xml_texts: Iterable[str]) -> set[str]:
@@ -534,18 +625,7 @@ def parse_trx(xml_texts: Iterable[str]) -> set[str]:
     and ``...[1]``) — parsing a single file would silently drop every other
     project's cases, which is the shape of under-measurement #259 is about.
     """
-    passed: set[str] = set()
-    other: set[str] = set()
-    for xml_text in xml_texts:
-        root = ET.fromstring(xml_text)
-        classes = _trx_class_by_test_id(root)
-        for result in root.iter(f"{TRX_NS}UnitTestResult"):
-            name = result.get("testName")
-            if not name:
-                continue
-            cid = _trx_case_id(name, classes.get(result.get("testId") or ""))
-            (passed if result.get("outcome") == "Passed" else other).add(cid)
-    return passed - other
+    return _trx_passed(_trx_parse(io.StringIO(text)) for text in xml_texts)
 
 
 def trx_case_files(cfg: Config, suite: Suite, xml_texts: Iterable[str]) -> dict[str, str]:
@@ -556,6 +636,10 @@ def trx_case_files(cfg: Config, suite: Suite, xml_texts: Iterable[str]) -> dict[
     ``<ClassName>.cs`` exists under the suite cwd — an ambiguous or missing
     match stays unresolved (counted by ``score``), never guessed.
     """
+    return _trx_case_files(cfg, suite, [_trx_parse(io.StringIO(text)) for text in xml_texts])
+
+
+def _trx_case_files(cfg: Config, suite: Suite, documents: list[TrxDocument]) -> dict[str, str]:
     base = (cfg.repo / suite.cwd).resolve()
     by_stem: dict[str, list[Path]] = {}
     for path in base.rglob("*.cs"):
@@ -564,14 +648,9 @@ def trx_case_files(cfg: Config, suite: Suite, xml_texts: Iterable[str]) -> dict[
         by_stem.setdefault(path.stem, []).append(path)
 
     out: dict[str, str] = {}
-    for xml_text in xml_texts:
-        root = ET.fromstring(xml_text)
-        classes = _trx_class_by_test_id(root)
-        for result in root.iter(f"{TRX_NS}UnitTestResult"):
-            name = result.get("testName")
-            if not name:
-                continue
-            cls = classes.get(result.get("testId") or "")
+    for results, classes in documents:
+        for name, tid, _outcome in results:
+            cls = classes.get(tid)
             if not cls:
                 continue
             candidates = by_stem.get(cls.rsplit(".", 1)[-1], [])
@@ -589,13 +668,18 @@ def trx_case_files(cfg: Config, suite: Suite, xml_texts: Iterable[str]) -> dict[
     return out
 
 
-def _trx_documents(report: Path) -> list[str]:
-    """TRX document texts for a suite's ``report`` path — every ``*.trx`` when
-    it names a directory (the normal `dotnet test` case: one file per test
+def _trx_files(report: Path) -> list[Path]:
+    """The TRX files for a suite's ``report`` path — every ``*.trx`` when it
+    names a directory (the normal `dotnet test` case: one file per test
     project), or the single file when it names one."""
     if report.is_dir():
-        return [p.read_text() for p in sorted(report.rglob("*.trx"))]
-    return [report.read_text()] if report.is_file() else []
+        return sorted(report.rglob("*.trx"))
+    return [report] if report.is_file() else []
+
+
+def _parse_trx_report(cfg: Config, suite: Suite, files: list[Path]) -> tuple[set[str], dict[str, str]]:
+    documents = [_trx_parse(str(path)) for path in files]
+    return _trx_passed(documents), _trx_case_files(cfg, suite, documents)
 
 
 def parse_pass_fail_lines(stdout: str) -> set[str]:
@@ -617,13 +701,14 @@ def junit_case_files(cfg: Config, suite: Suite, xml_text: str) -> dict[str, str]
     Cases that resolve to no existing file are simply absent from the map —
     ``score`` counts them in ``test_files_unresolved``.
     """
-    root = ET.fromstring(xml_text)
+    return _junit_case_files(cfg, suite, _junit_cases(io.StringIO(xml_text)))
+
+
+def _junit_case_files(cfg: Config, suite: Suite, cases: list[JunitCase]) -> dict[str, str]:
     out: dict[str, str] = {}
     base = (cfg.repo / suite.cwd).resolve()
-    for case in root.iter("testcase"):
-        cls = case.get("classname") or case.get("file") or ""
-        cid = f"{suite.name}::{cls}::{case.get('name', '')}"
-        fattr = case.get("file")
+    for cls, name, fattr, _passed in cases:
+        cid = f"{suite.name}::{cls}::{name}"
         candidates = [base / fattr] if fattr else []
         if cls:
             parts = cls.split(".")
@@ -640,6 +725,13 @@ def junit_case_files(cfg: Config, suite: Suite, xml_text: str) -> dict[str, str]
     return out
 
 
+def _parse_junit_report(cfg: Config, suite: Suite, report: Path) -> tuple[set[str], dict[str, str]]:
+    """``(passing case IDs, case-ID -> file map)`` from one streamed pass over
+    an on-disk junit report (the text-taking pair above parses it twice)."""
+    cases = _junit_cases(str(report))
+    return _junit_passed(cases), _junit_case_files(cfg, suite, cases)
+
+
 def go_case_dirs(cfg: Config, suite: Suite, stdout: str) -> dict[str, str]:
     """Map go-test-json case IDs to repo-relative package DIRECTORIES (#207).
 
@@ -691,7 +783,34 @@ def run_suite(cfg: Config, suite: Suite) -> tuple[set[str], dict[str, str]]:
     return ids, files
 
 
-def run_suite_measured(cfg: Config, suite: Suite) -> tuple[set[str], dict[str, str], int]:
+def _run_suite_cmd(cfg: Config, suite: Suite, timeout: float | None) -> subprocess.CompletedProcess:
+    """``suite.cmd`` in its own process group, so a timeout kills the runner
+    AND what it spawned (``go test`` binaries, jest workers, ``dotnet``'s
+    testhost) — the same discipline as ``quality/duplication._run_capture``.
+    A suite that hits its timeout measured nothing; that is a RatchetError,
+    never a quietly partial pass-set."""
+    proc = subprocess.Popen(
+        suite.cmd, shell=True, cwd=cfg.repo / suite.cwd, stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE, text=True, start_new_session=True,
+    )
+    try:
+        out, err = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+        except (AttributeError, ProcessLookupError, PermissionError, OSError):
+            proc.kill()
+        _out, err = proc.communicate()
+        raise RatchetError(
+            f"suite {suite.name!r}: timed out after {timeout:g}s — killed, no "
+            f"measurement taken:\n{(err or '')[-2000:]}"
+        ) from None
+    return subprocess.CompletedProcess(suite.cmd, proc.returncode, out, err)
+
+
+def run_suite_measured(
+    cfg: Config, suite: Suite, timeout: float | None = None
+) -> tuple[set[str], dict[str, str], int]:
     """``(passing case IDs, case-ID -> source file/dir map, exit code)``.
 
     A non-zero exit is expected when tests fail — the parsed per-case results
@@ -699,7 +818,8 @@ def run_suite_measured(cfg: Config, suite: Suite) -> tuple[set[str], dict[str, s
     report-only high-water-test-file cue; unresolvable cases are absent here
     and surfaced by ``score`` as ``test_files_unresolved``. The exit code is
     returned so ``suite_measurement`` (#289) can distinguish "the suite ran
-    and nothing passed" from "the suite never ran".
+    and nothing passed" from "the suite never ran". ``timeout`` (seconds)
+    applies when the suite declares none of its own.
     """
     if suite.parser == "junit-xml" and suite.report:
         # #289: the same reason TRX pre-clears below, on the parser CW itself
@@ -721,9 +841,7 @@ def run_suite_measured(cfg: Config, suite: Suite) -> tuple[set[str], dict[str, s
             for old in stale.rglob("*.trx"):
                 old.unlink()
 
-    proc = subprocess.run(
-        suite.cmd, shell=True, cwd=cfg.repo / suite.cwd, capture_output=True, text=True
-    )
+    proc = _run_suite_cmd(cfg, suite, suite.timeout if suite.timeout is not None else timeout)
     files: dict[str, str] = {}
     if suite.parser == "go-test-json":
         passed = parse_go_test_json(proc.stdout)
@@ -741,8 +859,7 @@ def run_suite_measured(cfg: Config, suite: Suite) -> tuple[set[str], dict[str, s
         # unguarded and exited with an ElementTree traceback — outside the
         # documented 0/1/2/3/4 exit taxonomy, so no wrapper could classify it.
         try:
-            passed = parse_junit_xml(report.read_text())
-            files = junit_case_files(cfg, suite, report.read_text())
+            passed, files = _parse_junit_report(cfg, suite, report)
         except ET.ParseError as exc:
             raise RatchetError(
                 f"suite {suite.name!r}: report {report} is not parseable XML ({exc}) — "
@@ -752,15 +869,14 @@ def run_suite_measured(cfg: Config, suite: Suite) -> tuple[set[str], dict[str, s
         if not suite.report:
             raise RatchetError(f"suite {suite.name!r}: trx parser needs `report`")
         report = cfg.repo / suite.report
-        docs = _trx_documents(report)
-        if not docs:
+        trx = _trx_files(report)
+        if not trx:
             raise RatchetError(
                 f"suite {suite.name!r}: no .trx written to {report} by cmd "
                 "(a test project without a trx logger reports NOTHING, which "
                 f"would look like a clean empty pass-set):\n{proc.stderr[-2000:]}"
             )
-        passed = parse_trx(docs)
-        files = trx_case_files(cfg, suite, docs)
+        passed, files = _parse_trx_report(cfg, suite, trx)
     elif suite.parser == "pass-fail-lines":
         passed = parse_pass_fail_lines(proc.stdout)
     else:
@@ -827,15 +943,12 @@ def reuse_suite_report(
             "or drop --reuse-report"
         )
     if suite.parser == "junit-xml":
-        text = report_path.read_text()
-        passed = parse_junit_xml(text)
-        files = junit_case_files(cfg, suite, text)
+        passed, files = _parse_junit_report(cfg, suite, report_path)
     elif suite.parser == "trx":
-        docs = _trx_documents(report_path)
-        if not docs:
+        trx = _trx_files(report_path)
+        if not trx:
             raise RatchetError(f"suite {suite.name!r}: no .trx found at reused report {report_path}")
-        passed = parse_trx(docs)
-        files = trx_case_files(cfg, suite, docs)
+        passed, files = _parse_trx_report(cfg, suite, trx)
     elif suite.parser == "go-test-json":
         # #322: go-test-json has no XML/TRX document of its own — the
         # "report" is just the ``go test -json`` stdout stream, captured to a
@@ -891,6 +1004,118 @@ def _parse_reuse_report(items: list[str] | None, suite_names: set[str]) -> dict[
     return out
 
 
+# ---- concurrent, reusable suite runs ------------------------------------------
+#
+# `score` used to run every suite one after another, every time. Suites are
+# independent processes — a Go, a pytest, and a jest suite share nothing but
+# the CPU — so the ones that DO need running run concurrently (bounded by
+# `--jobs`), and — only when asked for (`--suite-cache`) — a suite whose inputs
+# are unchanged since a stored measurement is not run at all
+# (chief_wiggum/suite_cache.py). The assembled scorecard is in config order
+# whichever suite finished first, and each entry's `source` says which of
+# "run", "cached", or "reused-report" produced it.
+
+SUITE_JOBS_ENV = "CW_RATCHET_SUITE_JOBS"
+# Suites usually parallelise internally (`go test -p`, jest workers, xdist);
+# more concurrent suites than this oversubscribes rather than helps.
+DEFAULT_SUITE_JOBS = 4
+
+
+def _suite_jobs(requested: int | None, suites: list[Suite]) -> int:
+    """How many suites run at once: ``--jobs``, else ``CW_RATCHET_SUITE_JOBS``,
+    else ``min(DEFAULT_SUITE_JOBS, CPUs)``. A malformed env value is serial —
+    a typo must never fan out more runs than asked for. Suites that write the
+    same ``report`` would clobber each other's file mid-parse, so any such
+    collision serialises the whole run."""
+    if requested is None:
+        raw = os.environ.get(SUITE_JOBS_ENV, "").strip()
+        try:
+            requested = int(raw) if raw else min(DEFAULT_SUITE_JOBS, os.cpu_count() or 1)
+        except ValueError:
+            requested = 1
+    reports = [(s.cwd, s.report) for s in suites if s.report]
+    if len(reports) != len(set(reports)):
+        return 1
+    return max(1, min(requested, len(suites)))
+
+
+def _repo_relative(cfg: Config, path: Path) -> str | None:
+    try:
+        return (cfg.repo / path).resolve().relative_to(cfg.repo.resolve()).as_posix()
+    except ValueError:
+        return None
+
+
+def _suite_cache_keys(cfg: Config, suites: list[Suite]) -> list[str | None]:
+    """The reuse key per suite (``None`` — always run — outside a git work
+    tree). Computed BEFORE anything runs: a suite that rewrites a tracked
+    file must not key its result to the tree it left behind."""
+    if not suites:
+        return []
+    written = {_repo_relative(cfg, Path(s.report)) for s in cfg.suites if s.report}
+    written.add(_repo_relative(cfg, cfg.state_dir))
+    listings = suite_cache.input_listings(
+        cfg.repo, [s.inputs or [] for s in suites], sorted(p for p in written if p)
+    )
+    return [
+        None if listing is None else suite_cache.key(
+            {"name": s.name, "cmd": s.cmd, "parser": s.parser, "cwd": s.cwd,
+             "report": s.report, "inputs": s.inputs},
+            listing,
+        )
+        for s, listing in zip(suites, listings, strict=True)
+    ]
+
+
+def score_suites(
+    cfg: Config,
+    reuse_map: dict[str, Path],
+    reuse_max_age: float,
+    *,
+    jobs: int | None = None,
+    timeout: float | None = None,
+    use_cache: bool = False,
+) -> list[tuple[set[str], dict[str, str], int | None, str]]:
+    """``(ids, files, exit_code, source)`` per configured suite, in config
+    order. ``--reuse-report`` suites are parsed, with ``use_cache`` cached
+    suites are replayed, and the rest run ``jobs`` at a time; the first failure (config order) is
+    raised once the suites already started have finished, and the ones not
+    yet started are cancelled."""
+    out: list[tuple[set[str], dict[str, str], int | None, str] | None] = [None] * len(cfg.suites)
+    for i, suite in enumerate(cfg.suites):
+        if suite.name in reuse_map:
+            ids, files = reuse_suite_report(cfg, suite, reuse_map[suite.name], reuse_max_age)
+            out[i] = (ids, files, None, "reused-report")  # nothing executed; the report is the evidence
+    pending = [i for i, o in enumerate(out) if o is None]
+    keys = dict(zip(
+        pending,
+        _suite_cache_keys(cfg, [cfg.suites[i] for i in pending]) if use_cache else [None] * len(pending),
+        strict=True,
+    ))
+    for i in pending:
+        hit = suite_cache.load(keys[i]) if keys[i] else None
+        if hit is not None:
+            out[i] = (set(hit.ids), dict(hit.files), hit.exit_code, "cached")
+    to_run = [i for i in pending if out[i] is None]
+    n = _suite_jobs(jobs, [cfg.suites[i] for i in to_run])
+    if n <= 1:
+        results = [run_suite_measured(cfg, cfg.suites[i], timeout) for i in to_run]
+    else:
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            futures = [pool.submit(run_suite_measured, cfg, cfg.suites[i], timeout) for i in to_run]
+            try:
+                results = [f.result() for f in futures]
+            except BaseException:
+                for f in futures:
+                    f.cancel()
+                raise
+    for i, (ids, files, exit_code) in zip(to_run, results, strict=True):
+        if keys[i]:
+            suite_cache.store(keys[i], suite_cache.Result(frozenset(ids), files, exit_code))
+        out[i] = (ids, files, exit_code, "run")
+    return [o for o in out if o is not None]
+
+
 # ---- complexity + churn snapshot (report-only dimension) -----------------------
 #
 # DIRECTION NOTE: complexity is a cost the ratchet drives DOWN. The high-water
@@ -1027,11 +1252,22 @@ def quality_regressions(quality: dict, hw: dict, tolerance: dict) -> list[dict]:
 
 
 def load_journal(cfg: Config) -> list[dict]:
-    """Read the journal and verify the hash chain. Fail closed on tamper."""
-    if not cfg.journal.is_file():
+    """Read the journal and verify the hash chain. Fail closed on tamper.
+
+    Served from ``_chain_view`` (checkpointed, memoized); on any break the
+    strict from-genesis read below runs and raises exactly as it always has.
+    Treat the returned records as read-only — they are shared with the memo."""
+    view = _chain_view(cfg.journal)
+    if view.intact:
+        return list(view.records)
+    return _load_journal_strict(cfg.journal)
+
+
+def _load_journal_strict(journal: Path) -> list[dict]:
+    if not journal.is_file():
         return []
     records = []
-    for line in cfg.journal.read_text().splitlines():
+    for line in journal.read_text().splitlines():
         line = line.strip()
         if line:
             records.append(json.loads(line))
@@ -1048,6 +1284,119 @@ def load_journal(cfg: Config) -> list[dict]:
     return records
 
 
+# ---- checkpointed chain verification -------------------------------------------
+# Every journal reader used to re-derive every record_hash from genesis — a
+# canonical json.dumps + SHA-256 per record, thousands of records, several
+# reads per command (load_journal twice per `record`; last_authority_action
+# once per gate in `status`/gate validation). The verified prefix is the same
+# bytes every time, so two layers skip re-proving it:
+#
+# - an in-process memo keyed on the journal's (size, mtime, ctime, inode) —
+#   ctime cannot be set back from userland, so any write, even one that
+#   restores size and mtime, invalidates it;
+# - a signed on-disk checkpoint (chief_wiggum.chain_checkpoint) of the last
+#   verified byte prefix. It is honoured only while those exact bytes still
+#   hash to its digest; everything after it is verified record by record.
+#
+# Any break — a bad hash, an unparseable or non-object line — sends the caller
+# to the strict/tolerant from-genesis reads below, so fail-closed behaviour and
+# error text are unchanged. CW_RATCHET_NO_CHECKPOINT=1 skips the on-disk layer.
+
+
+@dataclass(frozen=True)
+class _ChainView:
+    """The verified prefix of one journal file. ``intact`` when it covers
+    every non-blank line; ``lines`` counts those lines (the append path's
+    broken-chain check); ``events`` indexes prefix positions by
+    ``(event, ref)`` for string-valued pairs."""
+
+    records: tuple[dict, ...] = ()
+    lines: int = 0
+    intact: bool = True
+    events: dict[tuple[str, str], tuple[int, ...]] = field(default_factory=dict)
+
+
+_CHAIN_MEMO: dict[str, tuple[tuple[int, int, int, int], _ChainView]] = {}
+
+
+def _chain_view(journal_path: str | Path) -> _ChainView:
+    p = Path(journal_path)
+    try:
+        st = p.stat()
+    except OSError:
+        return _ChainView()
+    key = (st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino)
+    memo_key = os.path.abspath(p)
+    hit = _CHAIN_MEMO.get(memo_key)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    try:
+        data = p.read_bytes()
+    except OSError:
+        return _ChainView()
+    view = _verify_chain(p, data)
+    if len(data) == st.st_size:  # not appended to mid-read
+        _CHAIN_MEMO[memo_key] = (key, view)
+    return view
+
+
+def _verify_chain(p: Path, data: bytes) -> _ChainView:
+    records: list[dict] = []
+    prev, start = "genesis", 0
+    cp = chain_checkpoint.load(p)
+    if (
+        cp is not None and cp.offset <= len(data)
+        and chain_checkpoint.prefix_digest(data, cp.offset) == cp.prefix_sha256
+    ):
+        try:
+            prefix = [json.loads(ln) for ln in data[:cp.offset].decode().splitlines() if ln.strip()]
+        except ValueError:
+            prefix = []
+        if len(prefix) == cp.records and prefix and prefix[-1].get("record_hash") == cp.chain_hash:
+            records, prev, start = prefix, cp.chain_hash, cp.offset
+    try:
+        tail = data[start:].decode()
+    except UnicodeDecodeError:
+        return _tolerant_view(p)
+    offset = start
+    for raw in tail.splitlines(keepends=True):
+        line = raw.strip()
+        if line:
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                return _tolerant_view(p)
+            if not isinstance(rec, dict):
+                return _tolerant_view(p)
+            body = {k: v for k, v in rec.items() if k != "record_hash"}
+            if rec.get("record_hash") != stable_hash(prev, json.dumps(body, sort_keys=True)):
+                return _tolerant_view(p)
+            records.append(rec)
+            prev = rec["record_hash"]
+        offset += len(raw.encode())
+    if records and len(records) > (cp.records if cp is not None else 0):
+        chain_checkpoint.store(p, chain_checkpoint.Checkpoint(
+            records=len(records), offset=offset, chain_hash=prev,
+            prefix_sha256=chain_checkpoint.prefix_digest(data, offset),
+        ))
+    return _view(records, len(records), intact=True)
+
+
+def _tolerant_view(p: Path) -> _ChainView:
+    """A broken chain: the from-genesis tolerant prefix, never checkpointed."""
+    lines = sum(1 for ln in p.read_text().splitlines() if ln.strip())
+    return _view(_verified_prefix_from_genesis(p), lines, intact=False)
+
+
+def _view(records: list[dict], lines: int, *, intact: bool) -> _ChainView:
+    events: dict[tuple[str, str], list[int]] = {}
+    for i, rec in enumerate(records):
+        event, ref = rec.get("event"), rec.get("ref")
+        if isinstance(event, str) and isinstance(ref, str):
+            events.setdefault((event, ref), []).append(i)
+    return _ChainView(tuple(records), lines, intact, {k: tuple(v) for k, v in events.items()})
+
+
 # --- gate-authority journal primitives (chief-wiggum#198) ---------------------
 # Path-based so `check_gate_validation.py` can journal/read wire events with only
 # the journal path (it has no ratchet Config), while the chain format stays owned
@@ -1077,6 +1426,10 @@ def verified_prefix(journal_path: str | Path) -> list[dict]:
     that should erase the knowledge the gate was blocking). Parsing is
     line-by-line so a non-JSON trailing line stops the prefix instead of
     crashing the whole read (finding 2)."""
+    return list(_chain_view(journal_path).records)
+
+
+def _verified_prefix_from_genesis(journal_path: str | Path) -> list[dict]:
     p = Path(journal_path)
     if not p.is_file():
         return []
@@ -1110,13 +1463,13 @@ def last_authority_action(journal_path: str | Path, gate: str) -> str | None:
     event carrying any OTHER `details` (e.g. a bogus `noop` slipped in after a
     real wire) is IGNORED, never treated as an un-wiring — it must never flip a
     wired gate to un-wired and suppress the demotion (finding 1)."""
-    for rec in reversed(verified_prefix(journal_path)):
-        if rec.get("event") == GATE_AUTHORITY and rec.get("ref") == gate:
-            action = rec.get("details")
-            if action in _AUTHORITY_ACTIONS:
-                return action
-            # else: not a real authority action — skip, keep looking for the
-            # last genuine wire/unwire.
+    view = _chain_view(journal_path)
+    for i in reversed(view.events.get((GATE_AUTHORITY, gate), ())):
+        action = view.records[i].get("details")
+        if action in _AUTHORITY_ACTIONS:
+            return action
+        # else: not a real authority action — skip, keep looking for the
+        # last genuine wire/unwire.
     return None
 
 
@@ -1130,10 +1483,9 @@ def append_authority_event(journal_path: str | Path, gate: str, action: str,
     # Robust broken/garbled-chain detection: compare the verified prefix against
     # the raw non-empty line count WITHOUT a full JSON parse (a garbage tail
     # must raise TamperError, not a JSONDecodeError — finding 3's append path).
-    p = Path(journal_path)
-    raw_lines = [ln for ln in p.read_text().splitlines() if ln.strip()] if p.is_file() else []
-    verified = verified_prefix(journal_path)
-    if len(verified) != len(raw_lines):
+    view = _chain_view(journal_path)
+    verified = view.records
+    if not view.intact or len(verified) != view.lines:
         raise TamperError(
             f"cannot append a gate-authority event: {journal_path} chain is broken — fail closed"
         )
@@ -1677,24 +2029,22 @@ def cmd_score(args) -> int:
     pass_set: set[str] = set()
     test_files: dict[str, str] = {}
     suite_entries: list[dict] = []
-    for suite in cfg.suites:
-        if args.no_tests:
-            break
-        if suite.name in reuse_map:
-            ids, files = reuse_suite_report(cfg, suite, reuse_map[suite.name], reuse_max_age)
-            exit_code = None  # nothing was executed; the report is the evidence
-            source = "reused-report"
-        else:
-            ids, files, exit_code = run_suite_measured(cfg, suite)
-            source = "run"
-        suite_entries.append({
-            "suite": suite.name,
-            "source": source,
-            "exit_code": exit_code,
-            "passing_cases": len(ids),
-        })
-        pass_set |= ids
-        test_files.update(files)
+    if not args.no_tests:
+        outcomes = score_suites(
+            cfg, reuse_map, reuse_max_age,
+            jobs=getattr(args, "jobs", None),
+            timeout=getattr(args, "suite_timeout", None),
+            use_cache=getattr(args, "suite_cache", False) or suite_cache.enabled(),
+        )
+        for suite, (ids, files, exit_code, source) in zip(cfg.suites, outcomes, strict=True):
+            suite_entries.append({
+                "suite": suite.name,
+                "source": source,
+                "exit_code": exit_code,
+                "passing_cases": len(ids),
+            })
+            pass_set |= ids
+            test_files.update(files)
     quality = {"skipped": "quality metrics disabled (--no-quality)"}
     if not args.no_quality:
         quality = score_quality(cfg, venv=args.venv, gobin=args.gobin)
@@ -1750,6 +2100,12 @@ def cmd_score(args) -> int:
         f"{cmeas['id_bearing_artifacts']} artifact(s) scanned, "
         f"{len(vscan.hashes)} verifier test hash(es); {qmsg}"
     )
+    replayed = [e["suite"] for e in suite_entries if e["source"] == "cached"]
+    if replayed:
+        print(
+            f"ratchet: replayed from cache, NOT re-run (inputs unchanged): "
+            f"{', '.join(replayed)}"
+        )
     if smeas["status"] == SUITE_STATUS_ERROR:
         sys.stderr.write(
             "ratchet: ERROR — suite(s) contributed ZERO passing cases; the pass-set "
@@ -2315,6 +2671,12 @@ def _scanner_version() -> str:
     return scanner_version(
         here,
         here.parent / "artifacts.py",
+        # Checkpointed journal verification: decides whether a prefix is
+        # re-verified, so a bug here is a fail-open tamper check.
+        cw_dir / "chain_checkpoint.py",
+        # Per-suite result reuse: decides whether a suite's pass-set is
+        # measured or replayed, so a key bug is a stale pass-set.
+        cw_dir / "suite_cache.py",
         cw_dir / "grandfather.py",
         cw_dir / "hashing.py",
         # The single epic-tree walk backing load_contract_hashes/
@@ -2325,6 +2687,11 @@ def _scanner_version() -> str:
         cw_dir / "verification.py",
         cw_dir / "verifier_hashes.py",
         q_dir / "churn.py",
+        # churn's commit walk and numstat now come from the shared history
+        # store (and its cache-dir helper) — a store bug is a wrong churn.
+        q_dir / "history.py",
+        q_dir / "cache.py",
+        cw_dir / "sqlite_store.py",
         q_dir / "complexity.py",
     )
 
@@ -2386,6 +2753,22 @@ def main() -> int:
         help=f"max age of a --reuse-report file before it is treated as STALE "
              f"(default {DEFAULT_REUSE_REPORT_MAX_AGE}s)",
     )
+    sp.add_argument(
+        "--jobs", type=int, default=None, metavar="N",
+        help=f"suites run concurrently (default ${SUITE_JOBS_ENV}, else "
+             f"min({DEFAULT_SUITE_JOBS}, CPUs); 1 = serial)",
+    )
+    sp.add_argument(
+        "--suite-timeout", type=float, default=None, metavar="SECONDS",
+        help="kill a suite (and everything it spawned) after SECONDS and fail; a suite's "
+             "own `timeout` in ratchet.json wins (default: no timeout)",
+    )
+    sp.add_argument(
+        "--suite-cache", action="store_true",
+        help="replay a suite's stored result instead of running it while its inputs are "
+             f"unchanged (also ${suite_cache.ENABLE_ENV}=1); for local iteration only — the "
+             "cache cannot see toolchain or environment changes, so CI should never set it",
+    )
 
     for name in ("check", "regressed", "highwater", "recent"):
         sp = sub.add_parser(name)
@@ -228,7 +228,7 @@ def collect(repo: Path, commits_limit: int = 400, prs: list[dict] | None = None)
     # Production-time telemetry, when the factory logged it — authoritative for
     # gate value/noise + token cost (things git archaeology can't recover).
     repo_key = repo.name
-    telemetry = factory_log.aggregate(factory_log.read_log(), repo=repo_key)
+    telemetry = factory_log.aggregate(factory_log.read_log(repo=repo_key), repo=repo_key)
     if not telemetry["records"]:
         telemetry = factory_log.aggregate(factory_log.read_log())  # fall back to unfiltered
 
@@ -285,7 +285,7 @@ def collect(repo: Path, commits_limit: int = 400, prs: list[dict] | None = None)
     # What that cost is MADE of. Report-only: every finding here is something the
     # operator can act on and CW cannot (session shape, cache TTL, read width),
     # so it never gates — see factory_log.session_cost_report.
-    cost_shape = factory_log.session_cost_report(factory_log.read_log())
+    cost_shape = factory_log.session_cost_report(factory_log.read_log(event=factory_log.CLAUDE_CODE))
     for f in cost_shape["findings"]:
         findings.append(Finding("factory-logs",
                                 "warn" if f["severity"] == "warn" else "info",
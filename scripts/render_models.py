@@ -6,7 +6,7 @@ Takes structured model JSON (state machines, contracts) and renders three views:
 
   Human view  — Markdown + Mermaid (backward-compatible with /architect output)
   Machine view — XState JSON, deal decorators, Hypothesis skeletons, guard templates
-  Test view   — Test paths from @xstate/graph, assertion templates, coverage report
+  Test view   — Transition-covering test paths, assertion templates, coverage report
 
 CLI:
     python3 scripts/render_models.py <model.json> --view human|machine|test|all --output <dir>
@@ -17,7 +17,6 @@ from __future__ import annotations
 
 import argparse
 import json
-import subprocess
 import sys
 from pathlib import Path
 
@@ -364,132 +363,86 @@ def render_machine_view(model: dict, output_dir: Path, schema_type: str) -> list
 
 
 # ---------------------------------------------------------------------------
-# Test view: paths from @xstate/graph, assertion templates, coverage
+# Test view: paths from formal_models.path_report, assertion templates, coverage
 # ---------------------------------------------------------------------------
 
 
-def run_xstate_paths(xstate_json: dict) -> dict | None:
-    """Shell out to Node xstate_paths.js. Returns parsed output or None on failure."""
-    script = REPO_ROOT / "scripts" / "xstate_paths.js"
-    if not script.exists():
-        print(f"WARNING: {script} not found, skipping XState path generation", file=sys.stderr)
-        return None
-
-    try:
-        result = subprocess.run(
-            ["node", str(script)],
-            input=json.dumps(xstate_json),
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        if result.returncode != 0:
-            print(f"WARNING: xstate_paths.js failed: {result.stderr.strip()}", file=sys.stderr)
-            return None
-        return json.loads(result.stdout)
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError) as e:
-        print(f"WARNING: xstate_paths.js error: {e}", file=sys.stderr)
-        return None
-
-
 def render_test_view(model: dict, output_dir: Path, schema_type: str) -> list[str]:
     """Generate test artifacts. Returns list of files created."""
     files = []
 
     if schema_type == "state-machine":
-        # XState path generation via Node bridge
-        xstate = fm.to_xstate(model)
-        path_data = run_xstate_paths(xstate)
-
-        if path_data:
-            # Write raw path data
-            paths_path = output_dir / "test-paths.json"
-            paths_path.write_text(json.dumps(path_data, indent=2))
-            files.append(str(paths_path))
-
-            # Generate human-readable test plan
-            plan_lines = [
-                f"# Test Plan: {model['name']}",
-                "",
-                f"Generated from formal model. {path_data['summary']['total_paths']} paths covering "
-                f"{path_data['summary']['states_covered']}/{path_data['summary']['states_total']} states "
-                f"and {path_data['summary']['transitions_covered']} transitions.",
-                "",
-                "## Positive Test Cases (valid paths)",
-                "",
-            ]
-            for i, path in enumerate(path_data["paths"], 1):
-                steps_str = " → ".join(
-                    f"{s['state']}--{s['event']}-->{s['next_state']}"
-                    for s in path["steps"]
+        # In-process path analysis (memoized per model content hash).
+        path_data = fm.path_report(model)
+
+        # Write raw path data
+        paths_path = output_dir / "test-paths.json"
+        paths_path.write_text(json.dumps(path_data, indent=2))
+        files.append(str(paths_path))
+
+        # Generate human-readable test plan
+        plan_lines = [
+            f"# Test Plan: {model['name']}",
+            "",
+            f"Generated from formal model. {path_data['summary']['total_paths']} paths covering "
+            f"{path_data['summary']['states_covered']}/{path_data['summary']['states_total']} states "
+            f"and {path_data['summary']['transitions_covered']} transitions.",
+            "",
+            "## Positive Test Cases (valid paths)",
+            "",
+        ]
+        for i, path in enumerate(path_data["paths"], 1):
+            steps_str = " → ".join(
+                f"{s['state']}--{s['event']}-->{s['next_state']}"
+                for s in path["steps"]
+            )
+            plan_lines.append(f"### Path {i}: → {path['target']}")
+            plan_lines.append(f"```")
+            plan_lines.append(steps_str)
+            plan_lines.append(f"```")
+            plan_lines.append("")
+
+        # Invalid transition tests
+        invalid = model.get("invalid_transitions", [])
+        if invalid:
+            plan_lines.append("## Negative Test Cases (must be rejected)")
+            plan_lines.append("")
+            for it in invalid:
+                plan_lines.append(
+                    f"- **{it['from']} → {it['to']}**: {it.get('reason', 'invalid transition')} "
+                    f"— expect 400/409"
                 )
-                plan_lines.append(f"### Path {i}: → {path['target']}")
-                plan_lines.append(f"```")
-                plan_lines.append(steps_str)
-                plan_lines.append(f"```")
-                plan_lines.append("")
-
-            # Invalid transition tests
-            invalid = model.get("invalid_transitions", [])
-            if invalid:
-                plan_lines.append("## Negative Test Cases (must be rejected)")
-                plan_lines.append("")
-                for it in invalid:
-                    plan_lines.append(
-                        f"- **{it['from']} → {it['to']}**: {it.get('reason', 'invalid transition')} "
-                        f"— expect 400/409"
-                    )
-                plan_lines.append("")
-
-            # Invariant checks
-            invariants = model.get("invariants", [])
-            if invariants:
-                plan_lines.append("## Invariant Checks (verify at each state)")
-                plan_lines.append("")
-                for inv in invariants:
-                    scope = ""
-                    if inv.get("scope") == "state-specific" and inv.get("applies_to_states"):
-                        scope = f" (in states: {', '.join(inv['applies_to_states'])})"
-                    plan_lines.append(f"- **{inv['id']}**{scope}: {inv['description']}")
-                plan_lines.append("")
-
-            # Coverage summary
-            plan_lines.extend([
-                "## Coverage Summary",
-                "",
-                f"| Metric | Value |",
-                f"|--------|-------|",
-                f"| Total paths | {path_data['summary']['total_paths']} |",
-                f"| States covered | {path_data['summary']['states_covered']}/{path_data['summary']['states_total']} |",
-                f"| Transitions covered | {path_data['summary']['transitions_covered']} |",
-                f"| Invalid transitions to test | {len(invalid)} |",
-                f"| Invariants to verify | {len(invariants)} |",
-                "",
-            ])
-
-            plan_path = output_dir / "test-plan.md"
-            plan_path.write_text("\n".join(plan_lines))
-            files.append(str(plan_path))
-        else:
-            # Fallback: use Python path enumeration
-            paths = fm.enumerate_paths(model)
-            fallback = {
-                "paths": [
-                    {
-                        "target": p[-1]["next_state"] if p else model["initial"],
-                        "steps": p,
-                        "length": len(p),
-                    }
-                    for p in paths
-                ],
-                "summary": {
-                    "total_paths": len(paths),
-                    "note": "Generated by Python fallback (Node bridge unavailable)",
-                },
-            }
-            paths_path = output_dir / "test-paths.json"
-            paths_path.write_text(json.dumps(fallback, indent=2))
-            files.append(str(paths_path))
+            plan_lines.append("")
+
+        # Invariant checks
+        invariants = model.get("invariants", [])
+        if invariants:
+            plan_lines.append("## Invariant Checks (verify at each state)")
+            plan_lines.append("")
+            for inv in invariants:
+                scope = ""
+                if inv.get("scope") == "state-specific" and inv.get("applies_to_states"):
+                    scope = f" (in states: {', '.join(inv['applies_to_states'])})"
+                plan_lines.append(f"- **{inv['id']}**{scope}: {inv['description']}")
+            plan_lines.append("")
+
+        # Coverage summary
+        plan_lines.extend([
+            "## Coverage Summary",
+            "",
+            f"| Metric | Value |",
+            f"|--------|-------|",
+            f"| Total paths | {path_data['summary']['total_paths']} |",
+            f"| States covered | {path_data['summary']['states_covered']}/{path_data['summary']['states_total']} |",
+            f"| Transitions covered | {path_data['summary']['transitions_covered']} |",
+            f"| Invalid transitions to test | {len(invalid)} |",
+            f"| Invariants to verify | {len(invariants)} |",
+            "",
+        ])
+
+        plan_path = output_dir / "test-plan.md"
+        plan_path.write_text("\n".join(plan_lines))
+        files.append(str(plan_path))
 
     elif schema_type == "contracts":
         # Generate assertion templates per operation
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import sys
 from dataclasses import dataclass, field
@@ -26,6 +27,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from chief_wiggum import emission_pool, findings_cache  # noqa: E402
+from chief_wiggum.hashing import scanner_version  # noqa: E402
+from chief_wiggum.manifest import ManifestError, build_manifest  # noqa: E402
+
 
 @dataclass
 class CodeMatch:
@@ -165,6 +172,151 @@ def scan_go_files(repo_path: Path) -> list[CodeMatch]:
     return matches
 
 
+# Directories never descended into. The walk used to filter ``rglob`` results
+# on ``"vendor/" in rel`` (and node_modules/, .git/) AFTER walking the whole
+# subtree; a path contains ``"vendor/"`` exactly when one of its directories'
+# names ENDS in ``vendor``, so pruning on that suffix visits the same files.
+_PRUNE_SUFFIXES = ("vendor", "node_modules", ".git")
+
+# Update keywords looked for in the 8 lines up to a status SET. None spans a
+# newline, so "in the joined window" is "in one of the window's lines" — which
+# a per-line prefix count answers without building the window.
+_UPDATE_KEYWORDS = ("$set", "Update", "update", "bson.M{", "status:", "Status =", "Status:")
+_UPDATE_RE = re.compile("|".join(map(re.escape, _UPDATE_KEYWORDS)))
+_FILTER_KEYWORDS = ("FindOne(", "Find(", "CountDocuments(", "filter", "Filter")
+
+
+def _go_candidates(repo_path: Path) -> list[str]:
+    """Sorted repo-relative paths of the non-test ``.go`` files to scan,
+    pruning vendored, ``node_modules`` and ``.git`` directories during the
+    walk instead of after it."""
+    out: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(repo_path):
+        dirnames[:] = [d for d in dirnames if not d.endswith(_PRUNE_SUFFIXES)]
+        for name in filenames:
+            if name.endswith(".go") and not name.endswith("_test.go"):
+                out.append(str((Path(dirpath) / name).relative_to(repo_path)))
+    return sorted(out)
+
+
+def _prefix_counts(lines: list[str], hit: Any) -> list[int]:
+    """``counts[k]`` = how many of ``lines[:k]`` satisfy ``hit``, so "does
+    any line of lines[a:b]" is ``counts[b] - counts[a] > 0``."""
+    counts = [0]
+    total = 0
+    for line in lines:
+        if hit(line):
+            total += 1
+        counts.append(total)
+    return counts
+
+
+def scan_go_text(rel: str, text: str) -> list[CodeMatch]:
+    """Status SET operations in one Go file — a pure function of its path and
+    content (the unit ``scan_go_files_measured`` caches and parallelizes).
+
+    The file is split once, the ``$set``/update-keyword context windows are
+    answered from per-line prefix counts instead of re-joining up to 17
+    lines per match, and the SET/function regexes run only on lines carrying
+    the literal every one of them requires."""
+    lines = text.splitlines()
+    # Built on the first SET candidate: most files have none.
+    update_counts: list[int] | None = None
+    set_counts: list[int] | None = None
+    matches: list[CodeMatch] = []
+    current_func = ""
+    func_guard_statuses: list[str] = []
+
+    for i, line in enumerate(lines, 1):
+        # Track current function
+        if "func" in line:
+            func_match = GO_FUNC_PATTERN.search(line)
+            if func_match:
+                current_func = func_match.group(1)
+                func_guard_statuses = []
+
+        has_status = '"status"' in line
+        # Track guard statuses in filters (for from-state inference)
+        # Look for status checks in MongoDB filters. The preceding lines are
+        # joined WITHOUT a separator, so a FindOne split across a line break
+        # still counts — kept exactly.
+        if has_status and ("$in" in line or "FindOne" in "".join(lines[max(0, i-5):i])):
+            for gp in GO_GUARD_PATTERNS:
+                for gm in gp.finditer(line):
+                    if len(gm.groups()) == 2:
+                        func_guard_statuses.append(camel_to_snake(gm.group(2)))
+                    elif len(gm.groups()) == 1:
+                        val = gm.group(1)
+                        if val not in ("$in", "$ne", "$set", "status", "$or"):
+                            func_guard_statuses.append(val)
+
+        # Every SET pattern needs '"status"' or '.Status' on the line.
+        if not has_status and ".Status" not in line:
+            continue
+        stripped = line.strip()
+        # Skip lines that are clearly comments, not updates
+        if stripped.startswith("//"):
+            continue
+
+        # Detect status SET operations (not just references)
+        for sp in GO_SET_PATTERNS:
+            for sm in sp.finditer(line):
+                if len(sm.groups()) == 2:
+                    status_val = camel_to_snake(sm.group(2))
+                elif len(sm.groups()) == 1:
+                    status_val = sm.group(1)
+                else:
+                    continue
+
+                if update_counts is None:
+                    update_counts = _prefix_counts(lines, _UPDATE_RE.search)
+                    set_counts = _prefix_counts(lines, lambda ln: "$set" in ln)
+                # Determine if this is in an update context (not a filter):
+                # any update keyword in lines[i-8:i].
+                is_update = update_counts[i] - update_counts[max(0, i-8)] > 0
+                is_filter = any(kw in stripped for kw in _FILTER_KEYWORDS)
+
+                if not is_update and not is_filter:
+                    # Check broader context: "$set" in lines[i-15:i+2]
+                    hi = min(len(lines), i + 2)
+                    is_update = set_counts[hi] - set_counts[max(0, i-15)] > 0
+
+                if is_filter and not is_update:
+                    continue
+
+                # Collect guard statuses from the enclosing function
+                guards = list(set(func_guard_statuses))
+
+                matches.append(CodeMatch(
+                    file=rel,
+                    line=i,
+                    handler=current_func,
+                    target_status=status_val,
+                    guard_statuses=guards,
+                    raw_line=stripped,
+                ))
+
+    return matches
+
+
+def _emit_go_file(repo: str, rel: str) -> tuple[list[dict] | None, str | None]:
+    """Per-file emission for ``emission_pool``: ``(match dicts, None)`` on a
+    read, ``(None, reason)`` when the file could not be read. Module-level so
+    a worker process can run it; plain dicts are the findings-cache payload."""
+    try:
+        text = (Path(repo) / rel).read_text()
+    except (OSError, UnicodeDecodeError) as exc:
+        return None, type(exc).__name__
+    return [vars(m).copy() for m in scan_go_text(rel, text)], None
+
+
+def _scanner_version() -> str:
+    """Hash of this module's source: the emission half of the findings-cache
+    key, so an edit to the patterns or the context rules never serves matches
+    the previous logic produced."""
+    return scanner_version(Path(__file__).resolve())
+
+
 def scan_go_files_measured(repo_path: Path) -> tuple[list[CodeMatch], int, list[str]]:
     """``(matches, files_scanned, unreadable)``.
 
@@ -173,99 +325,57 @@ def scan_go_files_measured(repo_path: Path) -> tuple[list[CodeMatch], int, list[
     is Go-only, so a TypeScript repo, an empty root, or a wrong root yields
     zero matches and reports every model transition MISSING, exactly as a Go
     repo that genuinely never implements them would (#289).
-    """
-    matches = []
-    scanned = 0
-    unreadable: list[str] = []
 
-    for go_file in repo_path.rglob("*.go"):
-        rel = go_file.relative_to(repo_path)
-        if any(p in str(rel) for p in ["vendor/", "node_modules/", ".git/"]):
-            continue
-        if str(rel).endswith("_test.go"):
-            continue
+    Every candidate is accounted for on every run; what varies is whether its
+    matches are recomputed. A file whose git blob and this scanner's version
+    are unchanged is served from the per-file findings cache
+    (``chief_wiggum.findings_cache``, engine ``verify_transitions``; off under
+    ``CW_FINDINGS_NO_CACHE=1`` or outside git); misses are scanned through
+    ``chief_wiggum.emission_pool`` (``CW_SCAN_WORKERS``) and assembled in walk
+    order, so the result is identical cached, serial or parallel.
+    """
+    root = str(repo_path)
+    candidates = _go_candidates(repo_path)
 
+    blobs: dict[str, str] = {}
+    scanner_hash = ""
+    if not findings_cache.disabled() and candidates:
         try:
-            lines = go_file.read_text().splitlines()
-        except (OSError, UnicodeDecodeError) as exc:
-            # #289: never a silent drop — a file the scanner could not open is
-            # named in the report, the same treatment check_traceability and
-            # check_single_writer give `unscanned` (#282).
-            unreadable.append(f"{rel}: {type(exc).__name__}")
-            continue
-        scanned += 1
-
-        current_func = ""
-        func_guard_statuses: list[str] = []
-
-        for i, line in enumerate(lines, 1):
-            # Track current function
-            func_match = GO_FUNC_PATTERN.search(line)
-            if func_match:
-                current_func = func_match.group(1)
-                func_guard_statuses = []
-
-            # Track guard statuses in filters (for from-state inference)
-            # Look for status checks in MongoDB filters
-            if '"status"' in line and ("$in" in line or "FindOne" in "".join(lines[max(0,i-5):i])):
-                for gp in GO_GUARD_PATTERNS:
-                    for gm in gp.finditer(line):
-                        if len(gm.groups()) == 2:
-                            func_guard_statuses.append(camel_to_snake(gm.group(2)))
-                        elif len(gm.groups()) == 1:
-                            val = gm.group(1)
-                            if val not in ("$in", "$ne", "$set", "status", "$or"):
-                                func_guard_statuses.append(val)
-
-            # Detect status SET operations (not just references)
-            for sp in GO_SET_PATTERNS:
-                for sm in sp.finditer(line):
-                    # Skip lines that are clearly filters, not updates
-                    stripped = line.strip()
-                    if stripped.startswith("//"):
-                        continue
-
-                    if len(sm.groups()) == 2:
-                        entity_prefix = sm.group(1)
-                        status_val = camel_to_snake(sm.group(2))
-                    elif len(sm.groups()) == 1:
-                        entity_prefix = ""
-                        status_val = sm.group(1)
-                    else:
-                        continue
-
-                    # Determine if this is in an update context (not a filter)
-                    context_window = lines[max(0, i-8):i]
-                    context_text = "\n".join(context_window)
-                    is_update = any(kw in context_text for kw in [
-                        "$set", "Update", "update", "bson.M{",
-                        "status:", "Status =", "Status:",
-                    ])
-                    is_filter = any(kw in stripped for kw in [
-                        "FindOne(", "Find(", "CountDocuments(",
-                        "filter", "Filter",
-                    ])
-
-                    if not is_update and not is_filter:
-                        # Check broader context
-                        broad_context = "\n".join(lines[max(0, i-15):i+2])
-                        is_update = "$set" in broad_context
-
-                    if is_filter and not is_update:
-                        continue
-
-                    # Collect guard statuses from the enclosing function
-                    guards = list(set(func_guard_statuses))
-
-                    matches.append(CodeMatch(
-                        file=str(rel),
-                        line=i,
-                        handler=current_func,
-                        target_status=status_val,
-                        guard_statuses=guards,
-                        raw_line=stripped,
-                    ))
+            manifest = build_manifest(repo_path, lambda p: p.endswith(".go"))
+        except ManifestError:
+            manifest = {}
+        # The manifest keys with "/"; candidates with the OS separator.
+        blobs = {rel: manifest[key] for rel in candidates
+                 if (key := Path(rel).as_posix()) in manifest}
+        scanner_hash = _scanner_version()
+    served = (
+        findings_cache.load_many(root, "verify_transitions", scanner_hash, blobs)
+        if blobs else {}
+    )
+    misses = [rel for rel in candidates if rel not in served]
+    emitted = dict(zip(misses, emission_pool.emit_files(root, misses, _emit_go_file), strict=True))
 
+    matches: list[CodeMatch] = []
+    scanned = 0
+    unreadable: list[str] = []
+    fresh: list[tuple[str, str, list[dict]]] = []
+    for rel in candidates:
+        found = served.get(rel)
+        if found is None:
+            found, reason = emitted[rel]
+            if found is None:
+                # #289: never a silent drop — a file the scanner could not
+                # open is named in the report, the same treatment
+                # check_traceability and check_single_writer give
+                # `unscanned` (#282). Never cached: it re-attempts next run.
+                unreadable.append(f"{rel}: {reason}")
+                continue
+            if rel in blobs:
+                fresh.append((rel, blobs[rel], found))
+        scanned += 1
+        matches.extend(CodeMatch(**d) for d in found)
+    if fresh:
+        findings_cache.store_many(root, "verify_transitions", scanner_hash, fresh)
     return matches, scanned, unreadable
 
 
@@ -548,8 +658,29 @@ def main() -> int:
         "(missing/undocumented transitions) stay report-only: this checker is advisory "
         "about coverage and blocking only about its own instrument (docs/gate-rollout.md).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the per-file findings cache for this run — every Go file is "
+        "re-scanned, even on an unchanged git blob (the dual-run zero-diff check).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Worker processes for scanning cache misses (default: one per CPU; 1 = "
+        "serial). Matches are assembled in walk order, so the report is identical at any N.",
+    )
     args = parser.parse_args()
 
+    if args.no_cache:
+        os.environ[findings_cache.NO_CACHE_ENV] = "1"
+    if args.jobs is not None:
+        if args.jobs < 1:
+            print("Error: --jobs must be >= 1", file=sys.stderr)
+            return 2
+        os.environ[emission_pool.WORKERS_ENV] = str(args.jobs)
+
     repo = Path(args.repo_path).resolve()
     if not repo.is_dir():
         print(f"Error: {repo} is not a directory", file=sys.stderr)
@@ -45,7 +45,78 @@ def isolate_quality_cache(tmp_path, monkeypatch):
 def isolate_findings_cache(tmp_path, monkeypatch):
     """Redirect the #327 per-file gate-findings cache
     (``chief_wiggum/findings_cache.py``, used by ``check_traceability.py`` /
-    ``check_single_writer.py``) to a per-test path — same rationale as
-    ``isolate_quality_cache`` above: without this, a test run would read and
-    write the operator's REAL ``~/.chief-wiggum/cache/findings`` directory."""
+    ``check_single_writer.py`` / ``check_dst_readiness.py`` and
+    ``quality/complexity.py``'s per-file tool results) to a per-test path —
+    same rationale as ``isolate_quality_cache`` above: without this, a test
+    run would read and write the operator's REAL
+    ``~/.chief-wiggum/cache/findings`` directory."""
     monkeypatch.setenv("CW_FINDINGS_CACHE_DIR", str(tmp_path / "findings-cache"))
+
+
+@pytest.fixture(autouse=True)
+def isolate_manifest_cache(tmp_path, monkeypatch):
+    """Redirect ``chief_wiggum/manifest.py``'s stat-keyed hash cache to a
+    per-test path — same rationale as ``isolate_findings_cache`` above:
+    without this, a test run would read and write the operator's REAL
+    ``~/.chief-wiggum/cache/manifest`` directory."""
+    monkeypatch.setenv("CW_MANIFEST_CACHE_DIR", str(tmp_path / "manifest-cache"))
+
+
+@pytest.fixture(autouse=True)
+def isolate_corpus_digest_cache(tmp_path, monkeypatch):
+    """Redirect ``check_gate_validation.corpus_digest``'s stat-keyed digest
+    cache to a per-test path — same rationale as ``isolate_findings_cache``
+    above: without this, a test run would read and write the operator's REAL
+    ``~/.chief-wiggum/cache/corpus-digest`` directory."""
+    monkeypatch.setenv("CW_CORPUS_DIGEST_CACHE_DIR", str(tmp_path / "corpus-digest-cache"))
+
+
+@pytest.fixture(autouse=True)
+def isolate_mutation_cache(tmp_path, monkeypatch):
+    """Redirect the native mutation engine's verdict cache
+    (``chief_wiggum/mutation.py``) to a per-test path — same rationale as
+    ``isolate_findings_cache`` above: without this, a test run would read and
+    write the operator's REAL ``~/.chief-wiggum/cache/mutation`` directory."""
+    monkeypatch.setenv("CW_MUTATION_CACHE_DIR", str(tmp_path / "mutation-cache"))
+
+
+@pytest.fixture(autouse=True)
+def isolate_plane_b_index(tmp_path, monkeypatch):
+    """Redirect ``code_query.py``'s persistent Plane B index
+    (``chief_wiggum/plane_b_index.py``) to a per-test path — same rationale
+    as ``isolate_findings_cache`` above: without this, a test run would read
+    and write the operator's REAL ``~/.chief-wiggum/cache/plane-b``
+    directory."""
+    monkeypatch.setenv("CW_PLANE_B_INDEX_DIR", str(tmp_path / "plane-b-index"))
+
+
+@pytest.fixture(autouse=True)
+def isolate_ratchet_checkpoints(tmp_path, monkeypatch):
+    """Redirect ``ratchet.py``'s signed journal-verification checkpoints
+    (``chief_wiggum/chain_checkpoint.py``) to a per-test path — same
+    rationale as ``isolate_findings_cache`` above: without this, a test run
+    would read and write the operator's REAL ``~/.chief-wiggum/cache/ratchet``
+    directory."""
+    monkeypatch.setenv("CW_RATCHET_CHECKPOINT_DIR", str(tmp_path / "ratchet-checkpoints"))
+
+
+@pytest.fixture(autouse=True)
+def isolate_ratchet_suite_cache(tmp_path, monkeypatch):
+    """Redirect ``ratchet.py score``'s per-suite result reuse
+    (``chief_wiggum/suite_cache.py``) to a per-test path — same rationale as
+    ``isolate_findings_cache`` above: without this, a test run would read and
+    write the operator's REAL ``~/.chief-wiggum/cache/ratchet-suites``
+    directory. The opt-in is cleared too, so an operator who exports it
+    locally still gets the default (uncached) ``score`` in every test."""
+    monkeypatch.setenv("CW_RATCHET_SUITE_CACHE_DIR", str(tmp_path / "ratchet-suite-cache"))
+    monkeypatch.delenv("CW_RATCHET_SUITE_CACHE", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def isolate_lsp_broker(tmp_path, monkeypatch):
+    """Point the LSP broker socket (``chief_wiggum/lsp_broker.py``) at a
+    per-test path and clear the session-wide opt-in: without this, a test
+    that resolves an LSP-tier symbol would attach to the operator's REAL
+    broker under ``~/.chief-wiggum/run/`` and answer from its servers."""
+    monkeypatch.setenv("CW_LSP_BROKER_SOCKET", str(tmp_path / "lsp-broker.sock"))
+    monkeypatch.delenv("CW_LSP_BROKER", raising=False)
@@ -0,0 +1,75 @@
+"""A stand-in language server for tests: speaks the LSP wire protocol over
+stdio, answers ``initialize``/``shutdown``, keeps every opened document's
+text current through ``didOpen``/``didChange``/``didClose``, and answers
+``documentSymbol`` with one symbol per ``func Name`` line (spanning to the
+line before the next one). Every spawn, documentSymbol request, open and
+close is appended to the log file named by ``argv[1]``, so a test can count
+cold starts, round trips and open documents without a real gopls/pyright.
+"""
+
+import json
+import re
+import sys
+from urllib.parse import unquote, urlparse
+
+log = open(sys.argv[1], "a")  # noqa: SIM115 — lives as long as the process
+log.write("spawn\n")
+log.flush()
+inp, out = sys.stdin.buffer, sys.stdout.buffer
+texts: dict[str, str] = {}
+
+
+def send(obj: dict) -> None:
+    body = json.dumps(obj).encode()
+    out.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    out.flush()
+
+
+def record(entry: str, uri: str) -> None:
+    log.write(f"{entry} {unquote(urlparse(uri).path).rsplit('/', 1)[-1]}\n")
+    log.flush()
+
+
+def symbols(text: str) -> list[dict]:
+    lines = text.splitlines()
+    decls = [(i, m.group(1)) for i, line in enumerate(lines) if (m := re.match(r"func (\w+)", line))]
+    return [
+        {"name": name, "range": {
+            "start": {"line": i},
+            "end": {"line": decls[j + 1][0] - 1 if j + 1 < len(decls) else len(lines) - 1},
+        }}
+        for j, (i, name) in enumerate(decls)
+    ]
+
+
+while True:
+    length = None
+    while True:
+        line = inp.readline()
+        if not line:
+            sys.exit(0)
+        if line in (b"\r\n", b"\n"):
+            break
+        key, _, value = line.decode().partition(":")
+        if key.strip().lower() == "content-length":
+            length = int(value)
+    msg = json.loads(inp.read(length))
+    method = msg.get("method")
+    if method == "textDocument/didOpen":
+        doc = msg["params"]["textDocument"]
+        texts[doc["uri"]] = doc["text"]
+        record("open", doc["uri"])
+    elif method == "textDocument/didChange":
+        texts[msg["params"]["textDocument"]["uri"]] = msg["params"]["contentChanges"][-1]["text"]
+    elif method == "textDocument/didClose":
+        uri = msg["params"]["textDocument"]["uri"]
+        texts.pop(uri, None)
+        record("close", uri)
+    elif method == "textDocument/documentSymbol":
+        uri = msg["params"]["textDocument"]["uri"]
+        record("symbols", uri)
+        send({"jsonrpc": "2.0", "id": msg["id"], "result": symbols(texts.get(uri, ""))})
+    elif method == "exit":
+        sys.exit(0)
+    elif "id" in msg:
+        send({"jsonrpc": "2.0", "id": msg["id"], "result": {} if method == "initialize" else None})
@@ -816,6 +816,88 @@ def test_load_measured_k6_summary_export(tmp_path):
     assert data["unused_metric"]["p95"] is None
 
 
+def test_load_measured_keeps_other_exported_percentiles(tmp_path):
+    p = tmp_path / "k6-summary.json"
+    p.write_text(json.dumps({"metrics": {"ttft": {"values": {"p(95)": 300, "p(99)": 410, "p(99.9)": 500, "count": 9}}}}))
+    data = cbt.load_measured(p)
+    assert data["ttft"] == {"p95": 300, "count": 9, "quantiles": {0.99: 410, 0.999: 500}}
+    doc = {"trees": [{"root": _leaf("BUD-q-001", 400, alpha=0.01, telemetry_ref="ttft")}]}
+    result = cbt.check_measured(doc, data, source="k6").measured[0]
+    assert (result.observed, result.quantile, result.status) == (410, 0.99, "breached")
+    # No matching percentile exported: the p95, as always, and it says so.
+    doc["trees"][0]["root"]["alpha"] = 0.02
+    result = cbt.check_measured(doc, data, source="k6").measured[0]
+    assert (result.observed, result.quantile) == (300, 0.95)
+
+
+# --- raw samples + quantile sketches ---------------------------------------------
+
+
+def _write_samples(path, rows):
+    import gzip
+
+    lines = "".join(json.dumps(r) + "\n" for r in rows)
+    if path.suffix == ".gz":
+        with gzip.open(path, "wt") as fh:
+            fh.write(lines)
+    else:
+        path.write_text(lines)
+    return path
+
+
+def test_load_samples_streams_jsonl_k6_points_and_csv(tmp_path):
+    jsonl = _write_samples(tmp_path / "spans.jsonl.gz", [
+        {"metric": "ttft", "value": v} for v in range(1, 101)
+    ] + [{"type": "Metric", "metric": "ttft", "data": {"type": "trend"}}])
+    k6 = _write_samples(tmp_path / "k6.json", [
+        {"type": "Point", "metric": "ttft", "data": {"time": "t", "value": 1000, "tags": {}}},
+    ])
+    csv_path = tmp_path / "asr.csv"
+    csv_path.write_text("metric_name,timestamp,metric_value\nasr,1,10\nasr,2,20\nasr,3,oops\n")
+    (tmp_path / "torn.jsonl").write_text('{"metric": "ttft", "value": 5}\n{"metric": "tt')
+    sketches, skipped = cbt.load_samples([jsonl, k6, csv_path, tmp_path / "torn.jsonl"])
+    assert sketches["ttft"].count == 102 and sketches["asr"].count == 2
+    assert sketches["ttft"].quantile(1.0) == 1000
+    assert skipped == 2  # the non-numeric CSV row and the torn JSON line
+
+
+def test_sketched_node_is_judged_at_its_own_alpha(tmp_path):
+    samples = _write_samples(tmp_path / "lat.jsonl", [{"metric": "lat", "value": v} for v in range(1, 1001)])
+    sketches, _ = cbt.load_samples([samples])
+    measured = cbt.measured_from_sketches(sketches)
+    doc = {"trees": [{"root": _leaf("BUD-sk-001", 960, alpha=0.05, telemetry_ref="lat")}]}
+    result = cbt.check_measured(doc, measured, source="lat.jsonl").measured[0]
+    assert result.status == "held" and result.quantile == 0.95
+    assert abs(result.observed - 950) <= 950 * 0.01
+    doc["trees"][0]["root"]["alpha"] = 0.01  # same data, tighter tail: p99 ~ 990
+    result = cbt.check_measured(doc, measured, source="lat.jsonl").measured[0]
+    assert result.status == "breached" and result.quantile == 0.99
+
+
+def test_cli_merges_shard_sketches_like_one_pass(tmp_path, capsys):
+    doc = {"trees": [{"root": _leaf("BUD-sh-001", 5000, alpha=0.01, telemetry_ref="lat")}]}
+    budget = _write(tmp_path, "budget.json", doc)
+    shards = []
+    for n in range(3):
+        shard = _write_samples(tmp_path / f"shard{n}.jsonl",
+                               [{"metric": "lat", "value": v} for v in range(n * 1000 + 1, n * 1000 + 1001)])
+        sketch = tmp_path / f"shard{n}.sketch.json"
+        assert cbt.main([str(budget), "--samples", str(shard), "--write-sketch", str(sketch)]) == 0
+        shards.append((shard, sketch))
+    capsys.readouterr()
+
+    def observed(*extra):
+        assert cbt.main([str(budget), "--format", "json", *extra]) == 0
+        return json.loads(capsys.readouterr().out)["measured"][0]["observed"]
+
+    merged = observed(*[a for _, sk in shards for a in ("--sketch", str(sk))])
+    one_pass = observed(*[a for sh, _ in shards for a in ("--samples", str(sh))])
+    assert merged == one_pass and abs(merged - 2970) <= 2970 * 0.01
+
+    (tmp_path / "not-a-sketch.json").write_text(json.dumps({"lat": {"p95": 1}}))
+    assert cbt.main([str(budget), "--sketch", str(tmp_path / "not-a-sketch.json")]) == 2
+
+
 # --- authority line ------------------------------------------------------------
 
 
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
+import subprocess
 
 import check_dst_readiness as dst
+from chief_wiggum import emission_pool, findings_cache
 
 
 def _rule_files(report, rule):
@@ -357,6 +359,127 @@ def test_skip_dir_inside_root_still_skipped(tmp_path):
     assert _rule_files(report, "wall-clock") == ["svc.go"]
 
 
+def test_skip_dirs_are_pruned_during_the_walk(tmp_path, monkeypatch):
+    deps = tmp_path / "web" / "node_modules" / "dep"
+    deps.mkdir(parents=True)
+    (deps / "index.js").write_text("Date.now();\n")
+    (tmp_path / "svc.go").write_text("func H() { _ = time.Now() }\n")
+    visited: list[str] = []
+    real_walk = dst.os.walk
+
+    def recording_walk(top, *args, **kwargs):
+        for entry in real_walk(top, *args, **kwargs):
+            visited.append(entry[0])
+            yield entry
+
+    monkeypatch.setattr(dst.os, "walk", recording_walk)
+    report = dst.check(tmp_path)
+    assert _rule_files(report, "wall-clock") == ["svc.go"]
+    assert visited and not any("node_modules" in d for d in visited)
+
+
+# --- per-file cache + worker pool -------------------------------------------------
+
+
+def _git_repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    files = {
+        "svc.go": "func H() { _ = time.Now() }\n",
+        "pkg/a.py": "import random\nx = random.randint(1, 6)\n",
+        "pkg/exempt.py": "# cw:dst-exempt\nimport time\nt = time.time()\n",
+        "pkg/clean.ts": "export const x = 1;\n",
+        "pkg/clock.ts": "export const now = () => Date.now();\n",
+    }
+    for rel, text in files.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(text)
+    for args in (["init", "-q"], ["add", "-A"],
+                 ["-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "seed"]):
+        subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+    return root
+
+
+def _recording_emit(monkeypatch):
+    emitted: list[str] = []
+    real = emission_pool.emit_files
+
+    def recording(root, rels, emit_one, **kwargs):
+        emitted.extend(rels)
+        return real(root, rels, emit_one, **kwargs)
+
+    monkeypatch.setattr(emission_pool, "emit_files", recording)
+    return emitted
+
+
+def test_warm_run_serves_every_file_from_the_cache(tmp_path, monkeypatch):
+    root = _git_repo(tmp_path)
+    emitted = _recording_emit(monkeypatch)
+    cold = dst.check(root).to_dict()
+    assert sorted(emitted) == ["pkg/a.py", "pkg/clean.ts", "pkg/exempt.py", "svc.go"]
+
+    emitted.clear()
+    assert dst.check(root).to_dict() == cold
+    assert emitted == []
+    assert {"file": "pkg/exempt.py", "reason": "cw:dst-exempt marker"} in cold["exempted_files"]
+
+    (root / "pkg" / "clean.ts").write_text("export const x = Math.random();\n")
+    emitted.clear()
+    edited = dst.check(root)
+    assert emitted == ["pkg/clean.ts"]
+    assert _rule_files(edited, "unseeded-random") == ["pkg/a.py", "pkg/clean.ts"]
+
+
+def test_cached_run_matches_no_cache_run(tmp_path, monkeypatch):
+    root = _git_repo(tmp_path)
+    dst.check(root)
+    cached = dst.check(root).to_dict()
+    monkeypatch.setenv(findings_cache.NO_CACHE_ENV, "1")
+    emitted = _recording_emit(monkeypatch)
+    assert dst.check(root).to_dict() == cached
+    assert len(emitted) == 4
+
+
+def test_a_cache_entry_from_another_scanner_version_never_serves(tmp_path, monkeypatch):
+    root = _git_repo(tmp_path)
+    dst.check(root)
+    monkeypatch.setattr(dst, "_scanner_version", lambda: "edited-scanner")
+    emitted = _recording_emit(monkeypatch)
+    dst.check(root)
+    assert len(emitted) == 4
+
+
+def test_subdirectory_root_sees_an_uncommitted_edit(tmp_path):
+    """A source_root below the git toplevel: the edited file must not be
+    served its HEAD blob's cached (clean) result."""
+    root = _git_repo(tmp_path)
+    sub = root / "pkg"
+    assert _rule_files(dst.check(sub), "wall-clock") == []
+    (sub / "clean.ts").write_text("export const t = Date.now();\n")
+    assert _rule_files(dst.check(sub), "wall-clock") == ["clean.ts"]
+
+
+def test_pooled_scan_matches_serial_scan(tmp_path, monkeypatch):
+    for i in range(6):
+        (tmp_path / f"m{i}.py").write_text("import time\nt = time.time()\n")
+    (tmp_path / "m_exempt.py").write_text("# cw:dst-exempt\nx = random.random()\n")
+    monkeypatch.setenv(emission_pool.WORKERS_ENV, "1")
+    serial = dst.check(tmp_path).to_dict()
+    monkeypatch.setenv(emission_pool.WORKERS_ENV, "3")
+    monkeypatch.setattr(emission_pool, "MIN_PARALLEL_FILES", 1)
+    assert dst.check(tmp_path).to_dict() == serial
+    assert serial["counts"]["files_scanned"] == 6
+
+
+def test_main_scanner_version_needs_no_source_root(capsys):
+    assert dst.main(["--scanner-version"]) == 0
+    assert capsys.readouterr().out.strip() == dst._scanner_version()
+
+
+def test_main_rejects_zero_jobs(tmp_path, capsys):
+    assert dst.main([str(tmp_path), "--jobs", "0"]) == 2
+
+
 # --- Python idioms: qualified datetime, from-imports, aliases (P1 regression) ----
 
 
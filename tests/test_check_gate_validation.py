@@ -11,6 +11,7 @@ may grant blocking authority.
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -1127,3 +1128,149 @@ def test_validation_dir_is_defined_once_and_imported():
     assert gv.DEFAULT_VALIDATION_DIR is factory_log.DEFAULT_VALIDATION_DIR
     assert Path(gv.DEFAULT_VALIDATION_DIR).is_absolute()
     assert Path(gv.DEFAULT_VALIDATION_DIR).parts[-3:] == ("docs", "quality", "validation")
+
+
+# --- in-process scanner versions, corpus digest cache, --all ------------------
+
+
+VERSIONED_GATES = (
+    "check_architecture", "check_single_writer", "check_traceability", "ci_scaffold",
+    "code_query", "quality_slop_gate", "ratchet", "saas_gate",
+)
+
+
+def test_in_process_scanner_version_matches_the_gates_own_flag():
+    """The registry's static read of ``_scanner_version()`` is only sound if it
+    is the gate's own answer: for every versioned gate, the in-process hash
+    must equal what ``<gate>.py --scanner-version`` prints."""
+    from chief_wiggum.scanner_registry import live_scanner_version, static_scanner_deps
+
+    for gate in VERSIONED_GATES:
+        script = SCRIPTS / f"{gate}.py"
+        assert static_scanner_deps(script), f"{gate}: _scanner_version not statically readable"
+        proc = subprocess.run(
+            [sys.executable, str(script), "--scanner-version"],
+            capture_output=True, text=True, check=True,
+        )
+        assert live_scanner_version(script) == proc.stdout.strip(), gate
+
+
+def test_live_scanner_version_skips_the_subprocess_for_readable_gates(tmp_path, monkeypatch):
+    """A gate whose ``_scanner_version`` is the plain path-list form is hashed
+    in process — no interpreter launch — and a dependency edit still stales it."""
+    scripts_dir = tmp_path / "scripts"
+    (scripts_dir / "chief_wiggum").mkdir(parents=True)
+    dep = scripts_dir / "chief_wiggum" / "dep.py"
+    dep.write_text("A = 1\n")
+    (scripts_dir / "example_gate.py").write_text(
+        "from pathlib import Path\n"
+        "from chief_wiggum.hashing import scanner_version\n\n"
+        "def _scanner_version() -> str:\n"
+        "    here = Path(__file__).resolve()\n"
+        "    cw_dir = here.parent / \"chief_wiggum\"\n"
+        "    return scanner_version(here, cw_dir / \"dep.py\")\n"
+    )
+
+    def _boom(*a, **kw):
+        raise AssertionError("subprocess probe used for a statically readable gate")
+
+    monkeypatch.setattr(gv.subprocess, "run", _boom)
+    first, err = gv._live_scanner_version("example_gate", scripts_dir)
+    assert err is None and first
+    dep.write_text("A = 2\n")
+    second, err = gv._live_scanner_version("example_gate", scripts_dir)
+    assert err is None and second != first
+
+
+def test_unreadable_scanner_dependency_is_a_provenance_error(tmp_path):
+    """A declared dependency that cannot be read is a broken probe (#289),
+    never a silent skip."""
+    scripts_dir = tmp_path / "scripts"
+    scripts_dir.mkdir()
+    (scripts_dir / "example_gate.py").write_text(
+        "from pathlib import Path\n"
+        "from chief_wiggum.hashing import scanner_version\n\n"
+        "def _scanner_version() -> str:\n"
+        "    here = Path(__file__).resolve()\n"
+        "    return scanner_version(here, here.parent / \"missing.py\")\n"
+    )
+    vdir = _write_record(tmp_path, "example_gate", _minimal_valid_record(scanner_version="x"))
+    report = gv.check("example_gate", vdir, scripts_dir=scripts_dir)
+    assert any("could not be read" in e for e in report.provenance_errors)
+    assert report.passing is False
+
+
+def _corpus(tmp_path: Path) -> Path:
+    root = tmp_path / "corpus"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.txt").write_text("alpha\n")
+    (root / "sub" / "b.txt").write_text("beta\n")
+    old = 1_600_000_000_000_000_000  # outside the racy window
+    for p in (root / "a.txt", root / "sub" / "b.txt"):
+        os.utime(p, ns=(old, old))
+    return root
+
+
+def test_corpus_digest_cache_hit_returns_the_same_digest_without_reading(tmp_path, monkeypatch):
+    root = _corpus(tmp_path)
+    first = gv.corpus_digest(root)
+    assert first.startswith("sha256:")
+
+    def _no_read(*a, **kw):
+        raise AssertionError("corpus bytes re-read on an unchanged corpus")
+
+    monkeypatch.setattr(gv, "_digest_files", _no_read)
+    assert gv.corpus_digest(root) == first
+
+
+def test_corpus_digest_cache_invalidates_on_any_change(tmp_path, monkeypatch):
+    root = _corpus(tmp_path)
+    first = gv.corpus_digest(root)
+    (root / "sub" / "b.txt").write_text("gamma\n")
+    second = gv.corpus_digest(root)
+    assert second != first
+    (root / "c.txt").write_text("new\n")
+    assert gv.corpus_digest(root) not in (first, second)
+    monkeypatch.setenv(gv.CORPUS_DIGEST_NO_CACHE_ENV, "1")
+    assert gv.corpus_digest(root) == gv._digest_files(root, gv._corpus_files(root))
+
+
+def test_corpus_digest_racy_corpus_is_not_cached(tmp_path):
+    root = tmp_path / "corpus"
+    root.mkdir()
+    (root / "a.txt").write_text("fresh\n")
+    gv.corpus_digest(root)
+    assert not any((tmp_path / "corpus-digest-cache").glob("*.json"))
+
+
+def test_cli_all_checks_every_record_in_gate_order(tmp_path, capsys):
+    vdir = _write_multi_gate_records(tmp_path, ("gate_c", "gate_a", "gate_b"))
+    rc = gv.main(["--all", "--validation-dir", str(vdir), "--gate", "--format", "json", "--jobs", "3"])
+    assert rc == 0
+    out = json.loads(capsys.readouterr().out)
+    assert list(out["gates"]) == ["gate_a", "gate_b", "gate_c"]
+    assert all(r["passing"] for r in out["gates"].values())
+
+
+def test_cli_all_parallel_verifies_chain_once_and_matches_sequential(tmp_path, monkeypatch, capsys):
+    vdir = _write_multi_gate_records(tmp_path, ("gate_a", "gate_b", "gate_c", "gate_d"))
+    calls: list[int] = []
+    orig = gv._load_and_verify_chain
+
+    def spy(journal):
+        calls.append(1)
+        return orig(journal)
+
+    monkeypatch.setattr(gv, "_load_and_verify_chain", spy)
+    gv.main(["--all", "--validation-dir", str(vdir), "--format", "json", "--jobs", "4"])
+    parallel = json.loads(capsys.readouterr().out)
+    assert calls == [1]
+    gv.main(["--all", "--validation-dir", str(vdir), "--format", "json", "--jobs", "1"])
+    assert json.loads(capsys.readouterr().out) == parallel
+
+
+def test_cli_all_refuses_names_and_wire(tmp_path, capsys):
+    vdir = _write_multi_gate_records(tmp_path, ("gate_a",))
+    assert gv.main(["gate_a", "--all", "--validation-dir", str(vdir)]) == 2
+    assert gv.main(["--all", "--validation-dir", str(vdir), "--wire"]) == 2
+    assert gv.main(["--all", "--validation-dir", str(tmp_path / "empty")]) == 2
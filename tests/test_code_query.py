@@ -20,6 +20,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 FIXTURE = Path(__file__).parent / "fixtures" / "code_query_repo"
 SCRIPT = Path(__file__).parent.parent / "scripts" / "code_query.py"
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -135,6 +137,86 @@ def test_orient_error_on_undecodable_file():
         bad.unlink()
 
 
+# --- orient over many paths (one query) ------------------------------------------
+
+
+_BATCH_PATHS = ["src/order.py", "src/admin.py", "ui/orders/page.tsx", "./src/order.py", "src/missing.py"]
+
+
+def _ids(env: dict) -> list[str]:
+    return sorted({f["id"] for f in env["facts"] if f["id"]})
+
+
+def test_orient_many_matches_per_file_orient_and_merges_ids():
+    env = code_query.cmd_orient_many(FIXTURE, _BATCH_PATHS, "checkout", limit=1000)
+    assert set(env) == ENVELOPE_KEYS | {"ids", "files"}
+    # Normalized, deduplicated, in the order given.
+    assert list(env["files"]) == ["src/order.py", "src/admin.py", "ui/orders/page.tsx", "src/missing.py"]
+    union: set[str] = set()
+    for rel in ("src/order.py", "src/admin.py", "ui/orders/page.tsx"):
+        single = code_query.cmd_orient(FIXTURE, rel, "checkout", limit=1000)
+        per_file = env["files"][rel]
+        assert per_file["applicability"] == "applicable"
+        assert per_file["ids"] == _ids(single)
+        assert per_file["facts"] == len(single["facts"])
+        assert per_file["summary"] == single["summary"]
+        union |= set(_ids(single))
+    assert env["ids"] == sorted(union)
+    assert {"CTR-order-confirm-001", "INV-checkout-001"} <= set(env["ids"])
+    # A missing path is reported, never a failed batch.
+    assert env["files"]["src/missing.py"]["applicability"] == "inapplicable"
+    assert any("src/missing.py" in w for w in env["warnings"])
+    assert env["applicability"] == "applicable"
+
+
+def test_orient_many_ids_are_never_paged_away():
+    env = code_query.cmd_orient_many(FIXTURE, _BATCH_PATHS, "checkout", limit=1)
+    assert len(env["facts"]) == 1 and env["omitted"] > 0
+    assert {"CTR-order-confirm-001", "INV-checkout-001"} <= set(env["ids"])
+
+
+def test_orient_many_reads_path_independent_inputs_once(monkeypatch):
+    calls = {"epics": 0, "hotspots": 0, "debt": 0, "links": 0, "doc_freq": 0}
+
+    def counting(name, fn):
+        def wrapper(*a, **k):
+            calls[name] += 1
+            return fn(*a, **k)
+        return wrapper
+
+    monkeypatch.setattr(code_query, "discover_epics", counting("epics", code_query.discover_epics))
+    monkeypatch.setattr(code_query, "_load_hotspots", counting("hotspots", code_query._load_hotspots))
+    monkeypatch.setattr(code_query, "_load_debt", counting("debt", code_query._load_debt))
+    monkeypatch.setattr(
+        code_query, "_external_link_entries", counting("links", code_query._external_link_entries),
+    )
+    monkeypatch.setattr(
+        code_query, "_word_document_frequency", counting("doc_freq", code_query._word_document_frequency),
+    )
+    code_query.cmd_orient_many(FIXTURE, _BATCH_PATHS, "checkout")
+    assert calls == {"epics": 1, "hotspots": 1, "debt": 1, "links": 1, "doc_freq": 1}
+
+
+def test_orient_many_all_missing_is_inapplicable_and_empty_list_is_usage_error():
+    env = code_query.cmd_orient_many(FIXTURE, ["nope.py", "also/nope.py"], "checkout")
+    assert env["applicability"] == "inapplicable"
+    assert env["ids"] == [] and env["facts"] == []
+    with pytest.raises(code_query.UsageError):
+        code_query.run_verb(FIXTURE, "orient", [], epic="checkout")
+
+
+def test_cli_orient_with_several_paths_answers_one_batch():
+    r = subprocess.run(
+        [sys.executable, str(SCRIPT), "--repo", str(FIXTURE), "--epic", "checkout", "--format", "json",
+         "orient", "src/order.py", "ui/orders/page.tsx"],
+        capture_output=True, text=True,
+    )
+    assert r.returncode == 0, r.stderr
+    env = json.loads(r.stdout)
+    assert list(env["files"]) == ["src/order.py", "ui/orders/page.tsx"]
+    assert "CTR-order-confirm-001" in env["ids"]
+
+
 # --- governs ----------------------------------------------------------------------
 
 
@@ -739,6 +821,8 @@ def test_scanner_version_includes_both_checker_sources():
         cw / "languages.py",
         cw / "manifest.py", cw / "hashing.py",
         cw / "textio.py",
+        cw / "plane_b_index.py", cw / "emission_pool.py",
+        cw / "sqlite_store.py",
     )
     assert code_query._scanner_version() == expected
 
@@ -1001,7 +1085,7 @@ def test_governs_field_mode_scans_writers_once_across_epics(monkeypatch):
     """cmd_governs' field-name mode used to call check_single_writer.
     scan_writers ONCE PER EPIC with a matching invariant — E epics with a
     matching invariant meant E full-tree walks. Union the matching
-    invariants across epics and scan once."""
+    invariants across epics and scan (refresh Plane B) once."""
     inv_a = _sw_invariant("INV-a-001", "order.status", "src/order.py")
     inv_b = _sw_invariant("INV-b-001", "order.status", "src/order.py")
     epic_a = code_query.Epic(slug="epic-a", dir=FIXTURE / "docs" / "epics" / "checkout",
@@ -1011,13 +1095,14 @@ def test_governs_field_mode_scans_writers_once_across_epics(monkeypatch):
     monkeypatch.setattr(code_query, "discover_epics", lambda repo_root, epic=None: [epic_a, epic_b])
 
     calls = []
-    real_scan = check_single_writer.scan_writers
+    real_refresh = code_query.plane_b_index.refresh
 
-    def counting_scan(*a, **kw):
+    def counting_refresh(*a, **kw):
         calls.append((a, kw))
-        return real_scan(*a, **kw)
+        return real_refresh(*a, **kw)
 
-    monkeypatch.setattr(code_query.check_single_writer, "scan_writers", counting_scan)
+    # The tree is scanned through the Plane B index now; one refresh = one scan.
+    monkeypatch.setattr(code_query.plane_b_index, "refresh", counting_refresh)
 
     env = code_query.cmd_governs(FIXTURE, "order.status", None)
     assert len(calls) == 1, "one source scan regardless of epic count"
@@ -1036,13 +1121,14 @@ def test_writers_scans_once_across_epics_matching_by_field(monkeypatch):
     monkeypatch.setattr(code_query, "discover_epics", lambda repo_root, epic=None: [epic_a, epic_b])
 
     calls = []
-    real_scan = check_single_writer.scan_writers
+    real_refresh = code_query.plane_b_index.refresh
 
-    def counting_scan(*a, **kw):
+    def counting_refresh(*a, **kw):
         calls.append((a, kw))
-        return real_scan(*a, **kw)
+        return real_refresh(*a, **kw)
 
-    monkeypatch.setattr(code_query.check_single_writer, "scan_writers", counting_scan)
+    # The tree is scanned through the Plane B index now; one refresh = one scan.
+    monkeypatch.setattr(code_query.plane_b_index, "refresh", counting_refresh)
 
     env = code_query.cmd_writers(FIXTURE, "order.status", None)
     assert len(calls) == 1, "one source scan regardless of epic count"
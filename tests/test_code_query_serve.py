@@ -0,0 +1,189 @@
+"""Tests for ``code_query.py serve`` — the resident daemon answering verbs
+over a Unix socket.
+
+The contract: a daemon reply is the SAME envelope a one-shot call returns,
+and resident state is only ever reused while the tree it was computed from
+is provably unchanged (HEAD + manifest for Plane B, the epics tree's
+stat fingerprint for Plane A, the daemon's own scanner version for all of
+it).
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import code_query  # noqa: E402
+
+FIXTURE = Path(__file__).parent / "fixtures" / "code_query_repo"
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    r = tmp_path / "cq"
+    shutil.copytree(FIXTURE, r)
+    _git(r, "init", "-q", "--initial-branch=main")
+    _git(r, "config", "user.email", "test@example.com")
+    _git(r, "config", "user.name", "Test")
+    _git(r, "add", "-A")
+    _git(r, "commit", "-q", "-m", "fixture")
+    return r
+
+
+@pytest.fixture
+def sock_path():
+    # AF_UNIX paths cap near 100 bytes; pytest's tmp_path can be longer.
+    d = Path(tempfile.mkdtemp(prefix="cq-", dir="/tmp"))
+    yield d / "s.sock"
+    shutil.rmtree(d, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(repo, sock_path):
+    result: dict = {}
+    thread = threading.Thread(
+        target=lambda: result.update(exit=code_query.serve(repo, sock_path, idle_timeout=30)),
+        daemon=True,
+    )
+    thread.start()
+    for _ in range(200):
+        if sock_path.exists():
+            break
+        time.sleep(0.01)
+    yield sock_path, result, thread
+    if thread.is_alive():
+        code_query.query_daemon(sock_path, {"verb": "shutdown"})
+        thread.join(timeout=10)
+
+
+def _ask(sock_path: Path, **request) -> dict:
+    reply = code_query.query_daemon(sock_path, request)
+    assert reply is not None
+    return reply
+
+
+def _strip_cache_flag(env: dict) -> dict:
+    for f in env["facts"]:
+        f["provenance"].pop("from_cache", None)
+    return env
+
+
+def test_ping_reports_repo_and_scanner_version(daemon, repo):
+    sock_path, _result, _thread = daemon
+    reply = _ask(sock_path, verb="ping")
+    assert reply == {"ok": True, "repo": str(repo), "scanner_version": code_query._scanner_version()}
+
+
+@pytest.mark.parametrize("verb,arg", [
+    ("orient", "src/order.py"),
+    ("governs", "order.status"),
+    ("writers", "INV-checkout-001"),
+    ("guards", "CTR-order-confirm-001"),
+    ("trace", "CTR-order-confirm-001"),
+    ("show", "src/order.py:1"),
+])
+def test_daemon_replies_match_one_shot_envelopes(daemon, repo, verb, arg):
+    sock_path, _result, _thread = daemon
+    served = _ask(sock_path, verb=verb, arg=arg, epic="checkout", limit=100)
+    again = _ask(sock_path, verb=verb, arg=arg, epic="checkout", limit=100)
+    one_shot = code_query.run_verb(repo, verb, arg, epic="checkout", limit=100)
+    assert _strip_cache_flag(served) == _strip_cache_flag(again) == _strip_cache_flag(one_shot)
+
+
+def test_usage_errors_come_back_as_errors(daemon, repo):
+    sock_path, _result, _thread = daemon
+    assert "unknown verb" in _ask(sock_path, verb="frobnicate", arg="x")["error"]
+    assert "epic dir not found" in _ask(sock_path, verb="writers", arg="x", epic="nope")["error"]
+    assert "requires" in _ask(sock_path, verb="writers")["error"]
+
+
+def test_malformed_lines_do_not_kill_the_connection(daemon):
+    sock_path, _result, _thread = daemon
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(str(sock_path))
+        s.sendall(b"{not json\n" + json.dumps({"verb": "ping"}).encode() + b"\n")
+        reader = s.makefile("rb")
+        assert "malformed request" in json.loads(reader.readline())["error"]
+        assert json.loads(reader.readline())["ok"] is True
+
+
+def test_plane_b_is_reused_until_the_tree_changes(daemon, repo):
+    sock_path, _result, _thread = daemon
+    _ask(sock_path, verb="writers", arg="INV-checkout-001", epic="checkout")
+    _ask(sock_path, verb="guards", arg="CTR-order-confirm-001", epic="checkout")
+    assert code_query._RESIDENT.refreshes == 1
+
+    admin = repo / "src" / "admin.py"
+    admin.write_text(admin.read_text() + "\n# touched\n")
+    _ask(sock_path, verb="writers", arg="INV-checkout-001", epic="checkout")
+    assert code_query._RESIDENT.refreshes == 2
+
+    _git(repo, "commit", "-q", "-am", "touch")  # same content, new HEAD: provenance dirtiness moved
+    env = _ask(sock_path, verb="writers", arg="INV-checkout-001", epic="checkout")
+    assert code_query._RESIDENT.refreshes == 3
+    assert not any(f["provenance"]["dirty"] for f in env["facts"])
+
+
+def test_plane_a_edits_are_seen_on_the_next_request(daemon, repo):
+    sock_path, _result, _thread = daemon
+    before = _ask(sock_path, verb="writers", arg="INV-checkout-001", epic="checkout", limit=100)
+    assert any(not f["sanctioned"] for f in before["facts"])
+    sm = repo / "docs" / "epics" / "checkout" / "models" / "state-machines.json"
+    sm.write_text(sm.read_text().replace('"src/order.py"\n', '"src/order.py",\n        "src/admin.py"\n', 1))
+
+    after = _ask(sock_path, verb="writers", arg="INV-checkout-001", epic="checkout", limit=100)
+    assert all(f["sanctioned"] for f in after["facts"])
+
+
+def test_a_code_change_retires_the_daemon(daemon, monkeypatch):
+    sock_path, result, thread = daemon
+    monkeypatch.setattr(code_query, "_scanner_version", lambda: "edited-since-start")
+    reply = _ask(sock_path, verb="ping")
+    assert reply["stale"] is True
+    thread.join(timeout=10)
+    assert result["exit"] == 1
+    assert not sock_path.exists()
+
+
+def test_cli_socket_uses_the_daemon_and_falls_back_locally(daemon, repo, capsys, monkeypatch):
+    sock_path, _result, _thread = daemon
+    argv = ["--repo", str(repo), "--socket", str(sock_path), "writers", "INV-checkout-001"]
+    assert code_query.main(argv) == 0
+    via_daemon = json.loads(capsys.readouterr().out)
+    assert code_query._RESIDENT.refreshes == 1  # the daemon answered
+
+    code_query.query_daemon(sock_path, {"verb": "shutdown"})
+    _thread.join(timeout=10)
+    assert code_query.main(argv) == 0  # no daemon: answered in-process
+    local = json.loads(capsys.readouterr().out)
+    assert _strip_cache_flag(via_daemon) == _strip_cache_flag(local)
+
+
+def test_serve_refuses_a_socket_another_daemon_holds(daemon, repo, capsys):
+    sock_path, _result, _thread = daemon
+    assert code_query.serve(repo, sock_path, idle_timeout=1) == 2
+    assert "already serving" in capsys.readouterr().err
+
+
+def test_serve_replaces_a_stale_socket_file_and_honours_idle_timeout(repo, sock_path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(sock_path))
+    stale.close()  # the file stays; nobody listens
+    assert code_query.serve(repo, sock_path, idle_timeout=0.2) == 0
+    assert not sock_path.exists()
+    assert code_query._RESIDENT is None
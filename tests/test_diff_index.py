@@ -0,0 +1,161 @@
+"""Tests for scripts/chief_wiggum/diff_index.py — the streamed, per-file
+index behind ``review.capture_diff`` / ``run_review``.
+
+The contract: the index's byte ranges reproduce the diff exactly as a
+``text=True`` read returned it (universal newlines), a diff within budget
+renders unchanged, and an over-budget diff keeps whole files by relevance
+(lockfiles/vendored/binary dropped first) and names what it left out —
+without reading more than it keeps.
+"""
+
+from __future__ import annotations
+
+import io
+import subprocess
+
+import pytest
+from chief_wiggum import diff_index
+from chief_wiggum.diff_index import FileDiff, index_diff, rank
+
+SRC = (
+    "diff --git a/src/app.py b/src/app.py\n"
+    "index 1111111..2222222 100644\n"
+    "--- a/src/app.py\n"
+    "+++ b/src/app.py\n"
+    "@@ -1,2 +1,3 @@\n"
+    " keep\n"
+    "-old\n"
+    "+new\n"
+    "+++ added line that starts with two pluses\n"
+    "@@ -10 +11 @@\n"
+    "--- removed line that starts with two minuses\n"
+)
+LOCK = (
+    "diff --git a/package-lock.json b/package-lock.json\n"
+    "--- a/package-lock.json\n"
+    "+++ b/package-lock.json\n"
+    "@@ -1 +1 @@\n"
+    + "".join(f"+\"dep{i}\": \"1.0.{i}\",\n" for i in range(200))
+)
+BIN = (
+    "diff --git a/img/logo.png b/img/logo.png\n"
+    "index 3333333..4444444 100644\n"
+    "Binary files a/img/logo.png and b/img/logo.png differ\n"
+)
+TEST = (
+    "diff --git a/tests/test_app.py b/tests/test_app.py\n"
+    "--- a/tests/test_app.py\n"
+    "+++ b/tests/test_app.py\n"
+    "@@ -1 +1 @@\n"
+    "+def test_new(): pass\n"
+)
+DIFF = SRC + LOCK + BIN + TEST
+
+
+def _index(text: str):
+    return index_diff(io.BytesIO(text.encode()))
+
+
+def test_index_records_paths_ranges_and_counts():
+    with _index(DIFF) as idx:
+        assert idx.paths == ["src/app.py", "package-lock.json", "img/logo.png", "tests/test_app.py"]
+        assert idx.total_bytes == len(DIFF.encode())
+        assert "".join(idx.text(f.start, f.end) for f in idx.files) == DIFF
+        app, lock, logo, test = idx.files
+        assert (app.hunks, app.added, app.removed) == (2, 2, 2)
+        assert (lock.hunks, lock.added, lock.removed) == (1, 200, 0)
+        assert logo.binary and not app.binary
+        assert test.size == len(TEST.encode())
+
+
+def test_render_within_budget_is_the_raw_diff():
+    with _index(DIFF) as idx:
+        assert idx.render(len(DIFF.encode())) == DIFF
+
+
+def test_render_over_budget_drops_low_relevance_files_first_and_lists_them():
+    budget = len((SRC + TEST + BIN).encode()) + 10
+    with _index(DIFF) as idx:
+        out = idx.render(budget)
+    assert out.startswith(SRC)
+    assert "diff --git a/tests/test_app.py" in out
+    assert "+\"dep0\"" not in out  # the lockfile body was not shown...
+    assert "package-lock.json (+200/-0," in out  # ...but is named
+    assert "showing 3 of 4 files" in out
+    # Kept files stay in git's order.
+    assert out.index("src/app.py") < out.index("img/logo.png") < out.index("tests/test_app.py")
+
+
+def test_render_skips_a_file_too_large_but_keeps_smaller_later_ones():
+    big = SRC.replace("+new\n", "+new\n" + "+x\n" * 5000)
+    with _index(big + TEST) as idx:
+        out = idx.render(len(TEST.encode()) + 5)
+    assert out.startswith(TEST)
+    assert "src/app.py (+5002/-2," in out
+
+
+def test_render_with_no_file_sections_or_nothing_fitting_truncates_the_head():
+    with _index("y" * 5000) as idx:
+        out = idx.render(1000)
+    assert out.startswith("y" * 1000)
+    assert "diff truncated at 1000 bytes of 5000" in out
+    with _index(LOCK) as idx:
+        out = idx.render(100)
+    assert out.startswith(LOCK[:100])
+    assert f"diff truncated at 100 bytes of {len(LOCK)}" in out
+
+
+def test_long_lines_are_read_in_pieces_and_never_parsed_mid_line(monkeypatch):
+    monkeypatch.setattr(diff_index, "CHUNK_BYTES", 16)
+    text = SRC.replace("+new\n", "+" + "a" * 40 + "diff --git a/fake b/fake" + "\n")
+    with _index(text + TEST) as idx:
+        assert idx.paths == ["src/app.py", "tests/test_app.py"]
+        assert idx.render(10**6) == text + TEST
+
+
+def test_crlf_and_lone_cr_are_read_as_text_mode_would(monkeypatch):
+    crlf = SRC.replace("\n", "\r\n").replace(" keep\r\n", " ke\rep\r\n")
+    expected = io.TextIOWrapper(io.BytesIO(crlf.encode()), encoding="utf-8").read()
+    assert "\r" not in expected  # universal newlines, as text=True read it
+    for chunk in (diff_index.CHUNK_BYTES, 16):  # 16: a piece ends between a CR and its LF
+        monkeypatch.setattr(diff_index, "CHUNK_BYTES", chunk)
+        with _index(crlf + TEST) as idx:
+            assert idx.paths == ["src/app.py", "tests/test_app.py"]
+            assert idx.files[0].added == 2 and idx.files[0].removed == 2
+            assert idx.total_bytes == len((expected + TEST).encode())
+            assert idx.render(10**6) == expected + TEST
+
+
+@pytest.mark.parametrize("path,expected", [
+    ("src/app.py", 0), ("vendor/lib/x.go", 1), ("web/node_modules/a/index.js", 1),
+    ("go.sum", 1), ("ui/yarn.lock", 1), ("static/app.min.js", 1), ("vendor.py", 0),
+])
+def test_rank(path, expected):
+    assert rank(FileDiff(path=path, old_path=path, start=0)) == expected
+
+
+def test_capture_diff_index_streams_a_real_git_diff(tmp_path):
+    from chief_wiggum import review
+
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=tmp_path, check=True,
+                              capture_output=True, text=True)
+
+    git("init", "-q", "--initial-branch=main")
+    git("config", "user.name", "Ada")
+    git("config", "user.email", "ada@example.com")
+    (tmp_path / "a.py").write_text("a = 1\n")
+    git("add", "-A")
+    git("commit", "-q", "-m", "base")
+    git("checkout", "-q", "-b", "feature")
+    (tmp_path / "a.py").write_text("a = 2\n")
+    (tmp_path / "b.py").write_text("b = 1\n")
+    git("add", "-A")
+    git("commit", "-q", "-m", "change")
+
+    expected = git("diff", "main...HEAD").stdout
+    with review.capture_diff_index(tmp_path, "main") as idx:
+        assert idx.paths == ["a.py", "b.py"]
+        assert idx.render(10**6) == expected
+    with pytest.raises(review.ReviewError, match="base ref"):
+        review.capture_diff_index(tmp_path, "no-such-ref")
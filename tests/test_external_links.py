@@ -4,17 +4,24 @@ Tier behavior is tested WITHOUT any language server (``use_lsp=False`` or a
 suffix the LSP registry doesn't cover): the Python ast tier and the emitters'
 regex tier must stand on their own; the LSP tier's normalization is unit-tested
 purely (``_flatten_symbols``) plus via a monkeypatched span, never by spawning
-a real server.
+a real server. Session pooling is exercised against a scripted stand-in that
+speaks the LSP wire protocol over stdio and logs what it was asked.
 """
 
 from __future__ import annotations
 
 import json
 import subprocess
+import sys
+from pathlib import Path
 
 import pytest
 from chief_wiggum import external_links as xl
 
+# A stand-in language server speaking the LSP wire protocol over stdio (see
+# the fixture's docstring); it logs every spawn and documentSymbol request.
+STUB_SERVER = Path(__file__).parent / "fixtures" / "stub_lsp_server.py"
+
 PY_SRC = """\
 def create_order(req):
     if req.start > req.end:
@@ -233,6 +240,108 @@ def test_lsp_tier_is_used_when_it_yields_a_span(tmp_path, monkeypatch):
     assert span2.tier == "regex"
 
 
+# --- pooled sessions and per-file grouping ------------------------------------
+
+@pytest.fixture
+def stub_server(tmp_path, monkeypatch):
+    """Route ``.go`` files to the stand-in server; returns its log path."""
+    log = tmp_path / "stub.log"
+    server = xl.lsp.LspServer(
+        name="stub", command=(sys.executable, str(STUB_SERVER), str(log)),
+        language_id="go", extensions=(".go",),
+    )
+    monkeypatch.setattr(xl.lsp, "server_for_file", lambda p: server if str(p).endswith(".go") else None)
+    monkeypatch.setattr(xl.lsp, "server_available", lambda s: True)
+    return log
+
+
+def _many_go_links(root, store, files=4):
+    for n in range(files):
+        _write(root, f"pkg{n}/orders.go", GO_SRC)
+        for symbol in ("CreateOrder", "unrelated"):
+            xl.add_link(store, root, f"pkg{n}/orders.go", symbol, "guards",
+                        ["CTR-order-001"], use_lsp=False)
+
+
+def test_verify_uses_one_session_and_one_symbol_request_per_file(tmp_path, stub_server):
+    root = _target(tmp_path)
+    store = tmp_path / "external-links.json"
+    _many_go_links(root, store)
+    result = xl.verify_links(store, root, use_lsp=True, jobs=4)
+    assert [e["tier"] for e in result["ok"]] == ["lsp"] * 8
+    assert not result["suspect"] and not result["unresolved"]
+    log = stub_server.read_text().splitlines()
+    assert log.count("spawn") == 1  # one warm session for the whole run
+    assert sorted(x for x in log if x.startswith("symbols")) == ["symbols orders.go"] * 4
+    # Each file is open on the server only for its own query.
+    assert sorted(x for x in log if x.startswith("close")) == ["close orders.go"] * 4
+
+
+def test_lsp_spans_match_the_regex_tier_hashes(tmp_path, stub_server):
+    """The stand-in reports the same blocks the regex tier derives, so links
+    recorded without LSP verify ``ok`` through it — grouping and pooling do
+    not change what a span hashes to."""
+    root = _target(tmp_path)
+    store = tmp_path / "external-links.json"
+    _many_go_links(root, store, files=2)
+    pooled = xl.verify_links(store, root, use_lsp=True, jobs=1)
+    plain = xl.verify_links(store, root, use_lsp=False)
+    strip = lambda r: [(e["file"], e["symbol"], e["line"]) for e in r["ok"]]  # noqa: E731
+    assert strip(pooled) == strip(plain)
+
+
+def test_verify_result_is_independent_of_jobs(tmp_path):
+    root = _target(tmp_path)
+    store = tmp_path / "external-links.json"
+    for n in range(6):
+        _write(root, f"m{n}.py", PY_SRC)
+        xl.add_link(store, root, f"m{n}.py", "create_order", "guards", ["CTR-order-001"], use_lsp=False)
+        xl.add_link(store, root, f"m{n}.py", "unrelated", "guards", ["CTR-order-002"], use_lsp=False)
+    _write(root, "m2.py", PY_SRC.replace("return 1", "return 2"))
+    (root / "m4.py").unlink()
+    serial = xl.verify_links(store, root, use_lsp=False, jobs=1)
+    parallel = xl.verify_links(store, root, use_lsp=False, jobs=8)
+    assert serial == parallel
+    assert {k: len(v) for k, v in serial.items()} == {"ok": 9, "suspect": 1, "unresolved": 2}
+
+
+def test_resolver_reads_each_file_once(tmp_path, monkeypatch):
+    root = _target(tmp_path)
+    _write(root, "orders.py", PY_SRC)
+    reads = []
+    real = xl._SourceFile.__init__
+    monkeypatch.setattr(xl._SourceFile, "__init__",
+                        lambda self, full, text: (reads.append(full.name), real(self, full, text))[1])
+    with xl.SymbolResolver(root, use_lsp=False) as resolver:
+        for symbol in ("create_order", "unrelated", "TestOrders.test_create"):
+            span, reason = resolver.resolve("orders.py", symbol)
+            assert span is not None, reason
+    assert reads == ["orders.py"]
+
+
+def test_server_that_fails_to_start_is_tried_once(tmp_path, monkeypatch):
+    """A broken server costs one start attempt per run, and every link still
+    falls through to the regex tier."""
+    root = _target(tmp_path)
+    store = tmp_path / "external-links.json"
+    _many_go_links(root, store, files=3)
+    broken = xl.lsp.LspServer(name="broken", command=("definitely-not-a-language-server",),
+                              language_id="go", extensions=(".go",))
+    monkeypatch.setattr(xl.lsp, "server_for_file", lambda p: broken)
+    monkeypatch.setattr(xl.lsp, "server_available", lambda s: True)
+    starts = []
+    real_enter = xl.lsp.LspClient.__enter__
+
+    def counting_enter(self):
+        starts.append(self.server.name)
+        return real_enter(self)
+
+    monkeypatch.setattr(xl.lsp.LspClient, "__enter__", counting_enter)
+    result = xl.verify_links(store, root, use_lsp=True, jobs=3)
+    assert starts == ["broken"]
+    assert [e["tier"] for e in result["ok"]] == ["regex"] * 6
+
+
 # --- store: add / load / verify ----------------------------------------------
 
 
@@ -455,6 +455,139 @@ def test_until_ts_excludes_in_flight_turns(monkeypatch, tmp_path):
     assert {r["request_id"] for r in factory_log.read_log()} == {"early"}
 
 
+# ---- incremental ingest: per-transcript resume checkpoints --------------------
+# A re-run reads only bytes appended since the last one, so ingesting after every
+# session stays cheap. The checkpoint must never skip a turn a later run is owed:
+# one still being written, one beyond `until`, one before `since`.
+
+
+@pytest.fixture
+def scan_spy(monkeypatch):
+    """Record every ``(transcript name, start offset)`` the ingest reads from."""
+    calls: list[tuple[str, int]] = []
+    real = factory_log._scan_transcript
+
+    def spy(path, start, tail):
+        out = real(path, start, tail)
+        calls.append((Path(path).name, out[0]))
+        return out
+
+    monkeypatch.setattr(factory_log, "_scan_transcript", spy)
+    return calls
+
+
+def test_rerun_reads_only_appended_bytes(transcripts, scan_spy):
+    f = transcripts / "proj-a" / "s.jsonl"
+    first = _turn("req-1") + "\n"
+    f.write_text(first)
+    assert factory_log.ingest_claude_transcripts(transcripts) == 1
+
+    scan_spy.clear()
+    assert factory_log.ingest_claude_transcripts(transcripts) == 0
+    assert scan_spy == []  # unchanged file: not opened at all
+
+    with f.open("a") as fh:
+        fh.write(_turn("req-2") + "\n")
+    assert factory_log.ingest_claude_transcripts(transcripts) == 1
+    assert scan_spy == [("s.jsonl", len(first.encode()))]
+    assert [r["request_id"] for r in factory_log.read_log()] == ["req-1", "req-2"]
+
+
+def test_a_line_still_being_written_is_ingested_once_complete(transcripts):
+    f = transcripts / "proj-a" / "s.jsonl"
+    line = _turn("req-1")
+    f.write_text(line[:40])
+    assert factory_log.ingest_claude_transcripts(transcripts) == 0
+    f.write_text(line + "\n")
+    assert factory_log.ingest_claude_transcripts(transcripts) == 1
+
+
+def test_a_final_line_without_a_trailing_newline_is_ingested(transcripts, scan_spy):
+    f = transcripts / "proj-a" / "s.jsonl"
+    first = _turn("req-1") + "\n"
+    f.write_text(first + _turn("req-2"))
+    assert factory_log.ingest_claude_transcripts(transcripts) == 2
+
+    scan_spy.clear()
+    assert factory_log.ingest_claude_transcripts(transcripts) == 0  # re-read, deduped
+    assert scan_spy == [("s.jsonl", len(first.encode()))]
+
+    with f.open("a") as fh:
+        fh.write("\n" + _turn("req-3") + "\n")
+    assert factory_log.ingest_claude_transcripts(transcripts) == 1
+    assert [r["request_id"] for r in factory_log.read_log()] == ["req-1", "req-2", "req-3"]
+
+
+def test_turns_beyond_until_are_ingested_by_a_later_run(transcripts):
+    (transcripts / "proj-a" / "s.jsonl").write_text(
+        _turn("early", ts="2026-08-03T06:00:00.000Z") + "\n"
+        + _turn("late", ts="2026-08-03T07:00:00.000Z") + "\n")
+    cutoff = factory_log._parse_iso_ts("2026-08-03T06:30:00.000Z")
+    assert factory_log.ingest_claude_transcripts(transcripts, until=cutoff) == 1
+    assert factory_log.ingest_claude_transcripts(transcripts) == 1
+    assert [r["request_id"] for r in factory_log.read_log()] == ["early", "late"]
+
+
+def test_turns_before_since_are_ingested_by_a_wider_later_run(transcripts, scan_spy):
+    (transcripts / "proj-a" / "s.jsonl").write_text(
+        _turn("early", ts="2026-08-03T06:00:00.000Z") + "\n"
+        + _turn("late", ts="2026-08-03T07:00:00.000Z") + "\n")
+    since = factory_log._parse_iso_ts("2026-08-03T06:30:00.000Z")
+    assert factory_log.ingest_claude_transcripts(transcripts, since=since) == 1
+
+    with (transcripts / "proj-a" / "s.jsonl").open("a") as fh:
+        fh.write(_turn("later", ts="2026-08-03T08:00:00.000Z") + "\n")
+    scan_spy.clear()
+    assert factory_log.ingest_claude_transcripts(transcripts, since=since) == 1
+    assert scan_spy[0][1] > 0  # same window: the checkpoint still holds
+
+    scan_spy.clear()
+    assert factory_log.ingest_claude_transcripts(transcripts) == 1
+    assert scan_spy == [("s.jsonl", 0)]  # the window widened back over "early"
+    assert {r["request_id"] for r in factory_log.read_log()} == {"early", "late", "later"}
+
+
+def test_a_rewritten_transcript_is_re_read_from_the_start(transcripts, scan_spy):
+    f = transcripts / "proj-a" / "s.jsonl"
+    f.write_text(_turn("req-1") + "\n")
+    factory_log.ingest_claude_transcripts(transcripts)
+    f.write_text(_turn("req-9", tin=7) + "\n" + _turn("req-10") + "\n")  # same inode, new bytes
+    scan_spy.clear()
+    assert factory_log.ingest_claude_transcripts(transcripts) == 2
+    assert scan_spy == [("s.jsonl", 0)]
+
+
+def test_a_rotated_log_voids_every_checkpoint(transcripts):
+    (transcripts / "proj-a" / "s.jsonl").write_text(_turn("req-1") + "\n" + _turn("req-2") + "\n")
+    assert factory_log.ingest_claude_transcripts(transcripts) == 2
+    factory_log.log_path().write_text("")
+    assert factory_log.ingest_claude_transcripts(transcripts) == 2
+
+
+def test_pooled_parse_writes_the_same_ledger_as_a_serial_one(transcripts, monkeypatch, tmp_path):
+    for i in range(4):
+        lines = [_turn(f"r{i}-{j}", tin=10 * i + j + 1, sidechain=bool(j % 2)) for j in range(5)]
+        (transcripts / "proj-a" / f"s{i}.jsonl").write_text("\n".join(lines) + "\n")
+
+    monkeypatch.setenv("CW_FACTORY_LOG", str(tmp_path / "serial.jsonl"))
+    monkeypatch.setenv("CW_SCAN_WORKERS", "1")
+    assert factory_log.ingest_claude_transcripts(transcripts) == 20
+
+    monkeypatch.setenv("CW_FACTORY_LOG", str(tmp_path / "pooled.jsonl"))
+    monkeypatch.setenv("CW_SCAN_WORKERS", "3")
+    monkeypatch.setattr(factory_log, "_PARALLEL_TRANSCRIPT_BYTES", 0)
+    assert factory_log.ingest_claude_transcripts(transcripts) == 20
+    assert (tmp_path / "pooled.jsonl").read_text() == (tmp_path / "serial.jsonl").read_text()
+
+
+def test_no_index_escape_hatch_re_reads_and_still_dedups(transcripts, monkeypatch, scan_spy):
+    monkeypatch.setenv("CW_FACTORY_LOG_NO_INDEX", "1")
+    (transcripts / "proj-a" / "s.jsonl").write_text(_turn("req-1") + "\n")
+    assert factory_log.ingest_claude_transcripts(transcripts) == 1
+    assert factory_log.ingest_claude_transcripts(transcripts) == 0
+    assert scan_spy == [("s.jsonl", 0), ("s.jsonl", 0)]
+
+
 # ---- count_transcript_turns: independent evidence, never a write (#345 AC4) -
 
 def test_count_transcript_turns_reports_buckets_without_writing(monkeypatch, tmp_path):
@@ -0,0 +1,153 @@
+"""Tests for the streaming, filtered factory-log reader (``factory_log.iter_log``)
+and its sidecar offset index (``chief_wiggum/log_index.py``).
+
+The contract is parity: a filtered read served through the index yields exactly
+the records a linear ``CW_FACTORY_LOG_NO_INDEX=1`` scan yields, in file order —
+across appends, a write in flight, a rewritten log, and a corrupt or unusable
+sidecar.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import factory_log  # noqa: E402
+from chief_wiggum import log_index  # noqa: E402
+
+RECORDS = [
+    {"ts": 100.0, "event": "gate", "repo": "acme/app", "name": "ratchet", "result": "pass"},
+    {"ts": 200.0, "event": "claude_code", "repo": "app", "request_id": "req-1", "ticket": "42"},
+    {"ts": 300.0, "event": "consult", "repo": "acme/app", "provider": "codex", "ticket": 42},
+    {"ts": "2026-01-01T00:00:00Z", "event": "claude_code", "repo": "app", "request_id": "req-2"},
+    {"ts": 400, "event": "claude_code", "repo": "acme/app", "request_id": "req-3"},
+    {"ts": 500.0, "event": "query", "verb": "governs"},
+]
+
+
+def _write(log: Path, records, *, mode: str = "w", tail: str = "") -> None:
+    with log.open(mode) as fh:
+        for r in records:
+            fh.write(json.dumps(r) + "\n")
+        fh.write(tail)
+
+
+@pytest.fixture
+def log(tmp_path):
+    path = factory_log.log_path()
+    lines = [json.dumps(r) for r in RECORDS[:3]] + ["", "{not json", "[1, 2]"]
+    lines += [json.dumps(r) for r in RECORDS[3:]]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def _linear(monkeypatch, **filters) -> list[dict]:
+    with monkeypatch.context() as m:
+        m.setenv(log_index.NO_INDEX_ENV, "1")
+        return factory_log.read_log(**filters)
+
+
+FILTERS = [
+    {"event": "claude_code"},
+    {"repo": "acme/app"},
+    {"ticket": "42"},
+    {"ticket": 42},
+    {"since": 200, "until": 400},
+    {"since": 250},
+    {"event": "claude_code", "repo": "app", "until": 300},
+    {"event": "escape"},
+]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_indexed_read_matches_a_linear_scan(log, monkeypatch, filters):
+    indexed = factory_log.read_log(**filters)
+    assert indexed == _linear(monkeypatch, **filters)
+    assert indexed == [r for r in factory_log.read_log() if factory_log._matches(r, **filters)]
+
+
+def test_filters_push_down_to_exact_offsets(log):
+    positions, end = log_index.offsets(log, event="claude_code")
+    assert end == log.stat().st_size
+    with log.open("rb") as fh:
+        ids = []
+        for pos in positions:
+            fh.seek(pos)
+            ids.append(json.loads(fh.readline())["request_id"])
+    assert ids == ["req-1", "req-2", "req-3"]
+
+
+def test_window_is_inclusive_and_skips_non_numeric_timestamps(log):
+    assert [r["ts"] for r in factory_log.iter_log(since=200, until=400)] == [200.0, 300.0, 400]
+
+
+def test_ticket_matches_both_tag_spellings(log):
+    assert [r["event"] for r in factory_log.iter_log(ticket="42")] == ["claude_code", "consult"]
+
+
+def test_unfiltered_read_keeps_every_parsable_line(log):
+    assert factory_log.read_log() == RECORDS[:3] + [[1, 2]] + RECORDS[3:]
+    assert not log_index.sidecar_path(log).exists()  # nothing to push down, no index built
+
+
+def test_appends_are_indexed_incrementally(log):
+    assert len(factory_log.read_log(event="gate")) == 1
+    size = log.stat().st_size
+    _write(log, [{"ts": 600.0, "event": "gate", "name": "ci"}], mode="a")
+
+    assert [r["name"] for r in factory_log.iter_log(event="gate")] == ["ratchet", "ci"]
+    conn = sqlite3.connect(str(log_index.sidecar_path(log)))
+    indexed = dict(conn.execute("SELECT key, value FROM meta"))["indexed_bytes"]
+    rows = conn.execute("SELECT COUNT(*) FROM records WHERE pos >= ?", (size,)).fetchone()[0]
+    conn.close()
+    assert int(indexed) == log.stat().st_size
+    assert rows == 1
+
+
+def test_a_line_still_being_written_is_read_live_not_indexed(log):
+    _write(log, [], mode="a", tail=json.dumps({"ts": 700.0, "event": "gate", "name": "late"}))
+    assert [r["name"] for r in factory_log.iter_log(event="gate")] == ["ratchet", "late"]
+    _positions, end = log_index.offsets(log, event="gate")
+    assert end < log.stat().st_size
+
+
+def test_a_rewritten_log_rebuilds_the_index(log):
+    assert len(factory_log.read_log(event="claude_code")) == 3
+    _write(log, [{"ts": 1.0, "event": "claude_code", "request_id": "fresh"}])
+    assert [r["request_id"] for r in factory_log.iter_log(event="claude_code")] == ["fresh"]
+    assert factory_log.ingested_request_ids() == {"fresh"}
+
+
+def test_a_corrupt_sidecar_is_rebuilt(log, monkeypatch):
+    log_index.sidecar_path(log).write_bytes(b"definitely not sqlite" * 64)
+    assert factory_log.read_log(repo="acme/app") == _linear(monkeypatch, repo="acme/app")
+    assert log_index.offsets(log, repo="acme/app") is not None
+
+
+def test_an_unusable_sidecar_degrades_to_a_linear_scan(log, monkeypatch):
+    log_index.sidecar_path(log).mkdir()  # cannot be opened, cannot be replaced
+    assert log_index.offsets(log, event="gate") is None
+    assert factory_log.read_log(event="claude_code") == _linear(monkeypatch, event="claude_code")
+    assert factory_log.ingested_request_ids() == {"req-1", "req-2", "req-3"}
+
+
+def test_ingested_request_ids_come_from_the_persisted_set(log, monkeypatch):
+    assert factory_log.ingested_request_ids() == {"req-1", "req-2", "req-3"}
+    _write(log, [{"ts": 800.0, "event": "claude_code", "request_id": "req-4"}], mode="a",
+           tail=json.dumps({"ts": 801.0, "event": "claude_code", "request_id": "req-5"}))
+    assert factory_log.ingested_request_ids() == {"req-1", "req-2", "req-3", "req-4", "req-5"}
+
+    monkeypatch.setenv(log_index.NO_INDEX_ENV, "1")
+    assert factory_log.ingested_request_ids() == {"req-1", "req-2", "req-3", "req-4", "req-5"}
+
+
+def test_missing_log_reads_empty(tmp_path):
+    assert factory_log.read_log(tmp_path / "absent.jsonl", event="gate") == []
+    assert factory_log.ingested_request_ids() == set()
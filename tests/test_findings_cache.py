@@ -7,6 +7,9 @@ operator's real ``~/.chief-wiggum/cache/findings``.
 
 from __future__ import annotations
 
+import json
+import sqlite3
+
 from chief_wiggum import findings_cache as fc
 
 # --- load/store roundtrip ----------------------------------------------------
@@ -26,11 +29,20 @@ def test_load_is_a_miss_when_nothing_stored(tmp_path):
 
 def test_load_tolerates_corrupt_cache_file(tmp_path):
     repo = str(tmp_path / "r")
-    path = fc._entry_path(repo, "check_traceability", "order.py", "abc123", "scanner-v1")
-    path.write_text("{not json")
+    fc._db_path(repo).write_bytes(b"{not a database at all" * 64)
     assert fc.load(repo, "check_traceability", "order.py", "abc123", "scanner-v1") is None
 
 
+def test_store_recovers_from_a_corrupt_cache_file(tmp_path):
+    """The database is derived data: a corrupt one is discarded on the write
+    path and rebuilt, costing one cold scan rather than a permanently dead
+    cache."""
+    repo = str(tmp_path / "r")
+    fc._db_path(repo).write_bytes(b"{not a database at all" * 64)
+    fc.store(repo, "check_traceability", "order.py", "abc123", "v1", [{"a": 1}])
+    assert fc.load(repo, "check_traceability", "order.py", "abc123", "v1") == [{"a": 1}]
+
+
 def test_different_engines_do_not_collide(tmp_path):
     repo = str(tmp_path / "r")
     fc.store(repo, "check_traceability", "order.py", "abc123", "v1", [{"a": 1}])
@@ -90,18 +102,160 @@ def test_no_cache_env_disables_both_read_and_write(tmp_path, monkeypatch):
 # --- malformed on-disk data never crashes ------------------------------------
 
 
-def test_load_rejects_non_dict_json(tmp_path):
+def _raw_put(repo: str, rel: str, blob_sha: str, scanner_hash: str, payload: str) -> None:
+    """Write a row behind the API's back — a hand-edited or half-migrated entry."""
+    fc.store(repo, "check_traceability", "seed.py", "seed", scanner_hash, [])
+    conn = sqlite3.connect(str(fc._db_path(repo)))
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO findings VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ("check_traceability", rel, blob_sha, scanner_hash, payload, len(payload), 0),
+        )
+    conn.close()
+
+
+def test_load_rejects_non_json_payload(tmp_path):
     repo = str(tmp_path / "r")
-    path = fc._entry_path(repo, "check_traceability", "order.py", "sha1", "v1")
-    path.write_text("[1, 2, 3]")
+    _raw_put(repo, "order.py", "sha1", "v1", "{not json")
     assert fc.load(repo, "check_traceability", "order.py", "sha1", "v1") is None
 
 
 def test_load_rejects_non_list_findings(tmp_path):
-    import json
     repo = str(tmp_path / "r")
-    path = fc._entry_path(repo, "check_traceability", "order.py", "sha1", "v1")
-    path.write_text(json.dumps({
-        "rel": "order.py", "blob_sha": "sha1", "scanner_hash": "v1", "findings": "not-a-list",
-    }))
+    _raw_put(repo, "order.py", "sha1", "v1", json.dumps({"findings": "not-a-list"}))
     assert fc.load(repo, "check_traceability", "order.py", "sha1", "v1") is None
+
+
+# --- packed storage: bulk APIs ------------------------------------------------
+
+
+def test_store_many_then_load_many_roundtrips_only_matching_blobs(tmp_path):
+    repo = str(tmp_path / "r")
+    fc.store_many(repo, "check_traceability", "v1", [
+        ("a.py", "sha-a", [{"n": 1}]),
+        ("b.py", "sha-b", [{"n": 2}]),
+        ("c.py", "sha-c", []),
+    ])
+    got = fc.load_many(repo, "check_traceability", "v1", {
+        "a.py": "sha-a",       # hit
+        "b.py": "sha-b-EDITED",  # content moved on -> miss
+        "c.py": "sha-c",       # hit with zero findings is still a hit
+        "d.py": "sha-d",       # never stored
+    })
+    assert got == {"a.py": [{"n": 1}], "c.py": []}
+
+
+def test_one_database_file_per_repo(tmp_path):
+    """The inode problem this backend exists to fix: thousands of entries
+    across engines and scanner versions still occupy one file."""
+    repo = str(tmp_path / "r")
+    for gen in ("v1", "v2"):
+        for engine in ("check_traceability", "check_single_writer"):
+            fc.store_many(repo, engine, gen, [(f"f{i}.py", f"s{i}", [{"i": i}]) for i in range(200)])
+    entries = [p.name for p in fc._root().iterdir()]
+    assert entries == [fc._db_path(repo).name] or set(entries) <= {
+        fc._db_path(repo).name, f"{fc._db_path(repo).name}-wal", f"{fc._db_path(repo).name}-shm"}
+
+
+def test_legacy_per_entry_json_layout_is_removed(tmp_path):
+    repo = str(tmp_path / "r")
+    legacy = fc._root() / fc._repo_id(repo) / "check_traceability"
+    legacy.mkdir(parents=True)
+    (legacy / "deadbeef.json").write_text("{}")
+    fc.store(repo, "check_traceability", "order.py", "sha1", "v1", [])
+    assert not legacy.parent.exists()
+
+
+def test_store_many_is_all_or_nothing(tmp_path, monkeypatch):
+    repo = str(tmp_path / "r")
+    fc.store(repo, "check_traceability", "keep.py", "k", "v1", [{"kept": True}])
+
+    def boom(*_a, **_k):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    real_evict = fc._evict
+    monkeypatch.setattr(fc, "_evict", boom)  # fails after the INSERT, inside the transaction
+    fc.store_many(repo, "check_traceability", "v1", [("new.py", "n", [{"new": True}])])
+    monkeypatch.setattr(fc, "_evict", real_evict)
+    assert fc.load(repo, "check_traceability", "new.py", "n", "v1") is None  # rolled back
+    assert fc.load(repo, "check_traceability", "keep.py", "k", "v1") == [{"kept": True}]
+
+
+# --- packed storage: bounded size ---------------------------------------------
+
+
+def _payload_bytes(repo: str) -> int:
+    conn = sqlite3.connect(str(fc._db_path(repo)))
+    (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM findings").fetchone()
+    conn.close()
+    return total
+
+
+def _age(repo: str, scanner_hash: str, last_used: int) -> None:
+    conn = sqlite3.connect(str(fc._db_path(repo)))
+    with conn:
+        conn.execute("UPDATE findings SET last_used = ? WHERE scanner_hash = ?", (last_used, scanner_hash))
+    conn.close()
+
+
+def test_eviction_drops_stale_scanner_generations_before_the_live_one(tmp_path, monkeypatch):
+    repo = str(tmp_path / "r")
+    big = [{"pad": "x" * 1000}]
+    fc.store_many(repo, "check_traceability", "gen-old", [(f"f{i}.py", "s", big) for i in range(5)])
+    fc.store_many(repo, "check_traceability", "gen-mid", [(f"f{i}.py", "s", big) for i in range(5)])
+    _age(repo, "gen-old", 100)
+    _age(repo, "gen-mid", 200)
+    monkeypatch.setenv(fc.MAX_BYTES_ENV, str(12_000))
+    fc.store_many(repo, "check_traceability", "gen-live", [(f"f{i}.py", "s", big) for i in range(5)])
+
+    assert fc.load(repo, "check_traceability", "f0.py", "s", "gen-old") is None  # LRU generation gone
+    assert fc.load(repo, "check_traceability", "f0.py", "s", "gen-mid") == big  # fits: kept
+    assert all(
+        fc.load(repo, "check_traceability", f"f{i}.py", "s", "gen-live") == big for i in range(5))
+    assert _payload_bytes(repo) <= 12_000
+
+
+def test_eviction_trims_the_live_generation_lru_first_when_it_alone_is_over(tmp_path, monkeypatch):
+    repo = str(tmp_path / "r")
+    big = [{"pad": "x" * 1000}]
+    fc.store_many(repo, "check_traceability", "live", [("old.py", "s", big)])
+    _age(repo, "live", 0)  # old.py: least recently used
+    monkeypatch.setenv(fc.MAX_BYTES_ENV, str(2_500))
+    fc.store_many(repo, "check_traceability", "live", [("a.py", "s", big), ("b.py", "s", big)])
+
+    assert fc.load(repo, "check_traceability", "old.py", "s", "live") is None
+    assert fc.load(repo, "check_traceability", "a.py", "s", "live") == big
+    assert fc.load(repo, "check_traceability", "b.py", "s", "live") == big
+
+
+def test_a_hit_refreshes_its_lru_stamp(tmp_path, monkeypatch):
+    repo = str(tmp_path / "r")
+    fc.store(repo, "check_traceability", "a.py", "s", "v1", [])
+    conn = sqlite3.connect(str(fc._db_path(repo)))
+    with conn:
+        conn.execute("UPDATE findings SET last_used = 0")
+    conn.close()
+    assert fc.load(repo, "check_traceability", "a.py", "s", "v1") == []
+    conn = sqlite3.connect(str(fc._db_path(repo)))
+    (stamp,) = conn.execute("SELECT last_used FROM findings WHERE rel = 'a.py'").fetchone()
+    conn.close()
+    assert stamp > 0
+
+
+def test_eviction_never_drops_another_engines_live_generation(tmp_path, monkeypatch):
+    repo = str(tmp_path / "r")
+    big = [{"pad": "x" * 1000}]
+    fc.store_many(repo, "check_single_writer", "sw-old", [(f"f{i}.py", "s", big) for i in range(3)])
+    fc.store_many(repo, "check_single_writer", "sw-live", [(f"f{i}.py", "s", big) for i in range(3)])
+    _age(repo, "sw-old", 100)
+    _age(repo, "sw-live", 200)  # older than anything traceability writes below
+    monkeypatch.setenv(fc.MAX_BYTES_ENV, str(7_000))
+    fc.store_many(repo, "check_traceability", "tr-live", [(f"f{i}.py", "s", big) for i in range(5)])
+
+    assert fc.load(repo, "check_single_writer", "f0.py", "s", "sw-old") is None  # stale: gone
+    assert all(  # single-writer's most recent generation survives a traceability write
+        fc.load(repo, "check_single_writer", f"f{i}.py", "s", "sw-live") == big for i in range(3))
+    # Still over budget: traceability trims its OWN live entries, never single-writer's.
+    kept = [fc.load(repo, "check_traceability", f"f{i}.py", "s", "tr-live") for i in range(5)]
+    assert kept.count(None) > 0
+    assert _payload_bytes(repo) <= 7_000
@@ -151,6 +151,150 @@ def test_enumerate_paths_captures_guard_descriptions():
     assert paths[0][0]["guards"] == ["payment settled"]
 
 
+def _dense(n: int) -> dict:
+    """n states, every state linked to every later one plus a back edge —
+    far too many simple paths to enumerate."""
+    states = {f"s{i}": {} for i in range(n)}
+    states["done"] = {"type": "terminal"}
+    transitions = [
+        {"from": f"s{i}", "to": f"s{j}", "event": f"e{i}_{j}"}
+        for i in range(n) for j in range(i + 1, n)
+    ]
+    transitions += [{"from": f"s{i}", "to": "s0", "event": f"back{i}"} for i in range(1, n)]
+    transitions += [{"from": f"s{i}", "to": "done", "event": f"fin{i}"} for i in range(n)]
+    return _sm(states=states, transitions=transitions, initial="s0")
+
+
+def _recursive_paths(sm, max_depth=20):
+    """The recursive DFS enumerate_paths used to be — the order reference."""
+    terminal = {s for s, d in sm["states"].items() if d.get("type") == "terminal"}
+    out = []
+
+    def dfs(state, path, visited):
+        if state in terminal:
+            out.append(list(path))
+            return
+        if len(path) >= max_depth:
+            return
+        for t in sm["transitions"]:
+            if t["from"] != state or t["to"] in visited:
+                continue
+            path.append((t["event"], t["to"]))
+            visited.add(t["to"])
+            dfs(t["to"], path, visited)
+            visited.discard(t["to"])
+            path.pop()
+
+    dfs(sm["initial"], [], {sm["initial"]})
+    return out
+
+
+def test_iter_paths_streams_the_recursive_order_and_honours_budgets():
+    sm = _dense(6)
+    streamed = [[(s["event"], s["next_state"]) for s in p] for p in fm.iter_paths(sm)]
+    assert streamed == _recursive_paths(sm)
+    assert [[(s["event"], s["next_state"]) for s in p] for p in fm.iter_paths(sm, max_depth=3)] \
+        == _recursive_paths(sm, max_depth=3)
+    assert len(fm.enumerate_paths(sm, max_paths=5)) == 5
+    # The budget stops the walk itself: a machine with billions of simple
+    # paths still yields its first few immediately.
+    assert len(list(fm.iter_paths(_dense(40), max_paths=3))) == 3
+
+
+def _covered(paths):
+    events = [[s["event"] for s in p] for p in paths]
+    return {e for p in events for e in p}, {pair for p in events for pair in zip(p, p[1:], strict=False)}
+
+
+def test_transition_coverage_walks_every_reachable_transition_once_per_gap():
+    sm = _dense(30)
+    paths = list(fm.covering_paths(sm, "transition"))
+    singles, _ = _covered(paths)
+    assert singles == {t["event"] for t in sm["transitions"]}
+    assert len(paths) <= len(sm["transitions"])
+    for path in paths:
+        assert path[0]["state"] == "s0" and path[-1]["next_state"] == "done"
+        # Consecutive steps chain: each starts where the previous ended.
+        assert all(a["next_state"] == b["state"] for a, b in zip(path, path[1:], strict=False))
+
+
+def test_edge_pair_coverage_walks_every_consecutive_pair():
+    sm = _dense(8)
+    paths = list(fm.covering_paths(sm, "edge-pair"))
+    singles, pairs = _covered(paths)
+    expected = {
+        (t["event"], u["event"])
+        for t in sm["transitions"] for u in sm["transitions"] if t["to"] == u["from"]
+    }
+    assert pairs >= expected
+    assert singles == {t["event"] for t in sm["transitions"]}
+
+
+def test_covering_paths_skip_unreachable_and_respect_budget():
+    sm = _sm(
+        states={"a": {}, "b": {}, "orphan": {}, "stuck": {}, "done": {"type": "terminal"}},
+        transitions=[
+            {"from": "a", "to": "b", "event": "go"},
+            {"from": "b", "to": "done", "event": "finish"},
+            {"from": "b", "to": "stuck", "event": "wedge"},
+            {"from": "orphan", "to": "done", "event": "never"},
+        ],
+    )
+    paths = list(fm.covering_paths(sm))
+    assert [[s["event"] for s in p] for p in paths] == [["go", "finish"], ["go", "wedge"]]
+    assert len(list(fm.covering_paths(sm, max_paths=1))) == 1
+    import pytest
+
+    with pytest.raises(ValueError):
+        list(fm.covering_paths(sm, "all-paths"))
+
+
+# --- path analysis engine ---------------------------------------------------
+
+
+def test_shortest_paths_reach_every_reachable_state_by_bfs():
+    sm = _dense(5)
+    sm["states"]["orphan"] = {}
+    paths = fm.shortest_paths(sm)
+    assert "orphan" not in paths and paths["s0"] == []
+    assert [s["event"] for s in paths["s4"]] == ["e0_4"]
+    assert [s["event"] for s in paths["done"]] == ["fin0"]
+
+
+def test_simple_path_count_is_exact_on_a_dag_and_bounded_on_a_cycle():
+    dag = _dense(8)
+    dag["transitions"] = [t for t in dag["transitions"] if not t["event"].startswith("back")]
+    assert fm.count_simple_paths(dag) == (len(fm.enumerate_paths(dag)), True)
+    # A 60-state DAG has ~2^58 paths: counted, never walked.
+    big = _dense(60)
+    big["transitions"] = [t for t in big["transitions"] if not t["event"].startswith("back")]
+    count, exact = fm.count_simple_paths(big)
+    assert exact and count == 2 ** 59
+    cyclic = _dense(6)
+    assert fm.count_simple_paths(cyclic) == (len(fm.enumerate_paths(cyclic)), True)
+    assert fm.count_simple_paths(_dense(30), budget=50) == (50, False)
+
+
+def test_path_report_summarizes_and_is_memoized_by_content(monkeypatch):
+    sm = _dense(6)
+    sm["states"]["orphan"] = {}
+    report = fm.path_report(sm)
+    summary = report["summary"]
+    assert summary["total_paths"] == len(report["paths"])
+    assert summary["transitions_covered"] == len(sm["transitions"])
+    assert summary["states_covered"] == summary["shortest_paths_count"] == 7
+    assert summary["unreachable_states"] == ["orphan"]
+    assert all(p["target"] == "done" and p["length"] == len(p["steps"]) for p in report["paths"])
+
+    # Same content, different key order: served from the memo, not recomputed.
+    monkeypatch.setattr(fm, "covering_paths", lambda *a, **k: (_ for _ in ()).throw(AssertionError))
+    reordered = dict(reversed(list(sm.items())))
+    again = fm.path_report(reordered)
+    assert again == report
+    again["paths"].clear()  # a copy: the memo is untouched
+    assert fm.path_report(sm) == report
+
+
 # --- to_xstate --------------------------------------------------------------
 
 
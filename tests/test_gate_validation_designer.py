@@ -16,8 +16,10 @@ via its own validation record later, per docs/gate-rollout.md). Subcommands:
 - extract-seeds: materializes a record's trials into
   docs/quality/validation/seeds/<gate>.seeds.json so seeds version
   independently of gate code (the settled #218 note).
-- mutate: best-effort mutmut leg — surviving mutants are proposed seed-class
-  candidates; skipped-with-instructions when mutmut is absent, never silent.
+- mutate: best-effort mutation leg — surviving mutants are proposed seed-class
+  candidates. The native engine (default) runs a toy gate end to end; the
+  mutmut engine is skipped-with-instructions when mutmut is absent, never
+  silent.
 
 Tests use a tiny synthetic gate/record fixture rather than the real 7 (real
 runs are operator-invoked); a final smoke test runs the CLI against the real
@@ -505,11 +507,11 @@ def test_escapes_view_reads_only_log_and_records(toy_dirs, tmp_path, monkeypatch
     assert rows[0]["verdict"] == "DEMOTION"
 
 
-# --- mutate: best-effort mutmut leg --------------------------------------------
+# --- mutate: best-effort mutation leg ------------------------------------------
 
 
 def test_mutate_without_mutmut_is_skipped_with_instructions(tmp_path):
-    result = gvd.mutate_gate("toy_gate", scripts_dir=tmp_path, mutmut_available=False)
+    result = gvd.mutate_gate("toy_gate", scripts_dir=tmp_path, engine="mutmut", mutmut_available=False)
     assert result["status"] == "skipped"
     assert "pip install mutmut" in result["instructions"]
     assert "mutate toy_gate" in result["instructions"]
@@ -530,7 +532,7 @@ def test_mutate_nonzero_run_exit_is_failed_not_clean(tmp_path):
         return subprocess.CompletedProcess(
             cmd, 2, stdout="", stderr="Error: no such option: --paths-to-mutate\n")
 
-    result = gvd.mutate_gate("toy_gate", scripts_dir=tmp_path, mutmut_available=True,
+    result = gvd.mutate_gate("toy_gate", scripts_dir=tmp_path, engine="mutmut", mutmut_available=True,
                              runner=fake_run)
     assert result["status"] == "failed"
     assert "NOT a clean result" in result["detail"]
@@ -553,7 +555,7 @@ def test_cli_mutate_failed_run_still_exits_zero(monkeypatch, capsys):
 
 
 def test_mutate_missing_gate_script_is_reported(tmp_path):
-    result = gvd.mutate_gate("toy_gate", scripts_dir=tmp_path, mutmut_available=True)
+    result = gvd.mutate_gate("toy_gate", scripts_dir=tmp_path, engine="mutmut", mutmut_available=True)
     assert result["status"] == "error"
     assert "toy_gate.py" in result["detail"]
 
@@ -573,7 +575,7 @@ def test_mutate_parses_surviving_mutants_into_seed_candidates(tmp_path):
 
     result = gvd.mutate_gate(
         "toy_gate", scripts_dir=tmp_path, tests_path=tmp_path / "test_toy_gate.py",
-        mutmut_available=True, runner=fake_run, max_mutants=10)
+        engine="mutmut", mutmut_available=True, runner=fake_run, max_mutants=10)
     assert result["status"] == "ran"
     assert result["surviving_mutants"] == [4, 5, 9]
     assert len(result["candidates"]) == 3
@@ -594,7 +596,7 @@ def test_mutate_caps_reported_candidates_at_max_mutants(tmp_path):
             cmd, 0, stdout="Survived 🙁 (5)\n\n---- toy_gate.py (5) ----\n\n1-5\n",
             stderr="")
 
-    result = gvd.mutate_gate("toy_gate", scripts_dir=tmp_path, mutmut_available=True,
+    result = gvd.mutate_gate("toy_gate", scripts_dir=tmp_path, engine="mutmut", mutmut_available=True,
                              runner=fake_run, max_mutants=2)
     assert result["surviving_mutants"] == [1, 2, 3, 4, 5]
     assert len(result["candidates"]) == 2
@@ -611,7 +613,7 @@ def test_mutate_timeout_is_partial_not_silent(tmp_path):
             cmd, 0, stdout="Survived 🙁 (1)\n\n---- toy_gate.py (1) ----\n\n7\n",
             stderr="")
 
-    result = gvd.mutate_gate("toy_gate", scripts_dir=tmp_path, mutmut_available=True,
+    result = gvd.mutate_gate("toy_gate", scripts_dir=tmp_path, engine="mutmut", mutmut_available=True,
                              runner=fake_run, max_mutants=5)
     assert result["status"] == "partial"
     assert result["surviving_mutants"] == [7]
@@ -621,6 +623,97 @@ def test_mutate_timeout_is_partial_not_silent(tmp_path):
 # --- CLI: report-only always ---------------------------------------------------
 
 
+_TOY_GATE = (
+    '"""Toy gate."""\n'
+    "import sys\n\n"
+    "LIMIT = 3\n\n\n"
+    "def over(n: int) -> bool:\n"
+    "    return n > LIMIT\n\n\n"
+    "def both(a, b):\n"
+    "    return a and b\n\n\n"
+    "def unused(x):\n"
+    "    return x == 1\n\n\n"
+    'if __name__ == "__main__":\n'
+    "    sys.exit(0)\n"
+)
+_TOY_TESTS = (
+    "import toy_gate\n\n\n"
+    "def test_over():\n"
+    "    assert toy_gate.over(5)\n"
+    "    assert not toy_gate.over(3)\n\n\n"
+    "def test_both():\n"
+    "    assert toy_gate.both(1, 1)\n"
+)
+
+
+@pytest.fixture
+def toy_project(tmp_path):
+    scripts_dir = tmp_path / "proj" / "scripts"
+    tests_dir = tmp_path / "proj" / "tests"
+    scripts_dir.mkdir(parents=True)
+    tests_dir.mkdir()
+    (scripts_dir / "toy_gate.py").write_text(_TOY_GATE)
+    (tests_dir / "test_toy_gate.py").write_text(_TOY_TESTS)
+    return scripts_dir, tests_dir / "test_toy_gate.py"
+
+
+def test_mutate_native_runs_each_mutant_against_its_covering_tests(toy_project):
+    """The native engine needs no mutmut: `n > LIMIT` is pinned (killed),
+    the LIMIT bump and `and`->`or` survive the weak tests, and `unused` —
+    executed by no test — is reported uncovered rather than run. The
+    `__main__` block is never mutated."""
+    scripts_dir, _tests = toy_project
+    result = gvd.mutate_gate("toy_gate", scripts_dir=scripts_dir, jobs=2)
+    assert result["status"] == "ran", result["detail"]
+    assert result["engine"] == "native"
+    assert set(result["surviving_mutants"]) == {"L4C8:3->4", "L12C11:And->Or"}
+    assert result["uncovered_mutants"] == ["L16C11:Eq->NotEq#0", "L16C16:1->2"]
+    assert result["counts"]["killed"] == 1 and result["counts"]["cached"] == 0
+    assert not any(c["mutant_id"].startswith("L20") for c in result["candidates"])
+    assert (scripts_dir / "toy_gate.py").read_text() == _TOY_GATE  # never written
+    rendered = gvd.render_mutate("toy_gate", result)
+    assert "a and b -> (a or b)" in rendered
+
+
+def test_mutate_native_re_audit_replays_cached_verdicts(toy_project, monkeypatch):
+    scripts_dir, tests = toy_project
+    first = gvd.mutate_gate("toy_gate", scripts_dir=scripts_dir, jobs=1)
+
+    def _no_run(*a, **k):
+        raise AssertionError("a cached mutant or test map was recomputed")
+
+    # Scoped: monkeypatch.undo() would also revert conftest's autouse
+    # isolate_mutation_cache, pointing the third run at the real cache.
+    with monkeypatch.context() as m:
+        m.setattr(gvd.mutation, "_run_one", _no_run)
+        m.setattr(gvd.mutation, "trace_tests", _no_run)
+        second = gvd.mutate_gate("toy_gate", scripts_dir=scripts_dir, jobs=1)
+    assert second["counts"]["cached"] == second["mutants"] == first["mutants"]
+    assert second["surviving_mutants"] == first["surviving_mutants"]
+
+    tests.write_text(_TOY_TESTS + "\n\ndef test_both_false():\n"
+                     "    assert not toy_gate.both(1, 0)\n")
+    third = gvd.mutate_gate("toy_gate", scripts_dir=scripts_dir, jobs=1)
+    assert third["counts"]["cached"] == 0  # a test edit is a new cache key
+    assert "L12C11:And->Or" not in third["surviving_mutants"]
+
+
+def test_mutate_native_unrunnable_tests_are_failed_not_clean(toy_project):
+    scripts_dir, tests = toy_project
+    tests.write_text("def test_broken(:\n")
+    result = gvd.mutate_gate("toy_gate", scripts_dir=scripts_dir)
+    assert result["status"] == "failed"
+    assert "NOT a clean result" in result["detail"]
+
+
+def test_mutate_native_missing_tests_is_reported(toy_project):
+    scripts_dir, tests = toy_project
+    tests.unlink()
+    result = gvd.mutate_gate("toy_gate", scripts_dir=scripts_dir)
+    assert result["status"] == "error"
+    assert "test_toy_gate.py" in result["detail"]
+
+
 def _cli(*args):
     return subprocess.run(
         [sys.executable, str(REPO_ROOT / "scripts" / "gate_validation_designer.py"), *args],
@@ -675,7 +768,7 @@ def test_cli_mutate_skipped_path_exits_zero(monkeypatch, tmp_path):
     # real run — so call the function instead for the deterministic half and
     # only assert the CLI contract via --help.)
     result = gvd.mutate_gate("check_single_writer", scripts_dir=REPO_ROOT / "scripts",
-                             mutmut_available=False)
+                             engine="mutmut", mutmut_available=False)
     assert result["status"] == "skipped"
     res = _cli("mutate", "--help")
     assert res.returncode == 0
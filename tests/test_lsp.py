@@ -174,6 +174,41 @@ def test_transport_eof_wakes_pending_request(monkeypatch):
     assert _t.monotonic() - t0 < 1.5  # woken by EOF, not the 2s timeout
 
 
+def test_pool_remembers_a_server_that_failed_to_start():
+    spawned = []
+
+    def spawner(*a, **k):
+        spawned.append(a)
+        return _FakeProc()  # EOF at once -> initialize fails
+
+    with lsp.LspPool(".", spawner=spawner, timeout=0.3) as pool:
+        with pytest.raises(lsp.LspError, match="failed to start"):
+            pool.client(lsp.GOPLS)
+        with pytest.raises(lsp.LspError, match="failed to start"):
+            pool.client(lsp.GOPLS)
+    assert len(spawned) == 1  # one cold start per run, not one per caller
+
+
+def test_a_held_document_closes_when_its_last_holder_leaves(tmp_path):
+    client = lsp.LspClient(lsp.GOPLS, tmp_path)
+    sent: list[dict] = []
+    client._send = sent.append
+    src = tmp_path / "a.go"
+    src.write_text("package a\n")
+    with client.document(src):
+        with client.document(src):
+            pass
+        assert [m["method"] for m in sent] == ["textDocument/didOpen"]  # still held
+    with client.document(src):
+        pass
+    client.did_close(src)  # not open: nothing to send
+    assert [m["method"] for m in sent] == [
+        "textDocument/didOpen", "textDocument/didClose",
+        "textDocument/didOpen", "textDocument/didClose",
+    ]
+    assert not client._docs and not client._holds
+
+
 # --- integration: real gopls ------------------------------------------------
 
 
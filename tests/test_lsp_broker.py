@@ -0,0 +1,217 @@
+"""Tests for the persistent LSP broker (``chief_wiggum/lsp_broker.py``).
+
+The contract: a broker answer is the SAME envelope a one-shot ``lsp_query``
+prints, one warm session per (root, server) serves every caller, an edited
+file is re-synced before it is answered for, and every caller falls back to
+a local session when the broker is absent or stale. The language server is
+the scripted stand-in in ``fixtures/stub_lsp_server.py`` — no gopls needed.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import lsp_query
+import pytest
+from chief_wiggum import external_links as xl
+from chief_wiggum import lsp, lsp_broker
+
+STUB_SERVER = Path(__file__).parent / "fixtures" / "stub_lsp_server.py"
+
+GO_SRC = "package orders\n\nfunc CreateOrder() error {\n\treturn nil\n}\n"
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    """Route ``.go`` files to the stand-in server; returns its log path."""
+    log = tmp_path / "stub.log"
+    server = lsp.LspServer(
+        name="stub", command=(sys.executable, str(STUB_SERVER), str(log)),
+        language_id="go", extensions=(".go",),
+    )
+    monkeypatch.setattr(lsp, "server_for_file", lambda p: server if str(p).endswith(".go") else None)
+    monkeypatch.setattr(lsp, "server_available", lambda s: True)
+    return log
+
+
+@pytest.fixture
+def sock_path(monkeypatch):
+    # AF_UNIX paths cap near 100 bytes; pytest's tmp_path can be longer.
+    d = Path(tempfile.mkdtemp(prefix="lspb-", dir="/tmp"))
+    path = d / "b.sock"
+    monkeypatch.setenv(lsp_broker.SOCKET_ENV, str(path))
+    yield path
+    shutil.rmtree(d, ignore_errors=True)
+
+
+def _start(sock_path: Path, **kw) -> tuple[threading.Thread, dict]:
+    result: dict = {}
+    thread = threading.Thread(
+        target=lambda: result.update(exit=lsp_broker.serve(sock_path, **kw)), daemon=True,
+    )
+    thread.start()
+    for _ in range(300):
+        if lsp_broker.request(sock_path, {"op": "ping"}, timeout=1.0) is not None:
+            break
+        time.sleep(0.01)
+    return thread, result
+
+
+@pytest.fixture
+def broker(sock_path, stub):
+    thread, result = _start(sock_path, idle_timeout=30)
+    yield sock_path, result, thread
+    if thread.is_alive():
+        lsp_broker.request(sock_path, {"op": "shutdown"})
+        thread.join(timeout=10)
+
+
+def _spawns(log: Path) -> int:
+    return log.read_text().splitlines().count("spawn") if log.exists() else 0
+
+
+def test_one_warm_session_serves_every_request(broker, stub, tmp_path):
+    sock_path, _result, _thread = broker
+    (tmp_path / "a.go").write_text(GO_SRC)
+    (tmp_path / "b.go").write_text(GO_SRC.replace("CreateOrder", "Cancel"))
+    for name in ("a.go", "b.go", "a.go"):
+        reply = lsp_broker.query(sock_path, {"op": "symbols", "root": str(tmp_path),
+                                             "file": str(tmp_path / name)})
+        assert reply["available"] is True and reply["server"] == "stub"
+    assert _spawns(stub) == 1
+    ping = lsp_broker.request(sock_path, {"op": "ping"})
+    assert ping["sessions"] == [[str(tmp_path.resolve()), "stub"]]
+
+
+def test_an_edited_file_is_resynced_before_it_is_answered(broker, tmp_path):
+    sock_path, _result, _thread = broker
+    src = tmp_path / "a.go"
+    src.write_text(GO_SRC)
+    ask = {"op": "symbols", "root": str(tmp_path), "file": str(src)}
+    assert [s["name"] for s in lsp_broker.query(sock_path, ask)["result"]] == ["CreateOrder"]
+    src.write_text(GO_SRC + "\nfunc Added() {}\n")
+    assert [s["name"] for s in lsp_broker.query(sock_path, ask)["result"]] == ["CreateOrder", "Added"]
+
+
+def test_every_document_a_query_opens_is_closed_after_it(broker, stub, tmp_path):
+    sock_path, _result, thread = broker
+    for name in ("a.go", "b.go", "a.go"):
+        (tmp_path / name).write_text(GO_SRC)
+        lsp_broker.query(sock_path, {"op": "symbols", "root": str(tmp_path),
+                                     "file": str(tmp_path / name)})
+    lsp_broker.request(sock_path, {"op": "shutdown"})
+    thread.join(timeout=10)
+    log = stub.read_text().splitlines()
+    opened = [x.split()[1] for x in log if x.startswith("open ")]
+    closed = [x.split()[1] for x in log if x.startswith("close ")]
+    assert opened == closed == ["a.go", "b.go", "a.go"]
+
+
+def test_ping_lists_only_sessions_that_started(broker, stub, tmp_path, monkeypatch):
+    sock_path, _result, _thread = broker
+    broken = lsp.LspServer(name="broken", command=(sys.executable, "-c", ""),
+                           language_id="python", extensions=(".py",))
+    go = lsp.server_for_file("x.go")
+    monkeypatch.setattr(lsp, "server_for_file", lambda p: go if str(p).endswith(".go") else broken)
+    (tmp_path / "a.py").write_text("x = 1\n")
+    (tmp_path / "a.go").write_text(GO_SRC)
+    ask = {"op": "symbols", "root": str(tmp_path), "timeout": 5}
+    assert lsp_broker.query(sock_path, {**ask, "file": str(tmp_path / "a.py")})["available"] is False
+    assert lsp_broker.request(sock_path, {"op": "ping"})["sessions"] == []
+    assert lsp_broker.query(sock_path, {**ask, "file": str(tmp_path / "a.go")})["available"] is True
+    assert lsp_broker.request(sock_path, {"op": "ping"})["sessions"] == [[str(tmp_path.resolve()), "stub"]]
+
+
+def test_broker_envelope_matches_a_local_query(broker, tmp_path, capsys, monkeypatch):
+    sock_path, _result, _thread = broker
+    src = tmp_path / "a.go"
+    src.write_text(GO_SRC)
+    argv = ["--root", str(tmp_path), "symbols", str(src)]
+    assert lsp_query.main(argv) == 0
+    local = json.loads(capsys.readouterr().out)
+    assert lsp_query.main(["--broker", *argv]) == 0
+    brokered = json.loads(capsys.readouterr().out)
+    assert brokered == local
+    monkeypatch.setenv(lsp_broker.BROKER_ENV, "1")  # the session-wide opt-in
+    assert lsp_query.main(argv) == 0
+    assert json.loads(capsys.readouterr().out) == local
+
+
+def test_shutdown_and_idle_timeout_stop_the_broker(sock_path, stub, tmp_path):
+    thread, result = _start(sock_path, idle_timeout=30)
+    assert lsp_broker.request(sock_path, {"op": "shutdown"}) == {"ok": True}
+    thread.join(timeout=10)
+    assert not thread.is_alive() and result["exit"] == 0 and not sock_path.exists()
+
+    thread, result = _start(sock_path, idle_timeout=0.5)
+    (tmp_path / "a.go").write_text(GO_SRC)
+    lsp_broker.query(sock_path, {"op": "symbols", "root": str(tmp_path), "file": str(tmp_path / "a.go")})
+    thread.join(timeout=10)
+    assert not thread.is_alive() and result["exit"] == 0
+    # Its server went down with it: the stand-in saw stdin close and exited.
+    assert lsp_broker.request(sock_path, {"op": "ping"}) is None
+
+
+def test_a_stale_broker_is_not_trusted(broker, monkeypatch):
+    sock_path, result, thread = broker
+    monkeypatch.setattr(lsp_broker, "_version", lambda: "changed")
+    reply = lsp_broker.request(sock_path, {"op": "ping"})
+    assert reply["stale"] is True
+    thread.join(timeout=10)
+    assert result["exit"] == 1
+    assert lsp_broker.query(sock_path, {"op": "symbols", "root": "/", "file": "/x.go"}) is None
+
+
+def test_second_broker_on_a_live_socket_refuses(broker):
+    sock_path, _result, _thread = broker
+    assert lsp_broker.serve(sock_path, idle_timeout=1) == 2
+
+
+def test_external_links_attaches_to_a_listening_broker(broker, stub, tmp_path):
+    """Two verification runs share the broker's one warm server — the runs
+    themselves start none."""
+    sock_path, _result, _thread = broker
+    root = tmp_path / "target"
+    root.mkdir()
+    (root / "orders.go").write_text(GO_SRC)
+    store = tmp_path / "external-links.json"
+    xl.add_link(store, root, "orders.go", "CreateOrder", "guards", ["CTR-order-001"], use_lsp=False)
+    for _ in range(2):
+        result = xl.verify_links(store, root, use_lsp=True)
+        assert [e["tier"] for e in result["ok"]] == ["lsp"]
+    assert _spawns(stub) == 1
+
+
+def test_external_links_without_a_broker_uses_its_own_session(stub, tmp_path):
+    root = tmp_path / "target"
+    root.mkdir()
+    (root / "orders.go").write_text(GO_SRC)
+    store = tmp_path / "external-links.json"
+    xl.add_link(store, root, "orders.go", "CreateOrder", "guards", ["CTR-order-001"], use_lsp=False)
+    result = xl.verify_links(store, root, use_lsp=True)
+    assert [e["tier"] for e in result["ok"]] == ["lsp"]
+    assert _spawns(stub) == 1
+
+
+def test_session_sync_document_opens_once_then_changes(tmp_path):
+    """The session-side half of freshness, without any server: the first
+    sync opens, an unchanged one sends nothing, an edit sends a versioned
+    full-text didChange."""
+    client = lsp.LspClient(lsp.GOPLS, tmp_path)
+    sent: list[dict] = []
+    client._send = sent.append
+    src = tmp_path / "a.go"
+    src.write_text("one")
+    client.sync_document(src)
+    client.sync_document(src)
+    src.write_text("two")
+    client.sync_document(src)
+    assert [m["method"] for m in sent] == ["textDocument/didOpen", "textDocument/didChange"]
+    change = sent[1]["params"]
+    assert change["textDocument"]["version"] == 2 and change["contentChanges"] == [{"text": "two"}]
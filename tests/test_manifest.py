@@ -3,6 +3,7 @@ git repo (init, commit, dirty a file, add untracked) — not mocked git plumbing
 
 from __future__ import annotations
 
+import os
 import subprocess
 from pathlib import Path
 
@@ -51,6 +52,26 @@ def test_build_manifest_reflects_dirty_tracked_file(tmp_path):
     assert before != after
 
 
+def test_build_manifest_at_a_subdirectory_keys_every_path_relative_to_it(tmp_path):
+    """ls-tree / ls-files answer relative to the subdirectory; the dirty set
+    must too, or an edited file keeps its HEAD sha under the relative key."""
+    repo = tmp_path / "r"
+    _init_repo(repo)
+    (repo / "sub").mkdir()
+    (repo / "sub" / "a.go").write_text("package a\n")
+    (repo / "top.go").write_text("package top\n")
+    _commit(repo)
+    before = m.build_manifest(repo / "sub")
+    assert set(before) == {"a.go"}
+
+    (repo / "sub" / "a.go").write_text("package a\n\nfunc f() {}\n")
+    (repo / "sub" / "new.go").write_text("package a\n")
+    (repo / "top.go").write_text("package top\n\nfunc g() {}\n")
+    after = m.build_manifest(repo / "sub")
+    assert set(after) == {"a.go", "new.go"}
+    assert after["a.go"] == _git_hash(repo, "sub/a.go") != before["a.go"]
+
+
 def test_build_manifest_includes_untracked_non_ignored_file(tmp_path):
     repo = tmp_path / "r"
     _init_repo(repo)
@@ -112,6 +133,157 @@ def test_build_manifest_matches_git_hash_object(tmp_path):
     assert m.build_manifest(repo)["a.go"] == expected
 
 
+def _git_hash(repo: Path, rel: str) -> str:
+    return subprocess.run(
+        ["git", "hash-object", rel], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _spy_hash_objects(monkeypatch) -> list[list[str]]:
+    """Record every batched ``_hash_objects`` call while delegating to it."""
+    calls: list[list[str]] = []
+    original = m._hash_objects
+
+    def wrapper(repo_root, paths):
+        calls.append(sorted(paths))
+        return original(repo_root, paths)
+
+    monkeypatch.setattr(m, "_hash_objects", wrapper)
+    return calls
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate ``path`` past the racy-clean window so its hash is cacheable."""
+    t = path.stat().st_mtime - seconds
+    os.utime(path, (t, t))
+
+
+# --- batched hashing + stat cache --------------------------------------------
+
+
+def test_dirty_and_untracked_files_are_hashed_in_one_batch(tmp_path, monkeypatch):
+    repo = tmp_path / "r"
+    _init_repo(repo)
+    (repo / "a.go").write_text("package a\n")
+    _commit(repo)
+    (repo / "a.go").write_text("package a // dirty\n")
+    for i in range(5):
+        (repo / f"new_{i}.go").write_text(f"package n{i}\n")
+
+    calls = _spy_hash_objects(monkeypatch)
+    result = m.build_manifest(repo)
+    assert calls == [["a.go"] + [f"new_{i}.go" for i in range(5)]]  # ONE batch, not six forks
+    for rel in ["a.go"] + [f"new_{i}.go" for i in range(5)]:
+        assert result[rel] == _git_hash(repo, rel)
+
+
+def test_batched_hashing_handles_a_newline_in_a_path(tmp_path):
+    repo = tmp_path / "r"
+    _init_repo(repo)
+    (repo / "a.go").write_text("package a\n")
+    _commit(repo)
+    (repo / "odd\nname.go").write_text("package odd\n")
+    (repo / "b.go").write_text("package b\n")
+
+    hashed = m._hash_objects(repo, ["b.go", "odd\nname.go"])
+    assert hashed["b.go"] == _git_hash(repo, "b.go")
+    assert hashed["odd\nname.go"] == _git_hash(repo, "odd\nname.go")
+
+
+def test_batched_hashing_handles_a_path_starting_with_a_double_quote(tmp_path):
+    repo = tmp_path / "r"
+    _init_repo(repo)
+    (repo / "a.go").write_text("package a\n")
+    _commit(repo)
+    # --stdin-paths would C-unquote this line and hash "ab.go" instead.
+    (repo / '"a\\142.go"').write_text("package quoted\n")
+    (repo / "ab.go").write_text("package decoy\n")
+    (repo / "b.go").write_text("package b\n")
+
+    hashed = m._hash_objects(repo, ["b.go", '"a\\142.go"'])
+    assert hashed["b.go"] == _git_hash(repo, "b.go")
+    assert hashed['"a\\142.go"'] == _git_hash(repo, '"a\\142.go"')
+    assert hashed['"a\\142.go"'] != _git_hash(repo, "ab.go")
+
+
+def test_unchanged_untracked_file_is_not_rehashed_across_runs(tmp_path, monkeypatch):
+    repo = tmp_path / "r"
+    _init_repo(repo)
+    (repo / "a.go").write_text("package a\n")
+    _commit(repo)
+    (repo / "gen.go").write_text("package gen\n")
+    _age(repo / "gen.go")
+
+    calls = _spy_hash_objects(monkeypatch)
+    first = m.build_manifest(repo)
+    assert calls == [["gen.go"]]
+    calls.clear()
+    second = m.build_manifest(repo)
+    assert calls == []  # served from the stat cache
+    assert second == first
+
+
+def test_stat_change_rehashes_only_that_file(tmp_path, monkeypatch):
+    repo = tmp_path / "r"
+    _init_repo(repo)
+    (repo / "a.go").write_text("package a\n")
+    _commit(repo)
+    for name in ("one.go", "two.go"):
+        (repo / name).write_text(f"package {name[:3]}\n")
+        _age(repo / name)
+    m.build_manifest(repo)
+
+    (repo / "two.go").write_text("package two // edited\n")
+    _age(repo / "two.go")
+    calls = _spy_hash_objects(monkeypatch)
+    result = m.build_manifest(repo)
+    assert calls == [["two.go"]]
+    assert result["two.go"] == _git_hash(repo, "two.go")
+
+
+def test_racily_clean_file_is_hashed_but_not_cached(tmp_path, monkeypatch):
+    """A file modified inside the mtime-granularity window could be rewritten
+    with an identical (mtime, size, inode) — it must never be served from the
+    cache, or the manifest would carry the old content's hash."""
+    repo = tmp_path / "r"
+    _init_repo(repo)
+    (repo / "a.go").write_text("package a\n")
+    _commit(repo)
+    (repo / "fresh.go").write_text("package fresh\n")  # mtime == now
+
+    calls = _spy_hash_objects(monkeypatch)
+    m.build_manifest(repo)
+    m.build_manifest(repo)
+    assert calls == [["fresh.go"], ["fresh.go"]]
+
+
+def test_stat_cache_escape_hatch_disables_reuse(tmp_path, monkeypatch):
+    repo = tmp_path / "r"
+    _init_repo(repo)
+    (repo / "a.go").write_text("package a\n")
+    _commit(repo)
+    (repo / "gen.go").write_text("package gen\n")
+    _age(repo / "gen.go")
+    m.build_manifest(repo)
+
+    monkeypatch.setenv(m.NO_CACHE_ENV, "1")
+    calls = _spy_hash_objects(monkeypatch)
+    m.build_manifest(repo)
+    assert calls == [["gen.go"]]
+
+
+def test_corrupt_stat_cache_degrades_to_hashing(tmp_path):
+    repo = tmp_path / "r"
+    _init_repo(repo)
+    (repo / "a.go").write_text("package a\n")
+    _commit(repo)
+    (repo / "gen.go").write_text("package gen\n")
+    path = m._stat_cache_path(repo)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{not json")
+    assert m.build_manifest(repo)["gen.go"] == _git_hash(repo, "gen.go")
+
+
 # --- tree_manifest / changed_paths ------------------------------------------
 
 
@@ -298,3 +470,22 @@ def test_walk_source_files_prunes_nested_git_checkouts(tmp_path):
     (linked / "c.go").write_text("package c\n")
 
     assert m.walk_source_files(tmp_path) == ["a.go"]
+
+
+def test_walk_source_files_never_descends_into_skip_dirs(tmp_path, monkeypatch):
+    (tmp_path / "a.go").write_text("package a\n")
+    deps = tmp_path / "web" / "node_modules" / "left-pad"
+    deps.mkdir(parents=True)
+    (deps / "index.js").write_text("module.exports = 1\n")
+    visited: list[str] = []
+    real_walk = m.os.walk
+
+    def recording_walk(top, *args, **kwargs):
+        for entry in real_walk(top, *args, **kwargs):
+            visited.append(entry[0])
+            yield entry
+
+    monkeypatch.setattr(m.os, "walk", recording_walk)
+    assert m.walk_source_files(tmp_path, skip_dirs={"node_modules"}) == ["a.go"]
+    assert not any("node_modules" in d for d in visited)
+    assert "web/node_modules/left-pad/index.js" in m.walk_source_files(tmp_path)
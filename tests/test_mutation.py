@@ -0,0 +1,153 @@
+"""Tests for scripts/chief_wiggum/mutation.py — the native mutation engine
+behind ``gate_validation_designer.py mutate``.
+
+End-to-end runs (trace, parallel execution, cache replay) live in
+``test_gate_validation_designer.py`` against a toy gate; these pin the
+pieces: which mutants are generated and that each is a faithful one-span
+edit, how a mutant is mapped to its tests, the budget, and the cache.
+"""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+from chief_wiggum import mutation
+
+SOURCE = '''"""Module docstring with == and True."""
+import sys
+
+THRESHOLD: int = 2
+
+
+def check(items: list[int], strict: bool = False) -> bool:
+    """Docstring: x < 1."""
+    total = len(items) + 1
+    if not items or total >= THRESHOLD:
+        return strict is True
+    label = f"{total == 3}"
+    return "x" in label
+
+
+if __name__ == "__main__":
+    sys.exit(1 if check([]) else 0)
+'''
+
+
+def _by_operator(mutants):
+    return {(m.line, m.operator): m for m in mutants}
+
+
+def test_generates_each_operator_on_its_own_line():
+    mutants = mutation.generate_mutants(SOURCE)
+    ops = _by_operator(mutants)
+    assert (4, "2->3") in ops                  # module constant
+    assert (9, "Add->Sub") in ops
+    assert (9, "1->2") in ops
+    assert (10, "Or->And") in ops
+    assert (10, "drop-not") in ops
+    assert (10, "GtE->Lt#0") in ops
+    assert (11, "Is->IsNot#0") in ops
+    assert (13, "In->NotIn#0") in ops
+    assert (7, "False->True") in ops           # a default value is mutated...
+    assert not any(m.line == 7 and "int" in m.original for m in mutants)  # ...annotations not
+
+
+def test_skips_docstrings_annotations_fstrings_and_main_block():
+    lines = {m.line for m in mutation.generate_mutants(SOURCE)}
+    assert 1 not in lines and 8 not in lines   # docstrings
+    assert 12 not in lines                     # f-string internals
+    assert 16 not in lines and 17 not in lines  # if __name__ == "__main__": block
+
+
+def test_every_mutant_is_a_single_span_edit_that_compiles():
+    data = SOURCE.encode()
+    original_lines = SOURCE.splitlines()
+    for m in mutation.generate_mutants(SOURCE):
+        mutated = m.apply(data).decode()
+        ast.parse(mutated)
+        mutated_lines = mutated.splitlines()
+        assert len(mutated_lines) == len(original_lines)
+        changed = [i + 1 for i, (a, b) in enumerate(zip(original_lines, mutated_lines,
+                                                        strict=True)) if a != b]
+        assert changed == [m.line], m.mutant_id
+
+
+def test_mutant_ids_are_stable_and_unique():
+    first = [m.mutant_id for m in mutation.generate_mutants(SOURCE)]
+    assert first == [m.mutant_id for m in mutation.generate_mutants(SOURCE)]
+    assert len(first) == len(set(first))
+
+
+def test_tests_for_selects_covering_tests_and_skips_failing_ones():
+    test_map = mutation.TestMap(
+        lines={
+            mutation.COLLECTION: [2, 4],
+            "t.py::test_a": [9, 10],
+            "t.py::test_b": [10, 11],
+            "t.py::test_broken": [10],
+        },
+        failed=["t.py::test_broken"],
+    )
+    ops = _by_operator(mutation.generate_mutants(SOURCE))
+    assert test_map.tests_for(ops[(10, "Or->And")]) == ["t.py::test_a", "t.py::test_b"]
+    assert test_map.tests_for(ops[(11, "Is->IsNot#0")]) == ["t.py::test_b"]
+    # Module body only: every passing test may depend on it.
+    assert test_map.tests_for(ops[(4, "2->3")]) == ["t.py::test_a", "t.py::test_b"]
+    assert test_map.tests_for(ops[(13, "In->NotIn#0")]) == []
+
+
+def test_run_mutants_past_budget_is_not_run_and_uncovered_is_never_run(monkeypatch):
+    def _no_run(*a, **k):
+        raise AssertionError("mutant executed")
+
+    monkeypatch.setattr(mutation, "_run_one", _no_run)
+    mutants = mutation.generate_mutants(SOURCE)
+    test_map = mutation.TestMap(lines={"t.py::test_a": [9]}, failed=[])
+    verdicts = mutation.run_mutants(
+        mutants, SOURCE.encode(), "gate", Path("gate.py"), test_map, Path("."), Path("."),
+        per_mutant_seconds=1, budget_seconds=0, jobs=2,
+    )
+    assert {verdicts[m.mutant_id] for m in mutants if m.line == 9} == {mutation.NOT_RUN}
+    assert {verdicts[m.mutant_id] for m in mutants if m.line != 9} == {mutation.NO_COVERAGE}
+
+
+def test_cache_round_trip_drops_uncacheable_verdicts(tmp_path, monkeypatch):
+    cache = mutation.MutationCache("gate", "g1", "t1")
+    cache.test_map = mutation.TestMap(lines={"t::a": [1]}, failed=[])
+    cache.verdicts = {"m1": mutation.KILLED, "m2": mutation.ERROR, "m3": mutation.NOT_RUN}
+    cache.store()
+    assert cache.path.parent == tmp_path / "mutation-cache"
+
+    again = mutation.MutationCache("gate", "g1", "t1")
+    assert again.verdicts == {"m1": mutation.KILLED}
+    assert again.test_map.lines == {"t::a": [1]}
+    assert mutation.MutationCache("gate", "g2", "t1").verdicts == {}  # gate changed
+    assert mutation.MutationCache("gate", "g1", "t2").verdicts == {}  # tests changed
+
+    monkeypatch.setenv(mutation.NO_CACHE_ENV, "1")
+    disabled = mutation.MutationCache("gate", "g1", "t1")
+    assert disabled.verdicts == {} and disabled.test_map is None
+
+
+def test_a_gate_loaded_by_path_sees_the_mutant(tmp_path):
+    """Tests that ``spec_from_file_location`` the gate (scripts that are not
+    importable by name) must run the mutant, not the file on disk."""
+    gate = tmp_path / "path_gate.py"
+    source = b"def ok():\n    return 1 == 1\n"
+    gate.write_bytes(source)
+    test = tmp_path / "test_path_gate.py"
+    test.write_text(
+        "import importlib.util\n\n"
+        f"_spec = importlib.util.spec_from_file_location('loaded_gate', {str(gate)!r})\n"
+        "gate = importlib.util.module_from_spec(_spec)\n"
+        "_spec.loader.exec_module(gate)\n\n\n"
+        "def test_ok():\n"
+        "    assert gate.ok() is True\n"
+        f"    assert gate.__file__ == {str(gate)!r}\n"
+    )
+    (flip,) = [m for m in mutation.generate_mutants(source) if m.operator.startswith("Eq")]
+    verdict = mutation._run_one(flip, source, "path_gate", gate, [str(test)], tmp_path, tmp_path,
+                                timeout=60)
+    assert verdict == mutation.KILLED
+    assert gate.read_bytes() == source
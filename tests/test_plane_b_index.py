@@ -0,0 +1,256 @@
+"""Tests for the persistent Plane B index (``chief_wiggum/plane_b_index.py``)
+and its wiring into ``code_query.py``.
+
+Two contracts: the index re-emits ONLY files whose manifest blob changed
+(plus anything it cannot prove fresh — no manifest entry, a new scanner
+version, an unreadable row), and an indexed query answers exactly what a
+``--no-index`` live scan answers, fact for fact and in the same order.
+"""
+
+from __future__ import annotations
+
+import shutil
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import code_query  # noqa: E402
+from chief_wiggum import plane_b_index as pbi  # noqa: E402
+
+FIXTURE = Path(__file__).parent / "fixtures" / "code_query_repo"
+
+EMITTED: list[str] = []
+
+
+def _emit_lines(root: str, rel: str):
+    """Module-level stand-in emitter: one finding per non-blank line, and a
+    record of every file it actually read."""
+    EMITTED.append(rel)
+    try:
+        text = (Path(root) / rel).read_text()
+    except OSError as exc:
+        return None, f"unreadable: {exc.__class__.__name__}"
+    return [{"rel": rel, "line": i} for i, ln in enumerate(text.splitlines(), 1) if ln.strip()], None
+
+
+ENGINES = (pbi.Engine("lines", lambda rel: rel.endswith(".py"), _emit_lines),)
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+
+
+def _init_repo(repo: Path) -> None:
+    repo.mkdir(parents=True, exist_ok=True)
+    _git(repo, "init", "-q", "--initial-branch=main")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+
+
+def _commit(repo: Path) -> None:
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "commit")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    r = tmp_path / "repo"
+    _init_repo(r)
+    (r / "a.py").write_text("x = 1\ny = 2\n")
+    (r / "b.py").write_text("z = 3\n")
+    (r / "empty.py").write_text("\n")
+    (r / "notes.txt").write_text("not a candidate\n")
+    _commit(r)
+    EMITTED.clear()
+    return r
+
+
+def _rows(repo: Path) -> dict[str, str]:
+    conn = sqlite3.connect(str(pbi._db_path(str(repo))))
+    rows = dict(conn.execute("SELECT rel, blob_sha FROM emissions"))
+    conn.close()
+    return rows
+
+
+# --- the index ---------------------------------------------------------------
+
+
+def test_cold_refresh_emits_every_candidate_and_a_warm_one_reads_nothing(repo):
+    cold = pbi.refresh(repo, ENGINES, "v1")
+    assert sorted(EMITTED) == ["a.py", "b.py", "empty.py"]
+    assert cold.served == set()
+
+    EMITTED.clear()
+    warm = pbi.refresh(repo, ENGINES, "v1")
+    assert EMITTED == []
+    assert warm.emissions == cold.emissions
+    assert warm.served == {"a.py", "b.py", "empty.py"}
+    assert list(warm.emissions["lines"]) == ["a.py", "b.py", "empty.py"]  # walk order
+
+
+def test_only_changed_files_are_re_emitted(repo):
+    pbi.refresh(repo, ENGINES, "v1")
+    EMITTED.clear()
+    (repo / "b.py").write_text("z = 3\nw = 4\n")  # dirty, uncommitted
+
+    snap = pbi.refresh(repo, ENGINES, "v1")
+    assert EMITTED == ["b.py"]
+    assert snap.emissions["lines"]["b.py"] == [{"rel": "b.py", "line": 1}, {"rel": "b.py", "line": 2}]
+    assert snap.served == {"a.py", "empty.py"}
+
+
+def test_new_and_deleted_files_update_the_index(repo):
+    pbi.refresh(repo, ENGINES, "v1")
+    (repo / "a.py").unlink()
+    (repo / "c.py").write_text("c = 1\n")  # untracked, not ignored: in the manifest
+    EMITTED.clear()
+
+    snap = pbi.refresh(repo, ENGINES, "v1")
+    assert EMITTED == ["c.py"]
+    assert "a.py" not in snap.emissions["lines"]
+    assert set(_rows(repo)) == {"b.py", "c.py", "empty.py"}
+
+
+def test_a_new_scanner_version_discards_the_whole_generation(repo):
+    pbi.refresh(repo, ENGINES, "v1")
+    EMITTED.clear()
+    snap = pbi.refresh(repo, ENGINES, "v2")
+    assert sorted(EMITTED) == ["a.py", "b.py", "empty.py"]
+    assert snap.served == set()
+
+
+def test_gitignored_files_are_scanned_live_and_never_stored(repo):
+    (repo / ".gitignore").write_text("gen.py\n")
+    (repo / "gen.py").write_text("g = 1\n")
+    pbi.refresh(repo, ENGINES, "v1")
+    EMITTED.clear()
+
+    snap = pbi.refresh(repo, ENGINES, "v1")
+    assert EMITTED == ["gen.py"]  # no manifest blob: nothing proves it fresh
+    assert snap.emissions["lines"]["gen.py"] == [{"rel": "gen.py", "line": 1}]
+    assert "gen.py" not in _rows(repo)
+
+
+def test_unreadable_files_land_in_unscanned_and_are_never_stored(repo):
+    (repo / "dangling.py").symlink_to(repo / "missing.py")
+    _commit(repo)
+    snap = pbi.refresh(repo, ENGINES, "v1")
+    assert [u["file"] for u in snap.unscanned["lines"]] == ["dangling.py"]
+    assert "dangling.py" not in snap.emissions["lines"]
+    assert "dangling.py" not in _rows(repo)
+
+
+def test_escape_hatch_scans_live_and_never_touches_the_store(repo, monkeypatch):
+    monkeypatch.setenv(pbi.NO_INDEX_ENV, "1")
+    pbi.refresh(repo, ENGINES, "v1")
+    EMITTED.clear()
+    snap = pbi.refresh(repo, ENGINES, "v1")
+    assert sorted(EMITTED) == ["a.py", "b.py", "empty.py"]
+    assert snap.served == set()
+    assert not pbi._db_path(str(repo)).exists()
+
+
+def test_a_corrupt_index_is_rebuilt(repo):
+    pbi._db_path(str(repo)).write_bytes(b"definitely not sqlite" * 64)
+    cold = pbi.refresh(repo, ENGINES, "v1")
+    EMITTED.clear()
+    warm = pbi.refresh(repo, ENGINES, "v1")
+    assert EMITTED == []
+    assert warm.emissions == cold.emissions
+
+
+def test_an_undecodable_row_is_re_emitted(repo):
+    pbi.refresh(repo, ENGINES, "v1")
+    conn = sqlite3.connect(str(pbi._db_path(str(repo))))
+    with conn:
+        conn.execute("UPDATE emissions SET findings = '{oops' WHERE rel = 'a.py'")
+    conn.close()
+    EMITTED.clear()
+    snap = pbi.refresh(repo, ENGINES, "v1")
+    assert EMITTED == ["a.py"]
+    assert snap.emissions["lines"]["a.py"] == [{"rel": "a.py", "line": 1}, {"rel": "a.py", "line": 2}]
+
+
+def test_non_git_root_scans_live_without_an_index(tmp_path):
+    root = tmp_path / "plain"
+    root.mkdir()
+    (root / "a.py").write_text("x = 1\n")
+    EMITTED.clear()
+    pbi.refresh(root, ENGINES, "v1")
+    pbi.refresh(root, ENGINES, "v1")
+    assert EMITTED == ["a.py", "a.py"]
+
+
+# --- code_query.py -----------------------------------------------------------
+
+
+@pytest.fixture
+def cq_repo(tmp_path):
+    r = tmp_path / "cq"
+    shutil.copytree(FIXTURE, r)
+    _init_repo(r)
+    _commit(r)
+    return r
+
+
+def _strip_cache_flag(env: dict) -> dict:
+    for f in env["facts"]:
+        f["provenance"].pop("from_cache", None)
+    return env
+
+
+@pytest.mark.parametrize("verb,args", [
+    ("cmd_guards", ("CTR-order-confirm-001",)),
+    ("cmd_verifies", ("CTR-order-confirm-001",)),
+    ("cmd_writers", ("INV-checkout-001",)),
+    ("cmd_governs", ("order.status",)),
+    ("cmd_trace", ("CTR-order-confirm-001",)),
+])
+def test_indexed_queries_match_a_no_index_live_scan(cq_repo, monkeypatch, verb, args):
+    cmd = getattr(code_query, verb)
+    cold = cmd(cq_repo, *args, "checkout", limit=100)
+    warm = cmd(cq_repo, *args, "checkout", limit=100)
+    monkeypatch.setenv(pbi.NO_INDEX_ENV, "1")
+    live = cmd(cq_repo, *args, "checkout", limit=100)
+
+    assert live["facts"], "fixture sanity"
+    assert _strip_cache_flag(warm) == _strip_cache_flag(live) == _strip_cache_flag(cold)
+
+
+def test_second_query_serves_plane_b_from_the_index(cq_repo):
+    cold = code_query.cmd_writers(cq_repo, "INV-checkout-001", "checkout", limit=100)
+    assert {f["provenance"]["from_cache"] for f in cold["facts"]} == {False}
+
+    warm = code_query.cmd_writers(cq_repo, "INV-checkout-001", "checkout", limit=100)
+    assert {f["provenance"]["from_cache"] for f in warm["facts"]} == {True}
+
+    (cq_repo / "src" / "admin.py").write_text((cq_repo / "src" / "admin.py").read_text() + "\n")
+    edited = code_query.cmd_writers(cq_repo, "INV-checkout-001", "checkout", limit=100)
+    by_file = {f["file"]: f["provenance"]["from_cache"] for f in edited["facts"]}
+    assert by_file["src/admin.py"] is False
+    assert by_file["src/order.py"] is True
+
+
+def test_plane_a_edits_are_seen_without_touching_the_index(cq_repo):
+    """Only emission is indexed: retargeting the invariant's sanctioned
+    writer flips the verdict on the very next query, with every write site
+    still served from the index."""
+    before = code_query.cmd_writers(cq_repo, "INV-checkout-001", "checkout", limit=100)
+    assert any(not f["sanctioned"] for f in before["facts"])
+    sm = cq_repo / "docs" / "epics" / "checkout" / "models" / "state-machines.json"
+    sm.write_text(sm.read_text().replace('"src/order.py"\n', '"src/order.py",\n        "src/admin.py"\n', 1))
+
+    after = code_query.cmd_writers(cq_repo, "INV-checkout-001", "checkout", limit=100)
+    assert all(f["sanctioned"] for f in after["facts"])
+    assert all(f["provenance"]["from_cache"] for f in after["facts"])
+
+
+def test_cli_no_index_flag_sets_the_escape_hatch(cq_repo, monkeypatch, capsys):
+    monkeypatch.delenv(pbi.NO_INDEX_ENV, raising=False)
+    assert code_query.main(["--repo", str(cq_repo), "--no-index", "guards", "CTR-order-confirm-001"]) == 0
+    assert not pbi._db_path(str(cq_repo)).exists()
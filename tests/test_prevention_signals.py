@@ -104,6 +104,39 @@ def test_duplication_ignores_wholly_preexisting_and_wholly_new_classes():
     assert prevention_signals.duplication_findings(classes, added) == []
 
 
+COPIED = (
+    "def tally(rows, *, key='id', default=None):\n"
+    "    seen = {}\n"
+    "    for row in rows:\n"
+    "        value = row.get(key, default)\n"
+    "        if value is None:\n"
+    "            continue\n"
+    "        seen[value] = {'name': row['name'], 'size': len(row)}\n"
+    "    total = sum(item['size'] for item in seen.values())\n"
+    "    return sorted(seen.items()), total\n"
+)
+
+
+def test_native_detector_flags_a_diff_copying_existing_code(repo):
+    """The default detector needs no jscpd: the copied block is found from
+    the changed file's stored fingerprints, and the untouched copy it
+    duplicates is reported as the existing span."""
+    _git(repo, "checkout", "-q", "main")
+    (repo / "old.py").write_text(COPIED)
+    _commit_all(repo, "existing helper")
+    _git(repo, "checkout", "-q", "-b", "copy")
+    (repo / "new.py").write_text("import os\n\n" + COPIED)
+    _commit_all(repo, "copy it")
+    env = prevention_signals.build_signals(str(repo), "main", str(repo.parent / "wd"))
+    dup = env["signals"]["new_duplication"]
+    assert dup["detector"] == "native"
+    assert env["counts"]["new_duplication"] == 1
+    (finding,) = dup["findings"]
+    assert finding["added_spans"] == ["new.py:3-11"]
+    assert finding["existing_spans"] == ["old.py:1-9"]
+    assert "duplicates existing old.py:1-9" in prevention_signals.format_report(env)
+
+
 # --- (b) dead code introduced -------------------------------------------------
 
 
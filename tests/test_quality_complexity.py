@@ -0,0 +1,310 @@
+"""Tests for quality/complexity.py's per-file tool cache and chunk pool, and
+for quality/trend.py, which measures history through the same cache.
+
+CI has no lizard/radon/gocognit/complexipy, so these run against tiny
+stand-in scripts that speak each tool's output format and log every file
+they are handed. The contract: results equal a live (``CW_QUALITY_NO_CACHE``)
+run, a warm run hands the tools only the files whose content changed, and
+output that cannot be attributed to a file (or a crashed run) is never
+stored. ``tests/conftest.py`` isolates both cache directories.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+from quality import cache, complexity, trend
+
+_FAKE = r'''
+import json, os, sys
+
+args = sys.argv[1:]
+if args == ["--version"]:
+    print(os.environ.get("FAKE_TOOL_VERSION", "1.0"))
+    sys.exit(0)
+name = os.path.basename(sys.argv[0])
+out_path = None
+if name == "complexipy":
+    out_path = args[args.index("--output") + 1]
+files = [a for a in args if os.path.isfile(a) and a != out_path]
+with open(os.environ["FAKE_TOOL_LOG"], "a") as log:
+    for f in files:
+        log.write(f"{name} {f}\n")
+mode = os.environ.get("FAKE_TOOL_MODE", "")
+
+
+def reported(f):
+    return os.path.basename(f) if mode == "rename" else f
+
+
+def functions(f):
+    lines = open(f).read().splitlines()
+    for i, line in enumerate(lines):
+        if line.startswith(("def ", "func ")):
+            yield i + 1, 1 + sum(x.strip().startswith("if ") for x in lines[i:]), len(lines) - i
+
+
+if name == "lizard":
+    for f in files:
+        for start, ccn, length in functions(f):
+            print(f"{length},{ccn},10,0,{length},fn@{start}-{start}@{f},{reported(f)},fn,fn,{start},{start}")
+    if mode == "crash":
+        print("Traceback (most recent call last):\n  boom", file=sys.stderr)
+        sys.exit(1)
+    sys.exit(1 if mode == "warn" else 0)
+if name == "radon":
+    print(json.dumps({reported(f): {"mi": 40.0 + len(open(f).read()) % 50, "rank": "A"} for f in files}))
+if name == "gocognit":
+    print(json.dumps([
+        {"Complexity": ccn, "Pos": {"Filename": reported(f), "Line": start}}
+        for f in files for start, ccn, _ in functions(f)
+    ]))
+if name == "complexipy":
+    with open(out_path, "w") as fh:
+        json.dump([
+            {"complexity": ccn, "path": reported(f), "function_name": "fn"}
+            for f in files for start, ccn, _ in functions(f)
+        ], fh)
+'''
+
+FILES = {
+    "pkg/a.py": "def a(x):\n    if x:\n        return 1\n    return 2\n",
+    "pkg/b.py": "def b():\n    return 3\n\ndef c(y):\n    if y:\n        pass\n",
+    "pkg/c.py": "X = 1\n",
+    "svc/main.go": "package svc\n\nfunc Run(x int) int {\n\tif x > 0 {\n\t\treturn 1\n\t}\n\treturn 0\n}\n",
+}
+
+
+def _git(repo, *args):
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True, text=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q", "--initial-branch=main")
+    _git(root, "config", "user.name", "Ada")
+    _git(root, "config", "user.email", "ada@example.com")
+    for rel, text in FILES.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(text)
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "seed")
+    return root
+
+
+@pytest.fixture
+def venv(tmp_path, monkeypatch):
+    """A fake venv whose bin/ holds the four stand-in tools; returns the
+    venv path and a reader for the ``(tool, file)`` invocation log."""
+    bindir = tmp_path / "venv" / "bin"
+    bindir.mkdir(parents=True)
+    for name in ("lizard", "radon", "gocognit", "complexipy"):
+        tool = bindir / name
+        tool.write_text(f"#!{sys.executable}\n{_FAKE}")
+        tool.chmod(0o755)
+    log = tmp_path / "tool.log"
+    log.write_text("")
+    monkeypatch.setenv("FAKE_TOOL_LOG", str(log))
+    complexity._tool_identity.cache_clear()
+    yield tmp_path / "venv", lambda: [tuple(line.split(" ", 1)) for line in log.read_text().splitlines()]
+    complexity._tool_identity.cache_clear()
+
+
+def _src(repo, *rels):
+    return [str(repo / rel) for rel in rels]
+
+
+def test_warm_lizard_run_reanalyzes_only_changed_files(repo, venv):
+    venv_dir, calls = venv
+    lizard = str(venv_dir / "bin" / "lizard")
+    files = _src(repo, "pkg/a.py", "pkg/b.py", "pkg/c.py")
+    cold = complexity.lizard_ccn(files, lizard, repo=str(repo))
+    assert sorted(f for _t, f in calls()) == sorted(files)
+    assert [(r["file"], r["ccn"]) for r in cold] == [(files[0], 2), (files[1], 2), (files[1], 2)]
+
+    assert complexity.lizard_ccn(files, lizard, repo=str(repo)) == cold
+    assert len(calls()) == 3  # nothing re-run
+
+    (repo / "pkg" / "c.py").write_text("def late(z):\n    if z:\n        if z:\n            pass\n")
+    warm = complexity.lizard_ccn(files, lizard, repo=str(repo))
+    assert calls()[3:] == [("lizard", files[2])]
+    assert warm[-1] == {"nloc": 4, "ccn": 3, "length": 4, "file": files[2]}
+
+
+def test_analyze_matches_a_live_run(repo, venv, monkeypatch):
+    venv_dir, calls = venv
+    cold = complexity.analyze(str(repo), venv=str(venv_dir))
+    warm = complexity.analyze(str(repo), venv=str(venv_dir))
+    n_cold = len(calls())
+    monkeypatch.setenv(cache.NO_CACHE_ENV, "1")
+    live = complexity.analyze(str(repo), venv=str(venv_dir))
+    assert cold == warm == live
+    assert len(calls()) == 2 * n_cold  # the warm run ran nothing; the live one everything
+    py = live["languages"]["python"]
+    assert py["cyclomatic_src"]["functions"] == 3
+    assert py["maintainability_index"]["files"] == 3
+    assert py["cognitive_src"]["functions"] == 3
+    assert live["languages"]["go"]["cognitive_src"]["cognitive_max"] == 2
+
+
+def test_chunks_run_concurrently_with_identical_results(repo, venv, monkeypatch):
+    venv_dir, calls = venv
+    lizard = str(venv_dir / "bin" / "lizard")
+    files = _src(repo, "pkg/a.py", "pkg/b.py", "pkg/c.py", "svc/main.go")
+    monkeypatch.setenv(cache.NO_CACHE_ENV, "1")
+    monkeypatch.setenv(complexity.JOBS_ENV, "1")
+    serial = complexity.lizard_ccn(files, lizard, repo=str(repo))
+    monkeypatch.setattr(complexity, "LIZARD_CHUNK", 1)
+    monkeypatch.setenv(complexity.JOBS_ENV, "4")
+    assert complexity.lizard_ccn(files, lizard, repo=str(repo)) == serial
+    assert sorted(f for _t, f in calls()) == sorted(files * 2)
+
+
+@pytest.mark.parametrize("mode", ["rename", "crash"])
+def test_unattributable_or_crashed_output_is_used_but_never_stored(repo, venv, monkeypatch, mode):
+    venv_dir, calls = venv
+    lizard = str(venv_dir / "bin" / "lizard")
+    files = _src(repo, "pkg/a.py")
+    monkeypatch.setenv("FAKE_TOOL_MODE", mode)
+    rows = complexity.lizard_ccn(files, lizard, repo=str(repo))
+    assert [r["ccn"] for r in rows] == [2]
+    complexity.lizard_ccn(files, lizard, repo=str(repo))
+    assert len(calls()) == 2
+
+
+def test_threshold_warning_exit_status_is_still_stored(repo, venv, monkeypatch):
+    venv_dir, calls = venv
+    lizard = str(venv_dir / "bin" / "lizard")
+    monkeypatch.setenv("FAKE_TOOL_MODE", "warn")
+    files = _src(repo, "pkg/a.py")
+    first = complexity.lizard_ccn(files, lizard, repo=str(repo))
+    assert complexity.lizard_ccn(files, lizard, repo=str(repo)) == first
+    assert len(calls()) == 1
+
+
+def test_a_different_tool_version_never_serves_the_other_ones_rows(repo, venv, monkeypatch):
+    venv_dir, calls = venv
+    lizard = str(venv_dir / "bin" / "lizard")
+    files = _src(repo, "pkg/a.py")
+    complexity.lizard_ccn(files, lizard, repo=str(repo))
+    monkeypatch.setenv("FAKE_TOOL_VERSION", "2.0")
+    complexity._tool_identity.cache_clear()
+    complexity.lizard_ccn(files, lizard, repo=str(repo))
+    assert len(calls()) == 2
+
+
+def test_without_a_repo_or_outside_git_every_file_runs_live(tmp_path, venv):
+    venv_dir, calls = venv
+    lizard = str(venv_dir / "bin" / "lizard")
+    plain = tmp_path / "plain"
+    plain.mkdir()
+    (plain / "m.py").write_text("def m():\n    pass\n")
+    files = [str(plain / "m.py")]
+    for _ in range(2):
+        assert complexity.lizard_ccn(files, lizard, repo=str(plain))[0]["ccn"] == 1
+        assert complexity.lizard_ccn(files, lizard)[0]["ccn"] == 1
+    assert len(calls()) == 4
+    assert json.loads(json.dumps(complexity.lizard_ccn([], lizard))) == []
+
+
+# --- trend: sampled commits read from the object database --------------------
+
+HISTORY = [
+    {"pkg/a.py": "def a(x):\n    if x:\n        return 5\n    return 6\n",
+     "tests/test_a.py": "def test_a():\n    assert True",  # no trailing newline
+     "docs/gen.py": "def skipped():\n    pass\n"},
+    {"svc/extra.go": "package svc\n\nfunc Extra() {}\n",
+     "pkg/link.py": None},  # symlink: not a source file
+]
+
+
+@pytest.fixture
+def history_repo(repo):
+    for step in HISTORY:
+        for rel, text in step.items():
+            path = repo / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if text is None:
+                path.symlink_to("a.py")
+            else:
+                path.write_text(text)
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", "step")
+    return repo
+
+
+def _checkout_metrics(repo, commit, lizard, tmp_path):
+    """The pre-object-database reference: a worktree checkout measured with
+    bucket + loc_counts + an uncached lizard run."""
+    wt = tmp_path / f"ref_{commit[:10]}"
+    _git(repo, "worktree", "add", "--detach", "-q", str(wt), commit)
+    try:
+        src: list[str] = []
+        test: list[str] = []
+        for sets in complexity.bucket(str(wt)).values():
+            src += [f for f in sets["src"] if not (wt / f).is_symlink()]
+            test += sets["test"]
+        src_loc = complexity.loc_counts(src)
+        test_loc = complexity.loc_counts(test)
+        d = complexity.dist(complexity.lizard_ccn(src, lizard)) or {}
+    finally:
+        _git(repo, "worktree", "remove", "--force", str(wt))
+    return {
+        "src_loc": src_loc, "test_loc": test_loc,
+        "test_ratio": round(test_loc / src_loc, 2) if src_loc else 0,
+        "src_files": len(src), "functions": d.get("functions"), "ccn_mean": d.get("ccn_mean"),
+        "pct_ccn_gt10": d.get("pct_ccn_gt10"), "pct_len_gt60": d.get("pct_len_gt60"),
+    }
+
+
+def _src_blobs(repo, commits):
+    return {(rel, sha) for c in commits for rel, sha in trend.tree_population(str(repo), c)["src"].items()}
+
+
+def test_trend_matches_a_checkout_and_measures_each_blob_once(history_repo, venv, tmp_path):
+    venv_dir, calls = venv
+    lizard = str(venv_dir / "bin" / "lizard")
+    commits = [sha for sha, _date in trend.sample_commits(str(history_repo), 3)]
+    result = trend.analyze(str(history_repo), str(tmp_path / "wt"), n=3, venv=str(venv_dir))
+
+    assert [p["commit"] for p in result["series"]] == [c[:10] for c in commits]
+    # Unchanged files are measured once across all three samples.
+    assert len(calls()) == len(_src_blobs(history_repo, commits)) == 6
+    assert all(f.startswith(str(tmp_path / "wt")) for _t, f in calls())
+    assert list((tmp_path / "wt").iterdir()) == []  # scratch removed, no worktrees
+    worktrees = subprocess.run(["git", "-C", str(history_repo), "worktree", "list"],
+                               capture_output=True, text=True, check=True).stdout
+    assert len(worktrees.splitlines()) == 1
+
+    for commit, point in zip(commits, result["series"], strict=True):
+        expected = _checkout_metrics(history_repo, commit, lizard, tmp_path)
+        assert {k: point[k] for k in expected} == expected
+    assert result["series"][-1]["test_loc"] == 2 and result["series"][-1]["src_files"] == 5
+
+
+def test_trend_measures_the_union_of_samples_once_with_identical_series(
+    history_repo, venv, tmp_path, monkeypatch,
+):
+    venv_dir, calls = venv
+    monkeypatch.setenv(cache.NO_CACHE_ENV, "1")
+    monkeypatch.setenv(complexity.JOBS_ENV, "1")
+    commits = [sha for sha, _date in trend.sample_commits(str(history_repo), 3)]
+    serial = trend.analyze(str(history_repo), str(tmp_path / "a"), n=3, venv=str(venv_dir))
+    # Even uncached, a file unchanged across samples is handed to lizard once.
+    assert len(calls()) == len(_src_blobs(history_repo, commits))
+    monkeypatch.setenv(complexity.JOBS_ENV, "3")
+    assert trend.analyze(str(history_repo), str(tmp_path / "b"), n=3, venv=str(venv_dir)) == serial
+
+
+def test_cat_blobs_streams_contents_and_skips_missing_objects(history_repo):
+    pop = trend.tree_population(str(history_repo), "HEAD")
+    sha = pop["src"]["pkg/a.py"]
+    got = dict(trend._cat_blobs(str(history_repo), [sha, "0" * 40, sha]))
+    assert got == {sha: (history_repo / "pkg" / "a.py").read_bytes()}
+    assert trend._line_count(b"") == 0
+    assert trend._line_count(b"a\nb") == 2 and trend._line_count(b"a\n") == 1
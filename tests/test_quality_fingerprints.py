@@ -0,0 +1,250 @@
+"""Tests for quality/fingerprints.py: the native, incremental clone detector
+behind ``clones.analyze(engine="native")`` and prevention_signals'
+new-duplication signal.
+
+The contract: stored and live (``CW_QUALITY_NO_CACHE``) runs report the same
+duplicates, a warm run re-fingerprints only the files whose content changed,
+and a focused run is exactly the full run's duplicates touching the focus
+files. ``tests/conftest.py``'s ``isolate_quality_cache`` keeps the store in a
+per-test directory.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import subprocess
+
+import pytest
+from quality import cache, clones, fingerprints
+
+# ~70 tokens over 9 lines: comfortably past MIN_TOKENS / MIN_LINES.
+BLOCK = """\
+def normalize(records, *, key="id", default=None):
+    seen = {}
+    for record in records:
+        value = record.get(key, default)
+        if value is None:
+            continue
+        seen[value] = {"name": record["name"], "size": len(record)}
+    total = sum(item["size"] for item in seen.values())
+    return sorted(seen.items()), total
+"""
+
+FILES = {
+    "pkg/a.py": "import os\n\n" + BLOCK,
+    "pkg/b.py": "X = 1\n\n\n" + BLOCK + "\nprint(X)\n",
+    "pkg/c.py": "def other():\n    return 2\n",
+}
+
+
+def _git(repo, *args):
+    subprocess.run(["git", "-C", str(repo), *args], check=True,
+                   capture_output=True, text=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "--initial-branch=main")
+    _git(repo, "config", "user.name", "Ada")
+    _git(repo, "config", "user.email", "ada@example.com")
+    for rel, content in FILES.items():
+        p = repo / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(content)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "seed")
+    return repo
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    seen: list[str] = []
+    real = cache.read_bytes
+
+    def recording(repo, rel):
+        seen.append(rel)
+        return real(repo, rel)
+
+    monkeypatch.setattr(cache, "read_bytes", recording)
+    return seen
+
+
+def _spans(dups):
+    return [((d["firstFile"]["name"], d["firstFile"]["start"], d["firstFile"]["end"]),
+             (d["secondFile"]["name"], d["secondFile"]["start"], d["secondFile"]["end"]))
+            for d in dups]
+
+
+def test_copied_block_is_one_duplicate_with_exact_spans(repo):
+    dups = fingerprints.duplicates(str(repo), sorted(FILES))
+    assert _spans(dups) == [(("pkg/a.py", 3, 11), ("pkg/b.py", 4, 12))]
+    (dup,) = dups
+    assert dup["lines"] == 9
+    assert dup["tokens"] >= fingerprints.MIN_TOKENS
+    assert dup["fragment"] == BLOCK.rstrip("\n")
+    assert dup["format"] == "python"
+
+
+def test_comments_and_whitespace_do_not_break_a_clone(repo):
+    noisy = BLOCK.replace("    seen = {}\n", "    seen = {}   # cache\n\n")
+    (repo / "pkg" / "c.py").write_text(noisy)
+    dups = fingerprints.duplicates(str(repo), sorted(FILES))
+    assert {d["secondFile"]["name"] for d in dups} == {"pkg/b.py", "pkg/c.py"}
+
+
+def test_c_family_comments_are_dropped():
+    code = "a = b; // trailing\n/* block\n spans */ c = d;\n"
+    plain = "a = b;\nc = d;\n"
+    assert fingerprints._lex(code, "go")[0] == fingerprints._lex(plain, "go")[0]
+    assert fingerprints._lex("x = a // b\n", "python")[0] != fingerprints._lex("x = a\n", "python")[0]
+
+
+def test_short_or_small_copies_are_not_duplicates(repo):
+    (repo / "pkg" / "d.py").write_text(FILES["pkg/c.py"])
+    dups = fingerprints.duplicates(str(repo), [*sorted(FILES), "pkg/d.py"])
+    assert "pkg/d.py" not in {d["secondFile"]["name"] for d in dups}
+
+
+def test_warm_run_refingerprints_only_changed_files(repo, reads):
+    corpus = sorted(FILES)
+    cold = fingerprints.duplicates(str(repo), corpus)
+    assert sorted(reads) == corpus
+
+    reads.clear()
+    assert fingerprints.duplicates(str(repo), corpus) == cold
+    assert reads == []
+
+    (repo / "pkg" / "c.py").write_text(BLOCK)  # uncommitted edit
+    reads.clear()
+    warm = fingerprints.duplicates(str(repo), corpus)
+    assert reads == ["pkg/c.py"]
+    assert len(warm) == 3  # a~b, a~c, b~c
+
+
+def test_stored_focused_and_live_runs_agree(repo, monkeypatch):
+    (repo / "pkg" / "c.py").write_text("# prelude\n" + BLOCK)
+    corpus = sorted(FILES)
+    stored = fingerprints.duplicates(str(repo), corpus)
+    focused = fingerprints.duplicates(str(repo), corpus, focus=["pkg/c.py"])
+    assert focused == [d for d in stored if "pkg/c.py" in
+                       (d["firstFile"]["name"], d["secondFile"]["name"])]
+    assert len(focused) == 2
+    monkeypatch.setenv(cache.NO_CACHE_ENV, "1")
+    assert fingerprints.duplicates(str(repo), corpus) == stored
+    assert fingerprints.duplicates(str(repo), corpus, focus=["pkg/c.py"]) == focused
+
+
+def test_a_scoped_query_neither_reports_nor_evicts_files_outside_it(repo, reads):
+    corpus = sorted(FILES)
+    fingerprints.duplicates(str(repo), corpus)
+    reads.clear()
+    assert fingerprints.duplicates(str(repo), ["pkg/a.py", "pkg/c.py"]) == []
+    assert fingerprints.duplicates(str(repo), ["pkg/b.py", "pkg/c.py"],
+                                   focus=["pkg/c.py"]) == []
+    assert len(fingerprints.duplicates(str(repo), corpus)) == 1
+    assert reads == []  # alternating scopes never re-fingerprint anything
+
+
+def test_a_deleted_file_is_dropped_from_the_store(repo):
+    corpus = sorted(FILES)
+    fingerprints.duplicates(str(repo), corpus)
+    (repo / "pkg" / "b.py").unlink()
+    assert fingerprints.duplicates(str(repo), ["pkg/a.py"]) == []
+    conn = sqlite3.connect(str(cache.repo_dir(str(repo)) / fingerprints._DB_NAME))
+    stored = {rel for (rel,) in conn.execute("SELECT rel FROM anchors")}
+    conn.close()
+    assert "pkg/b.py" not in stored and "pkg/a.py" in stored
+
+
+def test_a_copy_of_exactly_min_tokens_is_still_found(tmp_path):
+    # The anchor index is winnowed: every MIN_TOKENS-token copy must still
+    # share an anchor, at every offset and in the same file.
+    words = [f"w{i}" for i in range(fingerprints.MIN_TOKENS)]
+    block = "\n".join(" ".join(words[i:i + 5]) for i in range(0, len(words), 5)) + "\n"
+    (tmp_path / "x.py").write_text("a b c\n" + block)
+    (tmp_path / "y.py").write_text(block + "z\n" + block)
+    dups = fingerprints.duplicates(str(tmp_path), ["x.py", "y.py"])
+    assert {(d["firstFile"]["name"], d["secondFile"]["name"]) for d in dups} == {
+        ("x.py", "y.py"), ("y.py", "y.py")}
+    assert all(d["tokens"] == fingerprints.MIN_TOKENS for d in dups)
+
+
+def test_untracked_and_non_git_corpora_are_fingerprinted_live(repo, tmp_path):
+    (repo / "scratch.py").write_text(BLOCK)
+    (repo / ".gitignore").write_text("scratch.py\n")
+    got = fingerprints.duplicates(str(repo), [*sorted(FILES), "scratch.py"])
+    assert len(got) == 3
+
+    plain = tmp_path / "plain"
+    plain.mkdir()
+    (plain / "x.py").write_text(BLOCK)
+    (plain / "y.py").write_text(BLOCK)
+    assert _spans(fingerprints.duplicates(str(plain), ["x.py", "y.py"])) == [
+        (("x.py", 1, 9), ("y.py", 1, 9))]
+
+
+def test_bytes_not_matching_the_manifest_are_never_stored(repo, monkeypatch, reads):
+    real = cache.manifest
+
+    def lying(repo_, corpus):
+        m = real(repo_, corpus)
+        m["pkg/b.py"] = "0" * 40  # as if the file changed after it was hashed
+        return m
+
+    monkeypatch.setattr(cache, "manifest", lying)
+    corpus = sorted(FILES)
+    first = fingerprints.duplicates(str(repo), corpus)
+    reads.clear()
+    assert fingerprints.duplicates(str(repo), corpus) == first
+    assert "pkg/b.py" in reads  # fingerprinted live every time
+
+
+def test_corrupt_or_foreign_version_store_is_rebuilt(repo):
+    corpus = sorted(FILES)
+    expected = fingerprints.duplicates(str(repo), corpus)
+    db = cache.repo_dir(str(repo)) / fingerprints._DB_NAME
+
+    conn = sqlite3.connect(str(db))
+    with conn:
+        conn.execute("UPDATE meta SET value = 'old' WHERE key = 'version'")
+        conn.execute("DELETE FROM anchors")
+    conn.close()
+    assert fingerprints.duplicates(str(repo), corpus) == expected
+
+    for suffix in ("-wal", "-shm"):
+        (db.parent / f"{db.name}{suffix}").unlink(missing_ok=True)
+    db.write_bytes(b"not a database" * 100)
+    assert fingerprints.duplicates(str(repo), corpus) == expected
+
+
+def test_boilerplate_windows_past_the_occurrence_cap_pair_nothing(repo, monkeypatch):
+    monkeypatch.setattr(fingerprints, "MAX_OCCURRENCES", 1)
+    assert fingerprints.duplicates(str(repo), sorted(FILES)) == []
+
+
+def test_native_clones_engine_clusters_like_jscpd_duplicates(repo, monkeypatch):
+    (repo / "pkg" / "c.py").write_text(BLOCK)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "third copy")
+    result = clones.analyze(str(repo), "unused", engine="native")
+    assert result["status"] == "measured"
+    assert result["detector"] == "native"
+    (cls,) = result["clone_classes"]
+    assert cls["size"] == 3
+    assert [m["file"] for m in cls["members"]] == ["pkg/a.py", "pkg/b.py", "pkg/c.py"]
+
+    scoped = clones.analyze(str(repo), "unused", engine="native",
+                            path_filter=lambda rel: rel != "pkg/c.py")
+    assert scoped["files_in_corpus"] == 2
+    assert [c["size"] for c in scoped["clone_classes"]] == [2]
+
+    focused = clones.analyze(str(repo), "unused", engine="native", focus=["pkg/c.py"])
+    assert focused["focus_files"] == 1
+    assert focused["clone_classes"] == result["clone_classes"]
+
+    monkeypatch.setenv(clones.ENGINE_ENV, "native")
+    assert clones.analyze(str(repo), "unused")["detector"] == "native"
+    with pytest.raises(ValueError, match="unknown clone engine"):
+        clones.analyze(str(repo), "unused", engine="simian")
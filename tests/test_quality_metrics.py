@@ -14,7 +14,7 @@ import os
 import subprocess
 
 import pytest
-from quality import churn, complexity, duplication, process, report, survival, trend
+from quality import churn, complexity, duplication, history, process, report, survival, trend
 
 # --- synthetic repo fixture -------------------------------------------------
 
@@ -287,12 +287,12 @@ def test_trend_skips_without_lizard(synth_repo, monkeypatch):
 
 
 # --- #328: a sampled commit's metrics are immutable — the second measurement
-# of the SAME commit must perform zero checkouts (no `git worktree add`).
+# of the SAME commit must read nothing from git (no `git ls-tree` of its tree).
 # lizard is faked out (CI has none of the battery's tools installed) so this
 # exercises the caching path, not lizard itself.
 
 
-def _spy_on_worktree_add(monkeypatch, module):
+def _spy_on_tree_reads(monkeypatch, module):
     calls: list[tuple] = []
     real_run = module.run
 
@@ -304,39 +304,39 @@ def _spy_on_worktree_add(monkeypatch, module):
     return calls
 
 
-def test_trend_measure_at_second_call_same_commit_skips_checkout(synth_repo, monkeypatch):
+def test_trend_measure_at_second_call_same_commit_reads_nothing(synth_repo, monkeypatch):
     monkeypatch.setattr(trend, "_tool", lambda *a, **k: "/usr/bin/true")
-    monkeypatch.setattr(trend, "lizard_ccn", lambda files, lizard_bin: [
+    monkeypatch.setattr(trend, "lizard_ccn", lambda files, lizard_bin, **kw: [
         {"nloc": 3, "ccn": 1, "length": 3, "file": f} for f in files
     ])
     commit, _date = trend.sample_commits(str(synth_repo), 2)[0]
-    calls = _spy_on_worktree_add(monkeypatch, trend)
+    calls = _spy_on_tree_reads(monkeypatch, trend)
     workdir = str(synth_repo / "wt")
 
     m1 = trend.measure_at(str(synth_repo), commit, "/usr/bin/true", workdir)
-    adds_after_first = sum(1 for c in calls if "worktree" in c and "add" in c)
-    assert adds_after_first >= 1
+    reads_after_first = sum(1 for c in calls if "ls-tree" in c)
+    assert reads_after_first >= 1
 
     m2 = trend.measure_at(str(synth_repo), commit, "/usr/bin/true", workdir)
-    adds_after_second = sum(1 for c in calls if "worktree" in c and "add" in c)
-    assert adds_after_second == adds_after_first, (
-        "second measure_at for the SAME commit must perform zero checkouts"
+    reads_after_second = sum(1 for c in calls if "ls-tree" in c)
+    assert reads_after_second == reads_after_first, (
+        "second measure_at for the SAME commit must read no tree"
     )
     assert m1 == m2
 
 
-def test_trend_measure_at_no_cache_env_forces_a_real_checkout(synth_repo, monkeypatch):
+def test_trend_measure_at_no_cache_env_forces_a_real_measurement(synth_repo, monkeypatch):
     monkeypatch.setattr(trend, "_tool", lambda *a, **k: "/usr/bin/true")
-    monkeypatch.setattr(trend, "lizard_ccn", lambda files, lizard_bin: [])
+    monkeypatch.setattr(trend, "lizard_ccn", lambda files, lizard_bin, **kw: [])
     commit, _date = trend.sample_commits(str(synth_repo), 2)[0]
-    calls = _spy_on_worktree_add(monkeypatch, trend)
+    calls = _spy_on_tree_reads(monkeypatch, trend)
     workdir = str(synth_repo / "wt")
 
     trend.measure_at(str(synth_repo), commit, "/usr/bin/true", workdir)
-    n1 = sum(1 for c in calls if "worktree" in c and "add" in c)
+    n1 = sum(1 for c in calls if "ls-tree" in c)
     monkeypatch.setenv("CW_QUALITY_NO_CACHE", "1")
     trend.measure_at(str(synth_repo), commit, "/usr/bin/true", workdir)
-    n2 = sum(1 for c in calls if "worktree" in c and "add" in c)
+    n2 = sum(1 for c in calls if "ls-tree" in c)
     assert n2 > n1
 
 
@@ -441,3 +441,108 @@ def test_tracked_files_reflects_a_mutation_between_calls(synth_repo, monkeypatch
     _git(synth_repo, "add", "-A")
     after = complexity.tracked_files(str(synth_repo))
     assert "new_file.py" in after
+
+
+# --- one history extraction shared by every engine --------------------------
+
+
+@pytest.fixture()
+def extract_spy(monkeypatch):
+    """Records the shas each ``history._extract`` call was asked for, and
+    starts from an empty per-process memo (a fresh process)."""
+    monkeypatch.setattr(history, "_MEMO", {})
+    asked: list[list[str]] = []
+    real = history._extract
+
+    def spy(repo, shas):
+        asked.append(list(shas))
+        return real(repo, shas)
+
+    monkeypatch.setattr(history, "_extract", spy)
+    return asked
+
+
+def _engines(repo):
+    return (
+        churn.analyze(repo, top_n=100, no_merges=True),
+        churn.analyze(repo, top_n=100, no_merges=False),
+        churn.analyze(repo, top_n=100, since="2025-12-01"),
+        process.analyze(repo),
+        process.compute_coupling(repo, min_co=1),
+        trend.sample_commits(repo, 3),
+    )
+
+
+def test_history_store_matches_a_fresh_extraction(synth_repo, monkeypatch):
+    repo = str(synth_repo)
+    stored = _engines(repo)
+    monkeypatch.setenv("CW_QUALITY_NO_CACHE", "1")
+    assert _engines(repo) == stored
+
+
+def test_every_engine_shares_one_extraction(synth_repo, extract_spy):
+    repo = str(synth_repo)
+    _engines(repo)
+    assert [len(shas) for shas in extract_spy if shas] == [5]
+
+
+def test_a_later_process_reads_history_from_the_store(synth_repo, extract_spy, monkeypatch):
+    repo = str(synth_repo)
+    first = _engines(repo)
+    monkeypatch.setattr(history, "_MEMO", {})
+    assert _engines(repo) == first
+    assert [shas for shas in extract_spy if shas] == [extract_spy[0]]
+
+
+def test_a_new_commit_extracts_only_that_commit(synth_repo, extract_spy):
+    repo = str(synth_repo)
+    assert churn.analyze(repo)["scale"]["commits"] == 5
+    _commit(synth_repo, "fix: late", {"a.py": "def a():\n    return 6\n"})
+    head = subprocess.run(["git", "-C", repo, "rev-parse", "HEAD"],
+                          capture_output=True, text=True).stdout.strip()
+    assert churn.analyze(repo)["scale"]["commits"] == 6
+    assert [shas for shas in extract_spy if shas][-1] == [head]
+
+
+def test_a_corrupt_history_store_is_rebuilt(synth_repo, extract_spy, monkeypatch):
+    repo = str(synth_repo)
+    first = _engines(repo)
+    from quality import cache
+    (cache.repo_dir(repo) / "history.sqlite").write_bytes(b"not a database" * 100)
+    monkeypatch.setattr(history, "_MEMO", {})
+    assert _engines(repo) == first
+    monkeypatch.setattr(history, "_MEMO", {})
+    assert _engines(repo) == first
+    assert len([shas for shas in extract_spy if shas]) == 2  # once per store, never per engine
+
+
+def test_a_lookup_reads_only_the_requested_commits_from_the_store(synth_repo, extract_spy):
+    repo = str(synth_repo)
+    shas = [c.sha for c in history.commits(repo, "HEAD")]
+    history._MEMO.clear()
+    got = history.lookup(repo, shas[:2])
+    assert list(got) == shas[:2]
+    assert len([asked for asked in extract_spy if asked]) == 1  # served by the store
+    assert set(history._MEMO[os.path.abspath(repo)]) == set(shas[:2])
+
+
+def test_an_unknown_sha_does_not_fail_the_rest_of_the_batch(synth_repo, extract_spy):
+    repo = str(synth_repo)
+    head = subprocess.run(["git", "-C", repo, "rev-parse", "HEAD", "HEAD^{tree}"],
+                          capture_output=True, text=True).stdout.split()
+    got = history.lookup(repo, [head[0], "0" * 40, head[1]])
+    assert list(got) == [head[0]] and got[head[0]].changes
+
+
+def test_survival_author_times_come_from_the_store(synth_repo, tmp_path):
+    repo = str(synth_repo)
+    shas = [c.sha for c in history.commits(repo, "HEAD")]
+    authored = history.commits(repo, "HEAD")[0].authored
+    path = tmp_path / "survival.json"
+    path.write_text(json.dumps({
+        shas[0]: [[authored, 10], [authored + 20 * 86400, 9]],
+        "0" * 40: [[authored, 5]],  # unknown to git: skipped, never a crash
+    }))
+    result = survival.analyze_survival_json(str(path), repo)
+    assert result["total_lines_tracked"] == 10
+    assert result["survival_by_age_days"][14]["survival_pct"] == 93.0  # 1.0 -> 0.9 over 20d
@@ -0,0 +1,184 @@
+"""Tests for quality/tokens.py: the persistent identifier-occurrence index
+behind the built-in dead-code tier and prevention_signals' dead-code signal.
+
+The contract: counts always equal a full live count over the corpus (the
+pre-index behavior), while a warm query re-reads only the files whose
+content changed. ``tests/conftest.py``'s ``isolate_quality_cache`` keeps the
+index in a per-test directory.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import subprocess
+from collections import Counter
+
+import pytest
+from quality import cache, dead_code, population, tokens
+
+
+def _git(repo, *args):
+    subprocess.run(["git", "-C", str(repo), *args], check=True,
+                   capture_output=True, text=True)
+
+
+def _make_repo(tmp_path, files: dict[str, str]):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "--initial-branch=main")
+    _git(repo, "config", "user.name", "Ada")
+    _git(repo, "config", "user.email", "ada@example.com")
+    for rel, content in files.items():
+        p = repo / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(content)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "seed")
+    return repo
+
+
+FILES = {
+    "pkg/a.py": "def helper():\n    return 1\n\nclass Widget:\n    pass\n",
+    "pkg/b.py": "from pkg.a import helper\n\nhelper()\n",
+    "tests/test_a.py": "from pkg.a import Widget\n",
+}
+NAMES = ["helper", "Widget", "nowhere", "pkg"]
+
+
+def _expected(repo, corpus, names=NAMES):
+    """The pre-index reference: every corpus file read and regex-counted."""
+    live: Counter = Counter()
+    for rel in corpus:
+        if (repo / rel).is_file():
+            live.update(dead_code.IDENT_RE.findall((repo / rel).read_text(errors="replace")))
+    return {n: live.get(n, 0) for n in names}
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return _make_repo(tmp_path, FILES)
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    seen: list[str] = []
+    real = cache.read_bytes
+
+    def recording(repo, rel):
+        seen.append(rel)
+        return real(repo, rel)
+
+    monkeypatch.setattr(cache, "read_bytes", recording)
+    return seen
+
+
+def test_counts_match_a_live_count_and_absent_names_are_zero(repo):
+    corpus = sorted(FILES)
+    got = tokens.occurrences(str(repo), corpus, NAMES)
+    assert got == {"helper": 3, "Widget": 2, "nowhere": 0, "pkg": 2}
+    assert got == _expected(repo, corpus)
+
+
+def test_warm_query_reads_only_changed_files(repo, reads):
+    corpus = sorted(FILES)
+    tokens.occurrences(str(repo), corpus, NAMES)
+    assert sorted(reads) == corpus
+
+    reads.clear()
+    assert tokens.occurrences(str(repo), corpus, NAMES) == _expected(repo, corpus)
+    assert reads == []
+
+    (repo / "pkg" / "b.py").write_text("print('no uses left')\n")  # uncommitted edit
+    reads.clear()
+    got = tokens.occurrences(str(repo), corpus, NAMES)
+    assert reads == ["pkg/b.py"]
+    assert got["helper"] == 1
+    assert got == _expected(repo, corpus)
+
+
+def test_files_leaving_the_corpus_or_the_tree_are_subtracted(repo, reads):
+    corpus = sorted(FILES)
+    tokens.occurrences(str(repo), corpus, NAMES)
+    smaller = ["pkg/a.py", "pkg/b.py"]
+    reads.clear()
+    assert tokens.occurrences(str(repo), smaller, NAMES)["Widget"] == 1
+    assert reads == []
+
+    (repo / "pkg" / "b.py").unlink()
+    got = tokens.occurrences(str(repo), smaller, NAMES)
+    assert got == {"helper": 1, "Widget": 1, "nowhere": 0, "pkg": 0}
+
+
+def test_bytes_not_matching_the_manifest_are_counted_but_never_indexed(repo, monkeypatch, reads):
+    real = cache.manifest
+
+    def lying(repo_, corpus):
+        m = real(repo_, corpus)
+        m["pkg/b.py"] = "0" * 40  # as if the file changed after it was hashed
+        return m
+
+    monkeypatch.setattr(cache, "manifest", lying)
+    corpus = sorted(FILES)
+    assert tokens.occurrences(str(repo), corpus, NAMES) == _expected(repo, corpus)
+    reads.clear()
+    assert tokens.occurrences(str(repo), corpus, NAMES) == _expected(repo, corpus)
+    assert reads == ["pkg/b.py"]  # re-read every time, never served from the index
+
+
+def test_corpus_files_outside_the_manifest_are_counted_live(repo):
+    (repo / "untracked_but_ignored.py").write_text("helper\n")
+    (repo / ".gitignore").write_text("untracked_but_ignored.py\n")
+    corpus = [*sorted(FILES), "untracked_but_ignored.py"]
+    assert tokens.occurrences(str(repo), corpus, NAMES)["helper"] == 4
+
+
+def test_no_cache_and_non_git_fall_back_to_a_live_count(repo, tmp_path, monkeypatch):
+    corpus = sorted(FILES)
+    monkeypatch.setenv(cache.NO_CACHE_ENV, "1")
+    assert tokens.occurrences(str(repo), corpus, NAMES) == _expected(repo, corpus)
+    monkeypatch.delenv(cache.NO_CACHE_ENV)
+    assert not (cache.repo_dir(str(repo)) / tokens._DB_NAME).exists()
+
+    plain = tmp_path / "plain"
+    plain.mkdir()
+    (plain / "x.py").write_text("helper helper\n")
+    assert tokens.occurrences(str(plain), ["x.py"], ["helper"]) == {"helper": 2}
+
+
+def test_corrupt_or_foreign_version_index_is_rebuilt(repo):
+    corpus = sorted(FILES)
+    tokens.occurrences(str(repo), corpus, NAMES)
+    db = cache.repo_dir(str(repo)) / tokens._DB_NAME
+
+    conn = sqlite3.connect(str(db))
+    with conn:
+        conn.execute("UPDATE meta SET value = 'old' WHERE key = 'version'")
+        conn.execute("UPDATE totals SET n = 99")
+    conn.close()
+    assert tokens.occurrences(str(repo), corpus, NAMES) == _expected(repo, corpus)
+
+    for suffix in ("-wal", "-shm"):
+        (db.parent / f"{db.name}{suffix}").unlink(missing_ok=True)
+    db.write_bytes(b"not a database" * 100)
+    assert tokens.occurrences(str(repo), corpus, NAMES) == _expected(repo, corpus)
+
+
+def test_byte_counting_matches_the_text_identifier_grammar():
+    assert tokens.IDENT_BYTES_RE_PATTERN.decode() == dead_code.IDENT_RE.pattern
+    data = "héllo wörld_1 _x9 naïve\n".encode() + b"\xff\xfeabc \x80def"
+    text = data.decode("utf-8", errors="replace")
+    assert tokens.file_counts(data) == Counter(dead_code.IDENT_RE.findall(text))
+
+
+def test_builtin_dead_code_pass_is_identical_with_and_without_the_index(repo, monkeypatch):
+    (repo / "pkg" / "c.py").write_text("def orphan():\n    pass\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "orphan")
+    monkeypatch.setattr(dead_code, "_vulture_pass", lambda *a, **k: None)
+    indexed = dead_code.analyze(str(repo))
+    warm = dead_code.analyze(str(repo))
+    monkeypatch.setenv(cache.NO_CACHE_ENV, "1")
+    live = dead_code.analyze(str(repo))
+    assert indexed == warm == live
+    assert [f["symbol"] for f in live["findings"]] == ["orphan"]
+    assert population.tracked_source(str(repo))  # the corpus was non-empty
@@ -0,0 +1,85 @@
+"""Tests for the mergeable quantile sketch (``chief_wiggum/quantile_sketch.py``).
+
+The contract: every quantile is within the sketch's relative accuracy of the
+exact sample quantile, merging shards gives exactly the sketch of the
+concatenated samples, memory is bounded by the bucket cap, and a serialized
+sketch round-trips (and a non-sketch is refused, never read as empty).
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from chief_wiggum.quantile_sketch import QuantileSketch
+
+
+def _exact(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def _sketch(samples, **kw) -> QuantileSketch:
+    sketch = QuantileSketch(**kw)
+    for v in samples:
+        sketch.add(v)
+    return sketch
+
+
+@pytest.mark.parametrize("q", [0.0, 0.5, 0.9, 0.95, 0.99, 0.999, 1.0])
+def test_quantiles_are_within_relative_accuracy(q):
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(5, 1.2) for _ in range(20_000)]
+    sketch = _sketch(samples, relative_accuracy=0.01)
+    assert sketch.count == len(samples)
+    assert sketch.quantile(q) == pytest.approx(_exact(samples, q), rel=0.01)
+    assert sketch.quantile(1.0) == max(samples) and sketch.quantile(0.0) == min(samples)
+
+
+def test_merged_shards_equal_one_pass_over_all_samples():
+    rng = random.Random(11)
+    shards = [[rng.expovariate(1 / 300) for _ in range(3_000)] for _ in range(4)]
+    merged = QuantileSketch()
+    for shard in shards:
+        merged.merge(_sketch(shard))
+    whole = _sketch([v for shard in shards for v in shard])
+    assert merged.to_dict() == whole.to_dict()
+    with pytest.raises(ValueError):
+        merged.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+def test_memory_is_bounded_by_the_bucket_cap_and_keeps_the_tail():
+    samples = [10 ** (i / 1000) for i in range(9_000)]  # nine decades
+    sketch = _sketch(samples, max_buckets=64)
+    assert sketch.bucket_count <= 64
+    assert sketch.quantile(0.99) == pytest.approx(_exact(samples, 0.99), rel=0.01)
+
+
+def test_the_cap_holds_for_signed_samples_down_to_two_buckets():
+    samples = [-(10 ** (i / 100)) for i in range(300)] + [10 ** (i / 100) for i in range(300)]
+    sketch = _sketch(samples, max_buckets=2)
+    assert sketch.bucket_count == 2
+    assert sketch.quantile(0.0) < 0 < sketch.quantile(1.0)
+    with pytest.raises(ValueError, match="max_buckets"):
+        QuantileSketch(max_buckets=1)
+
+
+def test_zero_and_negative_values_are_ordered():
+    sketch = _sketch([-50, -5, 0, 0, 5, 50])
+    assert sketch.quantile(0.0) == -50
+    assert sketch.quantile(0.2) == pytest.approx(-5, rel=0.01)
+    assert sketch.quantile(0.5) == 0
+    assert sketch.quantile(1.0) == 50
+    assert QuantileSketch().quantile(0.5) is None
+    with pytest.raises(ValueError):
+        sketch.add(float("nan"))
+
+
+def test_round_trip_and_rejection():
+    sketch = _sketch([1.5, 2.5, 300.0, 0.0, -4.0])
+    again = QuantileSketch.from_dict(sketch.to_dict())
+    assert again.to_dict() == sketch.to_dict()
+    assert again.quantile(0.75) == sketch.quantile(0.75)
+    for bad in ({}, {**sketch.to_dict(), "count": 99}):
+        with pytest.raises(ValueError):
+            QuantileSketch.from_dict(bad)
@@ -5,6 +5,7 @@ import json
 import shutil
 import subprocess
 import sys
+import time
 from datetime import date
 from pathlib import Path
 
@@ -14,6 +15,7 @@ SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
 sys.path.insert(0, str(SCRIPTS))
 
 import ratchet  # noqa: E402
+from chief_wiggum import suite_cache  # noqa: E402
 
 # ---- fixtures -----------------------------------------------------------------
 
@@ -927,6 +929,122 @@ def test_append_authority_event_fails_closed_on_garbled_tail(tmp_path):
         ratchet.append_authority_event(journal, "g", "unwire")
 
 
+# ---- checkpointed chain verification -----------------------------------------
+# A reader resumes verification from a signed checkpoint of the last verified
+# byte prefix (and skips it entirely on an unchanged file), but must still fail
+# closed on a tamper anywhere — before the checkpoint or after it.
+
+
+def _authority_chain(journal: Path, n: int) -> None:
+    _chain(journal, [
+        {"record_id": f"rec-{i:05d}", "event": "gate-authority", "ref": f"g{i % 3}",
+         "details": "wire" if i % 2 else "unwire"}
+        for i in range(1, n + 1)
+    ])
+
+
+@pytest.fixture
+def hash_calls(monkeypatch):
+    """Count record hashes computed by ratchet's chain verification."""
+    calls = []
+    real = ratchet.stable_hash
+
+    def counting(*parts):
+        calls.append(parts[0])
+        return real(*parts)
+
+    monkeypatch.setattr(ratchet, "stable_hash", counting)
+    return calls
+
+
+def _fresh_process():
+    ratchet._CHAIN_MEMO.clear()
+
+
+def test_unchanged_journal_is_not_re_verified_in_process(tmp_path, hash_calls):
+    journal = tmp_path / "ratchet-journal.jsonl"
+    _authority_chain(journal, 6)
+    first = ratchet.verified_prefix(journal)
+    assert len(hash_calls) == 6
+    assert ratchet.verified_prefix(journal) == first
+    assert ratchet.last_authority_action(journal, "g1") == "unwire"
+    assert len(hash_calls) == 6
+
+
+def test_verification_resumes_from_the_checkpoint(tmp_path, hash_calls):
+    journal = tmp_path / "ratchet-journal.jsonl"
+    _authority_chain(journal, 6)
+    cfg = argparse.Namespace(journal=journal)
+    before = ratchet.load_journal(cfg)
+    ratchet.append_authority_event(journal, "g9", "wire")
+    _fresh_process()
+    hash_calls.clear()
+
+    after = ratchet.load_journal(cfg)
+    assert after[:6] == before and after[6]["ref"] == "g9"
+    assert len(hash_calls) == 1  # only the appended record is hashed
+    assert ratchet.last_authority_action(journal, "g9") == "wire"
+
+
+def test_tamper_inside_the_checkpointed_prefix_still_fails_closed(tmp_path):
+    journal = tmp_path / "ratchet-journal.jsonl"
+    _authority_chain(journal, 4)
+    cfg = argparse.Namespace(journal=journal)
+    ratchet.load_journal(cfg)  # checkpoint covers all four records
+    # Same-length in-place edit of an early record, hash left untouched.
+    journal.write_text(journal.read_text().replace('"details": "wire"', '"details": "xire"', 1))
+    _fresh_process()
+
+    with pytest.raises(ratchet.TamperError, match="record 0"):
+        ratchet.load_journal(cfg)
+    assert ratchet.verified_prefix(journal) == []
+
+
+def test_tamper_after_the_checkpoint_still_fails_closed(tmp_path):
+    journal = tmp_path / "ratchet-journal.jsonl"
+    _authority_chain(journal, 3)
+    cfg = argparse.Namespace(journal=journal)
+    ratchet.load_journal(cfg)
+    with journal.open("a") as f:
+        f.write(json.dumps({"record_id": "rec-00004", "event": "gate-authority", "ref": "g",
+                            "details": "wire", "record_hash": "0" * 64}, sort_keys=True) + "\n")
+
+    with pytest.raises(ratchet.TamperError, match="record 3"):
+        ratchet.load_journal(cfg)
+    assert len(ratchet.verified_prefix(journal)) == 3
+    with pytest.raises(ratchet.TamperError):
+        ratchet.append_authority_event(journal, "g", "unwire")
+
+
+def test_a_forged_checkpoint_is_ignored(tmp_path, hash_calls):
+    from chief_wiggum import chain_checkpoint  # noqa: PLC0415
+    journal = tmp_path / "ratchet-journal.jsonl"
+    _authority_chain(journal, 5)
+    ratchet.verified_prefix(journal)
+    cp_file = chain_checkpoint._path(journal)
+    forged = json.loads(cp_file.read_text())
+    forged["records"] = 4
+    cp_file.write_text(json.dumps(forged))
+    assert chain_checkpoint.load(journal) is None
+
+    _fresh_process()
+    hash_calls.clear()
+    assert len(ratchet.verified_prefix(journal)) == 5
+    assert len(hash_calls) == 5  # verified from genesis
+
+
+def test_no_checkpoint_escape_hatch_writes_nothing(tmp_path, monkeypatch, hash_calls):
+    from chief_wiggum import chain_checkpoint  # noqa: PLC0415
+    monkeypatch.setenv(chain_checkpoint.NO_CHECKPOINT_ENV, "1")
+    journal = tmp_path / "ratchet-journal.jsonl"
+    _authority_chain(journal, 3)
+    ratchet.verified_prefix(journal)
+    _fresh_process()
+    ratchet.verified_prefix(journal)
+    assert len(hash_calls) == 6
+    assert not chain_checkpoint._path(journal).exists()
+
+
 # ---- --scanner-version (#184) --------------------------------------------------
 
 
@@ -1286,6 +1404,243 @@ def test_score_reuse_report_still_rejects_a_genuinely_unknown_parser(tmp_path):
         ratchet.reuse_suite_report(cfg, suite, report, 1800)
 
 
+# ---- concurrent, streamed, cached suite runs -------------------------------------
+
+
+def _pass_line_suite(name, script, **extra):
+    return {"name": name, "cmd": script, "cwd": ".", "parser": "pass-fail-lines", **extra}
+
+
+def _scorecard(repo):
+    return json.loads((Path(repo) / "docs" / "quality" / ratchet.SCORECARD_NAME).read_text())
+
+
+def test_independent_suites_run_concurrently(tmp_path):
+    """Each suite waits for the OTHER to start: run serially, the first gives
+    up and reports nothing; run concurrently, both see each other. Entries
+    still land in config order."""
+    wait = "for i in $(seq 100); do [ -f {other} ] && break; sleep 0.05; done; [ -f {other} ] && echo 'PASS: {me}'"
+    make_repo(tmp_path, suites=[
+        _pass_line_suite("a", "touch a.started; " + wait.format(other="b.started", me="a")),
+        _pass_line_suite("b", "touch b.started; " + wait.format(other="a.started", me="b")),
+    ])
+    ratchet.cmd_score(_score_args(tmp_path, jobs=2))
+    sc = _scorecard(tmp_path)
+    assert sc["pass_set"] == ["a::a", "b::b"]
+    assert [e["suite"] for e in sc["suite_measurement"]["suites"]] == ["a", "b"]
+
+
+def test_jobs_one_is_the_serial_loop(tmp_path):
+    make_repo(tmp_path, suites=[
+        _pass_line_suite("a", "echo a >> order; echo 'PASS: x'"),
+        _pass_line_suite("b", "echo b >> order; echo 'PASS: y'"),
+    ])
+    ratchet.cmd_score(_score_args(tmp_path, jobs=1))
+    assert (tmp_path / "order").read_text() == "a\nb\n"
+
+
+def test_suites_sharing_a_report_never_run_concurrently(tmp_path):
+    cfg = make_repo(tmp_path, suites=[
+        {"name": "a", "cmd": "true", "parser": "junit-xml", "report": "r.xml"},
+        {"name": "b", "cmd": "true", "parser": "junit-xml", "report": "r.xml"},
+        {"name": "c", "cmd": "true", "parser": "junit-xml", "report": "c.xml"},
+    ])
+    assert ratchet._suite_jobs(8, cfg.suites) == 1
+    assert ratchet._suite_jobs(8, cfg.suites[1:]) == 2
+
+
+def test_suite_jobs_env_default_and_malformed_value(monkeypatch):
+    suites = [ratchet.Suite(name=str(i), cmd="true", parser="pass-fail-lines") for i in range(8)]
+    monkeypatch.setenv(ratchet.SUITE_JOBS_ENV, "3")
+    assert ratchet._suite_jobs(None, suites) == 3
+    monkeypatch.setenv(ratchet.SUITE_JOBS_ENV, "lots")
+    assert ratchet._suite_jobs(None, suites) == 1
+
+
+def test_a_suite_past_its_timeout_is_killed_and_fails_loudly(tmp_path):
+    """The suite's own process group dies with it — a surviving grandchild
+    would keep the pipe open and hang `score` anyway."""
+    make_repo(tmp_path, suites=[
+        _pass_line_suite("slow", "echo 'PASS: early'; sleep 30 & wait", timeout=0.5),
+    ])
+    started = time.monotonic()
+    with pytest.raises(ratchet.RatchetError, match="timed out after 0.5s"):
+        ratchet.cmd_score(_score_args(tmp_path))
+    assert time.monotonic() - started < 10
+
+
+@pytest.mark.parametrize("field, value, message", [
+    ("inputs", "scripts", "'inputs' must be a list of pathspec strings"),
+    ("inputs", ["src", 3], "'inputs' must be a list of pathspec strings"),
+    ("timeout", "30s", "'timeout' must be a positive number"),
+    ("timeout", 0, "'timeout' must be a positive number"),
+    ("timeout", True, "'timeout' must be a positive number"),
+])
+def test_malformed_suite_inputs_or_timeout_is_a_config_error(tmp_path, field, value, message):
+    make_repo(tmp_path, suites=[_pass_line_suite("py", "echo 'PASS: x'")])
+    config = tmp_path / "docs" / "quality" / "ratchet.json"
+    raw = json.loads(config.read_text())
+    raw["suites"][0][field] = value
+    config.write_text(json.dumps(raw))
+    with pytest.raises(ratchet.RatchetError, match=f"suite 'py' {message}"):
+        ratchet.load_config(tmp_path)
+
+
+def test_well_formed_suite_inputs_and_timeout_load(tmp_path):
+    make_repo(tmp_path, suites=[_pass_line_suite("py", "true", inputs=["src"], timeout=2.5)])
+    (suite,) = ratchet.load_config(tmp_path).suites
+    assert (suite.inputs, suite.timeout) == (["src"], 2.5)
+
+
+def test_suite_timeout_flag_applies_to_suites_without_their_own(tmp_path):
+    make_repo(tmp_path, suites=[_pass_line_suite("slow", "sleep 30")])
+    with pytest.raises(ratchet.RatchetError, match="'slow': timed out"):
+        ratchet.cmd_score(_score_args(tmp_path, suite_timeout=0.5))
+
+
+def test_streamed_junit_report_matches_the_text_parsers(tmp_path):
+    cfg = make_repo(tmp_path)
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_w.py").write_text("")
+    xml = (
+        '<?xml version="1.0" encoding="utf-8"?><testsuites>'
+        '<testsuite name="outer"><testsuite name="inner">'
+        '<testcase classname="tests.test_w" name="ok"><system-out>' + "noise " * 5000
+        + '</system-out></testcase>'
+        '<testcase classname="tests.test_w.K" name="bad"><failure>x</failure></testcase>'
+        '</testsuite><testcase file="tests/test_w.py" name="skipped"><skipped/></testcase>'
+        '</testsuite></testsuites>'
+    )
+    report = tmp_path / "r.xml"
+    report.write_text(xml)
+    suite = ratchet.Suite(name="py", cmd="true", parser="junit-xml", report="r.xml")
+    passed, files = ratchet._parse_junit_report(cfg, suite, report)
+    assert passed == ratchet.parse_junit_xml(xml) == {"tests.test_w::ok"}
+    assert files == ratchet.junit_case_files(cfg, suite, xml)
+    assert set(files.values()) == {"tests/test_w.py"}
+
+
+def _cached_repo(tmp_path, suites):
+    """A git work tree (the cache needs one to key on) with a run counter."""
+    repo = tmp_path / "repo"
+    make_repo(repo, suites=suites)
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    (repo / ".gitignore").write_text("runs-*\n")
+    (repo / "src").mkdir()
+    (repo / "src" / "lib.py").write_text("x = 1\n")
+    (repo / "other.txt").write_text("unrelated\n")
+    return repo
+
+
+def _cached_args(repo, **overrides):
+    return _score_args(repo, suite_cache=True, **overrides)
+
+
+def _counting_suite(name, **extra):
+    return _pass_line_suite(name, f"echo run >> runs-{name}; echo 'PASS: {name}_case'", **extra)
+
+
+def _runs(repo, name):
+    path = repo / f"runs-{name}"
+    return len(path.read_text().splitlines()) if path.exists() else 0
+
+
+def test_an_unchanged_suite_is_replayed_not_rerun(tmp_path):
+    repo = _cached_repo(tmp_path, [_counting_suite("py")])
+    ratchet.cmd_score(_cached_args(repo))
+    first = _scorecard(repo)
+    ratchet.cmd_score(_cached_args(repo))
+    second = _scorecard(repo)
+    assert _runs(repo, "py") == 1
+    assert second["pass_set"] == first["pass_set"] == ["py::py_case"]
+    assert second["suite_measurement"]["suites"][0]["source"] == "cached"
+    assert first["suite_measurement"]["suites"][0]["source"] == "run"
+
+
+def test_a_changed_input_reruns_only_the_suites_that_read_it(tmp_path):
+    repo = _cached_repo(tmp_path, [
+        _counting_suite("lib", inputs=["src"]),
+        _counting_suite("whole"),
+    ])
+    ratchet.cmd_score(_cached_args(repo))
+    (repo / "other.txt").write_text("changed\n")
+    ratchet.cmd_score(_cached_args(repo))
+    assert (_runs(repo, "lib"), _runs(repo, "whole")) == (1, 2)
+    (repo / "src" / "new.py").write_text("")  # untracked files are inputs too
+    ratchet.cmd_score(_cached_args(repo))
+    assert (_runs(repo, "lib"), _runs(repo, "whole")) == (2, 3)
+
+
+def test_keying_the_inputs_writes_nothing_into_the_repo(tmp_path):
+    repo = _cached_repo(tmp_path, [_counting_suite("py")])
+    subprocess.run(["git", "add", "src"], cwd=repo, check=True)
+    (repo / "src" / "lib.py").write_text("x = 2\n")  # modified: add -A would hash it
+    before = sorted(p for p in (repo / ".git" / "objects").rglob("*") if p.is_file())
+    index = (repo / ".git" / "index").read_bytes()
+    first = suite_cache.input_listings(repo, [["src"], []], [])
+    assert all(listing for listing in first)
+    assert sorted(p for p in (repo / ".git" / "objects").rglob("*") if p.is_file()) == before
+    assert (repo / ".git" / "index").read_bytes() == index
+    assert suite_cache.input_listings(repo, [["src"], []], []) == first
+
+
+def test_a_changed_suite_definition_is_rerun(tmp_path):
+    repo = _cached_repo(tmp_path, [_counting_suite("py")])
+    ratchet.cmd_score(_cached_args(repo))
+    config = repo / "docs" / "quality" / "ratchet.json"
+    raw = json.loads(config.read_text())
+    raw["suites"][0]["cmd"] += "; true"
+    config.write_text(json.dumps(raw))
+    ratchet.cmd_score(_cached_args(repo))
+    assert _runs(repo, "py") == 2
+
+
+def test_the_ratchets_own_writes_do_not_bust_the_key(tmp_path):
+    """`score` writes the scorecard and the suite's report inside the tree;
+    neither may count as a changed input."""
+    repo = _cached_repo(tmp_path, [{
+        "name": "py", "parser": "junit-xml", "report": "out/report.xml",
+        "cmd": "mkdir -p out; echo run >> runs-py; "
+               f"printf '{_PASSING_JUNIT}' > out/report.xml",
+    }])
+    for _ in range(3):
+        ratchet.cmd_score(_cached_args(repo))
+    assert _runs(repo, "py") == 1
+    assert _scorecard(repo)["pass_set"] == ["py::a.b::t1"]
+
+
+def test_the_suite_cache_is_opt_in(tmp_path, monkeypatch, capsys):
+    repo = _cached_repo(tmp_path, [_counting_suite("py")])
+    ratchet.cmd_score(_score_args(repo))
+    ratchet.cmd_score(_score_args(repo))
+    assert _runs(repo, "py") == 2  # off by default: every score runs the suite
+    monkeypatch.setenv(suite_cache.ENABLE_ENV, "1")
+    ratchet.cmd_score(_score_args(repo))
+    capsys.readouterr()
+    ratchet.cmd_score(_score_args(repo))
+    assert _runs(repo, "py") == 3
+    assert "replayed from cache, NOT re-run (inputs unchanged): py" in capsys.readouterr().out
+
+
+def test_a_run_that_measured_nothing_is_never_replayed(tmp_path):
+    repo = _cached_repo(tmp_path, [_pass_line_suite("py", "echo run >> runs-py; exit 137")])
+    ratchet.cmd_score(_cached_args(repo))
+    ratchet.cmd_score(_cached_args(repo))
+    assert _runs(repo, "py") == 2
+    assert _scorecard(repo)["suite_measurement"]["status"] == "error"
+
+
+def test_a_corrupt_cache_entry_costs_a_run(tmp_path):
+    repo = _cached_repo(tmp_path, [_counting_suite("py")])
+    ratchet.cmd_score(_cached_args(repo))
+    cache_dir = tmp_path / "ratchet-suite-cache"
+    for entry in cache_dir.glob("*.json"):
+        entry.write_text("{not json")
+    ratchet.cmd_score(_cached_args(repo))
+    assert _runs(repo, "py") == 2
+    assert _scorecard(repo)["pass_set"] == ["py::py_case"]
+
+
 # ---- sanctioned pathset (chief-wiggum#213) -----------------------------------------
 
 
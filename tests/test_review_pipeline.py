@@ -1590,6 +1590,33 @@ def test_governing_ids_for_files_parses_orient_json(tmp_path):
     assert "src/foo.py" in calls[0]
 
 
+def test_governing_ids_for_files_asks_once_for_every_file_and_reads_merged_ids(tmp_path):
+    calls = []
+
+    def runner(cmd, **kwargs):
+        calls.append(cmd)
+        envelope = {
+            "facts": [{"id": "CTR-order-001"}],  # paged window: ids is the whole answer
+            "ids": ["CTR-order-001", "inv-order-002"],
+            "files": {},
+        }
+        return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(envelope), stderr="")
+
+    files = [f"src/mod{i}.py" for i in range(200)]
+    ids = review._governing_ids_for_files(tmp_path, "order-lifecycle", files, runner=runner)
+
+    assert ids == {"CTR-order-001", "INV-order-002"}
+    assert len(calls) == 1
+    assert calls[0][calls[0].index("orient") + 1:] == files
+
+
+def test_governing_ids_for_files_without_files_runs_nothing(tmp_path):
+    def runner(cmd, **kwargs):
+        raise AssertionError("code_query invoked with no files")
+
+    assert review._governing_ids_for_files(tmp_path, "order-lifecycle", [], runner=runner) == set()
+
+
 def test_governing_ids_for_files_degrades_to_empty_on_any_failure(tmp_path):
     def broken_runner(cmd, **kwargs):
         raise OSError("code_query.py not found")
@@ -1702,3 +1729,42 @@ def test_run_review_without_epic_slug_uses_whole_artifacts_unchanged(tmp_path, m
 
     assert "CTR-order-001" in captured["prompt"]
     assert "CTR-billing-005" in captured["prompt"]
+
+
+def test_run_review_governing_lookup_covers_files_the_diff_budget_omitted(tmp_path, monkeypatch):
+    # The diff text is budgeted per file, but the touched-file list comes from
+    # the streamed index: a file whose diff did not fit is still looked up.
+    monkeypatch.setattr(review.providers, "plan_role", lambda r, c: _plan())
+    asked = []
+
+    def code_query_runner(cmd, **kwargs):
+        asked.extend(cmd[cmd.index("orient") + 1:])
+        return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps({"facts": []}), stderr="")
+
+    captured = {}
+
+    def execute(provider, prompt, timeout_override=None):
+        captured["prompt"] = prompt
+        return "A substantive review with findings to report here."
+
+    big = "diff --git a/src/big.py b/src/big.py\n@@ -0,0 +1 @@\n" + "+x = 1\n" * 2000
+    small = "diff --git a/src/foo.py b/src/foo.py\n@@ -1 +1 @@\n+touched\n"
+    runner = _runner(
+        {
+            "rev-parse --show-toplevel": (0, str(tmp_path)),
+            "rev-parse --verify": (0, "abc"),
+            "diff": (0, big + small),
+        }
+    )
+
+    review.run_review(
+        _ticket(), tmp_path, "main", tmp_path / "out",
+        template=TEMPLATE, checklist=LONG_CHECKLIST,
+        epic_sections=[("Contracts", CONTRACTS_FIXTURE)],
+        config={}, execute=execute, runner=runner, max_diff_bytes=1000,
+        epic_slug="order-lifecycle", code_query_runner=code_query_runner,
+    )
+
+    assert sorted(asked) == ["src/big.py", "src/foo.py"]
+    assert "+touched" in captured["prompt"]
+    assert "src/big.py (+2000/-0," in captured["prompt"]
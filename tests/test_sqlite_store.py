@@ -0,0 +1,65 @@
+"""Tests for scripts/chief_wiggum/sqlite_store.py — the shared opener behind
+every derived-data SQLite store (findings cache, plane-B index, factory-log
+index, and the quality engines' history/tokens/clones stores).
+
+The contract: a version mismatch empties the store before anything reads it,
+a corrupt file is discarded and recreated on the write path but never on the
+read path, and no failure ever raises.
+"""
+
+from __future__ import annotations
+
+from chief_wiggum.sqlite_store import open_store
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS rows (k TEXT PRIMARY KEY, v TEXT NOT NULL);"
+
+
+def _put(conn, k: str, v: str) -> None:
+    with conn:
+        conn.execute("INSERT INTO rows VALUES (?, ?)", (k, v))
+
+
+def test_creates_the_store_in_wal_mode(tmp_path):
+    conn = open_store(tmp_path / "s.sqlite3", SCHEMA)
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    _put(conn, "a", "1")
+    conn.close()
+    conn = open_store(tmp_path / "s.sqlite3", SCHEMA)
+    assert conn.execute("SELECT k, v FROM rows").fetchall() == [("a", "1")]
+    conn.close()
+
+
+def test_a_version_mismatch_empties_every_table_and_records_the_new_version(tmp_path):
+    path = tmp_path / "s.sqlite3"
+    conn = open_store(path, SCHEMA, {"version": "1"})
+    _put(conn, "a", "1")
+    conn.close()
+
+    conn = open_store(path, SCHEMA, {"version": "1"})
+    assert conn.execute("SELECT COUNT(*) FROM rows").fetchone() == (1,)  # same version: kept
+    conn.close()
+
+    conn = open_store(path, SCHEMA, {"version": "2", "pattern": "x"})
+    assert conn.execute("SELECT COUNT(*) FROM rows").fetchone() == (0,)
+    assert dict(conn.execute("SELECT key, value FROM meta")) == {"version": "2", "pattern": "x"}
+    conn.close()
+
+
+def test_a_corrupt_file_is_recreated_on_write_but_left_alone_on_read(tmp_path):
+    path = tmp_path / "s.sqlite3"
+    path.write_bytes(b"not a database" * 100)
+    assert open_store(path, SCHEMA, create=False) is None
+    assert path.read_bytes().startswith(b"not a database")
+
+    conn = open_store(path, SCHEMA)
+    assert conn.execute("SELECT COUNT(*) FROM rows").fetchone() == (0,)
+    conn.close()
+
+
+def test_the_read_path_never_creates_a_store(tmp_path):
+    assert open_store(tmp_path / "absent.sqlite3", SCHEMA, create=False) is None
+    assert not (tmp_path / "absent.sqlite3").exists()
+
+
+def test_an_unopenable_path_is_none_not_an_error(tmp_path):
+    assert open_store(tmp_path / "no" / "such" / "dir" / "s.sqlite3", SCHEMA) is None
@@ -150,6 +150,126 @@ def test_scan_go_files_ignores_commented_lines(tmp_path):
     assert matches == []
 
 
+def test_context_windows_keep_their_exact_reach(tmp_path):
+    """The sliding context answers the same windows the line-joining scan
+    did: a filter-looking SET is kept only with an update keyword within the
+    8 lines ending at it, and a FindOne split across a line break (the
+    preceding lines are joined with no separator) still marks a guard."""
+    filler = ["    x := 1"] * 7
+    src = "\n".join([
+        "package main",
+        "func Near() {",
+        "    coll.UpdateOne(ctx, f, u)",
+        *filler[:6],
+        '    filter["status"] = "near"',  # UpdateOne 7 lines up: in the window
+        "}",
+        "func Far() {",
+        "    coll.UpdateOne(ctx, f, u)",
+        *filler[:7],
+        '    filter["status"] = "far"',  # 8 lines up: just out of reach
+        "}",
+        "func Split() {",
+        "    coll.Find",
+        'One(ctx, bson.M{"status": "held"})',
+        "    b.Status = models.BookingStatusReleased",
+        "}",
+    ])
+    (tmp_path / "w.go").write_text(src)
+    found = {m.target_status: m for m in vt.scan_go_files(tmp_path)}
+    assert set(found) == {"near", "held", "released"}
+    assert found["released"].guard_statuses == ["held"]
+
+
+def test_walk_prunes_vendored_trees_by_name_suffix(tmp_path):
+    """A path is skipped exactly when it contained "vendor/" (etc.) — i.e. a
+    directory whose name ENDS in vendor/node_modules/.git — and such trees
+    are pruned, not walked and filtered."""
+    body = 'func V() { s := bson.M{"$set": bson.M{"status": "confirmed"}} ; _ = s }\n'
+    for rel in ("myvendor/a.go", "x/node_modules/b.go", "repo.git/c.go", "vendors/d.go", "e.go"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text(body)
+    assert vt._go_candidates(tmp_path) == ["e.go", str(Path("vendors/d.go"))]
+
+
+def _git_repo(root: Path) -> Path:
+    for args in (["init", "-q"], ["config", "user.email", "t@example.com"], ["config", "user.name", "T"]):
+        subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+    return root
+
+
+def _handler(status: str) -> str:
+    return (
+        "package main\n"
+        "func Set() {\n"
+        f'    update := bson.M{{"$set": bson.M{{"status": "{status}"}}}}\n'
+        "}\n"
+    )
+
+
+def _count_emissions(monkeypatch) -> list[str]:
+    seen: list[str] = []
+    real = vt._emit_go_file
+
+    def counting(repo, rel):
+        seen.append(rel)
+        return real(repo, rel)
+
+    monkeypatch.setattr(vt, "_emit_go_file", counting)
+    return seen
+
+
+def test_unchanged_files_are_served_from_the_findings_cache(tmp_path, monkeypatch):
+    repo = _git_repo(tmp_path)
+    for n, status in enumerate(("alpha", "beta", "gamma")):
+        (repo / f"h{n}.go").write_text(_handler(status))
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True)
+    subprocess.run(["git", "commit", "-qm", "handlers"], cwd=repo, check=True)
+    seen = _count_emissions(monkeypatch)
+    cold = vt.scan_go_files_measured(repo)
+    assert sorted(seen) == ["h0.go", "h1.go", "h2.go"]
+
+    seen.clear()
+    warm = vt.scan_go_files_measured(repo)
+    assert seen == [] and warm == cold
+
+    (repo / "h1.go").write_text(_handler("changed"))  # dirty: a new blob
+    seen.clear()
+    edited = vt.scan_go_files_measured(repo)
+    assert seen == ["h1.go"]
+    assert sorted(m.target_status for m in edited[0]) == ["alpha", "changed", "gamma"]
+
+    monkeypatch.setenv("CW_FINDINGS_NO_CACHE", "1")
+    seen.clear()
+    assert vt.scan_go_files_measured(repo) == edited
+    assert sorted(seen) == ["h0.go", "h1.go", "h2.go"]
+
+
+def test_unreadable_file_is_reported_and_never_cached(tmp_path, monkeypatch):
+    repo = _git_repo(tmp_path)
+    (repo / "ok.go").write_text(_handler("fine"))
+    (repo / "bad.go").write_bytes(b"\xff\xfe not utf-8")
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True)
+    subprocess.run(["git", "commit", "-qm", "handlers"], cwd=repo, check=True)
+    seen = _count_emissions(monkeypatch)
+    for expected in (["bad.go", "ok.go"], ["bad.go"]):
+        seen.clear()
+        matches, scanned, unreadable = vt.scan_go_files_measured(repo)
+        assert scanned == 1 and unreadable == ["bad.go: UnicodeDecodeError"]
+        assert seen == expected  # the second run re-attempts bad.go, serves ok.go
+
+
+def test_parallel_scan_matches_serial(tmp_path, monkeypatch):
+    for n in range(12):
+        (tmp_path / f"d{n % 3}").mkdir(exist_ok=True)
+        (tmp_path / f"d{n % 3}" / f"h{n}.go").write_text(_handler(f"s{n}"))
+    monkeypatch.setenv("CW_FINDINGS_NO_CACHE", "1")
+    monkeypatch.setenv("CW_SCAN_WORKERS", "1")
+    serial = vt.scan_go_files_measured(tmp_path)
+    monkeypatch.setenv("CW_SCAN_WORKERS", "3")
+    monkeypatch.setattr(vt.emission_pool, "MIN_PARALLEL_FILES", 1)
+    assert vt.scan_go_files_measured(tmp_path) == serial
+
+
 # --- diff_transitions -------------------------------------------------------
 
 